@@ -3,9 +3,10 @@ from __future__ import annotations
 import csv
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from backend.app.normalize import normalize_planning_video_number
+from factory_common import workspace_index
 from factory_common.paths import planning_root as ssot_planning_root
 from factory_common.paths import script_data_root as ssot_script_data_root
 from factory_common.paths import script_pkg_root
@@ -14,8 +15,13 @@ DATA_ROOT = ssot_script_data_root()
 CHANNEL_PLANNING_DIR = ssot_planning_root() / "channels"
 CHANNELS_DIR = script_pkg_root() / "channels"
 
+# Planning CSV path -> ((mtime_ns, size), video numbers); the dashboard polls this per channel.
+_PLANNING_VIDEO_NUMBERS_CACHE: Dict[Path, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+
 
 def list_channel_dirs() -> List[Path]:
+    if workspace_index.index_enabled():
+        return [DATA_ROOT / name for name in workspace_index.scripts_index(DATA_ROOT).groups()]
     if not DATA_ROOT.exists():
         return []
     return sorted(p for p in DATA_ROOT.iterdir() if p.is_dir() and p.name.upper().startswith("CH"))
@@ -24,6 +30,9 @@ def list_channel_dirs() -> List[Path]:
 def list_video_dirs(channel_code: str) -> List[Path]:
     channel_code = channel_code.upper()
     channel_dir = DATA_ROOT / channel_code
+    if workspace_index.index_enabled() and channel_code.startswith("CH"):
+        videos = workspace_index.scripts_index(DATA_ROOT).units(channel_code)
+        return [channel_dir / name for name in sorted(videos, key=int)]
     if not channel_dir.exists():
         return []
     return sorted((p for p in channel_dir.iterdir() if p.is_dir() and p.name.isdigit()), key=lambda p: int(p.name))
@@ -42,6 +51,14 @@ def list_planning_video_numbers(channel_code: str) -> List[str]:
     csv_path = CHANNEL_PLANNING_DIR / f"{channel_code}.csv"
     if not csv_path.exists():
         return []
+    try:
+        st = csv_path.stat()
+        sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        sig = None
+    cached = _PLANNING_VIDEO_NUMBERS_CACHE.get(csv_path)
+    if sig is not None and cached is not None and cached[0] == sig:
+        return list(cached[1])
 
     numbers: List[str] = []
     try:
@@ -63,6 +80,8 @@ def list_planning_video_numbers(channel_code: str) -> List[str]:
             continue
         seen.add(number)
         unique.append(number)
+    if sig is not None:
+        _PLANNING_VIDEO_NUMBERS_CACHE[csv_path] = (sig, tuple(unique))
     return unique
 
 
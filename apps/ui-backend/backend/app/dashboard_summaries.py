@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+"""
+Materialized per-episode / per-channel dashboard summaries.
+
+`/api/dashboard/overview` used to re-derive every episode (status.json, effective stages, final
+artifact probes) on each call. Episode summaries are now cached and keyed by workspace index versions
+(factory_common/workspace_index.py) of the episode's script dir and audio final dir, plus stat
+signatures of artifact paths that status.json points outside those dirs. Channel rollups are keyed by
+the planning video list and the channel-level index versions, so an unchanged channel costs a few
+dict lookups instead of a disk walk.
+
+WORKSPACE_INDEX_DISABLE=1 bypasses the caches (every call recomputes from disk).
+
+created: 2026-10-16
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.app import episode_store, path_utils
+from backend.app.channel_catalog import list_planning_video_numbers, list_video_dirs
+from backend.app.dashboard_models import DashboardAlert, DashboardChannelSummary
+from backend.app.datetime_utils import parse_iso_datetime
+from backend.app.episode_store import load_status_snapshot, resolve_audio_path, resolve_srt_path, video_base_dir
+from backend.app.path_utils import safe_exists
+from backend.app.stage_status_utils import _stage_status_value
+from backend.app.status_models import STAGE_ORDER, VALID_STAGE_STATUSES
+from backend.app.status_store import default_status_payload
+from backend.app.video_effective_status import _derive_effective_stages
+from factory_common import workspace_index
+from factory_common.paths import audio_artifacts_root, audio_final_dir
+
+COUNTER_FIELDS = (
+    "script_completed",
+    "audio_completed",
+    "srt_completed",
+    "blocked",
+    "ready_for_audio",
+    "pending_sync",
+)
+
+
+@dataclass(frozen=True)
+class EpisodeSummary:
+    channel: str
+    video: str
+    status_value: str
+    updated_at: Optional[datetime]
+    counters: Dict[str, bool]  # COUNTER_FIELDS -> counted for this episode
+    stages: Dict[str, str]  # STAGE_ORDER -> normalized stage status
+    alerts: Tuple[DashboardAlert, ...]
+    external: Tuple[Tuple[str, Any], ...]  # (path, stat signature) of status.json-referenced artifacts
+    key: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class ChannelRollup:
+    code: str
+    episodes: Tuple[EpisodeSummary, ...]
+    counts: Dict[str, int]
+    stage_matrix: Dict[str, Dict[str, Dict[str, int]]]
+    alerts: Tuple[DashboardAlert, ...]
+    key: Tuple[Any, ...]
+
+
+_LOCK = threading.Lock()
+_EPISODES: Dict[Tuple[str, str, str, str], EpisodeSummary] = {}
+_CHANNELS: Dict[Tuple[str, str, str], ChannelRollup] = {}
+
+
+def _ensure_stage_bucket(
+    matrix: Dict[str, Dict[str, Dict[str, int]]], channel_code: str, stage_key: str
+) -> Dict[str, int]:
+    channel_bucket = matrix.setdefault(channel_code, {})
+    stage_bucket = channel_bucket.get(stage_key)
+    if not stage_bucket:
+        stage_bucket = {status: 0 for status in VALID_STAGE_STATUSES}
+        stage_bucket["unknown"] = 0
+        channel_bucket[stage_key] = stage_bucket
+    else:
+        for status in VALID_STAGE_STATUSES:
+            stage_bucket.setdefault(status, 0)
+        stage_bucket.setdefault("unknown", 0)
+    return stage_bucket
+
+
+def _increment_stage_matrix(
+    matrix: Dict[str, Dict[str, Dict[str, int]]],
+    channel_code: str,
+    stages: Dict[str, Any],
+) -> None:
+    for stage_key in STAGE_ORDER:
+        stage_bucket = _ensure_stage_bucket(matrix, channel_code, stage_key)
+        stage_entry = stages.get(stage_key)
+        status = _stage_status_value(stage_entry)
+        stage_bucket[status] = stage_bucket.get(status, 0) + 1
+
+
+def _collect_alerts(
+    *,
+    channel_code: str,
+    video_number: str,
+    stages: Dict[str, Any],
+    metadata: Dict[str, Any],
+    status_value: str,
+    alerts: List[DashboardAlert],
+) -> None:
+    if status_value == "blocked" or any(
+        _stage_status_value(stages.get(stage_key)) == "blocked" for stage_key in STAGE_ORDER
+    ):
+        alerts.append(
+            DashboardAlert(
+                type="blocked_stage",
+                channel=channel_code,
+                video=video_number,
+                message="ステージが要対応状態です",
+            )
+        )
+
+    audio_quality = metadata.get("audio", {}).get("quality", {})
+    quality_status = None
+    if isinstance(audio_quality, dict):
+        quality_status = audio_quality.get("status") or audio_quality.get("label")
+    elif isinstance(audio_quality, str):
+        quality_status = audio_quality
+    if quality_status:
+        ok_statuses = {"completed", "ok", "良好", "問題なし", "完了"}
+        if all(token.lower() not in ok_statuses for token in [quality_status.lower()]):
+            alerts.append(
+                DashboardAlert(
+                    type="audio_quality",
+                    channel=channel_code,
+                    video=video_number,
+                    message=f"音声品質ステータス: {quality_status}",
+                )
+            )
+
+    sheets_meta = metadata.get("sheets")
+    if isinstance(sheets_meta, dict):
+        state = sheets_meta.get("state")
+        if state and state.lower() == "failed":
+            alerts.append(
+                DashboardAlert(
+                    type="sheet_sync",
+                    channel=channel_code,
+                    video=video_number,
+                    message="スプレッドシート同期に失敗しました",
+                )
+            )
+
+
+# ---------------------------------------------------------------------------
+# Cache keys
+# ---------------------------------------------------------------------------
+
+
+def _audio_final_root() -> Path:
+    return audio_artifacts_root() / "final"
+
+
+def _roots() -> Tuple[str, str]:
+    return str(episode_store.DATA_ROOT), str(_audio_final_root())
+
+
+def _stat_sig(path: str) -> Any:
+    try:
+        st = os.stat(path)
+    except Exception:
+        return None
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def _external_paths(metadata: Dict[str, Any]) -> List[str]:
+    """Artifact paths status.json points at (may live outside the indexed episode dirs)."""
+    raw: List[Any] = []
+    audio_meta = metadata.get("audio", {})
+    synth_meta = audio_meta.get("synthesis", {}) if isinstance(audio_meta, dict) else {}
+    if isinstance(synth_meta, dict):
+        raw.append(synth_meta.get("final_wav"))
+    srt_meta = metadata.get("subtitles", {})
+    if isinstance(srt_meta, dict):
+        raw.append(srt_meta.get("final_srt"))
+    raw.append(metadata.get("assembled_path"))
+    script_meta = metadata.get("script")
+    if isinstance(script_meta, dict):
+        raw.append(script_meta.get("assembled_path"))
+
+    out: List[str] = []
+    for value in raw:
+        if not isinstance(value, str) or not value.strip():
+            continue
+        path = Path(value)
+        if path.is_absolute():
+            candidates = [path]
+        else:
+            candidates = [episode_store.PROJECT_ROOT / value, path_utils.PROJECT_ROOT / value]
+        for candidate in candidates:
+            if str(candidate) not in out:
+                out.append(str(candidate))
+    return out
+
+
+def _external_fresh(external: Tuple[Tuple[str, Any], ...]) -> bool:
+    return all(_stat_sig(path) == sig for path, sig in external)
+
+
+def _episode_versions(channel_code: str, video_number: str) -> Tuple[Any, ...]:
+    audio_dir = audio_final_dir(channel_code, video_number)
+    scripts = workspace_index.scripts_index(episode_store.DATA_ROOT)
+    audio = workspace_index.audio_final_index(_audio_final_root())
+    return (
+        scripts.unit_version(f"{channel_code}/{video_number}"),
+        audio.unit_version(f"{audio_dir.parent.name}/{audio_dir.name}"),
+    )
+
+
+def _cacheable(channel_code: str) -> bool:
+    # Versions only track CHxx/NNN dirs (workspace_index layouts).
+    return workspace_index.index_enabled() and channel_code.upper().startswith("CH")
+
+
+# ---------------------------------------------------------------------------
+# Episode summaries
+# ---------------------------------------------------------------------------
+
+
+def _compute_episode_summary(channel_code: str, video_number: str, key: Tuple[Any, ...]) -> EpisodeSummary:
+    status_payload = load_status_snapshot(channel_code, video_number)
+    if status_payload is None:
+        status_payload = default_status_payload(channel_code, video_number)
+
+    base_dir = video_base_dir(channel_code, video_number)
+    status_value = status_payload.get("status", "unknown")
+    metadata = status_payload.get("metadata", {}) if isinstance(status_payload.get("metadata", {}), dict) else {}
+    stages_raw = status_payload.get("stages", {})
+    stages, a_text_ok, audio_exists, srt_exists = _derive_effective_stages(
+        channel_code=channel_code,
+        video_number=video_number,
+        stages=stages_raw if isinstance(stages_raw, dict) else {},
+        metadata=metadata,
+    )
+
+    # 台本完成: script_polish_ai があれば優先、なければ script_review/script_validation を代用
+    script_completed = (
+        a_text_ok
+        or _stage_status_value(stages.get("script_polish_ai")) == "completed"
+        or _stage_status_value(stages.get("script_review")) == "completed"
+        or _stage_status_value(stages.get("script_validation")) == "completed"
+    )
+
+    # 音声完了: audio_synthesis があればそれ、無ければ最終WAVの存在で代用
+    audio_done = audio_exists or _stage_status_value(stages.get("audio_synthesis")) == "completed"
+    if not audio_done:  # legacy fallback (status.json metadata paths etc)
+        audio_path = resolve_audio_path(status_payload, base_dir)
+        audio_done = bool(audio_path and safe_exists(audio_path))
+
+    # 字幕完了: srt_generation があればそれ、無ければ最終SRTの存在で代用
+    srt_done = srt_exists or _stage_status_value(stages.get("srt_generation")) == "completed"
+    if not srt_done:  # legacy fallback (status.json metadata paths etc)
+        srt_path = resolve_srt_path(status_payload, base_dir)
+        srt_done = bool(srt_path and safe_exists(srt_path))
+
+    blocked = status_value == "blocked" or any(
+        _stage_status_value(stages.get(stage_key)) == "blocked" for stage_key in STAGE_ORDER
+    )
+    ready_for_audio = (
+        bool(metadata.get("ready_for_audio"))
+        or _stage_status_value(stages.get("script_validation")) == "completed"
+        or str(status_value or "").strip().lower() == "script_validated"
+    )
+    pending_sync = False
+    sheets_meta = metadata.get("sheets") if isinstance(metadata.get("sheets"), dict) else None
+    if sheets_meta:
+        state = sheets_meta.get("state")
+        pending_sync = bool(state and state.lower() != "synced")
+
+    alerts: List[DashboardAlert] = []
+    _collect_alerts(
+        channel_code=channel_code,
+        video_number=video_number,
+        stages=stages,
+        metadata=metadata,
+        status_value=status_value,
+        alerts=alerts,
+    )
+    return EpisodeSummary(
+        channel=channel_code,
+        video=video_number,
+        status_value=status_value,
+        updated_at=parse_iso_datetime(status_payload.get("updated_at")),
+        counters={
+            "script_completed": bool(script_completed),
+            "audio_completed": bool(audio_done),
+            "srt_completed": bool(srt_done),
+            "blocked": bool(blocked),
+            "ready_for_audio": bool(ready_for_audio),
+            "pending_sync": pending_sync,
+        },
+        stages={stage_key: _stage_status_value(stages.get(stage_key)) for stage_key in STAGE_ORDER},
+        alerts=tuple(alerts),
+        external=tuple((path, _stat_sig(path)) for path in _external_paths(metadata)),
+        key=key,
+    )
+
+
+def episode_summary(channel_code: str, video_number: str) -> EpisodeSummary:
+    """Dashboard summary of one episode; recomputed only when its inputs changed."""
+    if not _cacheable(channel_code):
+        return _compute_episode_summary(channel_code, video_number, ())
+    cache_key = (*_roots(), channel_code, video_number)
+    key = _episode_versions(channel_code, video_number)
+    with _LOCK:
+        cached = _EPISODES.get(cache_key)
+    if cached is not None and cached.key == key and _external_fresh(cached.external):
+        return cached
+    summary = _compute_episode_summary(channel_code, video_number, key)
+    with _LOCK:
+        _EPISODES[cache_key] = summary
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Channel rollups
+# ---------------------------------------------------------------------------
+
+
+def list_dashboard_video_numbers(channel_code: str) -> List[str]:
+    planned_video_numbers = list_planning_video_numbers(channel_code)
+    if planned_video_numbers:
+        return planned_video_numbers
+    return [video_dir.name for video_dir in list_video_dirs(channel_code)]
+
+
+def accumulate_channel(
+    channel_code: str, episodes: Any
+) -> Tuple[DashboardChannelSummary, Dict[str, Dict[str, Dict[str, int]]], List[DashboardAlert]]:
+    summary = DashboardChannelSummary(code=channel_code)
+    stage_matrix: Dict[str, Dict[str, Dict[str, int]]] = {}
+    alerts: List[DashboardAlert] = []
+    for episode in episodes:
+        summary.total += 1
+        for field in COUNTER_FIELDS:
+            if episode.counters.get(field):
+                setattr(summary, field, getattr(summary, field) + 1)
+        _increment_stage_matrix(stage_matrix, channel_code, episode.stages)
+        alerts.extend(episode.alerts)
+    return summary, stage_matrix, alerts
+
+
+def _compute_channel_rollup(channel_code: str, video_numbers: List[str], key: Tuple[Any, ...]) -> ChannelRollup:
+    episodes = tuple(episode_summary(channel_code, video_number) for video_number in video_numbers)
+    summary, stage_matrix, alerts = accumulate_channel(channel_code, episodes)
+    counts = {"total": summary.total, **{field: getattr(summary, field) for field in COUNTER_FIELDS}}
+    return ChannelRollup(
+        code=channel_code,
+        episodes=episodes,
+        counts=counts,
+        stage_matrix=stage_matrix,
+        alerts=tuple(alerts),
+        key=key,
+    )
+
+
+def channel_rollup(channel_code: str) -> ChannelRollup:
+    """All-episode rollup of one channel; reused while no episode of the channel changed."""
+    video_numbers = list_dashboard_video_numbers(channel_code)
+    if not _cacheable(channel_code):
+        return _compute_channel_rollup(channel_code, video_numbers, ())
+    cache_key = (*_roots(), channel_code)
+    key = (
+        tuple(video_numbers),
+        workspace_index.scripts_index(episode_store.DATA_ROOT).version(channel_code),
+        workspace_index.audio_final_index(_audio_final_root()).version(channel_code),
+    )
+    with _LOCK:
+        cached = _CHANNELS.get(cache_key)
+    if (
+        cached is not None
+        and cached.key == key
+        and all(_external_fresh(episode.external) for episode in cached.episodes if episode.external)
+    ):
+        return cached
+    rollup = _compute_channel_rollup(channel_code, video_numbers, key)
+    with _LOCK:
+        _CHANNELS[cache_key] = rollup
+    return rollup
+
+
+def clear_caches() -> None:
+    with _LOCK:
+        _EPISODES.clear()
+        _CHANNELS.clear()
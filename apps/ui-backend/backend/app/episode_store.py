@@ -10,6 +10,7 @@ from fastapi import HTTPException
 
 from backend.app.normalize import normalize_channel_code, normalize_video_number
 from backend.app.path_utils import safe_exists, safe_is_file
+from factory_common import workspace_index
 from factory_common.paths import audio_final_dir
 from factory_common.paths import repo_root as ssot_repo_root
 from factory_common.paths import script_data_root as ssot_script_data_root
@@ -45,6 +46,23 @@ def load_status_optional(channel_code: str, video_number: str) -> Optional[dict]
     return _load_json(status_path)
 
 
+def load_status_snapshot(channel_code: str, video_number: str) -> Optional[dict]:
+    """
+    `load_status_optional` served from the workspace index (factory_common/workspace_index.py).
+
+    The returned dict is shared with the index: read-only callers only (copy before mutating).
+    """
+    if not workspace_index.index_enabled():
+        return load_status_optional(channel_code, video_number)
+    entry = workspace_index.scripts_index(DATA_ROOT).unit(f"{channel_code}/{video_number}")
+    if entry is None:
+        # Not an indexed episode dir (missing, or non CHxx/NNN layout): direct read.
+        return load_status_optional(channel_code, video_number)
+    if entry.get("status_error"):
+        raise HTTPException(status_code=500, detail=f"Invalid JSON: {video_base_dir(channel_code, video_number) / 'status.json'}")
+    return entry.get("status")
+
+
 def resolve_text_file(path: Path) -> Optional[str]:
     """正規パスのみを読む。フォールバック禁止。"""
     if not safe_exists(path) or not safe_is_file(path):
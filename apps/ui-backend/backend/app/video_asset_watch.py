@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from factory_common.fs_watch import IN_CREATE, IN_MODIFY, InotifyWatcher
+
+# NOTE:
+# Shared watch behind `GET /api/video-production/projects/{project_id}/assets/stream`.
+# The SSE endpoint used to re-stat every image under the run dir each `poll_interval` per connected client,
+# so N open tabs meant N stat walks per tick. Now one hub per project owns:
+#   - an inotify watch on <run>/, images/, image_variants/, image_variants/*/ and image_variants/*/images/
+#     (factory_common/fs_watch.py); close-write / rename / delete events re-stat only the touched path and
+#     are pushed to every subscriber as `upsert` / `remove` right away (sub-second latency)
+#   - without inotify (macOS, watch limit reached, YTM_FS_WATCH_DISABLE=1) a single polling scan per
+#     project, shared by all subscribers (interval = the smallest `poll_interval` requested)
+# Directory create/delete/rename and queue overflow trigger a full rescan (diffed, so only real changes emit).
+# The hub starts with the first subscriber and stops (closing the watch) when the last one leaves;
+# stopping only signals the thread, so a disconnecting client never blocks the event loop.
+# A subscriber whose queue fills up (stalled client) is resynced with a fresh `snapshot` instead of
+# buffering without bound.
+#
+# Env toggles:
+# - VIDEO_ASSET_WATCH_DISABLE=1 -> legacy per-client polling loop in the endpoint
+# - YTM_FS_WATCH_DISABLE=1      -> hub polls instead of using inotify
+
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+DEFAULT_POLL_SEC = 0.75
+SUBSCRIBER_QUEUE_MAX = 1000
+
+Sig = Tuple[int, int]
+Event = Tuple[str, Dict[str, Any]]
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def watch_enabled() -> bool:
+    return not _truthy_env("VIDEO_ASSET_WATCH_DISABLE")
+
+
+def infer_image_kind(rel_to_project: Path) -> Tuple[str, Optional[str]]:
+    parts = rel_to_project.parts
+    if not parts:
+        return "unknown", None
+    if parts[0] == "images":
+        return "final", None
+    if parts[0] == "image_variants" and len(parts) >= 2:
+        return "variant", parts[1]
+    return "other", None
+
+
+def _is_image(path: Path) -> bool:
+    return path.suffix.lower() in IMAGE_EXTENSIONS
+
+
+def iter_project_image_files(project_dir: Path) -> List[Tuple[Path, Path]]:
+    """Return list of (absolute_path, rel_to_project) for images under images/ and image_variants/*/images/."""
+    out: List[Tuple[Path, Path]] = []
+    images_dir = project_dir / "images"
+    if images_dir.exists() and images_dir.is_dir():
+        for p in sorted(images_dir.iterdir()):
+            if p.is_file() and _is_image(p):
+                out.append((p, p.relative_to(project_dir)))
+    variants_root = project_dir / "image_variants"
+    if variants_root.exists() and variants_root.is_dir():
+        for variant_dir in sorted([p for p in variants_root.iterdir() if p.is_dir()]):
+            v_images = variant_dir / "images"
+            if not v_images.exists() or not v_images.is_dir():
+                continue
+            for p in sorted(v_images.iterdir()):
+                if p.is_file() and _is_image(p):
+                    out.append((p, p.relative_to(project_dir)))
+    return out
+
+
+def asset_payload(project_id: str, rel_to_project: Path, stat: os.stat_result) -> Dict[str, Any]:
+    # OUTPUT_ROOT-relative even if the run dir is a symlink target.
+    rel = str(Path(project_id) / rel_to_project)
+    kind, variant_id = infer_image_kind(rel_to_project)
+    return {
+        "path": rel,
+        "url": f"/api/video-production/assets/{rel}",
+        "kind": kind,
+        "variant_id": variant_id,
+        "size_bytes": stat.st_size,
+        "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+    }
+
+
+def scan_assets(project_id: str, project_dir: Path) -> Dict[str, Tuple[Sig, Dict[str, Any]]]:
+    """rel -> ((mtime_ns, size), asset payload), in listing order."""
+    out: Dict[str, Tuple[Sig, Dict[str, Any]]] = {}
+    for abs_path, rel_to_project in iter_project_image_files(project_dir):
+        try:
+            stat = abs_path.stat()
+        except Exception:
+            continue
+        asset = asset_payload(project_id, rel_to_project, stat)
+        out[asset["path"]] = ((stat.st_mtime_ns, stat.st_size), asset)
+    return out
+
+
+class Subscription:
+    """One SSE client of a hub. Events are delivered on the subscriber's event loop."""
+
+    def __init__(self, hub: "AssetHub", loop: asyncio.AbstractEventLoop, poll_interval: float) -> None:
+        self.hub = hub
+        self.poll_interval = poll_interval
+        self._loop = loop
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_MAX)
+        self._lagged = False
+        self._closed = False
+
+    def _deliver(self, event: Event) -> None:
+        # Runs on the subscriber's loop.
+        if self._lagged:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._lagged = True
+
+    def push(self, event: Event) -> bool:
+        """Thread-safe enqueue. False when the subscriber's loop is gone."""
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            return False
+        return True
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Next event, or None after `timeout` seconds without one."""
+        if self._lagged:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._lagged = False
+            return "snapshot", {"project_id": self.hub.project_id, "assets": self.hub.snapshot()}
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        _release(self)
+
+
+class AssetHub:
+    """Image state of one run dir, kept fresh by a single background watcher thread."""
+
+    def __init__(self, project_id: str, project_dir: Path) -> None:
+        self.project_id = project_id
+        self.project_dir = project_dir
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watcher: Optional[InotifyWatcher] = None
+        self._assets: Dict[str, Tuple[Sig, Dict[str, Any]]] = {}
+        self._subscribers: Set[Subscription] = set()
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and not self._watcher.closed
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [asset for _, asset in self._assets.values()]
+
+    def start(self) -> None:
+        # Watches go in before the initial scan so nothing written in between is missed.
+        self._watcher = InotifyWatcher.create()
+        self._watch_tree()
+        with self._lock:
+            self._assets = scan_assets(self.project_id, self.project_dir)
+        self._thread = threading.Thread(
+            target=self._run, name=f"video-asset-watch:{self.project_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        # Called on the subscriber's event loop: never block it. The daemon thread notices within one
+        # read_events/poll tick and closes the watch itself.
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _add(self, sub: Subscription) -> List[Dict[str, Any]]:
+        # Snapshot and registration are atomic: later pushes are exactly the changes after the snapshot.
+        with self._lock:
+            self._subscribers.add(sub)
+            return [asset for _, asset in self._assets.values()]
+
+    def _remove(self, sub: Subscription) -> int:
+        with self._lock:
+            self._subscribers.discard(sub)
+            return len(self._subscribers)
+
+    def _poll_sec(self) -> float:
+        with self._lock:
+            intervals = [s.poll_interval for s in self._subscribers]
+        return min(intervals) if intervals else DEFAULT_POLL_SEC
+
+    def _publish(self, events: List[Event]) -> None:
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            for event in events:
+                if not sub.push(event):
+                    # Subscriber's loop is closed without an unsubscribe (client torn down).
+                    sub.close()
+                    break
+
+    def _watch(self, path: Path) -> None:
+        if self._watcher is None or not path.is_dir():
+            return
+        if not self._watcher.add(path):
+            # Watch limit / permission: fall back to shared polling for this hub.
+            self._watcher.close()
+            self._watcher = None
+
+    def _watch_tree(self) -> None:
+        self._watch(self.project_dir)
+        self._watch(self.project_dir / "images")
+        variants_root = self.project_dir / "image_variants"
+        self._watch(variants_root)
+        if variants_root.is_dir():
+            for variant_dir in sorted(p for p in variants_root.iterdir() if p.is_dir()):
+                self._watch(variant_dir)
+                self._watch(variant_dir / "images")
+
+    def _rescan(self) -> List[Event]:
+        current = scan_assets(self.project_id, self.project_dir)
+        events: List[Event] = []
+        with self._lock:
+            previous = self._assets
+            self._assets = current
+        for rel, (sig, asset) in current.items():
+            prev = previous.get(rel)
+            if prev is None or prev[0] != sig:
+                events.append(("upsert", {"project_id": self.project_id, "asset": asset}))
+        for rel in previous:
+            if rel not in current:
+                events.append(("remove", {"project_id": self.project_id, "path": rel}))
+        return events
+
+    def _refresh_file(self, path: Path) -> List[Event]:
+        try:
+            rel_to_project = path.relative_to(self.project_dir)
+        except ValueError:
+            return []
+        parts = rel_to_project.parts
+        in_images = (len(parts) == 2 and parts[0] == "images") or (
+            len(parts) == 4 and parts[0] == "image_variants" and parts[2] == "images"
+        )
+        if not in_images or not _is_image(path):
+            return []
+        rel = str(Path(self.project_id) / rel_to_project)
+        try:
+            stat = path.stat()
+            is_file = path.is_file()
+        except OSError:
+            stat, is_file = None, False
+        with self._lock:
+            prev = self._assets.get(rel)
+            if stat is None or not is_file:
+                if prev is None:
+                    return []
+                self._assets.pop(rel, None)
+                return [("remove", {"project_id": self.project_id, "path": rel})]
+            sig = (stat.st_mtime_ns, stat.st_size)
+            if prev is not None and prev[0] == sig:
+                return []
+            asset = asset_payload(self.project_id, rel_to_project, stat)
+            self._assets[rel] = (sig, asset)
+        return [("upsert", {"project_id": self.project_id, "asset": asset})]
+
+    def _structural(self, path: Path) -> bool:
+        """True when `path` is one of the dirs whose layout decides which files are images."""
+        try:
+            parts = path.relative_to(self.project_dir).parts
+        except ValueError:
+            return True
+        if not parts:
+            return True
+        if parts[0] == "images":
+            return len(parts) == 1
+        if parts[0] == "image_variants":
+            return len(parts) <= 2 or (len(parts) == 3 and parts[2] == "images")
+        return False
+
+    def _pump(self) -> None:
+        assert self._watcher is not None
+        events = self._watcher.read_events(0.5)
+        if not events:
+            return
+        rescan = False
+        dirty: Dict[Path, None] = {}
+        for ev in events:
+            if ev.overflow or ev.is_dir or self._structural(ev.path):
+                rescan = True
+                if ev.is_dir and ev.moved:
+                    # Renamed dirs keep stale watch paths: start over with a fresh watcher.
+                    self._watcher.close()
+                    self._watcher = InotifyWatcher.create()
+                    break
+                continue
+            if not ev.mask & ~(IN_CREATE | IN_MODIFY):
+                # Still being written: wait for IN_CLOSE_WRITE so clients never see half-written images.
+                continue
+            dirty[ev.path] = None
+        if self._watcher is None:
+            self._publish(self._rescan())
+            return
+        if rescan:
+            self._watch_tree()
+            self._publish(self._rescan())
+            return
+        out: List[Event] = []
+        for path in dirty:
+            out.extend(self._refresh_file(path))
+        self._publish(out)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                if self.watching:
+                    self._pump()
+                else:
+                    self._publish(self._rescan())
+                    self._stop.wait(self._poll_sec())
+        finally:
+            if self._watcher is not None:
+                self._watcher.close()
+            self._watcher = None
+
+
+_HUBS: Dict[Path, AssetHub] = {}
+_HUBS_LOCK = threading.Lock()
+
+
+def subscribe(
+    project_id: str,
+    project_dir: Path,
+    *,
+    poll_interval: float = DEFAULT_POLL_SEC,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Tuple[Subscription, List[Dict[str, Any]]]:
+    """Join (or start) the project's hub. Returns the subscription and the current asset snapshot."""
+    loop = loop or asyncio.get_running_loop()
+    key = Path(project_dir)
+    with _HUBS_LOCK:
+        hub = _HUBS.get(key)
+        if hub is None or hub.project_id != project_id:
+            hub = AssetHub(project_id, key)
+            hub.start()
+            _HUBS[key] = hub
+        sub = Subscription(hub, loop, poll_interval)
+        snapshot = hub._add(sub)
+    return sub, snapshot
+
+
+def _release(sub: Subscription) -> None:
+    hub = sub.hub
+    with _HUBS_LOCK:
+        if hub._remove(sub):
+            return
+        if _HUBS.get(hub.project_dir) is hub:
+            _HUBS.pop(hub.project_dir, None)
+    hub.stop()
+
+
+def active_hubs() -> Dict[Path, AssetHub]:
+    with _HUBS_LOCK:
+        return dict(_HUBS)
+
+
+def reset_hubs() -> None:
+    """Stop all hubs and wait for their threads (tests; do not call on an event loop)."""
+    with _HUBS_LOCK:
+        hubs = list(_HUBS.values())
+        _HUBS.clear()
+    for hub in hubs:
+        hub.stop()
+    for hub in hubs:
+        hub.join(timeout=2.0)
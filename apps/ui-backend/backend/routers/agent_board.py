@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from factory_common import segmented_log
 from factory_common.paths import logs_root, repo_root as ssot_repo_root
 
 router = APIRouter(prefix="/api/agent-org", tags=["agent_org"])
@@ -99,9 +100,7 @@ def _locked_update_json(path: Path, update_fn) -> dict:
 def _append_event(payload: dict) -> None:
     p = _coord_dir() / "events.jsonl"
     try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        segmented_log.append_jsonl(p, payload)
     except Exception:
         return
 
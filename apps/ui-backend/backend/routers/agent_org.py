@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from factory_common import segmented_log
 from factory_common.paths import logs_root, repo_root as ssot_repo_root
 
 router = APIRouter(prefix="/api/agent-org", tags=["agent_org"])
@@ -257,9 +258,7 @@ def _scopes_may_intersect(scope_a: str, scope_b: str) -> bool:
 def _append_event(payload: dict) -> None:
     p = _coord_dir() / "events.jsonl"
     try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        segmented_log.append_jsonl(p, payload)
     except Exception:
         return
 
@@ -1233,18 +1232,7 @@ def list_assignments(limit: int = Query(200, ge=1, le=2000)) -> Dict[str, Any]:
 def tail_events(limit: int = Query(200, ge=1, le=2000)) -> Dict[str, Any]:
     q = _queue_dir()
     p = _coord_dir() / "events.jsonl"
-    if not p.exists():
-        return {"count": 0, "events": [], "queue_dir": str(q)}
-    lines = p.read_text(encoding="utf-8").splitlines()
-    out: List[Dict[str, Any]] = []
-    for line in lines[-limit:]:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except Exception:
-            continue
-        if isinstance(obj, dict):
-            out.append(obj)
+    out: List[Dict[str, Any]] = [
+        obj for obj in segmented_log.tail_records(p, limit) if isinstance(obj, dict)
+    ]
     return {"count": len(out), "events": out, "queue_dir": str(q)}
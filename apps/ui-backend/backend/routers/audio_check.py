@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, HTTPException
 
 from backend.app.normalize import normalize_channel_code, normalize_video_number
+from factory_common import workspace_index
 from factory_common.paths import (
     audio_artifacts_root,
     audio_final_dir,
@@ -23,6 +24,26 @@ def list_recent_audio_checks(limit: int = 10) -> List[Dict[str, Any]]:
     if not audio_root.exists():
         return []
 
+    if workspace_index.index_enabled():
+        index = workspace_index.audio_final_index(audio_root)
+        for channel in index.groups():
+            if not channel.startswith("CH"):
+                continue
+            for video, entry in index.units(channel).items():
+                mtime = entry.get("log_mtime")
+                if mtime is None:
+                    continue
+                results.append(
+                    {
+                        "channel": channel,
+                        "video": video,
+                        "mtime": mtime,
+                        "updated_at": datetime.fromtimestamp(mtime, timezone.utc).isoformat(),
+                    }
+                )
+        results.sort(key=lambda x: x["mtime"], reverse=True)
+        return results[:limit]
+
     # Search for log.json files in workspaces/audio/final/CHxx/xxx/log.json
     for channel_dir in audio_root.iterdir():
         if not channel_dir.is_dir() or not channel_dir.name.startswith("CH"):
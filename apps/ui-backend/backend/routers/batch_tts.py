@@ -72,6 +72,7 @@ def get_batch_tts_progress() -> BatchTtsProgressResponse:
 @router.post("/start")
 async def start_batch_tts_regeneration(
     channels: List[str] = Body(default=["CH06", "CH02", "CH04"]),
+    parallel: int = Query(1, ge=1, le=8),
     background_tasks: BackgroundTasks = None,
 ):
     """バッチTTS再生成をバックグラウンドで開始"""
@@ -146,6 +147,8 @@ async def start_batch_tts_regeneration(
             "--log-path",
             str(log_file),
             *[arg for ch in channels_norm for arg in ("--channel", ch)],
+            "--parallel",
+            str(int(parallel)),
         ],
         cwd=str(PROJECT_ROOT),
         env=env,
@@ -41,6 +41,7 @@ from backend.app.stage_status_utils import _stage_status_value
 from backend.app.youtube_description_builder import _build_youtube_description
 from backend.tools.optional_fields_registry import get_planning_section, update_planning_from_row
 from factory_common.alignment import iter_thumbnail_catches_from_row, planning_hash_from_row, sha1_file as sha1_file_bytes
+from factory_common import workspace_index
 from factory_common.paths import audio_final_dir, video_runs_root as ssot_video_runs_root
 from script_pipeline.tools import planning_store
 
@@ -240,6 +241,21 @@ def _pick_latest_video_run_dirs(channel_code: str, video_numbers: set[str]) -> D
 
     pattern = re.compile(rf"^{re.escape(channel_code)}-(\d{{3}})", re.IGNORECASE)
     best: Dict[str, Tuple[float, Path]] = {}
+    if workspace_index.index_enabled():
+        runs = workspace_index.video_runs_index(root).units()
+        for name in sorted(runs):
+            match = pattern.match(name)
+            if not match:
+                continue
+            video_number = match.group(1).zfill(3)
+            if video_number not in video_numbers:
+                continue
+            score = float(runs[name].get("recency") or 0.0)
+            previous = best.get(video_number)
+            if previous is None or score > previous[0]:
+                best[video_number] = (score, root / name)
+        return {video_number: run_dir for video_number, (_, run_dir) in best.items()}
+
     try:
         run_dirs = list(root.iterdir())
     except Exception:
@@ -262,18 +278,51 @@ def _pick_latest_video_run_dirs(channel_code: str, video_numbers: set[str]) -> D
     return {video_number: run_dir for video_number, (_, run_dir) in best.items()}
 
 
+def _video_images_progress_response(
+    run_id: str,
+    *,
+    cues_mtime: Optional[float],
+    cue_count: Optional[int],
+    prompt_count: Optional[int],
+    images_count: int,
+    latest_image_mtime: Optional[float],
+) -> VideoImagesProgressResponse:
+    images_complete = False
+    if cue_count is not None and cue_count > 0:
+        images_complete = images_count >= cue_count
+
+    return VideoImagesProgressResponse(
+        run_id=run_id,
+        prompt_ready=bool(prompt_count),
+        prompt_ready_at=_utc_iso_from_mtime(cues_mtime),
+        cue_count=cue_count,
+        prompt_count=prompt_count,
+        images_count=int(images_count),
+        images_complete=bool(images_complete),
+        images_updated_at=_utc_iso_from_mtime(latest_image_mtime),
+    )
+
+
 def _compute_video_images_progress(run_dir: Path) -> VideoImagesProgressResponse:
     run_id = run_dir.name
 
+    if workspace_index.index_enabled():
+        entry = workspace_index.video_runs_index(run_dir.parent).unit(run_id)
+        if entry is not None:
+            return _video_images_progress_response(
+                run_id,
+                cues_mtime=entry.get("cues_mtime"),
+                cue_count=entry.get("cue_count"),
+                prompt_count=entry.get("prompt_count"),
+                images_count=int(entry.get("images_count") or 0),
+                latest_image_mtime=entry.get("images_mtime"),
+            )
+
     cue_count: Optional[int] = None
     prompt_count: Optional[int] = None
-    prompt_ready = False
-    prompt_ready_at: Optional[str] = None
 
     cues_path = run_dir / "image_cues.json"
     cues_mtime = _safe_mtime(cues_path)
-    if cues_mtime is not None:
-        prompt_ready_at = _utc_iso_from_mtime(cues_mtime)
     if cues_path.exists() and cues_path.is_file():
         try:
             raw = json.loads(cues_path.read_text(encoding="utf-8"))
@@ -291,7 +340,6 @@ def _compute_video_images_progress(run_dir: Path) -> VideoImagesProgressResponse
                 )
                 if prompt_value:
                     prompt_count += 1
-            prompt_ready = bool(prompt_count)
 
     images_count = 0
     latest_image_mtime: Optional[float] = None
@@ -312,19 +360,13 @@ def _compute_video_images_progress(run_dir: Path) -> VideoImagesProgressResponse
             images_count = 0
             latest_image_mtime = None
 
-    images_complete = False
-    if cue_count is not None and cue_count > 0:
-        images_complete = images_count >= cue_count
-
-    return VideoImagesProgressResponse(
-        run_id=run_id,
-        prompt_ready=bool(prompt_ready),
-        prompt_ready_at=prompt_ready_at,
+    return _video_images_progress_response(
+        run_id,
+        cues_mtime=cues_mtime,
         cue_count=cue_count,
         prompt_count=prompt_count,
-        images_count=int(images_count),
-        images_complete=bool(images_complete),
-        images_updated_at=_utc_iso_from_mtime(latest_image_mtime),
+        images_count=images_count,
+        latest_image_mtime=latest_image_mtime,
     )
 
 
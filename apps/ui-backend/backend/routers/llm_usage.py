@@ -13,6 +13,8 @@ import time
 import yaml
 
 from factory_common import fireworks_keys as fw_keys
+from factory_common import llm_usage_index
+from factory_common import segmented_log
 from factory_common.paths import logs_root, repo_root
 
 LOG_PATH = logs_root() / "llm_usage.jsonl"
@@ -35,18 +37,10 @@ def _deep_merge_dict(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str
 
 
 def _load_records(limit: int) -> List[Dict[str, Any]]:
-    if not LOG_PATH.exists():
-        return []
-    records = []
-    for line in LOG_PATH.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            records.append(json.loads(line))
-        except Exception:
-            continue
-    return records[-limit:] if limit else records
+    if limit:
+        # Only the tail is needed: read backwards (active file, then the newest rotated segments).
+        return segmented_log.tail_records(LOG_PATH, limit)
+    return list(segmented_log.iter_records(LOG_PATH))
 
 
 @router.get("/")
@@ -58,20 +52,19 @@ def list_usage(limit: int = Query(200, ge=1, le=2000)):
     return {"count": len(records), "records": records}
 
 
-def _iter_records() -> Iterable[Dict[str, Any]]:
-    if not LOG_PATH.exists():
-        return []
-    def _gen():
-        with LOG_PATH.open("r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = (line or "").strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except Exception:
-                    continue
-    return _gen()
+def _iter_records(
+    since: Optional[datetime] = None, until: Optional[datetime] = None
+) -> Iterable[Dict[str, Any]]:
+    # Rotated segments outside [since, until] are skipped (segmented_log manifest time ranges).
+    return segmented_log.iter_records(
+        LOG_PATH,
+        since=since.timestamp() if since else None,
+        until=until.timestamp() if until else None,
+    )
+
+
+def _log_exists() -> bool:
+    return LOG_PATH.exists() or bool(segmented_log.segments(LOG_PATH))
 
 
 def _sha256_hex(text: str) -> str:
@@ -285,53 +278,10 @@ def _probe_fireworks_pool(pool: str, *, limit: int = 0) -> Dict[str, Any]:
     return _get_fireworks_pool_status(pool)
 
 
-def _parse_dt(obj: Dict[str, Any]) -> Optional[datetime]:
-    ts = obj.get("timestamp")
-    if isinstance(ts, (int, float)):
-        try:
-            return datetime.fromtimestamp(float(ts), tz=timezone.utc)
-        except Exception:
-            return None
-    if isinstance(ts, str) and ts.strip():
-        try:
-            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        except Exception:
-            return None
-    ts2 = obj.get("ts")
-    if isinstance(ts2, str) and ts2.strip():
-        try:
-            return datetime.fromisoformat(ts2.replace("Z", "+00:00"))
-        except Exception:
-            return None
-    return None
-
-
-def _infer_provider(obj: Dict[str, Any]) -> str:
-    provider = str(obj.get("provider") or "").strip()
-    if provider:
-        return provider
-    model = str(obj.get("model") or "").strip()
-    if model.startswith("or_"):
-        return "openrouter"
-    chain = obj.get("chain")
-    if isinstance(chain, list) and any(str(x).startswith("or_") for x in chain):
-        return "openrouter"
-    err = str(obj.get("error") or "").lower()
-    if "openrouter.ai" in err or "insufficient credits" in err:
-        return "openrouter"
-    return ""
-
-
-def _usage_tokens(obj: Dict[str, Any]) -> Tuple[int, int, int]:
-    usage = obj.get("usage")
-    if not isinstance(usage, dict):
-        return (0, 0, 0)
-    prompt = int(usage.get("prompt_tokens") or 0)
-    completion = int(usage.get("completion_tokens") or 0)
-    total = int(usage.get("total_tokens") or 0)
-    if total <= 0:
-        total = prompt + completion
-    return (prompt, completion, total)
+# Shared with the usage index (factory_common/llm_usage_index.py) so both paths parse records identically.
+_parse_dt = llm_usage_index.record_datetime
+_infer_provider = llm_usage_index.infer_provider
+_usage_tokens = llm_usage_index.usage_tokens
 
 
 def _range_window(range_key: str) -> Tuple[str, Optional[datetime], Optional[datetime]]:
@@ -405,19 +355,10 @@ TASK_LABELS: Dict[str, str] = {
 }
 
 
-@router.get("/summary")
-def usage_summary(
-    range: str = Query("today_jst", description="today_jst | last_24h | last_7d | last_30d | all"),
-    top_n: int = Query(12, ge=3, le=50),
-    provider: str = Query("", description="Optional filter (e.g. openrouter, azure, codex_exec). Empty=all."),
-):
-    """
-    Aggregate token usage by task/model/provider for a time window.
-    Intended for UI dashboards and incident triage (e.g., OpenRouter credit exhaustion).
-    """
-    key, since, until = _range_window(range)
-    provider_filter = str(provider or "").strip().lower()
-
+def _scan_aggregates(
+    since: Optional[datetime], until: Optional[datetime], provider_filter: str, *, top_limit: int
+) -> Dict[str, Any]:
+    """Legacy path: one pass over the whole JSONL."""
     totals = _Agg()
     by_provider: Dict[str, _Agg] = defaultdict(_Agg)
     by_task: Dict[str, _Agg] = defaultdict(_Agg)
@@ -435,7 +376,7 @@ def usage_summary(
     top_calls: List[Tuple[int, Dict[str, Any]]] = []
 
     line_count = 0
-    for obj in _iter_records():
+    for obj in _iter_records(since, until):
         line_count += 1
         dt = _parse_dt(obj)
         if since and dt and dt < since:
@@ -510,7 +451,118 @@ def usage_summary(
             )
 
     # Sort / trim
-    top_calls_sorted = [it for _, it in sorted(top_calls, key=lambda kv: kv[0], reverse=True)[: min(20, top_n * 2)]]
+    top_calls_sorted = [it for _, it in sorted(top_calls, key=lambda kv: kv[0], reverse=True)[:top_limit]]
+    return {
+        "totals": totals,
+        "by_provider": by_provider,
+        "by_task": by_task,
+        "by_model": by_model,
+        "by_channel": by_channel,
+        "by_routing": by_routing,
+        "daily": daily,
+        "non_success_total": non_success_total,
+        "non_success_by_status_code": non_success_by_status_code,
+        "non_success_by_task": non_success_by_task,
+        "non_success_by_provider": non_success_by_provider,
+        "recent_failures": recent_failures,
+        "top_calls": top_calls_sorted,
+        "line_count": line_count,
+    }
+
+
+def _indexed_aggregates(
+    since: Optional[datetime], until: Optional[datetime], provider_filter: str, *, top_limit: int
+) -> Dict[str, Any]:
+    """Same aggregates as `_scan_aggregates`, served from the incremental usage index."""
+    llm_usage_index.ingest(LOG_PATH)
+    res = llm_usage_index.summarize(
+        LOG_PATH, since=since, until=until, provider=provider_filter, top_calls=top_limit, recent_failures=50
+    )
+
+    def _aggs(m: Dict[str, Dict[str, int]]) -> Dict[str, _Agg]:
+        return {k: _Agg(**v) for k, v in m.items()}
+
+    by_routing = _aggs(res["routing_keys"])
+    by_channel: Dict[str, _Agg] = defaultdict(_Agg)
+    for rk, a in by_routing.items():
+        if rk.startswith("CH") and "-" in rk:
+            c = by_channel[rk.split("-", 1)[0]]
+            for field in _Agg.__dataclass_fields__:
+                setattr(c, field, getattr(c, field) + getattr(a, field))
+
+    top_calls = []
+    for call in res["top_calls"]:
+        task = call["task"]
+        top_calls.append(
+            {
+                "timestamp": call["timestamp"],
+                "task": task,
+                "task_label": TASK_LABELS.get(task or "", task),
+                "routing_key": call["routing_key"],
+                "provider": call["provider"],
+                "model": call["model"],
+                "prompt_tokens": call["prompt_tokens"],
+                "completion_tokens": call["completion_tokens"],
+                "total_tokens": call["total_tokens"],
+                "finish_reason": call["finish_reason"],
+            }
+        )
+
+    failures = res["failures"]
+    return {
+        "totals": _Agg(**res["totals"]),
+        "by_provider": _aggs(res["providers"]),
+        "by_task": _aggs(res["tasks"]),
+        "by_model": _aggs(res["models"]),
+        "by_channel": by_channel,
+        "by_routing": by_routing,
+        "daily": _aggs(res["daily"]),
+        "non_success_total": failures["total"],
+        "non_success_by_status_code": failures["by_status_code"],
+        "non_success_by_task": failures["by_task"],
+        "non_success_by_provider": failures["by_provider"],
+        "recent_failures": res["recent_failures"],
+        "top_calls": top_calls,
+        "line_count": llm_usage_index.line_count(LOG_PATH),
+    }
+
+
+@router.get("/summary")
+def usage_summary(
+    range: str = Query("today_jst", description="today_jst | last_24h | last_7d | last_30d | all"),
+    top_n: int = Query(12, ge=3, le=50),
+    provider: str = Query("", description="Optional filter (e.g. openrouter, azure, codex_exec). Empty=all."),
+):
+    """
+    Aggregate token usage by task/model/provider for a time window.
+    Intended for UI dashboards and incident triage (e.g., OpenRouter credit exhaustion).
+    """
+    key, since, until = _range_window(range)
+    provider_filter = str(provider or "").strip().lower()
+
+    top_limit = min(20, top_n * 2)
+    agg: Optional[Dict[str, Any]] = None
+    if llm_usage_index.index_enabled() and _log_exists():
+        try:
+            agg = _indexed_aggregates(since, until, provider_filter, top_limit=top_limit)
+        except Exception:
+            agg = None  # fail-soft: fall back to scanning the JSONL
+    if agg is None:
+        agg = _scan_aggregates(since, until, provider_filter, top_limit=top_limit)
+    totals: _Agg = agg["totals"]
+    by_provider: Dict[str, _Agg] = agg["by_provider"]
+    by_task: Dict[str, _Agg] = agg["by_task"]
+    by_model: Dict[str, _Agg] = agg["by_model"]
+    by_channel: Dict[str, _Agg] = agg["by_channel"]
+    by_routing: Dict[str, _Agg] = agg["by_routing"]
+    daily: Dict[str, _Agg] = agg["daily"]
+    non_success_total: int = agg["non_success_total"]
+    non_success_by_status_code: Counter[str] = agg["non_success_by_status_code"]
+    non_success_by_task: Counter[str] = agg["non_success_by_task"]
+    non_success_by_provider: Counter[str] = agg["non_success_by_provider"]
+    recent_failures: List[Dict[str, Any]] = agg["recent_failures"]
+    top_calls_sorted: List[Dict[str, Any]] = agg["top_calls"]
+    line_count: int = agg["line_count"]
 
     def _agg_to_dict(a: _Agg) -> Dict[str, Any]:
         return {
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
 
 from backend.app.normalize import normalize_channel_code
 from backend.app.thumbnails_models import ThumbnailQcNoteUpdateRequest
 from backend.core.tools import thumbnails_qc_notes as qc_notes
 from factory_common.paths import thumbnails_root as ssot_thumbnails_root
+from script_pipeline.thumbnails import contactsheet
 
 router = APIRouter(prefix="/api/workspaces/thumbnails", tags=["thumbnails"])
 
@@ -61,3 +63,49 @@ def upsert_thumbnail_qc_note(channel: str, payload: ThumbnailQcNoteUpdateRequest
             document.pop(channel_code, None)
         qc_notes.write_thumbnail_qc_notes_document(document)
         return document.get(channel_code, {})
+
+
+@router.get("/{channel}/qc-sheet")
+def get_thumbnail_qc_sheet(
+    channel: str,
+    videos: Optional[str] = Query(None, description="カンマ区切りの動画番号 (省略時: assets 配下の全動画)"),
+    source_name: str = Query("00_thumb.png", description="各動画ディレクトリ内の画像ファイル名"),
+    tile_w: int = Query(640, ge=16, le=1920),
+    tile_h: int = Query(360, ge=9, le=1080),
+    cols: int = Query(6, ge=1, le=24),
+    pad: int = Query(8, ge=0, le=64),
+):
+    channel_code = normalize_channel_code(channel)
+    name = (source_name or "").strip()
+    if not name or Path(name).name != name or Path(name).suffix.lower() not in {".png", ".jpg", ".jpeg", ".webp"}:
+        raise HTTPException(status_code=400, detail="invalid source_name")
+
+    channel_dir = THUMBNAIL_ASSETS_DIR / channel_code
+    video_ids: List[str] = []
+    if videos:
+        for raw in videos.split(","):
+            token = raw.strip()
+            if not token:
+                continue
+            if not token.isdigit():
+                raise HTTPException(status_code=400, detail=f"invalid video: {token}")
+            video_ids.append(token.zfill(3))
+    elif channel_dir.is_dir():
+        # Only videos that actually have the image; explicit `videos` still get NEEDS_RESTORE placeholders.
+        video_ids = sorted(
+            p.name for p in channel_dir.iterdir() if p.is_dir() and p.name.isdigit() and (p / name).is_file()
+        )
+    if not video_ids:
+        raise HTTPException(status_code=404, detail="no thumbnails to render")
+
+    tiles = [contactsheet.SheetTile(label=vid, path=channel_dir / vid / name) for vid in video_ids]
+    key = contactsheet.contactsheet_cache_key(
+        tiles, tile_w=tile_w, tile_h=tile_h, cols=cols, pad=pad, output_mode="draft"
+    )
+    sheet = contactsheet.tile_cache_dir() / "sheets" / f"{channel_code}_{key[:24]}.png"
+    if not sheet.exists():
+        contactsheet.render_contactsheet(
+            tiles, sheet, tile_w=tile_w, tile_h=tile_h, cols=cols, pad=pad, output_mode="draft"
+        )
+    headers = {"Cache-Control": "no-store", "Pragma": "no-cache", "Expires": "0"}
+    return FileResponse(sheet, media_type="image/png", filename=f"contactsheet_{channel_code}.png", headers=headers)
@@ -4,6 +4,7 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from factory_common import workspace_index
 from factory_common.paths import audio_artifacts_root, script_data_root
 
 router = APIRouter(prefix="/api/tts-progress", tags=["tts-progress"])
@@ -29,8 +30,17 @@ class TtsProgressResponse(BaseModel):
     overall_progress: float
 
 
+def _use_index(channel: str) -> bool:
+    # Index covers CHxx/NNN dirs only; anything else (e.g. odd path params) keeps the direct scan.
+    return workspace_index.index_enabled() and channel.upper().startswith("CH") and Path(channel).name == channel
+
+
 def get_channel_episodes(channel: str) -> list[str]:
     """Get all episode IDs for a channel from the script data root."""
+    if _use_index(channel):
+        videos = workspace_index.scripts_index(SCRIPT_DATA_DIR).units(channel)
+        return sorted(video for video, entry in videos.items() if entry.get("assembled"))
+
     channel_dir = SCRIPT_DATA_DIR / channel
     if not channel_dir.exists():
         return []
@@ -53,6 +63,14 @@ def get_completed_episodes(channel: str) -> list[str]:
     1. 最終wavファイル ({channel}-{id}.wav) が存在する
     2. またはchunksディレクトリに10個以上のwavファイルがある
     """
+    if _use_index(channel):
+        videos = workspace_index.audio_final_index(TTS_OUTPUT_DIR).units(channel)
+        return sorted(
+            video
+            for video, entry in videos.items()
+            if entry.get("final_wav") or int(entry.get("chunk_wavs") or 0) >= 10
+        )
+
     output_dir = TTS_OUTPUT_DIR / channel
     if not output_dir.exists():
         return []
@@ -85,7 +103,9 @@ async def get_tts_progress():
     # Check all CH* channels
     # Scan SCRIPT_DATA_DIR for any CH* directories
     channel_codes = []
-    if SCRIPT_DATA_DIR.exists():
+    if workspace_index.index_enabled():
+        channel_codes = [name for name in workspace_index.scripts_index(SCRIPT_DATA_DIR).groups() if name.startswith("CH")]
+    elif SCRIPT_DATA_DIR.exists():
         for item in SCRIPT_DATA_DIR.iterdir():
             if item.is_dir() and item.name.startswith("CH"):
                 channel_codes.append(item.name)
@@ -58,9 +58,10 @@ def dashboard_test_env(tmp_path, monkeypatch) -> Dict[str, object]:
     monkeypatch.setattr(main, "CHANNELS_DIR", channels_dir)
     monkeypatch.setattr(main, "CHANNEL_INFO_PATH", channels_dir / "channels_info.json")
     monkeypatch.setattr(main, "YOUTUBE_CLIENT", None)
+    monkeypatch.setenv("WORKSPACE_INDEX_PATH", str(tmp_path / "workspace_index.sqlite3"))
 
     with TestClient(app) as client:
-        yield {"client": client}
+        yield {"client": client, "scripts_root": scripts_root}
 
 
 def test_dashboard_overview_includes_planning_channels(dashboard_test_env):
@@ -100,3 +101,64 @@ def test_dashboard_overview_survives_audio_volume_errors(dashboard_test_env, mon
 
     response = client.get("/api/dashboard/overview")
     assert response.status_code == 200
+
+
+def test_dashboard_overview_reflects_status_updates(dashboard_test_env, monkeypatch):
+    client: TestClient = dashboard_test_env["client"]  # type: ignore[assignment]
+    scripts_root: Path = dashboard_test_env["scripts_root"]  # type: ignore[assignment]
+    status_path = scripts_root / "CH01" / "001" / "status.json"
+    status_path.parent.mkdir(parents=True, exist_ok=True)
+    status_path.write_text('{"status": "pending", "stages": {}}', encoding="utf-8")
+
+    first = client.get("/api/dashboard/overview").json()
+    assert first["stage_matrix"]["CH01"]["script_outline"]["pending"] == 2
+
+    # Served from the workspace index: the rewrite must be visible on the next request.
+    status_path.write_text(
+        '{"status": "blocked", "stages": {"script_outline": {"status": "blocked"}}}', encoding="utf-8"
+    )
+    indexed = client.get("/api/dashboard/overview").json()
+    assert indexed["stage_matrix"]["CH01"]["script_outline"]["blocked"] == 1
+    assert {a["video"] for a in indexed["alerts"] if a["type"] == "blocked_stage"} == {"001"}
+
+    monkeypatch.setenv("WORKSPACE_INDEX_DISABLE", "1")
+    legacy = client.get("/api/dashboard/overview").json()
+    assert legacy["channels"] == indexed["channels"]
+    assert legacy["stage_matrix"] == indexed["stage_matrix"]
+
+
+def test_dashboard_overview_reuses_unchanged_episode_summaries(dashboard_test_env, monkeypatch):
+    from backend.app import dashboard_summaries
+
+    client: TestClient = dashboard_test_env["client"]  # type: ignore[assignment]
+    scripts_root: Path = dashboard_test_env["scripts_root"]  # type: ignore[assignment]
+    status_path = scripts_root / "CH01" / "002" / "status.json"
+    status_path.parent.mkdir(parents=True, exist_ok=True)
+    status_path.write_text('{"status": "script_validated", "updated_at": "2026-01-02T00:00:00Z"}', encoding="utf-8")
+
+    computed = []
+    original = dashboard_summaries._compute_episode_summary
+
+    def counting(channel_code, video_number, key):
+        computed.append((channel_code, video_number))
+        return original(channel_code, video_number, key)
+
+    monkeypatch.setattr(dashboard_summaries, "_compute_episode_summary", counting)
+    dashboard_summaries.clear_caches()
+
+    first = client.get("/api/dashboard/overview").json()
+    assert sorted(computed) == [("CH01", "001"), ("CH01", "002"), ("CH02", "010")]
+    computed.clear()
+
+    assert client.get("/api/dashboard/overview").json()["channels"] == first["channels"]
+    assert computed == []
+
+    status_path.write_text('{"status": "blocked", "updated_at": "2026-01-03T00:00:00Z"}', encoding="utf-8")
+    filtered = client.get("/api/dashboard/overview", params={"status": "blocked", "from": "2026-01-01T00:00:00Z"}).json()
+    assert computed == [("CH01", "002")]
+    assert [(c["code"], c["total"], c["blocked"]) for c in filtered["channels"]] == [("CH01", 1, 1)]
+
+    monkeypatch.setenv("WORKSPACE_INDEX_DISABLE", "1")
+    legacy = client.get("/api/dashboard/overview", params={"status": "blocked", "from": "2026-01-01T00:00:00Z"}).json()
+    assert legacy["channels"] == filtered["channels"]
+    assert legacy["stage_matrix"] == filtered["stage_matrix"]
@@ -7,8 +7,8 @@ from typing import Dict
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.app import normalize
 from backend.main import app
-from backend.routers import ssot_docs
 from backend.routers import thumbnails_qc_notes as qc_router
 from backend.core.tools import thumbnails_qc_notes as qc_tools
 
@@ -18,8 +18,8 @@ def qc_notes_test_env(tmp_path, monkeypatch) -> Dict[str, object]:
     # Make normalize_channel_code() accept CH01 via DATA_ROOT/CH01.
     scripts_root = tmp_path / "workspaces" / "scripts"
     (scripts_root / "CH01").mkdir(parents=True, exist_ok=True)
-    monkeypatch.setattr(ssot_docs, "DATA_ROOT", scripts_root)
-    monkeypatch.setattr(ssot_docs, "CHANNEL_PLANNING_DIR", tmp_path / "workspaces" / "planning" / "channels")
+    monkeypatch.setattr(normalize, "DATA_ROOT", scripts_root)
+    monkeypatch.setattr(normalize, "CHANNEL_PLANNING_DIR", tmp_path / "workspaces" / "planning" / "channels")
 
     # Isolate thumbnail assets + qc notes storage.
     thumbnails_root = tmp_path / "workspaces" / "thumbnails"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Dict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from backend.app import normalize
+from backend.routers import thumbnails_qc_notes as qc_router
+
+
+@pytest.fixture()
+def qc_sheet_test_env(tmp_path, monkeypatch) -> Dict[str, object]:
+    # Make normalize_channel_code() accept CH01 via DATA_ROOT/CH01.
+    scripts_root = tmp_path / "workspaces" / "scripts"
+    (scripts_root / "CH01").mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(normalize, "DATA_ROOT", scripts_root)
+    monkeypatch.setattr(normalize, "CHANNEL_PLANNING_DIR", tmp_path / "workspaces" / "planning" / "channels")
+
+    assets_root = tmp_path / "workspaces" / "thumbnails" / "assets"
+    (assets_root / "CH01").mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(qc_router, "THUMBNAIL_ASSETS_DIR", assets_root)
+    cache_dir = tmp_path / "qc_cache"
+    monkeypatch.setenv("THUMB_QC_TILE_CACHE_DIR", str(cache_dir))
+
+    app = FastAPI()
+    app.include_router(qc_router.router)
+    with TestClient(app) as client:
+        yield {"client": client, "assets_root": assets_root, "cache_dir": cache_dir}
+
+
+def test_qc_sheet_renders_and_reuses_cached_sheet(qc_sheet_test_env):
+    client: TestClient = qc_sheet_test_env["client"]  # type: ignore[assignment]
+    assets_root = qc_sheet_test_env["assets_root"]
+    cache_dir = qc_sheet_test_env["cache_dir"]
+    for vid, color in (("001", (200, 0, 0)), ("002", (0, 200, 0))):
+        (assets_root / "CH01" / vid).mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (320, 180), color).save(assets_root / "CH01" / vid / "00_thumb.png")
+    # A video dir without the requested image is left out of the default listing.
+    (assets_root / "CH01" / "003").mkdir()
+
+    resp = client.get("/api/workspaces/thumbnails/CH01/qc-sheet?tile_w=64&tile_h=36&cols=2&pad=4")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "image/png"
+    sheets = list((cache_dir / "sheets").glob("*.png"))
+    assert len(sheets) == 1
+    with Image.open(sheets[0]) as im:
+        assert im.size == (2 * 64 + 3 * 4, 36 + 2 * 4)
+
+    resp = client.get("/api/workspaces/thumbnails/CH01/qc-sheet?tile_w=64&tile_h=36&cols=2&pad=4")
+    assert resp.status_code == 200
+    assert list((cache_dir / "sheets").glob("*.png")) == sheets
+
+    resp = client.get("/api/workspaces/thumbnails/CH01/qc-sheet?source_name=../x.png")
+    assert resp.status_code == 400
+
+
+def test_qc_sheet_without_thumbnails_is_404(qc_sheet_test_env):
+    client: TestClient = qc_sheet_test_env["client"]  # type: ignore[assignment]
+    assets_root = qc_sheet_test_env["assets_root"]
+    (assets_root / "CH01" / "001").mkdir()
+
+    resp = client.get("/api/workspaces/thumbnails/CH01/qc-sheet")
+    assert resp.status_code == 404
+    resp = client.get("/api/workspaces/thumbnails/CH01/qc-sheet?videos=,")
+    assert resp.status_code == 404
+    assert not (qc_sheet_test_env["cache_dir"] / "sheets").exists()
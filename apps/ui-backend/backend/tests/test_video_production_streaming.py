@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 
@@ -7,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from backend import video_production
+from backend.app import video_asset_watch
 from video_pipeline.server.jobs import JobRecord, JobStatus
 
 
@@ -68,6 +70,76 @@ def test_assets_stream_emits_ready_and_snapshot(tmp_path, monkeypatch) -> None:
     assert any(str(a.get("path", "")).endswith(f"{project_id}/images/0001.png") for a in assets)
 
 
+def test_assets_stream_pushes_upserts_from_shared_watch(tmp_path, monkeypatch) -> None:
+    # TestClient buffers the whole body, so drive the ASGI app directly and disconnect once the upsert arrives.
+    project_id = "TEST-RUN-001"
+    output_root = tmp_path / "runs"
+    images_dir = output_root / project_id / "images"
+    images_dir.mkdir(parents=True, exist_ok=True)
+    (images_dir / "0001.png").write_bytes(b"not-a-real-png")
+
+    monkeypatch.setattr(video_production, "OUTPUT_ROOT", output_root)
+    monkeypatch.delenv("VIDEO_ASSET_WATCH_DISABLE", raising=False)
+    video_asset_watch.reset_hubs()
+    app = _make_app()
+
+    async def scenario() -> list[tuple[str, dict]]:
+        disconnected = asyncio.Event()
+        requested = False
+        body = ""
+        events: list[tuple[str, dict]] = []
+
+        async def receive() -> dict:
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            nonlocal body, events
+            if message["type"] != "http.response.body":
+                return
+            body += message.get("body", b"").decode("utf-8")
+            seen = _parse_sse_events(body)
+            names = [name for name, _ in seen]
+            if "snapshot" in names and "snapshot" not in [name for name, _ in events]:
+                assert video_asset_watch.active_hubs()
+                (images_dir / "0002.png").write_bytes(b"png")
+            if "upsert" in names:
+                disconnected.set()
+            events = seen
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/api/video-production/projects/{project_id}/assets/stream",
+            "raw_path": f"/api/video-production/projects/{project_id}/assets/stream".encode(),
+            "query_string": b"include_existing=1&poll_interval=0.2",
+            "root_path": "",
+            "headers": [],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=10.0)
+        return events
+
+    try:
+        events = asyncio.run(scenario())
+        names = [name for name, _ in events]
+        assert names[:2] == ["ready", "snapshot"]
+        upsert = next(payload for name, payload in events if name == "upsert")
+        assert upsert["asset"]["path"] == f"{project_id}/images/0002.png"
+        # The last client left: the hub is released without the loop waiting on its thread.
+        assert video_asset_watch.active_hubs() == {}
+    finally:
+        video_asset_watch.reset_hubs()
+
+
 def test_job_log_stream_emits_snapshot_and_done(tmp_path) -> None:
     app = _make_app()
     client = TestClient(app)
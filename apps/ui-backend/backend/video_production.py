@@ -35,6 +35,8 @@ from factory_common.paths import (
     video_runs_root,
 )
 
+from backend.app import video_asset_watch
+
 PROJECT_ROOT = ssot_repo_root()
 VIDEO_PIPELINE_ROOT = video_pkg_root()
 VALID_PROJECT_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
@@ -525,40 +527,6 @@ else:
         payload = json.dumps(data, ensure_ascii=False)
         return f"event: {event}\ndata: {payload}\n\n"
 
-    def _project_rel_to_output(project_id: str, project_dir: Path, file_path: Path) -> str:
-        """Return a stable OUTPUT_ROOT-relative path even if project_dir is a symlink target."""
-        rel = file_path.relative_to(project_dir)
-        return str(Path(project_id) / rel)
-
-    def _infer_image_kind(rel_to_project: Path) -> Tuple[str, Optional[str]]:
-        parts = rel_to_project.parts
-        if not parts:
-            return "unknown", None
-        if parts[0] == "images":
-            return "final", None
-        if parts[0] == "image_variants" and len(parts) >= 2:
-            return "variant", parts[1]
-        return "other", None
-
-    def _iter_project_image_files(project_dir: Path) -> List[Tuple[Path, Path]]:
-        """Return list of (absolute_path, rel_to_project) for images under images/ and image_variants/*/images/."""
-        out: List[Tuple[Path, Path]] = []
-        images_dir = project_dir / "images"
-        if images_dir.exists() and images_dir.is_dir():
-            for p in sorted(images_dir.iterdir()):
-                if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp"}:
-                    out.append((p, p.relative_to(project_dir)))
-        variants_root = project_dir / "image_variants"
-        if variants_root.exists() and variants_root.is_dir():
-            for variant_dir in sorted([p for p in variants_root.iterdir() if p.is_dir()]):
-                v_images = variant_dir / "images"
-                if not v_images.exists() or not v_images.is_dir():
-                    continue
-                for p in sorted(v_images.iterdir()):
-                    if p.is_file() and p.suffix.lower() in {".png", ".jpg", ".jpeg", ".webp"}:
-                        out.append((p, p.relative_to(project_dir)))
-        return out
-
     @video_router.get("/projects/{project_id}/assets/stream")
     async def stream_project_assets(
         project_id: Annotated[str, FastAPIPath(pattern=VALID_PROJECT_ID_PATTERN)],
@@ -569,90 +537,99 @@ else:
     ):
         """Stream image asset changes as Server-Sent Events (SSE).
 
-        - Emits `snapshot` once (optional) then `upsert` for new/updated images.
+        - Emits `snapshot` once (optional) then `upsert` for new/updated images and `remove` for deleted ones.
         - Watches `<run_dir>/images/` and `<run_dir>/image_variants/*/images/`.
+        - All clients of a project share one watch (`backend/app/video_asset_watch.py`);
+          `VIDEO_ASSET_WATCH_DISABLE=1` restores the per-client polling loop.
         """
         project_dir = _resolve_project_dir(project_id)
+        if once or not video_asset_watch.watch_enabled():
+            gen = _poll_project_assets(project_id, project_dir, request, include_existing, once, poll_interval)
+        else:
+            gen = _watch_project_assets(project_id, project_dir, request, include_existing, poll_interval)
+        return StreamingResponse(
+            gen,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
-        async def _gen():
-            yield _sse_event("ready", {"project_id": project_id})
-
-            seen: Dict[str, Tuple[int, int]] = {}
+    async def _watch_project_assets(
+        project_id: str,
+        project_dir: Path,
+        request: Request,
+        include_existing: bool,
+        poll_interval: float,
+    ):
+        yield _sse_event("ready", {"project_id": project_id})
+        sub, snapshot = video_asset_watch.subscribe(project_id, project_dir, poll_interval=poll_interval)
+        try:
             if include_existing:
-                snapshot: List[Dict[str, Any]] = []
-                for abs_path, rel_to_project in _iter_project_image_files(project_dir):
-                    try:
-                        stat = abs_path.stat()
-                    except Exception:
-                        continue
-                    rel = _project_rel_to_output(project_id, project_dir, abs_path)
-                    kind, variant_id = _infer_image_kind(rel_to_project)
-                    seen[rel] = (stat.st_mtime_ns, stat.st_size)
-                    snapshot.append(
-                        {
-                            "path": rel,
-                            "url": f"/api/video-production/assets/{rel}",
-                            "kind": kind,
-                            "variant_id": variant_id,
-                            "size_bytes": stat.st_size,
-                            "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        }
-                    )
                 yield _sse_event("snapshot", {"project_id": project_id, "assets": snapshot})
-
-            if once:
-                return
+            else:
+                # Same output as the polling loop: without a snapshot, existing images arrive as upserts.
+                for asset in snapshot:
+                    yield _sse_event("upsert", {"project_id": project_id, "asset": asset})
 
             last_ping = asyncio.get_running_loop().time()
             while True:
                 if await request.is_disconnected():
                     break
-
-                current: Dict[str, Tuple[int, int]] = {}
-                for abs_path, rel_to_project in _iter_project_image_files(project_dir):
-                    try:
-                        stat = abs_path.stat()
-                    except Exception:
-                        continue
-                    rel = _project_rel_to_output(project_id, project_dir, abs_path)
-                    current[rel] = (stat.st_mtime_ns, stat.st_size)
-                    if seen.get(rel) == current[rel]:
-                        continue
-                    kind, variant_id = _infer_image_kind(rel_to_project)
-                    seen[rel] = current[rel]
-                    yield _sse_event(
-                        "upsert",
-                        {
-                            "project_id": project_id,
-                            "asset": {
-                                "path": rel,
-                                "url": f"/api/video-production/assets/{rel}",
-                                "kind": kind,
-                                "variant_id": variant_id,
-                                "size_bytes": stat.st_size,
-                                "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            },
-                        },
-                    )
-
-                removed = [path for path in seen.keys() if path not in current]
-                for path in removed:
-                    seen.pop(path, None)
-                    yield _sse_event("remove", {"project_id": project_id, "path": path})
-
+                event = await sub.get(timeout=1.0)
+                if event is not None:
+                    yield _sse_event(*event)
                 now = asyncio.get_running_loop().time()
                 if now - last_ping >= 15.0:
                     # Comment line keeps intermediaries from buffering the stream.
                     yield ": ping\n\n"
                     last_ping = now
+        finally:
+            sub.close()
 
-                await asyncio.sleep(poll_interval)
+    async def _poll_project_assets(
+        project_id: str,
+        project_dir: Path,
+        request: Request,
+        include_existing: bool,
+        once: bool,
+        poll_interval: float,
+    ):
+        yield _sse_event("ready", {"project_id": project_id})
 
-        return StreamingResponse(
-            _gen(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
-        )
+        seen: Dict[str, Tuple[int, int]] = {}
+        if include_existing:
+            snapshot: List[Dict[str, Any]] = []
+            for rel, (sig, asset) in video_asset_watch.scan_assets(project_id, project_dir).items():
+                seen[rel] = sig
+                snapshot.append(asset)
+            yield _sse_event("snapshot", {"project_id": project_id, "assets": snapshot})
+
+        if once:
+            return
+
+        last_ping = asyncio.get_running_loop().time()
+        while True:
+            if await request.is_disconnected():
+                break
+
+            current = video_asset_watch.scan_assets(project_id, project_dir)
+            for rel, (sig, asset) in current.items():
+                if seen.get(rel) == sig:
+                    continue
+                seen[rel] = sig
+                yield _sse_event("upsert", {"project_id": project_id, "asset": asset})
+
+            removed = [path for path in seen.keys() if path not in current]
+            for path in removed:
+                seen.pop(path, None)
+                yield _sse_event("remove", {"project_id": project_id, "path": path})
+
+            now = asyncio.get_running_loop().time()
+            if now - last_ping >= 15.0:
+                # Comment line keeps intermediaries from buffering the stream.
+                yield ": ping\n\n"
+                last_ping = now
+
+            await asyncio.sleep(poll_interval)
 
     @video_router.get("/jobs/{job_id}/log/stream")
     async def stream_job_log(
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+bench_mecab_tokenize — 1エピソード分の MeCab トークナイズ時間を before/after で測る。
+
+before: 呼び出しごとに MeCab.Tagger() を生成 + メモ化なし（旧実装相当）
+after : スレッドローカル Tagger + LRU（tokenize_with_mecab / get_mecab_reading）
+
+計測対象（strict pipeline と同じ呼び出しパターン）:
+- WordDictionary(global_knowledge_base.json) のロード（辞書 surface ごとに get_mecab_reading）
+- セグメントごとの tokenize_with_mecab + get_mecab_reading（arbiter）
+- prepass ログ用の tokenize_with_mecab（orchestrator; 同一テキストを再トークナイズ）
+
+例:
+  python3 packages/audio_tts/scripts/bench_mecab_tokenize.py --input workspaces/scripts/CH06/033/content/assembled.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+from factory_common.paths import repo_root
+
+from audio_tts.tts import arbiter, mecab_tokenizer
+from audio_tts.tts.strict_segmenter import strict_segmentation
+
+_SAMPLE_TEXT = (
+    "静かな夜に、古い寺の鐘が遠くで鳴っていました。\n"
+    "重力波観測のニュースを聞きながら、私は縁側で茶を飲んでいた。\n"
+    "新潟の刈羽郡から、たった一人で東京へ出てきた若者の話です。\n"
+)
+
+
+@contextmanager
+def _legacy_mode() -> Iterator[None]:
+    """Emulate the pre-optimization behavior: fresh Tagger per parse, no memoization."""
+    import MeCab  # type: ignore
+
+    def _fresh_tagger():
+        tagger = MeCab.Tagger()
+        tagger.parse("")
+        return tagger
+
+    saved = (mecab_tokenizer._get_tagger, mecab_tokenizer._tokenize_cached, arbiter.get_mecab_reading)
+    mecab_tokenizer._get_tagger = _fresh_tagger
+    mecab_tokenizer._tokenize_cached = lambda text: tuple(mecab_tokenizer._tokenize_uncached(text))
+    arbiter.get_mecab_reading = arbiter.get_mecab_reading.__wrapped__
+    try:
+        yield
+    finally:
+        mecab_tokenizer._get_tagger, mecab_tokenizer._tokenize_cached, arbiter.get_mecab_reading = saved
+
+
+def _run_episode(texts: list[str]) -> Dict[str, float]:
+    t0 = time.perf_counter()
+    kb = arbiter.WordDictionary(arbiter.KB_PATH)
+    t1 = time.perf_counter()
+    for text in texts:
+        mecab_tokenizer.tokenize_with_mecab(text)
+        arbiter.get_mecab_reading(text)
+    for text in texts:
+        mecab_tokenizer.tokenize_with_mecab(text)
+    t2 = time.perf_counter()
+    return {"dict_load_sec": t1 - t0, "segments_sec": t2 - t1, "total_sec": t2 - t0, "kb_words": len(kb.words)}
+
+
+def _clear_caches() -> None:
+    mecab_tokenizer._tokenize_cached.cache_clear()
+    arbiter.get_mecab_reading.cache_clear()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--input", type=Path, help="A-text file (default: built-in sample x --repeat)")
+    ap.add_argument("--repeat", type=int, default=200, help="Sample text repetitions when --input is omitted")
+    ap.add_argument("--runs", type=int, default=2, help="Episodes per mode (2nd+ run shows warm-process cost)")
+    args = ap.parse_args()
+
+    if args.input:
+        path = args.input if args.input.is_absolute() else repo_root() / args.input
+        text = path.read_text(encoding="utf-8")
+    else:
+        text = _SAMPLE_TEXT * max(1, int(args.repeat))
+    texts = [s.text for s in strict_segmentation(text)]
+
+    report: Dict[str, object] = {"segments": len(texts)}
+    with _legacy_mode():
+        report["before"] = [_run_episode(texts) for _ in range(max(1, args.runs))]
+    _clear_caches()
+    report["after"] = [_run_episode(texts) for _ in range(max(1, args.runs))]
+
+    before = report["before"][0]["total_sec"]  # type: ignore[index]
+    after = report["after"][0]["total_sec"]  # type: ignore[index]
+    report["speedup_first_run"] = round(before / after, 2) if after else None
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+bench_voicepeak_slots — VOICEPEAK CLI のスロット数ごとのスループット（segments/sec）を測る。
+
+各スロット数について、同じセグメント列を一時ディレクトリへ strict_synthesis（voicepeak）で生成する。
+VOICEPEAK_CLI_SLOTS を切り替えるだけで、本番と同じロック / HOME 分離 / リトライ経路を通る。
+
+注意:
+- スロット 1 以上は既定で分離 HOME を使う。ライセンス済み設定が必要な環境では
+  VOICEPEAK_CLI_SLOT_HOME_SEED に設定ディレクトリを指定すること。
+- 出力が全スロット数でバイト一致するかも併せて報告する（ordered reassembly の確認）。
+
+例:
+  python3 packages/audio_tts/scripts/bench_voicepeak_slots.py --slots 1,2,4
+  python3 packages/audio_tts/scripts/bench_voicepeak_slots.py --input workspaces/scripts/CH06/033/content/assembled.md --limit 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from factory_common.paths import repo_root
+
+from audio_tts.tts import voicepeak_cli
+from audio_tts.tts.routing import load_routing_config, voicepeak_defaults
+from audio_tts.tts.strict_segmenter import strict_segmentation
+from audio_tts.tts.strict_synthesizer import strict_synthesis
+
+_SAMPLE_TEXT = (
+    "静かな夜に、古い寺の鐘が遠くで鳴っていました。\n"
+    "重力波観測のニュースを聞きながら、私は縁側で茶を飲んでいた。\n"
+    "新潟の刈羽郡から、たった一人で東京へ出てきた若者の話です。\n"
+)
+
+
+def _run_once(segments_text: List[str], slots: int, voice_config: Dict[str, object]) -> Dict[str, object]:
+    from audio_tts.tts.strict_structure import AudioSegment
+
+    prev = os.environ.get("VOICEPEAK_CLI_SLOTS")
+    os.environ["VOICEPEAK_CLI_SLOTS"] = str(slots)
+    voicepeak_cli._SLOT_STATS.clear()
+    try:
+        with tempfile.TemporaryDirectory(prefix=f"vp_bench_s{slots}_") as td:
+            out = Path(td) / "bench.wav"
+            segs = [AudioSegment(text=t, reading=t, pre_pause_sec=0.0, post_pause_sec=0.0) for t in segments_text]
+            t0 = time.perf_counter()
+            strict_synthesis(segs, out, "voicepeak", voice_config)
+            elapsed = time.perf_counter() - t0
+            digest = hashlib.sha256(out.read_bytes()).hexdigest()[:16]
+    finally:
+        if prev is None:
+            os.environ.pop("VOICEPEAK_CLI_SLOTS", None)
+        else:
+            os.environ["VOICEPEAK_CLI_SLOTS"] = prev
+    return {
+        "slots": slots,
+        "segments": len(segments_text),
+        "elapsed_sec": round(elapsed, 3),
+        "segments_per_sec": round(len(segments_text) / elapsed, 3) if elapsed else None,
+        "wav_sha256": digest,
+        "slot_stats": voicepeak_cli.slot_stats(),
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--input", type=Path, help="A-text file (default: built-in sample x --repeat)")
+    ap.add_argument("--repeat", type=int, default=4, help="Sample text repetitions when --input is omitted")
+    ap.add_argument("--limit", type=int, default=0, help="Use only the first N segments (0 = all)")
+    ap.add_argument("--slots", default="1,2,4", help="Comma-separated slot counts to measure")
+    ap.add_argument("--binary", help="VOICEPEAK binary (default: routing config)")
+    ap.add_argument("--narrator", help="Narrator (default: routing config)")
+    args = ap.parse_args()
+
+    if args.input:
+        path = args.input if args.input.is_absolute() else repo_root() / args.input
+        text = path.read_text(encoding="utf-8")
+    else:
+        text = _SAMPLE_TEXT * max(1, int(args.repeat))
+    texts = [s.text for s in strict_segmentation(text) if s.text.strip()]
+    if args.limit and args.limit > 0:
+        texts = texts[: args.limit]
+
+    defaults = voicepeak_defaults("", load_routing_config())
+    engine_options: Dict[str, object] = {
+        "binary_path": args.binary or defaults["binary_path"],
+        "narrator": args.narrator or defaults["narrator"],
+    }
+    slot_counts = sorted({max(1, int(x)) for x in str(args.slots).split(",") if x.strip()})
+
+    runs = [_run_once(texts, n, {"engine_options": engine_options}) for n in slot_counts]
+    base: Optional[float] = runs[0]["segments_per_sec"] if runs else None  # type: ignore[assignment]
+    for r in runs:
+        sps = r["segments_per_sec"]
+        r["speedup"] = round(float(sps) / base, 2) if base and sps else None  # type: ignore[arg-type]
+    report = {
+        "segments": len(texts),
+        "runs": runs,
+        "identical_output": len({r["wav_sha256"] for r in runs}) <= 1,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -305,6 +305,12 @@ def parse_args() -> argparse.Namespace:
     # Partial Regeneration
     p.add_argument("--indices", type=str, help="Comma-separated segment indices to regenerate (0-based). Example: '3,10'")
     p.add_argument("--resume", action="store_true", help="Resume from existing chunks (skip generation if chunk exists)")
+    p.add_argument(
+        "--synth-workers",
+        type=int,
+        default=None,
+        help="VOICEVOX concurrent synthesis workers (default: env VOICEVOX_SYNTH_WORKERS or 1=serial)",
+    )
     # Prepass (reading only, no synthesis)
     p.add_argument("--prepass", action="store_true", help="Reading-only pass (no wav synthesis). Generates log.json with readings.")
 
@@ -993,6 +999,7 @@ def main() -> None:
             resume=args.resume,
             prepass=args.prepass,
             skip_tts_reading=skip_tts_reading,
+            synthesis_workers=args.synth_workers,
         )
         if args.prepass:
             print(f"[SUCCESS] Prepass completed. Log: {log_path}")
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from audio_tts.tts.reading_dict import (
+    READING_DICT_ROOT,
+    PhraseReplacer,
+    export_words_for_word_dict,
+    load_channel_reading_dict,
+)
+
+
+def _legacy_apply(text: str, words: dict) -> str:
+    out = text
+    for surface in sorted(words.keys(), key=len, reverse=True):
+        if surface and surface in out:
+            out = out.replace(surface, words[surface])
+    return out
+
+
+CHANNELS = sorted(p.stem for p in READING_DICT_ROOT.glob("*.yaml"))
+
+
+@pytest.mark.parametrize("channel", CHANNELS)
+def test_matches_legacy_on_channel_dicts(channel):
+    words = export_words_for_word_dict(load_channel_reading_dict(channel))
+    if not words:
+        pytest.skip("empty dict")
+    replacer = PhraseReplacer(words)
+    rng = random.Random(channel)
+    surfaces = list(words)
+    fillers = ["、", "。", "の", "を", "は", "ア", "イ", "そして", "です"]
+    for _ in range(200):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            pick = rng.random()
+            if pick < 0.5:
+                parts.append(rng.choice(surfaces))
+            elif pick < 0.7:
+                # Fragments of surfaces/readings create overlaps and reading-like text.
+                src = rng.choice(surfaces + list(words.values()))
+                i = rng.randrange(len(src))
+                parts.append(src[i : i + rng.randint(1, 3)])
+            else:
+                parts.append(rng.choice(fillers))
+        text = "".join(parts)
+        assert replacer.apply(text) == _legacy_apply(text, words), text
+
+
+def test_matches_legacy_on_adversarial_small_alphabet():
+    rng = random.Random(0)
+    for _ in range(300):
+        words = {}
+        for _ in range(rng.randint(1, 8)):
+            surface = "".join(rng.choice("abcア") for _ in range(rng.randint(1, 4)))
+            words[surface] = "".join(rng.choice("アイb") for _ in range(rng.randint(0, 3)))
+        replacer = PhraseReplacer(words)
+        for _ in range(20):
+            text = "".join(rng.choice("abcアイ") for _ in range(rng.randint(0, 20)))
+            assert replacer.apply(text) == _legacy_apply(text, words), (words, text)
+
+
+def test_auditor_applies_channel_dict_with_compiled_replacer(monkeypatch):
+    from audio_tts.tts import auditor
+
+    monkeypatch.setattr(auditor, "load_learning_dict", lambda: {})
+    channel_dict = {
+        "重力波": {"reading_kana": "ジュウリョクハ"},
+        "重力": {"reading_kana": "ジュウリョク"},
+        "観測": {"reading_kana": "カンソク"},
+    }
+    words = export_words_for_word_dict(channel_dict)
+    blocks = [{"index": 0, "b_text": "重力波観測と重力"}]
+    auditor._select_candidates(blocks, channel_dict=channel_dict, hazard_dict=[])
+    assert blocks[0]["b_text"] == _legacy_apply("重力波観測と重力", words)
+    assert blocks[0]["audit_needed"] is False
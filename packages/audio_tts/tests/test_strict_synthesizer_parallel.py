@@ -0,0 +1,118 @@
+import io
+import threading
+import wave
+from pathlib import Path
+
+import pytest
+
+from audio_tts.tts.strict_structure import AudioSegment
+from audio_tts.tts.strict_synthesizer import strict_synthesis
+
+
+class _FakeVoicevox:
+    """Deterministic VOICEVOX stand-in: frames depend only on the text."""
+
+    def __init__(self, fail_once: set[str] | None = None) -> None:
+        self.base = "http://fake"
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.fail_once = set(fail_once or ())
+
+    def audio_query(self, text: str, speaker: int) -> dict:
+        with self.lock:
+            self.calls += 1
+            if text in self.fail_once:
+                self.fail_once.discard(text)
+                raise RuntimeError("transient")
+        return {"text": text, "accent_phrases": []}
+
+    def synthesis(self, query: dict, speaker: int) -> bytes:
+        text = str(query["text"])
+        nframes = 240 * (len(text) + 1)
+        sample = (sum(map(ord, text)) % 200 + 1).to_bytes(2, "little")
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(24000)
+            w.writeframes(sample * nframes)
+        return buf.getvalue()
+
+
+def _segments() -> list[AudioSegment]:
+    texts = ["あ", "いい", "ううう", "ええ", "お", "かきく", "けこ", "さ"]
+    return [AudioSegment(text=t, reading=t, pre_pause_sec=0.0, post_pause_sec=0.1 * (i % 3)) for i, t in enumerate(texts)]
+
+
+def _run(out: Path, client: _FakeVoicevox, **kwargs) -> list[AudioSegment]:
+    segs = _segments()
+    strict_synthesis(segs, out, "voicevox", None, voicevox_client=client, **kwargs)
+    return segs
+
+
+def test_parallel_output_is_byte_identical_to_serial(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOICEVOX_URLS", "")
+    serial = _run(tmp_path / "serial" / "out.wav", _FakeVoicevox(), synthesis_workers=1)
+    parallel = _run(tmp_path / "parallel" / "out.wav", _FakeVoicevox(), synthesis_workers=4)
+
+    assert (tmp_path / "serial" / "out.wav").read_bytes() == (tmp_path / "parallel" / "out.wav").read_bytes()
+    assert [s.duration_sec for s in serial] == [s.duration_sec for s in parallel]
+
+
+def test_parallel_resume_reuses_chunks_and_retries(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOICEVOX_URLS", "")
+    monkeypatch.setenv("VOICEVOX_SYNTH_RETRIES", "1")
+    out = tmp_path / "out.wav"
+    first = _FakeVoicevox(fail_once={"ううう"})
+    _run(out, first, synthesis_workers=3)
+    assert first.calls == len(_segments()) + 1
+    baseline = out.read_bytes()
+
+    (tmp_path / "chunks" / "out_part_002.wav").unlink()
+    second = _FakeVoicevox()
+    _run(out, second, synthesis_workers=3, resume=True)
+    assert second.calls == 1
+    assert out.read_bytes() == baseline
+
+
+def test_parallel_failure_reports_segment(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOICEVOX_URLS", "")
+    monkeypatch.setenv("VOICEVOX_SYNTH_RETRIES", "0")
+    with pytest.raises(RuntimeError, match="segment 4"):
+        _run(tmp_path / "out.wav", _FakeVoicevox(fail_once={"お"}), synthesis_workers=2)
+
+
+def test_streamed_output_matches_single_writeframes(tmp_path, monkeypatch):
+    from audio_tts.tts.strict_synthesizer import generate_silence
+
+    monkeypatch.setenv("VOICEVOX_URLS", "")
+    out = tmp_path / "out.wav"
+    segs = _run(out, _FakeVoicevox())
+
+    expected = bytearray()
+    for i, seg in enumerate(segs):
+        with wave.open(str(tmp_path / "chunks" / f"out_part_{i:03d}.wav"), "rb") as w:
+            frames = w.readframes(w.getnframes())
+        expected += generate_silence(seg.pre_pause_sec, 24000, 2, 1) + frames
+        expected += generate_silence(seg.post_pause_sec, 24000, 2, 1)
+    legacy = tmp_path / "legacy.wav"
+    with wave.open(str(legacy), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(24000)
+        wf.writeframes(bytes(expected))
+
+    assert out.read_bytes() == legacy.read_bytes()
+    assert not (tmp_path / ".out.wav.partial").exists()
+
+
+def test_failed_run_keeps_previous_output(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOICEVOX_URLS", "")
+    monkeypatch.setenv("VOICEVOX_SYNTH_RETRIES", "0")
+    out = tmp_path / "out.wav"
+    _run(out, _FakeVoicevox())
+    before = out.read_bytes()
+    with pytest.raises(RuntimeError):
+        _run(out, _FakeVoicevox(fail_once={"お"}))
+    assert out.read_bytes() == before
+    assert not (tmp_path / ".out.wav.partial").exists()
@@ -0,0 +1,70 @@
+import sys
+import textwrap
+import wave
+
+import pytest
+
+from audio_tts.tts import voicepeak_cli
+from audio_tts.tts.strict_structure import AudioSegment
+from audio_tts.tts.strict_synthesizer import strict_synthesis
+
+_FAKE_CLI = """
+    import os, sys, time, wave
+    args = sys.argv[1:]
+    text = open(args[args.index("-t") + 1], encoding="utf-8").read()
+    out = args[args.index("-o") + 1]
+    if "クラッシュ" in text and os.environ.get("HOME") == {home!r}:
+        sys.exit(3)  # slot 0 (shared HOME) crashes; other slots succeed
+    time.sleep(0.05)
+    sample = (sum(map(ord, text)) % 200 + 1).to_bytes(2, "little")
+    with wave.open(out, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(24000)
+        w.writeframes(sample * 240 * (len(text) + 1))
+"""
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    if sys.platform.startswith("win"):
+        pytest.skip("POSIX only")
+    home = tmp_path / "home"
+    home.mkdir()
+    binary = tmp_path / "voicepeak"
+    binary.write_text(f"#!{sys.executable}\n" + textwrap.dedent(_FAKE_CLI.format(home=str(home))), encoding="utf-8")
+    binary.chmod(0o755)
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("VOICEPEAK_CLI_COOLDOWN_SEC", "0")
+    monkeypatch.setenv("VOICEPEAK_CLI_RETRY_SLEEP_SEC", "0")
+    monkeypatch.setenv("VOICEPEAK_CLI_LOCK_PATH", str(tmp_path / "locks" / "voicepeak.lock"))
+    monkeypatch.setenv("VOICEPEAK_CLI_SLOT_HOME_ROOT", str(tmp_path / "slot_homes"))
+    monkeypatch.setattr(voicepeak_cli, "_SLOT_STATS", {})
+    return binary
+
+
+def _run(out, binary, texts):
+    segs = [AudioSegment(text=t, reading=t, pre_pause_sec=0.0, post_pause_sec=0.1) for t in texts]
+    strict_synthesis(segs, out, "voicepeak", {"engine_options": {"binary_path": str(binary), "narrator": "Fake"}})
+    return segs
+
+
+def test_multi_slot_output_matches_serial(tmp_path, fake_cli, monkeypatch):
+    texts = ["あ", "いい", "ううう", "ええ", "お", "かきく", "けこ", "さ"]
+    serial = _run(tmp_path / "serial" / "out.wav", fake_cli, texts)
+    monkeypatch.setenv("VOICEPEAK_CLI_SLOTS", "3")
+    multi = _run(tmp_path / "multi" / "out.wav", fake_cli, texts)
+
+    assert (tmp_path / "serial" / "out.wav").read_bytes() == (tmp_path / "multi" / "out.wav").read_bytes()
+    assert [s.duration_sec for s in serial] == [s.duration_sec for s in multi]
+    assert len(voicepeak_cli.slot_stats()) > 1
+
+
+def test_crashing_slot_is_retried_on_another_slot(tmp_path, fake_cli, monkeypatch):
+    monkeypatch.setenv("VOICEPEAK_CLI_SLOTS", "2")
+    monkeypatch.setenv("VOICEPEAK_CLI_NO_SILENCE_FALLBACK", "1")
+    out = tmp_path / "out.wav"
+    _run(out, fake_cli, ["クラッシュ", "あ", "クラッシュ", "い"])
+    with wave.open(str(out), "rb") as w:
+        assert w.getnframes() > 0
+    assert voicepeak_cli.slot_stats()[1]["failures"] == 0
@@ -0,0 +1,97 @@
+from audio_tts.tts import voicevox_cache
+from audio_tts.tts.voicevox_cache import CachedVoicevoxClient, wrap_client
+
+
+class _FakeVoicevox:
+    base = "http://127.0.0.1:9"
+
+    def __init__(self, version: str = "0.20.0") -> None:
+        self._version = version
+        self.queries = 0
+        self.syntheses = 0
+
+    def version(self, engine_url=None) -> str:
+        return self._version
+
+    def audio_query(self, text: str, speaker: int) -> dict:
+        self.queries += 1
+        return {"kana": text, "accent_phrases": [{"moras": [{"text": text}]}], "speedScale": 1.0}
+
+    def synthesis(self, query: dict, speaker: int) -> bytes:
+        self.syntheses += 1
+        return b"RIFF" + repr(sorted(query.items())).encode("utf-8")
+
+
+def test_query_and_synthesis_are_reused_across_clients(tmp_path):
+    first = CachedVoicevoxClient(_FakeVoicevox(), root=tmp_path)
+    q = first.audio_query("テスト", 3)
+    q["speedScale"] = 1.2  # callers mutate the query; cache must hand out copies
+    wav = first.synthesis(q, 3)
+    assert first.audio_query("テスト", 3)["speedScale"] == 1.0
+
+    inner = _FakeVoicevox()
+    second = CachedVoicevoxClient(inner, root=tmp_path)
+    q2 = second.audio_query("テスト", 3)
+    q2["speedScale"] = 1.2
+    assert second.synthesis(q2, 3) == wav
+    assert inner.queries == 0 and inner.syntheses == 0
+    assert second.cache_stats()["query_hit"] == 1
+    assert second.cache_stats()["synth_hit"] == 1
+
+
+def test_key_changes_with_params_speaker_and_engine(tmp_path):
+    inner = _FakeVoicevox()
+    client = CachedVoicevoxClient(inner, root=tmp_path)
+    q = client.audio_query("あ", 1)
+    client.synthesis(q, 1)
+    client.synthesis({**q, "pitchScale": 0.1}, 1)
+    client.synthesis(q, 2)
+    assert inner.syntheses == 3
+
+    upgraded = _FakeVoicevox(version="0.21.0")
+    CachedVoicevoxClient(upgraded, root=tmp_path).audio_query("あ", 1)
+    assert upgraded.queries == 1
+
+
+def test_prune_evicts_oldest_entries(tmp_path):
+    client = CachedVoicevoxClient(_FakeVoicevox(), root=tmp_path)
+    for i in range(5):
+        client.synthesis({"i": i, "pad": "x" * 1000}, 1)
+    total = sum(p.stat().st_size for p in tmp_path.rglob("*.wav"))
+    freed = client.prune(max_bytes=total // 2)
+    assert freed > 0
+    assert sum(p.stat().st_size for p in tmp_path.rglob("*.wav")) <= total // 2
+
+
+def test_wrap_client_respects_disable(monkeypatch):
+    fake = _FakeVoicevox()
+    monkeypatch.setenv("VOICEVOX_CACHE_DISABLE", "1")
+    assert wrap_client(fake) is fake
+    monkeypatch.delenv("VOICEVOX_CACHE_DISABLE")
+    assert isinstance(wrap_client(fake), CachedVoicevoxClient)
+    assert voicevox_cache.wrap_client(None) is None
+
+
+def test_prune_keeps_recently_hit_queries_and_memo_is_bounded(tmp_path, monkeypatch):
+    import os
+
+    monkeypatch.setattr(voicevox_cache, "QUERY_MEMO_MAX", 2)
+    client = CachedVoicevoxClient(_FakeVoicevox(), root=tmp_path)
+    client.audio_query("hot", 1)
+    for i in range(3):
+        client.synthesis({"i": i, "pad": "x" * 1000}, 1)
+    for p in tmp_path.rglob("*"):
+        if p.is_file():
+            os.utime(p, (1, 1))  # everything looks stale ...
+
+    # ... until a fresh client hits the query from disk.
+    reader = CachedVoicevoxClient(_FakeVoicevox(), root=tmp_path)
+    reader.audio_query("hot", 1)
+    query_bytes = sum(p.stat().st_size for p in tmp_path.rglob("*.json"))
+    client.prune(max_bytes=query_bytes)
+    remaining = [p for p in tmp_path.rglob("*") if p.is_file()]
+    assert [p.suffix for p in remaining] == [".json"]
+
+    for text in ("a", "b", "c"):
+        client.audio_query(text, 1)
+    assert len(client._queries) == 2
@@ -0,0 +1,121 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from audio_tts.tts.voicevox_api import VoicevoxClient
+
+
+def _start_engine(name: str):
+    hits: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # silence test output
+            pass
+
+        def _reply(self, body: bytes, status: int = 200) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self._reply(json.dumps("0.0.0-test").encode("utf-8"))
+
+        def do_POST(self):
+            hits.append(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            if self.path.startswith("/audio_query"):
+                if "bad" in self.path:
+                    self._reply(b"{}", status=422)
+                    return
+                self._reply(json.dumps({"kana": name, "accent_phrases": []}).encode("utf-8"))
+            else:
+                self._reply(b"RIFF" + name.encode("utf-8"))
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", hits
+
+
+def _dead_url() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_single_engine_query_and_synthesis():
+    server, url, hits = _start_engine("A")
+    try:
+        client = VoicevoxClient(url)
+        assert client.base == url
+        assert client.get_kana("テスト", 1) == "A"
+        assert client.synthesis({"accent_phrases": []}, 1) == b"RIFFA"
+        stats = client.stats()
+        assert stats["requests"] == 2 and stats["errors"] == 0
+        assert stats["engines"][0]["outstanding"] == 0
+        assert client.health_check() == {url: True}
+    finally:
+        server.shutdown()
+
+
+def test_dead_engine_is_skipped_before_dispatch():
+    a, url_a, hits_a = _start_engine("A")
+    b, url_b, hits_b = _start_engine("B")
+    dead = _dead_url()
+    try:
+        client = VoicevoxClient([dead, url_a, url_b])
+        kanas = [client.get_kana("x", 1) for _ in range(6)]
+        assert set(kanas) == {"A", "B"}
+        assert len(hits_a) == len(hits_b) == 3
+
+        engines = {e["url"]: e for e in client.stats()["engines"]}
+        assert engines[dead]["healthy"] is False
+        assert engines[dead]["requests"] == 0
+    finally:
+        a.shutdown()
+        b.shutdown()
+
+
+def test_fail_over_and_probe_before_readmission(monkeypatch):
+    from audio_tts.tts import voicevox_api
+
+    a, url_a, hits_a = _start_engine("A")
+    b, url_b, hits_b = _start_engine("B")
+    try:
+        client = VoicevoxClient([url_a, url_b])
+        assert client.get_kana("x", 1) == "A"
+        a.shutdown()
+        a.server_close()
+        assert [client.get_kana("x", 1) for _ in range(3)] == ["B", "B", "B"]
+        engines = {e["url"]: e for e in client.stats()["engines"]}
+        assert engines[url_a]["healthy"] is False
+        assert engines[url_a]["errors"] == 1
+
+        # Cooldown over: the engine is probed first and, still down, gets no request.
+        monkeypatch.setattr(voicevox_api, "UNHEALTHY_COOLDOWN_SEC", 0.0)
+        assert client.get_kana("x", 1) == "B"
+        engines = {e["url"]: e for e in client.stats()["engines"]}
+        assert engines[url_a]["errors"] == 1
+        assert engines[url_a]["requests"] == 2
+    finally:
+        b.shutdown()
+
+
+def test_http_errors_are_not_retried_on_other_engines():
+    a, url_a, hits_a = _start_engine("A")
+    b, url_b, hits_b = _start_engine("B")
+    try:
+        client = VoicevoxClient([url_a, url_b])
+        with pytest.raises(Exception):
+            client.audio_query("bad", 1)
+        assert len(hits_a) + len(hits_b) == 1
+        assert all(e["healthy"] for e in client.stats()["engines"])
+    finally:
+        a.shutdown()
+        b.shutdown()
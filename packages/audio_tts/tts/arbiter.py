@@ -4,11 +4,13 @@ import re
 import json
 import hashlib
 import time
+from functools import lru_cache
 from pathlib import Path
 from .strict_structure import AudioSegment
-from .mecab_tokenizer import tokenize_with_mecab
+from .mecab_tokenizer import tokenize_cache_size, tokenize_with_mecab
 from .voicevox_api import VoicevoxClient
 from .reading_dict import (
+    PhraseReplacer,
     ReadingEntry,
     is_banned_surface,
     export_words_for_word_dict,
@@ -89,6 +91,8 @@ class WordDictionary:
     def __init__(self, path: Path):
         self.path = path
         self.words: Dict[str, str] = self._load()
+        self._replacer: Optional[PhraseReplacer] = None
+        self._replacer_src: Dict[str, str] = {}
 
     def _load(self) -> Dict[str, str]:
         base: Dict[str, str] = {}
@@ -151,14 +155,8 @@ class WordDictionary:
         if not self.words:
             return text
         
-        result = text
-        # まず文字列マッチングで置換（長い単語から順に処理）
-        sorted_words = sorted(self.words.keys(), key=len, reverse=True)
-        for word in sorted_words:
-            if is_banned_surface(word):
-                continue
-            if word in result:
-                result = result.replace(word, self.words[word])
+        # まず文字列マッチングで置換（長い単語から順に処理; コンパイル済みマッチャで1パス）
+        result = self._phrase_replacer().apply(text)
         
         # さらにトークン単位でも確認（MeCabの分割結果を考慮）
         tokens = tokenize_with_mecab(text)
@@ -176,6 +174,15 @@ class WordDictionary:
         # 文字列マッチングの結果を優先（より確実）
         return result if result != text else token_result
 
+    def _phrase_replacer(self) -> PhraseReplacer:
+        # `words` is mutated in place by callers (kb.words.update / set), so rebuild on change.
+        if self._replacer is None or self._replacer_src != self.words:
+            self._replacer_src = dict(self.words)
+            self._replacer = PhraseReplacer(
+                {w: r for w, r in self._replacer_src.items() if not is_banned_surface(w)}
+            )
+        return self._replacer
+
 # Normalize Kana
 def normalize_kana_for_comparison(text: str) -> str:
     text = text.replace("'", "").replace("/", "").replace("_", "")
@@ -189,6 +196,8 @@ def normalize_kana_for_comparison(text: str) -> str:
     # 判定はすべてLLMに委譲する。
     return text
 
+
+@lru_cache(maxsize=tokenize_cache_size())
 def get_mecab_reading(text: str) -> str:
     tokens = tokenize_with_mecab(text)
     readings = []
@@ -424,15 +433,20 @@ def _apply_voicepeak_comma_policy(text: str, policy: str, drop_particles: set[st
     return "".join(out_chars)
 
 
+_PHRASE_REPLACERS: Dict[int, tuple] = {}
+
+
 def _apply_phrase_dict(text: str, words: Dict[str, str]) -> str:
     """Apply phrase-level replacements (longer surfaces first)."""
     if not text or not words:
         return text
-    out = text
-    for surface in sorted(words.keys(), key=len, reverse=True):
-        if surface and surface in out:
-            out = out.replace(surface, words[surface])
-    return out
+    cached = _PHRASE_REPLACERS.get(id(words))
+    if cached is None or cached[0] != words:
+        if len(_PHRASE_REPLACERS) >= 32:
+            _PHRASE_REPLACERS.clear()
+        cached = (dict(words), PhraseReplacer(words))
+        _PHRASE_REPLACERS[id(words)] = cached
+    return cached[1].apply(text)
 
 
 _ASCII_TOKEN_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9.\\-]*$")
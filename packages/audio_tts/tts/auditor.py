@@ -22,6 +22,7 @@ def get_router():  # pragma: no cover
 
 from .mecab_tokenizer import tokenize_with_mecab
 from .reading_dict import (
+    PhraseReplacer,
     ReadingEntry,
     export_words_for_word_dict,
     is_banned_surface,
@@ -100,17 +101,6 @@ def save_learning_dict(new_entries: Dict[str, str]) -> None:
     path.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def _apply_surface_map(text: str, mapping: Dict[str, str]) -> str:
-    if not mapping:
-        return text
-    patched = text
-    for surface in sorted(mapping, key=len, reverse=True):
-        reading = mapping[surface]
-        if surface in patched:
-            patched = patched.replace(surface, reading)
-    return patched
-
-
 def _tokenize_block(block: Dict[str, object]) -> List[RubyToken]:
     raw_text = str(block.get("text") or block.get("raw_text") or "")
     toks: List[RubyToken] = []
@@ -695,6 +685,8 @@ def _select_candidates(
 ]:
     hazard_dict = set(hazard_dict or load_hazard_terms())
     channel_surface_map = export_words_for_word_dict(channel_dict or {})
+    # Compiled once per audit (same longest-first semantics as the old per-block replace loop).
+    channel_replacer = PhraseReplacer(channel_surface_map)
     learned = load_learning_dict()
 
     # surfaceレベルで代表文脈と hazardタグを持たせるための集計
@@ -713,7 +705,7 @@ def _select_candidates(
         for k, v in learned.items():
             if k in txt:
                 txt = txt.replace(k, v)
-        patched_txt = _apply_surface_map(txt, channel_surface_map)
+        patched_txt = channel_replacer.apply(txt)
         if patched_txt != txt:
             b["b_text"] = patched_txt
             b["audit_needed"] = False
@@ -1028,12 +1020,12 @@ def audit_blocks(
                     channel_dict[surface] = entry.to_dict()
 
     # Apply resolved readings to all blocks.
-    surface_map = export_words_for_word_dict(channel_dict or {})
+    surface_replacer = PhraseReplacer(export_words_for_word_dict(channel_dict or {}))
     fixed_count = 0
     final_blocks: List[Dict[str, object]] = []
     for b in blocks:
         original = b.get("b_text", "")
-        patched = _apply_surface_map(original, surface_map)
+        patched = surface_replacer.apply(original)
         if patched != original:
             b["b_text"] = patched
             fixed_count += 1
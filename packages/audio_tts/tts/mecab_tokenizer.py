@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+import threading
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import os
 from pathlib import Path
 
@@ -15,13 +17,29 @@ if not os.getenv("MECABRC"):
 SILENCE_TAG_PATTERN = re.compile(r"\[(\d+(?:\.\d+)?)\]")
 
 
+# One MeCab.Tagger per thread (Tagger construction loads the dictionary and is the dominant cost;
+# a Tagger instance is not safe to share across threads).
+_TAGGER_LOCAL = threading.local()
+
+
+def _get_tagger():
+    tagger = getattr(_TAGGER_LOCAL, "tagger", None)
+    if tagger is None:
+        try:
+            import MeCab  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("mecab-python3 is required") from exc
+        tagger = MeCab.Tagger()
+        tagger.parse("")
+        _TAGGER_LOCAL.tagger = tagger
+    return tagger
+
+
 def _mecab_parse(text: str):
-    try:
-        import MeCab  # type: ignore
-    except ImportError as exc:  # pragma: no cover
-        raise RuntimeError("mecab-python3 is required") from exc
-    tagger = MeCab.Tagger()
-    tagger.parse("")
+    # Tagger first: it raises RuntimeError (not ImportError) when mecab-python3 is missing.
+    tagger = _get_tagger()  # keep a reference: nodes are owned by the tagger's lattice
+    import MeCab  # type: ignore
+
     node = tagger.parseToNode(text)
     while node:
         if node.stat in (MeCab.MECAB_BOS_NODE, MeCab.MECAB_EOS_NODE):
@@ -30,6 +48,7 @@ def _mecab_parse(text: str):
         yield node
         node = node.next
 
+
 _KATAKANA_RE = re.compile(r"^[ァ-ヴー・]+$")
 _HIRAGANA_RE = re.compile(r"[ぁ-ゖ]")
 _HIRAGANA_TO_KATAKANA = str.maketrans(
@@ -124,7 +143,30 @@ def _tokenize_segment(segment: str, offset: int) -> List[Dict[str, object]]:
     return tokens
 
 
+def tokenize_cache_size() -> int:
+    """LRU size for MeCab-derived memoization (`MECAB_TOKENIZE_CACHE_SIZE`, default 8192, 0 disables)."""
+    try:
+        return max(0, int((os.getenv("MECAB_TOKENIZE_CACHE_SIZE") or "8192").strip()))
+    except Exception:
+        return 8192
+
+
 def tokenize_with_mecab(a_text: str) -> List[Dict[str, object]]:
+    """
+    Tokenize with MeCab (silence tags `[1.2]` kept as single tokens).
+
+    Results are memoized per text (LRU, `MECAB_TOKENIZE_CACHE_SIZE`, 0 disables); callers always
+    receive fresh dicts so they may mutate them.
+    """
+    return [dict(t) for t in _tokenize_cached(a_text)]
+
+
+@lru_cache(maxsize=tokenize_cache_size())
+def _tokenize_cached(a_text: str) -> Tuple[Dict[str, object], ...]:
+    return tuple(_tokenize_uncached(a_text))
+
+
+def _tokenize_uncached(a_text: str) -> List[Dict[str, object]]:
     tokens: List[Dict[str, object]] = []
     last = 0
     index_counter = 0
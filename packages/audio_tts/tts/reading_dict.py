@@ -5,7 +5,7 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from factory_common.paths import audio_pkg_root
 
@@ -185,3 +185,132 @@ def describe_dict_state(channel: str) -> Dict[str, object]:
         "path": str(path),
         "entries": len(data),
     }
+
+
+# ---------------------------------------------------------------------------
+# Phrase replacement (compiled multi-pattern matcher)
+# ---------------------------------------------------------------------------
+
+
+class _AhoCorasick:
+    """Minimal Aho–Corasick automaton over `patterns` (reports every occurrence in one pass)."""
+
+    def __init__(self, patterns: List[str]) -> None:
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[int]] = [[]]
+        for pid, pat in enumerate(patterns):
+            node = 0
+            for ch in pat:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = nxt
+            self.out[node].append(pid)
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                cand = self.goto[f].get(ch, 0)
+                self.fail[nxt] = cand if cand != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield (end_index_exclusive, pattern_id) for every occurrence."""
+        node = 0
+        goto, fail, out = self.goto, self.fail, self.out
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i + 1, pid
+
+
+class PhraseReplacer:
+    """
+    Compiled equivalent of the legacy phrase loop:
+
+        for surface in sorted(words, key=len, reverse=True):
+            if surface in out:
+                out = out.replace(surface, words[surface])
+
+    Priority is longest surface first (ties keep dict order); each surface replaces its
+    non-overlapping occurrences left to right, and text already replaced is never matched by a
+    lower-priority surface. Surfaces are matched with one Aho–Corasick pass per run of surfaces.
+    Surfaces that share characters with a replacement reading could match text produced by an
+    earlier replacement, so they are applied in priority order with `str.replace` to keep the
+    output byte-identical to the legacy loop.
+    """
+
+    def __init__(self, words: Mapping[str, str]) -> None:
+        items = [(str(k), str(v)) for k, v in words.items() if k]
+        items.sort(key=lambda kv: len(kv[0]), reverse=True)
+        reading_chars = set("".join(v for _, v in items))
+        all_sequential = any(not v for _, v in items)
+
+        self._steps: List[Tuple[str, object]] = []
+        run: List[Tuple[str, str]] = []
+        for surface, reading in items:
+            if all_sequential or (set(surface) & reading_chars):
+                if run:
+                    self._steps.append(("ac", self._compile_run(run)))
+                    run = []
+                self._steps.append(("seq", (surface, reading)))
+            else:
+                run.append((surface, reading))
+        if run:
+            self._steps.append(("ac", self._compile_run(run)))
+        self.size = len(items)
+
+    @staticmethod
+    def _compile_run(run: List[Tuple[str, str]]) -> Tuple[_AhoCorasick, List[str], List[str]]:
+        surfaces = [s for s, _ in run]
+        return _AhoCorasick(surfaces), surfaces, [r for _, r in run]
+
+    def apply(self, text: str) -> str:
+        if not text or not self.size:
+            return text
+        out = text
+        for kind, payload in self._steps:
+            if kind == "seq":
+                surface, reading = payload  # type: ignore[misc]
+                if surface in out:
+                    out = out.replace(surface, reading)
+            else:
+                out = self._apply_run(out, payload)  # type: ignore[arg-type]
+        return out
+
+    @staticmethod
+    def _apply_run(text: str, compiled: Tuple[_AhoCorasick, List[str], List[str]]) -> str:
+        automaton, surfaces, readings = compiled
+        matches = [(pid, end - len(surfaces[pid])) for end, pid in automaton.iter_matches(text)]
+        if not matches:
+            return text
+        # pid order == priority order; within a surface, leftmost first (str.replace semantics).
+        matches.sort()
+        locked = bytearray(len(text))
+        chosen: List[Tuple[int, int]] = []
+        for pid, start in matches:
+            end = start + len(surfaces[pid])
+            if any(locked[start:end]):
+                continue
+            locked[start:end] = b"\x01" * (end - start)
+            chosen.append((start, pid))
+        chosen.sort()
+        parts: List[str] = []
+        pos = 0
+        for start, pid in chosen:
+            parts.append(text[pos:start])
+            parts.append(readings[pid])
+            pos = start + len(surfaces[pid])
+        parts.append(text[pos:])
+        return "".join(parts)
+
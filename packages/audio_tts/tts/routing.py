@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from factory_common.paths import audio_pkg_root, script_pkg_root
 
@@ -34,11 +34,15 @@ class RoutingConfig:
     eleven_model_id_env: Optional[str]
     eleven_channel_voice_id: Dict[str, str]
     eleven_voice_alias: Dict[str, str]
+    # All VOICEVOX engines (same engine version/dictionary) for load balancing.
+    # Always starts with `voicevox_url`.
+    voicevox_urls: List[str] = field(default_factory=list)
 
 
 def load_routing_config(path: Path = CONFIG_PATH) -> RoutingConfig:
     data = json.loads(path.read_text(encoding="utf-8"))
     vv = data["voicevox"]
+    vv_urls = _voicevox_urls(vv)
     vp = data["voicepeak"]
     llm = data.get("llm", {})
     el = data.get("elevenlabs", {})
@@ -46,7 +50,7 @@ def load_routing_config(path: Path = CONFIG_PATH) -> RoutingConfig:
         engine_default=data.get("engine_default", "voicevox"),
         channel_override=data.get("channel_override", {}),
         script_override=data.get("script_override", {}),
-        voicevox_url=vv["url"],
+        voicevox_url=vv_urls[0],
         voicevox_speaker_env=vv["speaker_env"],
         voicevox_channel_speaker_env=vv.get("channel_speaker_env", {}),
         voicepeak_binary_path=vp["binary_path"],
@@ -64,9 +68,25 @@ def load_routing_config(path: Path = CONFIG_PATH) -> RoutingConfig:
         eleven_model_id_env=el.get("model_id_env"),
         eleven_channel_voice_id=el.get("channel_voice_id", {}),
         eleven_voice_alias=el.get("voice_alias", {}),
+        voicevox_urls=vv_urls,
     )
 
 
+def _voicevox_urls(vv: Dict[str, Any]) -> List[str]:
+    """
+    Engine URLs for VOICEVOX: `url` followed by optional `urls` from routing.json.
+    `VOICEVOX_URLS` (comma-separated) replaces the whole list when set (first entry = primary).
+    """
+    raw = (os.getenv("VOICEVOX_URLS") or "").strip()
+    candidates = raw.split(",") if raw else [vv["url"], *(vv.get("urls") or [])]
+    urls: List[str] = []
+    for u in candidates:
+        u = str(u or "").strip().rstrip("/")
+        if u and u not in urls:
+            urls.append(u)
+    return urls or [str(vv["url"]).rstrip("/")]
+
+
 def load_default_voice_config(channel: str) -> Optional[Dict[str, Any]]:
     """
     Load script_pipeline's per-channel `voice_config.json` and return the default voice entry.
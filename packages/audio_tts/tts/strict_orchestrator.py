@@ -8,6 +8,7 @@ from .strict_segmenter import strict_segmentation
 from .arbiter import resolve_readings_strict
 from .strict_synthesizer import strict_synthesis, generate_srt
 from .voicevox_api import VoicevoxClient
+from .voicevox_cache import wrap_client
 from .mecab_tokenizer import tokenize_with_mecab
 from .reading_structs import RubyToken, align_moras_with_tokens
 from .routing import load_default_voice_config, load_routing_config, resolve_voicevox_speaker_id
@@ -29,6 +30,7 @@ def run_strict_pipeline(
     resume: bool = False,
     prepass: bool = False,
     skip_tts_reading: bool = False,
+    synthesis_workers: Optional[int] = None,
 ) -> None:
     
     print(f"=== STRICT PIPELINE START ===")
@@ -47,7 +49,8 @@ def run_strict_pipeline(
     vv_client = None
     speaker_id = 0
     if engine == "voicevox":
-        vv_client = VoicevoxClient(engine_url=cfg.voicevox_url)
+        # audio_query/synthesis are shared via a content-addressed cache (arbiter/prepass -> synthesis/SRT).
+        vv_client = wrap_client(VoicevoxClient(engine_url=cfg.voicevox_urls or cfg.voicevox_url))
         # Use ID from voice_config if available, otherwise fallback to routing logic
         if voice_config and "voicevox_speaker_id" in voice_config:
             speaker_id = int(voice_config["voicevox_speaker_id"])
@@ -362,6 +365,7 @@ def run_strict_pipeline(
                 patches=patches_by_block,
                 channel=channel,
                 voicepeak_overrides=voicepeak_config,
+                synthesis_workers=synthesis_workers,
             )
         
         # 4. SRT Generation
@@ -462,6 +466,12 @@ def run_strict_pipeline(
         "segments": log_segments,
     }
     output_log.write_text(json.dumps(log_data, ensure_ascii=False, indent=2), encoding="utf-8")
+    if vv_client is not None and hasattr(vv_client, "cache_stats"):
+        print(f"[VOICEVOX_CACHE] {vv_client.cache_stats()}")
+        try:
+            vv_client.prune()
+        except Exception as e:
+            print(f"[WARN] VOICEVOX cache prune failed: {e}")
     print(f"=== PIPELINE FINISHED ===")
     if arbiter_error is not None:
         raise RuntimeError(str(arbiter_error)) from arbiter_error
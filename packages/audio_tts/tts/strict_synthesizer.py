@@ -1,13 +1,14 @@
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 import time
 import wave
 import struct
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from .strict_structure import AudioSegment
 from .voicevox_api import VoicevoxClient
-from .voicepeak_cli import synthesize_chunk
+from .voicepeak_cli import synthesize_chunk, voicepeak_slots
 from .reading_structs import KanaPatch
 from .synthesis import apply_kana_patches
 from .text_normalizer import normalize_text_for_tts
@@ -20,6 +21,84 @@ def generate_silence(duration_sec: float, frame_rate: int, sample_width: int, ch
     # PCM silence is just zeros (supports any sample width / channel count).
     return b"\x00" * (num_frames * int(sample_width) * int(channels))
 
+
+# Shared zero block for streamed silence (no per-pause allocation).
+_ZERO_BLOCK = bytes(256 * 1024)
+
+
+class StreamingWavWriter:
+    """
+    Append-only WAV writer for episode assembly.
+
+    Frames go straight to `<output>.partial` (the RIFF header is patched by `wave` on close) and the
+    file is moved into place only on `finalize()`, so a failed run never clobbers the previous WAV.
+    Peak memory is one chunk regardless of episode length; output bytes are identical to writing
+    the concatenated frames in one `writeframes` call.
+    """
+
+    def __init__(self, output_wav: Path) -> None:
+        self.output_wav = output_wav
+        self.tmp_path = output_wav.with_name(f".{output_wav.name}.partial")
+        self.fmt: Optional[tuple[int, int, int]] = None
+        self.bytes_written = 0
+        self._w: Optional[wave.Wave_write] = None
+
+    def open(self, nchannels: int, sampwidth: int, framerate: int) -> None:
+        self.output_wav.parent.mkdir(parents=True, exist_ok=True)
+        self._w = wave.open(str(self.tmp_path), "wb")
+        self._w.setnchannels(nchannels)
+        self._w.setsampwidth(sampwidth)
+        self._w.setframerate(framerate)
+        self.fmt = (nchannels, sampwidth, framerate)
+
+    def write(self, frames: bytes) -> None:
+        if not frames:
+            return
+        assert self._w is not None, "StreamingWavWriter.open() must be called first"
+        self._w.writeframesraw(frames)
+        self.bytes_written += len(frames)
+
+    def write_silence(self, duration_sec: float) -> None:
+        if duration_sec <= 0:
+            return
+        assert self.fmt is not None
+        nchannels, sampwidth, framerate = self.fmt
+        remaining = int(duration_sec * framerate) * int(sampwidth) * int(nchannels)
+        block = memoryview(_ZERO_BLOCK)
+        while remaining > 0:
+            n = min(remaining, len(block))
+            self.write(block[:n])
+            remaining -= n
+
+    def write_chunk_file(self, chunk_path: Path, *, block_frames: int = 65536) -> float:
+        """Copy a chunk WAV's frames into the output; returns its duration in seconds."""
+        with wave.open(str(chunk_path), "rb") as w:
+            nframes = w.getnframes()
+            while True:
+                frames = w.readframes(block_frames)
+                if not frames:
+                    break
+                self.write(frames)
+            return nframes / w.getframerate()
+
+    def finalize(self) -> None:
+        if self._w is None:
+            raise RuntimeError("No audio generated (output_fmt not set)")
+        if self.bytes_written == 0:
+            self._w.writeframes(b"")  # make sure the header exists for an all-empty episode
+        self._w.close()
+        self._w = None
+        os.replace(self.tmp_path, self.output_wav)
+
+    def abort(self) -> None:
+        if self._w is not None:
+            try:
+                self._w.close()
+            except Exception:
+                pass
+            self._w = None
+        self.tmp_path.unlink(missing_ok=True)
+
 def strict_synthesis(
     segments: List[AudioSegment],
     output_wav: Path,
@@ -32,6 +111,7 @@ def strict_synthesis(
     patches: Optional[Dict[int, List[KanaPatch]]] = None,
     channel: Optional[str] = None,
     voicepeak_overrides: Optional[Dict[str, Any]] = None,
+    synthesis_workers: Optional[int] = None,
 ) -> None:
     
     if engine not in ("voicevox", "voicepeak"):
@@ -57,7 +137,7 @@ def strict_synthesis(
         pitch_i = int(pitch) if pitch is not None else int(defaults["pitch"])
         emotion_s = str(emotion or "")
 
-        all_frames = bytearray()
+        writer = StreamingWavWriter(output_wav)
         chunks_dir = output_wav.parent / "chunks"
         chunks_dir.mkdir(parents=True, exist_ok=True)
         base_stem = output_wav.stem
@@ -67,7 +147,9 @@ def strict_synthesis(
         print(f"[SYNTHESIS] (voicepeak) narrator={narrator} speed={speed_i} pitch={pitch_i} emotion={emotion_s}", flush=True)
         print(f"[SYNTHESIS] Processing {len(segments)} segments...", flush=True)
 
-        for i, seg in enumerate(segments):
+        # 1. Decide which chunks need (re)generation.
+        to_render: List[int] = []
+        for i in range(len(segments)):
             chunk_path = chunks_dir / f"{base_stem}_part_{i:03d}.wav"
 
             # Check if we should skip regeneration
@@ -82,64 +164,83 @@ def strict_synthesis(
                 skip_regen = True
 
             if not skip_regen:
-                text_to_speak = normalize_text_for_tts((seg.reading or seg.text or "").strip())
-                if text_to_speak:
-                    synthesize_chunk(
-                        text=text_to_speak,
-                        out_wav=chunk_path,
-                        binary_path=binary_path,
-                        narrator=narrator,
-                        speed=speed_i,
-                        pitch=pitch_i,
-                        emotion=emotion_s,
-                    )
-                else:
-                    # Empty segment -> ensure chunk exists as silence placeholder (rare)
-                    chunk_path.parent.mkdir(parents=True, exist_ok=True)
-                    with wave.open(str(chunk_path), "wb") as w:
-                        w.setnchannels(1)
-                        w.setsampwidth(2)
-                        w.setframerate(24000)
-                        w.writeframes(b"")
-
-            # Load chunk (either regenerated or reused)
-            try:
-                with wave.open(str(chunk_path), "rb") as w:
-                    params = w.getparams()
-                    fmt = (params.nchannels, params.sampwidth, params.framerate, params.comptype, params.compname)
-                    frames = w.readframes(w.getnframes())
-                    seg.duration_sec = w.getnframes() / w.getframerate()
-            except Exception as e:
-                raise RuntimeError(f"[ERROR] Failed to load voicepeak chunk {chunk_path}: {e}") from e
+                to_render.append(i)
 
-            if output_fmt is None:
-                output_fmt = fmt
-            elif fmt != output_fmt:
-                raise RuntimeError(
-                    f"[ERROR] voicepeak WAV params mismatch at seg {i}: {fmt} != {output_fmt} ({chunk_path})"
+        def _render_voicepeak(i: int) -> None:
+            seg = segments[i]
+            chunk_path = chunks_dir / f"{base_stem}_part_{i:03d}.wav"
+            text_to_speak = normalize_text_for_tts((seg.reading or seg.text or "").strip())
+            if text_to_speak:
+                synthesize_chunk(
+                    text=text_to_speak,
+                    out_wav=chunk_path,
+                    binary_path=binary_path,
+                    narrator=narrator,
+                    speed=speed_i,
+                    pitch=pitch_i,
+                    emotion=emotion_s,
                 )
+            else:
+                # Empty segment -> ensure chunk exists as silence placeholder (rare)
+                chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                with wave.open(str(chunk_path), "wb") as w:
+                    w.setnchannels(1)
+                    w.setsampwidth(2)
+                    w.setframerate(24000)
+                    w.writeframes(b"")
+
+        # 2. Render: serial by default, one worker per CLI slot when VOICEPEAK_CLI_SLOTS > 1
+        slots = max(1, min(voicepeak_slots(), len(to_render)))
+        if to_render:
+            print(
+                f"[SYNTHESIS] Rendering {len(to_render)} segments (reuse={len(segments) - len(to_render)}) slots={slots}",
+                flush=True,
+            )
+        if slots <= 1:
+            for n, i in enumerate(to_render, start=1):
+                _render_voicepeak(i)
+                if n % 10 == 0:
+                    print(f"  ... GEN {n}/{len(to_render)}", flush=True)
+        else:
+            _, failed = _render_concurrently(to_render, _render_voicepeak, slots, thread_name_prefix="voicepeak-synth")
+            if failed is not None:
+                print(f"[ERROR] voicepeak synthesis failed for seg {failed[0]}: {failed[1]}", flush=True)
+                raise failed[1]
 
-            segment_frames = bytearray()
-            segment_frames.extend(generate_silence(seg.pre_pause_sec, params.framerate, params.sampwidth, params.nchannels))
-            segment_frames.extend(frames)
-            segment_frames.extend(generate_silence(seg.post_pause_sec, params.framerate, params.sampwidth, params.nchannels))
-            all_frames.extend(segment_frames)
-
-            if (i + 1) % 10 == 0:
-                status = "SKIP" if skip_regen else "GEN "
-                print(f"  ... {i+1}/{len(segments)} {status}", flush=True)
+        # 3. Ordered reassembly, streamed chunk by chunk
+        try:
+            for i, seg in enumerate(segments):
+                chunk_path = chunks_dir / f"{base_stem}_part_{i:03d}.wav"
+
+                # Check chunk format (either regenerated or reused)
+                try:
+                    with wave.open(str(chunk_path), "rb") as w:
+                        params = w.getparams()
+                        fmt = (params.nchannels, params.sampwidth, params.framerate, params.comptype, params.compname)
+                except Exception as e:
+                    raise RuntimeError(f"[ERROR] Failed to load voicepeak chunk {chunk_path}: {e}") from e
+
+                if output_fmt is None:
+                    output_fmt = fmt
+                    writer.open(params.nchannels, params.sampwidth, params.framerate)
+                elif fmt != output_fmt:
+                    raise RuntimeError(
+                        f"[ERROR] voicepeak WAV params mismatch at seg {i}: {fmt} != {output_fmt} ({chunk_path})"
+                    )
 
-        if output_fmt is None:
-            raise RuntimeError("No audio generated (output_fmt not set)")
+                writer.write_silence(seg.pre_pause_sec)
+                try:
+                    seg.duration_sec = writer.write_chunk_file(chunk_path)
+                except Exception as e:
+                    raise RuntimeError(f"[ERROR] Failed to load voicepeak chunk {chunk_path}: {e}") from e
+                writer.write_silence(seg.post_pause_sec)
 
-        out_channels, out_sampwidth, out_rate, _, _ = output_fmt
-        with wave.open(str(output_wav), "wb") as wf:
-            wf.setnchannels(out_channels)
-            wf.setsampwidth(out_sampwidth)
-            wf.setframerate(out_rate)
-            wf.writeframes(all_frames)
+            writer.finalize()
+        except BaseException:
+            writer.abort()
+            raise
 
-        print(f"[SYNTHESIS] Written {len(all_frames)} bytes to {output_wav}", flush=True)
+        print(f"[SYNTHESIS] Written {writer.bytes_written} bytes to {output_wav}", flush=True)
         return
 
     # -------------------------------------------------------------------------
@@ -150,15 +251,13 @@ def strict_synthesis(
     if not client:
         from .routing import load_routing_config
         cfg = load_routing_config()
-        client = VoicevoxClient(engine_url=cfg.voicevox_url)
+        client = VoicevoxClient(engine_url=cfg.voicevox_urls or cfg.voicevox_url)
     
     # Prepare Output Wave
     FRAME_RATE = 24000
     SAMPLE_WIDTH = 2
     CHANNELS = 1
     
-    all_frames = bytearray()
-    
     # Chunk directory setup
     chunks_dir = output_wav.parent / "chunks"
     chunks_dir.mkdir(parents=True, exist_ok=True)
@@ -184,9 +283,22 @@ def strict_synthesis(
 
     print(f"[SYNTHESIS] Params: Speed={speed}, Pitch={pitch}, Intonation={intonation}")
 
+    query_params = {
+        "speedScale": speed,
+        "pitchScale": pitch,
+        "intonationScale": intonation,
+        "volumeScale": volume,
+        "prePhonemeLength": pre_phoneme,
+        "postPhonemeLength": post_phoneme,
+    }
+
+    # 1. Decide which chunks need (re)generation. Resume semantics are unchanged:
+    #    reuse `chunks/*_part_NNN.wav` when allowed and loadable, otherwise regenerate.
+    reused: Dict[int, float] = {}
+    to_render: List[int] = []
     for i, seg in enumerate(segments):
         chunk_path = chunks_dir / f"{base_stem}_part_{i:03d}.wav"
-        
+
         # Check if we should skip regeneration
         skip_regen = False
         if target_indices is not None:
@@ -197,85 +309,180 @@ def strict_synthesis(
                     print(f"[WARN] Chunk {chunk_path.name} missing, forcing regeneration.")
         elif resume and chunk_path.exists():
             skip_regen = True
-        
-        segment_frames = bytearray()
-
-        # 1. Pre-pause
-        if seg.pre_pause_sec > 0:
-            segment_frames.extend(generate_silence(seg.pre_pause_sec, FRAME_RATE, SAMPLE_WIDTH, CHANNELS))
-            
-        # 2. Synthesis or Load
+
         if skip_regen:
             try:
                 with wave.open(str(chunk_path), 'rb') as w:
-                    frames = w.readframes(w.getnframes())
-                    segment_frames.extend(frames)
-                    # Update duration in segment object for SRT
-                    seg.duration_sec = w.getnframes() / w.getframerate()
+                    reused[i] = w.getnframes() / w.getframerate()
             except Exception as e:
                 print(f"[ERROR] Failed to load chunk {chunk_path}: {e}")
                 # Fallback to regen if load fails.
                 skip_regen = False
-         
-        if not skip_regen:
-            text_to_speak = normalize_text_for_tts(seg.reading or seg.text or "")
 
+        if not skip_regen:
+            to_render.append(i)
+
+    # 2. Synthesis (serial or bounded worker pool)
+    workers = _resolve_synthesis_workers(synthesis_workers, len(to_render))
+    retries = _env_int("VOICEVOX_SYNTH_RETRIES", 2, minimum=0)
+
+    def _render(i: int) -> float:
+        seg = segments[i]
+        seg_patches = (patches or {}).get(i) or []
+        if seg_patches:
+            print(f"  [PATCH] Applying {len(seg_patches)} kana patches to seg {i}")
+        return _render_voicevox_chunk(
+            client,
+            text=normalize_text_for_tts(seg.reading or seg.text or ""),
+            speaker_id=speaker_id,
+            query_params=query_params,
+            seg_patches=seg_patches,
+            chunk_path=chunks_dir / f"{base_stem}_part_{i:03d}.wav",
+            fmt=(CHANNELS, SAMPLE_WIDTH, FRAME_RATE),
+            retries=retries,
+        )
+
+    rendered: Dict[int, float] = {}
+    if to_render:
+        print(
+            f"[SYNTHESIS] Rendering {len(to_render)} segments (reuse={len(reused)}) "
+            f"workers={workers} engines={len(getattr(client, 'engines', None) or [client])}"
+        )
+    if workers <= 1:
+        for n, i in enumerate(to_render, start=1):
             try:
-                query = client.audio_query(text_to_speak, speaker_id)
-                query["speedScale"] = speed
-                query["pitchScale"] = pitch
-                query["intonationScale"] = intonation
-                query["volumeScale"] = volume
-                query["prePhonemeLength"] = pre_phoneme
-                query["postPhonemeLength"] = post_phoneme
-
-                # Layer 4: Apply Kana Patches if available
-                if patches and i in patches:
-                    seg_patches = patches[i]
-                    if seg_patches:
-                        print(f"  [PATCH] Applying {len(seg_patches)} kana patches to seg {i}")
-                        patched_phrases = apply_kana_patches(query.get("accent_phrases"), seg_patches)
-                        if patched_phrases is not None:
-                            query["accent_phrases"] = patched_phrases
-
-                wav_data = client.synthesis(query, speaker_id)
-                
-                # Save speech part to chunk file
-                with wave.open(io.BytesIO(wav_data), 'rb') as w:
-                    frames = w.readframes(w.getnframes())
-                    segment_frames.extend(frames)
-                    seg.duration_sec = w.getnframes() / w.getframerate()
-                    
-                    # Save pure speech chunk
-                    with wave.open(str(chunk_path), 'wb') as wc:
-                        wc.setnchannels(CHANNELS)
-                        wc.setsampwidth(SAMPLE_WIDTH)
-                        wc.setframerate(FRAME_RATE)
-                        wc.writeframes(frames)
-                    
+                rendered[i] = _render(i)
             except Exception as e:
                 print(f"[ERROR] Synthesis failed for seg {i}: {e}")
                 raise RuntimeError(f"Synthesis failed at segment {i}") from e
-            
-        # 3. Post-pause
-        if seg.post_pause_sec > 0:
-            segment_frames.extend(generate_silence(seg.post_pause_sec, FRAME_RATE, SAMPLE_WIDTH, CHANNELS))
-            
-        all_frames.extend(segment_frames)
-        
-        # Progress
-        if (i+1) % 10 == 0:
-             status = "SKIP" if skip_regen else "GEN "
-             print(f"  ... {i+1}/{len(segments)} {status}")
-
-    # Write Final Combined File
-    with wave.open(str(output_wav), 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(SAMPLE_WIDTH)
-        wf.setframerate(FRAME_RATE)
-        wf.writeframes(all_frames)
-        
-    print(f"[SYNTHESIS] Written {len(all_frames)} bytes to {output_wav}")
+            if n % 10 == 0:
+                print(f"  ... GEN {n}/{len(to_render)}")
+    else:
+        results, failed = _render_concurrently(to_render, _render, workers, thread_name_prefix="voicevox-synth")
+        rendered.update(results)
+        if failed is not None:
+            print(f"[ERROR] Synthesis failed for seg {failed[0]}: {failed[1]}")
+            raise RuntimeError(f"Synthesis failed at segment {failed[0]}") from failed[1]
+
+    # 3. Ordered reassembly, streamed chunk by chunk (identical layout for serial/parallel runs)
+    writer = StreamingWavWriter(output_wav)
+    writer.open(CHANNELS, SAMPLE_WIDTH, FRAME_RATE)
+    try:
+        for i, seg in enumerate(segments):
+            chunk_path = chunks_dir / f"{base_stem}_part_{i:03d}.wav"
+            writer.write_silence(seg.pre_pause_sec)
+            chunk_duration = writer.write_chunk_file(chunk_path)
+            # Regenerated segments keep the engine-reported duration (same as the serial path).
+            seg.duration_sec = rendered[i] if i in rendered else reused.get(i, chunk_duration)
+            writer.write_silence(seg.post_pause_sec)
+        writer.finalize()
+    except BaseException:
+        writer.abort()
+        raise
+
+    print(f"[SYNTHESIS] Written {writer.bytes_written} bytes to {output_wav}")
+    if to_render and hasattr(client, "stats"):
+        print(f"[SYNTHESIS] Engine stats: {client.stats()}")
+
+
+def _render_concurrently(
+    indices: List[int],
+    render: Callable[[int], Any],
+    workers: int,
+    *,
+    thread_name_prefix: str,
+) -> tuple[Dict[int, Any], Optional[tuple[int, Exception]]]:
+    """
+    Run `render(i)` for each index on a bounded thread pool.
+    Returns (results, failed): `failed` is the lowest failing (index, exception). On the first failure
+    pending work is cancelled; chunks already written stay reusable via --resume.
+    """
+    results: Dict[int, Any] = {}
+    failed: Optional[tuple[int, Exception]] = None
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as pool:
+        futures = {pool.submit(render, i): i for i in indices}
+        for n, fut in enumerate(as_completed(futures), start=1):
+            i = futures[fut]
+            if fut.cancelled():
+                continue
+            try:
+                results[i] = fut.result()
+            except Exception as e:
+                if failed is None or i < failed[0]:
+                    failed = (i, e)
+                for other in futures:
+                    other.cancel()
+                continue
+            if n % 10 == 0:
+                print(f"  ... GEN {n}/{len(indices)}", flush=True)
+    return results, failed
+
+
+def _env_int(key: str, default: int, *, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(str(os.getenv(key, str(default))).strip()))
+    except Exception:
+        return default
+
+
+def _resolve_synthesis_workers(requested: Optional[int], pending: int) -> int:
+    """
+    Worker count for VOICEVOX synthesis.
+    Default is serial (1); opt in via `synthesis_workers=` or `VOICEVOX_SYNTH_WORKERS`.
+    """
+    workers = int(requested) if requested is not None else _env_int("VOICEVOX_SYNTH_WORKERS", 1)
+    return max(1, min(workers, pending or 1))
+
+
+def _render_voicevox_chunk(
+    client: VoicevoxClient,
+    *,
+    text: str,
+    speaker_id: int,
+    query_params: Dict[str, Any],
+    seg_patches: List[KanaPatch],
+    chunk_path: Path,
+    fmt: tuple[int, int, int],
+    retries: int,
+) -> float:
+    """
+    audio_query + synthesis for one segment, then persist the pure speech chunk.
+    Returns duration_sec. Retries transient engine errors with backoff.
+    """
+    channels, sampwidth, framerate = fmt
+    attempt = 0
+    while True:
+        try:
+            query = client.audio_query(text, speaker_id)
+            query.update(query_params)
+
+            # Layer 4: Apply Kana Patches if available
+            if seg_patches:
+                patched_phrases = apply_kana_patches(query.get("accent_phrases"), seg_patches)
+                if patched_phrases is not None:
+                    query["accent_phrases"] = patched_phrases
+
+            wav_data = client.synthesis(query, speaker_id)
+            with wave.open(io.BytesIO(wav_data), 'rb') as w:
+                frames = w.readframes(w.getnframes())
+                duration = w.getnframes() / w.getframerate()
+            break
+        except Exception as e:
+            if attempt >= retries:
+                raise
+            attempt += 1
+            print(f"  [RETRY] {chunk_path.name} attempt {attempt}/{retries}: {e}")
+            time.sleep(min(8.0, 0.5 * (2 ** (attempt - 1))))
+
+    # Save pure speech chunk atomically so an interrupted run never leaves a truncated chunk for --resume.
+    tmp_path = chunk_path.with_name(f".{chunk_path.name}.tmp")
+    with wave.open(str(tmp_path), 'wb') as wc:
+        wc.setnchannels(channels)
+        wc.setsampwidth(sampwidth)
+        wc.setframerate(framerate)
+        wc.writeframes(frames)
+    os.replace(tmp_path, chunk_path)
+    return duration
 
 
 def generate_srt(
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import wave
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence
 import struct
 from contextlib import contextmanager
 
@@ -62,10 +64,7 @@ def _voicepeak_global_lock():
         yield
         return
 
-    lock_path = Path(
-        (os.getenv("VOICEPEAK_CLI_LOCK_PATH") or "").strip()
-        or (Path(tempfile.gettempdir()) / "factory_voicepeak_cli.lock")
-    )
+    lock_path = _base_lock_path()
     try:
         lock_path.parent.mkdir(parents=True, exist_ok=True)
     except Exception:
@@ -86,6 +85,144 @@ def _voicepeak_global_lock():
             pass
 
 
+# ---------------------------------------------------------------------------
+# Multi-slot mode (opt-in): N concurrent CLI instances
+# ---------------------------------------------------------------------------
+#
+# Env:
+# - VOICEPEAK_CLI_SLOTS=N                    -> allow N concurrent CLI calls (default: 1 = global lock)
+# - VOICEPEAK_CLI_SLOT_ISOLATE_HOME=0/1      -> run slots >=1 with their own HOME (default: 1)
+# - VOICEPEAK_CLI_SLOT_HOME_ROOT=/path       -> parent dir for slot HOMEs (default: <tmp>/factory_voicepeak_slots)
+# - VOICEPEAK_CLI_SLOT_HOME_SEED=/path       -> directory copied into a fresh slot HOME (e.g. licensed app settings)
+# - VOICEPEAK_CLI_SLOT_MAX_FAILURES=3        -> consecutive failures before a slot is quarantined
+# - VOICEPEAK_CLI_SLOT_QUARANTINE_SEC=60     -> quarantine duration
+#
+# Slot 0 shares the legacy lock file/HOME, so single-slot runs behave exactly as before.
+
+_SLOT_GUARD = threading.Lock()
+_SLOT_THREAD_LOCKS: Dict[int, threading.Lock] = {}
+_SLOT_STATS: Dict[int, Dict[str, float]] = {}
+
+
+def voicepeak_slots() -> int:
+    return max(1, _env_int("VOICEPEAK_CLI_SLOTS", 1))
+
+
+def _base_lock_path() -> Path:
+    return Path(
+        (os.getenv("VOICEPEAK_CLI_LOCK_PATH") or "").strip()
+        or (Path(tempfile.gettempdir()) / "factory_voicepeak_cli.lock")
+    )
+
+
+def _slot_lock_path(slot: int) -> Path:
+    base = _base_lock_path()
+    return base if slot == 0 else base.with_name(f"{base.name}.slot{slot}")
+
+
+def _slot_stat(slot: int) -> Dict[str, float]:
+    return _SLOT_STATS.setdefault(
+        slot, {"runs": 0, "failures": 0, "consecutive_failures": 0, "busy_sec": 0.0, "quarantined_until": 0.0}
+    )
+
+
+def slot_stats() -> Dict[int, Dict[str, float]]:
+    with _SLOT_GUARD:
+        return {k: dict(v) for k, v in sorted(_SLOT_STATS.items())}
+
+
+def _record_slot_result(slot: int, *, ok: bool, busy_sec: float) -> None:
+    with _SLOT_GUARD:
+        st = _slot_stat(slot)
+        st["runs"] += 1
+        st["busy_sec"] += busy_sec
+        if ok:
+            st["consecutive_failures"] = 0
+            return
+        st["failures"] += 1
+        st["consecutive_failures"] += 1
+        if st["consecutive_failures"] >= max(1, _env_int("VOICEPEAK_CLI_SLOT_MAX_FAILURES", 3)):
+            st["quarantined_until"] = time.monotonic() + max(0.0, _env_float("VOICEPEAK_CLI_SLOT_QUARANTINE_SEC", 60.0))
+            st["consecutive_failures"] = 0
+
+
+def _slot_candidates(n: int, avoid: Sequence[int]) -> List[int]:
+    now = time.monotonic()
+    with _SLOT_GUARD:
+        healthy = [k for k in range(n) if _slot_stat(k)["quarantined_until"] <= now]
+    preferred = [k for k in healthy if k not in avoid]
+    # Never deadlock on bookkeeping: fall back to any healthy slot, then to all slots.
+    return preferred or healthy or list(range(n))
+
+
+def _slot_env(slot: int) -> Optional[Dict[str, str]]:
+    """Per-slot environment (isolated HOME for slots >= 1); None = inherit."""
+    if slot == 0 or not _env_truthy("VOICEPEAK_CLI_SLOT_ISOLATE_HOME", True):
+        return None
+    root = Path(
+        (os.getenv("VOICEPEAK_CLI_SLOT_HOME_ROOT") or "").strip()
+        or (Path(tempfile.gettempdir()) / "factory_voicepeak_slots")
+    )
+    home = root / f"slot{slot}"
+    if not home.exists():
+        seed = (os.getenv("VOICEPEAK_CLI_SLOT_HOME_SEED") or "").strip()
+        if seed and Path(seed).is_dir():
+            shutil.copytree(seed, home, dirs_exist_ok=True)
+        home.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env["HOME"] = str(home)
+    return env
+
+
+@contextmanager
+def _voicepeak_slot_lock(avoid: Sequence[int] = ()) -> Iterator[int]:
+    """
+    Acquire one of N CLI slots (in-process lock + cross-process flock per slot) and yield its index.
+    With a single slot this is the legacy global lock.
+    """
+    n = voicepeak_slots()
+    if n <= 1:
+        with _voicepeak_global_lock():
+            yield 0
+        return
+
+    try:
+        import fcntl  # type: ignore
+    except Exception:
+        fcntl = None  # type: ignore
+    use_flock = fcntl is not None and _env_truthy("VOICEPEAK_CLI_GLOBAL_LOCK", True)
+
+    while True:
+        for slot in _slot_candidates(n, avoid):
+            with _SLOT_GUARD:
+                tlock = _SLOT_THREAD_LOCKS.setdefault(slot, threading.Lock())
+            if not tlock.acquire(blocking=False):
+                continue
+            f = None
+            try:
+                if use_flock:
+                    lock_path = _slot_lock_path(slot)
+                    lock_path.parent.mkdir(parents=True, exist_ok=True)
+                    f = lock_path.open("a", encoding="utf-8")
+                    try:
+                        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        f.close()
+                        f = None
+                        continue
+                yield slot
+                return
+            finally:
+                if f is not None:
+                    try:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+                    except Exception:
+                        pass
+                    f.close()
+                tlock.release()
+        time.sleep(0.05)
+
+
 def _normalize_narrator_name(name: str) -> str:
     """
     Voicepeak CLI on macOS is unstable when narrator contains non-ASCII (e.g. '女性2').
@@ -304,10 +441,24 @@ def _run_voicepeak_line(
             cmd.extend(["-e", emotion])
 
         last_err: VoicepeakCLIError | None = None
+        failed_slots: List[int] = []
         for attempt in range(retry_count + 1):
             try:
-                with _voicepeak_global_lock():
-                    completed = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_sec)
+                # Retries prefer a different slot (per-slot crash recovery in multi-slot mode).
+                with _voicepeak_slot_lock(avoid=failed_slots) as slot:
+                    started = time.monotonic()
+                    try:
+                        completed = subprocess.run(
+                            cmd, capture_output=True, text=True, timeout=timeout_sec, env=_slot_env(slot)
+                        )
+                    except subprocess.TimeoutExpired:
+                        _record_slot_result(slot, ok=False, busy_sec=time.monotonic() - started)
+                        failed_slots.append(slot)
+                        raise
+                    ok = completed.returncode == 0 and out_wav.exists()
+                    _record_slot_result(slot, ok=ok, busy_sec=time.monotonic() - started)
+                    if not ok:
+                        failed_slots.append(slot)
             except subprocess.TimeoutExpired as exc:
                 last_err = VoicepeakCLIError(
                     "\n".join(
@@ -1,35 +1,98 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 # requests is optional; fall back to urllib when not installed.
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
-    import json
-    import urllib.parse
-    import urllib.request
+    HTTPAdapter = None  # type: ignore
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+# (connect, read) seconds. audio_query is cheap; synthesis of a long segment can take a while.
+QUERY_TIMEOUT: Tuple[float, float] = (3.0, 30.0)
+SYNTHESIS_TIMEOUT: Tuple[float, float] = (3.0, 120.0)
+PROBE_TIMEOUT: Tuple[float, float] = (1.0, 3.0)
+# How long an unhealthy engine is skipped before it is probed again (`GET /version`).
+UNHEALTHY_COOLDOWN_SEC = 15.0
+
+
+@dataclass
+class EngineState:
+    url: str
+    outstanding: int = 0
+    requests: int = 0
+    errors: int = 0
+    latency_sec_total: float = 0.0
+    bytes_in: int = 0
+    healthy: bool = True
+    unhealthy_since: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        ok = max(0, self.requests - self.errors)
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.latency_sec_total * 1000.0 / ok, 1) if ok else None,
+            "bytes_in": self.bytes_in,
+        }
 
 
 class VoicevoxClient:
-    """Minimal VOICEVOX HTTP client (audio_query + synthesis)."""
+    """
+    VOICEVOX HTTP client (audio_query + synthesis).
 
-    def __init__(self, engine_url: str = "http://127.0.0.1:50021") -> None:
-        self.base = engine_url.rstrip("/")
+    - Keeps one pooled keep-alive `requests.Session` per client (thread-safe for concurrent calls).
+    - Accepts one engine URL or a list; each request goes to the healthy engine with the fewest
+      outstanding requests. With several engines, `health_check()` runs before the first dispatch
+      so engines that are down never get a request. Engines that fail at the transport level are
+      skipped for `UNHEALTHY_COOLDOWN_SEC` (the request is retried on the next engine) and are
+      probed again before they get traffic back.
+    - `stats()` exposes per-engine latency/throughput counters.
+    """
 
-    def audio_query(self, text: str, speaker: int) -> Dict[str, Any]:
-        url = f"{self.base}/audio_query"
+    def __init__(
+        self,
+        engine_url: Union[str, Sequence[str]] = "http://127.0.0.1:50021",
+        *,
+        pool_maxsize: int = 16,
+    ) -> None:
+        urls = [engine_url] if isinstance(engine_url, str) else list(engine_url)
+        urls = [str(u).strip().rstrip("/") for u in urls if str(u or "").strip()]
+        if not urls:
+            raise ValueError("VoicevoxClient requires at least one engine URL")
+        self.engines: List[EngineState] = [EngineState(url=u) for u in dict.fromkeys(urls)]
+        self.base = self.engines[0].url
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._checked = len(self.engines) < 2
+        self._session = None
         if requests is not None:
-            resp = requests.post(url, params={"text": text, "speaker": speaker})
-            resp.raise_for_status()
-            return resp.json()
-        params = urllib.parse.urlencode({"text": text, "speaker": speaker})
-        req = urllib.request.Request(f"{url}?{params}", method="POST")
-        with urllib.request.urlopen(req, timeout=10) as r:  # noqa: S310
-            if r.status != 200:
-                raise RuntimeError(f"VOICEVOX audio_query failed: {r.status}")
-            return json.loads(r.read().decode("utf-8"))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(self.engines), pool_maxsize=max(1, int(pool_maxsize)))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def audio_query(self, text: str, speaker: int) -> Dict[str, Any]:
+        body = self._post("/audio_query", {"text": text, "speaker": speaker}, None, QUERY_TIMEOUT)
+        return json.loads(body.decode("utf-8"))
 
     def get_kana(self, text: str, speaker: int) -> str:
         """Return kana string from audio_query response."""
@@ -37,16 +100,143 @@ class VoicevoxClient:
         return str(query.get("kana") or "")
 
     def synthesis(self, audio_query: Dict[str, Any], speaker: int) -> bytes:
-        url = f"{self.base}/synthesis"
-        if requests is not None:
-            resp = requests.post(url, params={"speaker": speaker}, json=audio_query)
+        return self._post("/synthesis", {"speaker": speaker}, audio_query, SYNTHESIS_TIMEOUT)
+
+    def version(self, engine_url: Optional[str] = None) -> str:
+        url = (engine_url or self.base).rstrip("/")
+        return str(json.loads(self._send("GET", url, "/version", None, None, QUERY_TIMEOUT).decode("utf-8")))
+
+    def health_check(self) -> Dict[str, bool]:
+        """Probe every engine (`GET /version`) and update its health flag."""
+        return {eng.url: self._probe(eng) for eng in self.engines}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            engines = [e.snapshot() for e in self.engines]
+        elapsed = max(1e-6, time.monotonic() - self._started_at)
+        total = sum(e["requests"] for e in engines)
+        return {
+            "requests": total,
+            "errors": sum(e["errors"] for e in engines),
+            "requests_per_sec": round(total / elapsed, 2),
+            "engines": engines,
+        }
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def _probe(self, eng: EngineState) -> bool:
+        try:
+            self._send("GET", eng.url, "/version", None, None, PROBE_TIMEOUT)
+            ok = True
+        except Exception:
+            ok = False
+        with self._lock:
+            eng.healthy = ok
+            eng.unhealthy_since = 0.0 if ok else time.monotonic()
+        return ok
+
+    def _acquire(self, exclude: Sequence[EngineState]) -> Optional[EngineState]:
+        with self._lock:
+            first, self._checked = not self._checked, True
+        if first:
+            self.health_check()
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                e for e in self.engines
+                if e not in exclude and not e.healthy and now - e.unhealthy_since >= UNHEALTHY_COOLDOWN_SEC
+            ]
+            for e in due:
+                e.unhealthy_since = now  # claim the probe; concurrent callers keep skipping the engine
+        for e in due:
+            self._probe(e)
+        with self._lock:
+            candidates = [e for e in self.engines if e not in exclude]
+            healthy = [e for e in candidates if e.healthy] or candidates
+            if not healthy:
+                return None
+            eng = min(healthy, key=lambda e: (e.outstanding, e.requests))
+            eng.outstanding += 1
+            eng.requests += 1
+            return eng
+
+    def _release(self, eng: EngineState, *, started: float, nbytes: int, error: Optional[str]) -> None:
+        with self._lock:
+            eng.outstanding -= 1
+            if error is None:
+                eng.latency_sec_total += time.monotonic() - started
+                eng.bytes_in += nbytes
+                eng.healthy = True
+            else:
+                eng.errors += 1
+                if error == "transport":
+                    eng.healthy = False
+                    eng.unhealthy_since = time.monotonic()
+
+    def _post(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        payload: Optional[Dict[str, Any]],
+        timeout: Tuple[float, float],
+    ) -> bytes:
+        tried: List[EngineState] = []
+        last_exc: Optional[Exception] = None
+        while True:
+            eng = self._acquire(tried)
+            if eng is None:
+                assert last_exc is not None
+                raise last_exc
+            tried.append(eng)
+            started = time.monotonic()
+            try:
+                body = self._send("POST", eng.url, path, params, payload, timeout)
+            except Exception as exc:
+                transport = _is_transport_error(exc)
+                self._release(eng, started=started, nbytes=0, error="transport" if transport else "http")
+                if not transport:
+                    raise
+                last_exc = exc
+                continue
+            self._release(eng, started=started, nbytes=len(body), error=None)
+            return body
+
+    def _send(
+        self,
+        method: str,
+        base: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        payload: Optional[Dict[str, Any]],
+        timeout: Tuple[float, float],
+    ) -> bytes:
+        url = f"{base}{path}"
+        if self._session is not None:
+            resp = self._session.request(method, url, params=params, json=payload, timeout=timeout)
             resp.raise_for_status()
             return resp.content
-        params = urllib.parse.urlencode({"speaker": speaker})
-        body = json.dumps(audio_query, ensure_ascii=False).encode("utf-8")
-        req = urllib.request.Request(f"{url}?{params}", data=body, method="POST")
-        req.add_header("Content-Type", "application/json")
-        with urllib.request.urlopen(req, timeout=30) as r:  # noqa: S310
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+        req = urllib.request.Request(url, data=data, method=method)
+        if data is not None:
+            req.add_header("Content-Type", "application/json")
+        with urllib.request.urlopen(req, timeout=sum(timeout)) as r:  # noqa: S310
             if r.status != 200:
-                raise RuntimeError(f"VOICEVOX synthesis failed: {r.status}")
+                raise RuntimeError(f"VOICEVOX {path} failed: {r.status}")
             return r.read()
+
+
+def _is_transport_error(exc: Exception) -> bool:
+    """Connection-level failures (engine down/unreachable) vs. HTTP errors from a live engine."""
+    if requests is not None and isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, urllib.error.HTTPError):
+        return False
+    return isinstance(exc, (urllib.error.URLError, ConnectionError, TimeoutError))
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from factory_common.paths import audio_artifacts_root
+
+from .voicevox_api import VoicevoxClient
+from .voicevox_user_dict import VoicevoxUserDictClient
+
+SCHEMA_VERSION = 1
+
+# In-process memo of recently used query JSON (bounded; the on-disk cache is the source of truth).
+QUERY_MEMO_MAX = 2048
+
+# NOTE:
+# Content-addressed cache for VOICEVOX `audio_query` JSON and rendered `synthesis` WAV bytes.
+# The arbiter (reading audit / --prepass), strict_synthesis and SRT weighting all issue the same
+# audio_query calls for unchanged text, so one shared cache lets a prepass followed by a full run,
+# or a partial redo, reuse every unchanged artifact instead of re-querying the engine.
+#
+# Keys:
+# - engine fingerprint: engine version + digest of the engine's official user dictionary
+#   (user-dict edits change readings, so they must invalidate cached queries)
+# - audio_query: (engine fingerprint, speaker, text)
+# - synthesis:   (engine fingerprint, speaker, final query JSON)
+#   The final query already carries the normalized text's accent phrases, the voice params
+#   (speed/pitch/...) and any kana patches, so it is the exact synthesis input.
+#
+# Env toggles:
+# - VOICEVOX_CACHE_DISABLE=1      -> disable entirely (plain client behavior)
+# - VOICEVOX_CACHE_DIR=/path      -> override cache dir (default: workspaces/audio/cache/voicevox)
+# - VOICEVOX_CACHE_MAX_MB=...     -> byte budget enforced by prune() (default: 4096, 0 = unlimited)
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def cache_enabled() -> bool:
+    return not _truthy_env("VOICEVOX_CACHE_DISABLE")
+
+
+def cache_dir() -> Path:
+    raw = (os.getenv("VOICEVOX_CACHE_DIR") or "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return audio_artifacts_root() / "cache" / "voicevox"
+
+
+def _max_bytes() -> int:
+    raw = (os.getenv("VOICEVOX_CACHE_MAX_MB") or "").strip()
+    try:
+        return max(0, int(raw)) * 1024 * 1024 if raw else 4096 * 1024 * 1024
+    except Exception:
+        return 4096 * 1024 * 1024
+
+
+def _digest(obj: Any) -> str:
+    raw = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def engine_fingerprint(client: VoicevoxClient) -> str:
+    """Engine version + user-dict digest of the primary engine (all engines are assumed identical)."""
+    version = client.version()
+    try:
+        words = VoicevoxUserDictClient(client.base).list_words()
+    except Exception:
+        words = None
+    return _digest({"version": version, "user_dict": words})[:16]
+
+
+class CachedVoicevoxClient:
+    """
+    Drop-in wrapper around VoicevoxClient that serves audio_query/synthesis from the on-disk cache.
+
+    Cached query dicts are returned as fresh copies (callers mutate them before synthesis).
+    If the engine fingerprint cannot be computed, calls pass straight through.
+    """
+
+    def __init__(self, client: VoicevoxClient, root: Optional[Path] = None) -> None:
+        self.client = client
+        self.root = Path(root) if root is not None else cache_dir()
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self._fingerprint_failed = False
+        self._queries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.counters: Dict[str, int] = {"query_hit": 0, "query_miss": 0, "synth_hit": 0, "synth_miss": 0}
+
+    # Keep the VoicevoxClient surface (base/engines/stats/version/...) available to callers.
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _engine_dir(self) -> Optional[Path]:
+        if self._fingerprint is None and not self._fingerprint_failed:
+            with self._lock:
+                if self._fingerprint is None and not self._fingerprint_failed:
+                    try:
+                        self._fingerprint = engine_fingerprint(self.client)
+                    except Exception as exc:
+                        print(f"[VOICEVOX_CACHE] disabled for this run (engine fingerprint failed: {exc})")
+                        self._fingerprint_failed = True
+        return self.root / self._fingerprint if self._fingerprint else None
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def audio_query(self, text: str, speaker: int) -> Dict[str, Any]:
+        base = self._engine_dir()
+        if base is None:
+            return self.client.audio_query(text, speaker)
+        digest = _digest({"schema": SCHEMA_VERSION, "kind": "audio_query", "speaker": int(speaker), "text": text})
+        raw = self._memo_get(digest)
+        path = base / "query" / digest[:2] / f"{digest}.json"
+        if raw is None and path.exists():
+            try:
+                raw = path.read_bytes()
+                json.loads(raw.decode("utf-8"))
+                # LRU signal for prune(); memo hits below skip it (already touched by this run).
+                os.utime(path)
+            except Exception:
+                raw = None
+        if raw is not None:
+            self._memo_put(digest, raw)
+            self._count("query_hit")
+            return json.loads(raw.decode("utf-8"))
+
+        self._count("query_miss")
+        query = self.client.audio_query(text, speaker)
+        raw = json.dumps(query, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._memo_put(digest, raw)
+        try:
+            _atomic_write(path, raw)
+        except Exception:
+            pass
+        return json.loads(raw.decode("utf-8"))
+
+    def _memo_get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            raw = self._queries.get(digest)
+            if raw is not None:
+                self._queries.move_to_end(digest)
+            return raw
+
+    def _memo_put(self, digest: str, raw: bytes) -> None:
+        with self._lock:
+            self._queries[digest] = raw
+            self._queries.move_to_end(digest)
+            while len(self._queries) > QUERY_MEMO_MAX:
+                self._queries.popitem(last=False)
+
+    def get_kana(self, text: str, speaker: int) -> str:
+        """Return kana string from audio_query response."""
+        query = self.audio_query(text, speaker)
+        return str(query.get("kana") or "")
+
+    def synthesis(self, audio_query: Dict[str, Any], speaker: int) -> bytes:
+        base = self._engine_dir()
+        if base is None:
+            return self.client.synthesis(audio_query, speaker)
+        digest = _digest({"schema": SCHEMA_VERSION, "kind": "synthesis", "speaker": int(speaker), "query": audio_query})
+        path = base / "wav" / digest[:2] / f"{digest}.wav"
+        if path.exists():
+            try:
+                data = path.read_bytes()
+                if data[:4] == b"RIFF":
+                    os.utime(path)  # LRU signal for prune()
+                    self._count("synth_hit")
+                    return data
+            except Exception:
+                pass
+
+        self._count("synth_miss")
+        data = self.client.synthesis(audio_query, speaker)
+        try:
+            _atomic_write(path, data)
+        except Exception:
+            pass
+        return data
+
+    def cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"fingerprint": self._fingerprint, **self.counters}
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict least-recently-used entries (WAVs and query JSON) until the cache fits the byte budget.
+
+        Hits refresh the entry's mtime, so mtime order is LRU order. Returns bytes freed.
+        """
+        budget = _max_bytes() if max_bytes is None else max(0, int(max_bytes))
+        if not budget or not self.root.exists():
+            return 0
+        entries: List[tuple[float, int, Path]] = []
+        total = 0
+        paths = itertools.chain(self.root.glob("*/wav/*/*.wav"), self.root.glob("*/query/*/*.json"))
+        for p in paths:
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+        freed = 0
+        for _mtime, size, p in sorted(entries):
+            if total - freed <= budget:
+                break
+            try:
+                p.unlink()
+                freed += size
+            except OSError:
+                continue
+        return freed
+
+
+def wrap_client(client: Optional[VoicevoxClient]) -> Optional[Any]:
+    """Wrap `client` with the shared cache unless disabled (VOICEVOX_CACHE_DISABLE=1)."""
+    if client is None or not cache_enabled() or isinstance(client, CachedVoicevoxClient):
+        return client
+    return CachedVoicevoxClient(client)
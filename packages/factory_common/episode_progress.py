@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+from factory_common import workspace_index
 from factory_common.path_ref import is_path_ref, resolve_path_ref
 from factory_common.paths import (
     audio_final_dir,
@@ -413,6 +414,10 @@ def _resolve_episode_from_timeline_manifest(run_dir: Path) -> Optional[tuple[str
         return None
     data = _safe_read_json(tm)
     ep_raw = data.get("episode") if isinstance(data.get("episode"), dict) else {}
+    return _episode_from_manifest_episode(ep_raw)
+
+
+def _episode_from_manifest_episode(ep_raw: Any) -> Optional[tuple[str, str]]:
     if isinstance(ep_raw, dict):
         ep_id = str(ep_raw.get("id") or "").strip()
         ep = parse_episode_id(ep_id)
@@ -437,6 +442,36 @@ def index_run_candidates(
     if not root.exists():
         return out
 
+    if workspace_index.index_enabled():
+        runs = workspace_index.video_runs_index(root).units()
+        for name in sorted(runs):
+            entry = runs[name]
+            if not include_hidden_runs and name.startswith(("_", ".")):
+                continue
+            ep = parse_episode_id(name)
+            resolved = (ep.channel, ep.video) if ep else _episode_from_manifest_episode(entry.get("tm_episode"))
+            if not resolved or resolved[0] != ch:
+                continue
+            vid2 = resolved[1]
+            if wanted and vid2 not in wanted:
+                continue
+            run_dir = root / name
+            capcut_status, capcut_target, capcut_exists = _capcut_draft_status(run_dir / "capcut_draft")
+            out.setdefault(vid2, []).append(
+                RunCandidate(
+                    run_id=name,
+                    run_dir=run_dir,
+                    has_timeline_manifest=bool(entry.get("has_timeline_manifest")),
+                    capcut_draft_status=capcut_status,
+                    capcut_draft_target=capcut_target,
+                    capcut_draft_target_exists=capcut_exists,
+                    capcut_draft_info_mtime=float(entry.get("capcut_draft_info_mtime") or 0.0),
+                    mtime=float(entry.get("mtime") or 0.0),
+                )
+            )
+        _sort_run_candidates(out)
+        return out
+
     for run_dir in sorted(root.iterdir()):
         if not run_dir.is_dir():
             continue
@@ -474,6 +509,11 @@ def index_run_candidates(
             )
         )
 
+    _sort_run_candidates(out)
+    return out
+
+
+def _sort_run_candidates(out: dict[str, list[RunCandidate]]) -> None:
     for vid, items in out.items():
         items.sort(
             key=lambda c: (
@@ -485,7 +525,6 @@ def index_run_candidates(
             ),
             reverse=True,
         )
-    return out
 
 
 def build_episode_progress_view(
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import select
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# NOTE:
+# Minimal non-blocking inotify wrapper (Linux, via ctypes; no third-party watcher dependency).
+# Callers own the event loop: `read_events()` drains whatever the kernel queued so far, so a reader
+# that drains before answering always observes writes that completed before it (read-your-writes),
+# without a background thread. Elsewhere (macOS, or when inotify/watch limits are unavailable)
+# `InotifyWatcher.create()` returns None and callers fall back to polling/rescans.
+#
+# Env toggles:
+# - YTM_FS_WATCH_DISABLE=1 -> never use inotify (callers poll)
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+DEFAULT_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def watch_enabled() -> bool:
+    return (os.getenv("YTM_FS_WATCH_DISABLE") or "").strip().lower() not in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class FsEvent:
+    path: Path  # watched dir / name (the watched dir itself when name is empty)
+    mask: int
+
+    @property
+    def is_dir(self) -> bool:
+        return bool(self.mask & IN_ISDIR)
+
+    @property
+    def overflow(self) -> bool:
+        return bool(self.mask & IN_Q_OVERFLOW)
+
+    @property
+    def moved(self) -> bool:
+        return bool(self.mask & (IN_MOVED_FROM | IN_MOVED_TO | IN_MOVE_SELF))
+
+
+class InotifyWatcher:
+    """Directory watches on one inotify fd. Not thread-safe: guard with the caller's lock."""
+
+    def __init__(self, fd: int, libc) -> None:
+        self._fd = fd
+        self._libc = libc
+        self._paths: Dict[int, Path] = {}
+        self._wds: Dict[Path, int] = {}
+
+    @classmethod
+    def create(cls) -> Optional["InotifyWatcher"]:
+        if not sys.platform.startswith("linux") or not watch_enabled():
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except Exception:
+            return None
+        if fd < 0:
+            return None
+        return cls(fd, libc)
+
+    @property
+    def closed(self) -> bool:
+        return self._fd < 0
+
+    def __len__(self) -> int:
+        return len(self._wds)
+
+    def add(self, path: Path, mask: int = DEFAULT_MASK) -> bool:
+        """Watch one directory (not recursive). False when the watch could not be added."""
+        if self._fd < 0:
+            return False
+        p = Path(path)
+        if p in self._wds:
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(p)), mask | IN_ONLYDIR)
+        if wd < 0:
+            return False
+        self._wds[p] = wd
+        self._paths[wd] = p
+        return True
+
+    def watching(self, path: Path) -> bool:
+        return Path(path) in self._wds
+
+    def read_events(self, timeout: float = 0.0) -> List[FsEvent]:
+        """Drain queued events (waiting up to `timeout` seconds for the first one)."""
+        if self._fd < 0:
+            return []
+        out: List[FsEvent] = []
+        wait = max(0.0, float(timeout))
+        while True:
+            try:
+                ready, _, _ = select.select([self._fd], [], [], wait)
+            except (OSError, ValueError):
+                return out
+            if not ready:
+                return out
+            wait = 0.0
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return out
+            except OSError:
+                return out
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buf[offset : offset + length].split(b"\0", 1)[0]
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    out.append(FsEvent(path=Path("/"), mask=mask))
+                    continue
+                base = self._paths.get(wd)
+                if base is None:
+                    continue
+                if mask & IN_IGNORED:
+                    # Watch removed by the kernel (dir deleted / unmounted).
+                    self._paths.pop(wd, None)
+                    if self._wds.get(base) == wd:
+                        self._wds.pop(base, None)
+                    continue
+                name = os.fsdecode(raw_name)
+                out.append(FsEvent(path=(base / name) if name else base, mask=mask))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = -1
+        self._paths.clear()
+        self._wds.clear()
+
+    def __del__(self) -> None:
+        self.close()
@@ -25,6 +25,8 @@ import yaml
 
 from factory_common import paths as repo_paths
 from factory_common import fireworks_keys
+from factory_common import image_rate_limiter
+from factory_common import segmented_log
 from factory_common.routing_lockdown import lockdown_active
 
 IMAGE_MODEL_KEY_BLOCKLIST = {
@@ -282,6 +284,8 @@ def _set_provider_cooldown(provider: str, *, cooldown_sec: int) -> None:
         if prev is None or until > prev:
             _COOLDOWN_UNTIL_BY_PROVIDER[provider] = until
             _persist_cooldowns_to_disk()
+    # Adaptive per-provider admission rate (see image_rate_limiter.py).
+    image_rate_limiter.record_throttle(provider)
 
 
 def _extract_http_status(exc: Exception) -> Optional[int]:
@@ -758,7 +762,14 @@ class ImageClient:
                 for sub_attempt in range(max_attempts):
                     try:
                         adapter = self._get_adapter(model_key, model_conf)
+                        image_rate_limiter.admit(provider_name, model_key)
+                        call_started = time.perf_counter()
                         result = adapter.generate(model_conf, resolved)
+                        image_rate_limiter.record_success(
+                            provider_name, model_key, latency_sec=time.perf_counter() - call_started
+                        )
+                        # "<provider>:<model_key>" of the model that served (limiter bucket / image-store key).
+                        result.metadata["served_by"] = image_rate_limiter.bucket_key(provider_name, model_key)
                         duration_ms = int((time.perf_counter() - started_at) * 1000)
                         self._log_usage(
                             success=True,
@@ -847,7 +858,14 @@ class ImageClient:
             for sub_attempt in range(max_attempts):
                 try:
                     adapter = self._get_adapter(model_key, model_conf)
+                    image_rate_limiter.admit(provider_name, model_key)
+                    call_started = time.perf_counter()
                     result = adapter.generate(model_conf, resolved)
+                    image_rate_limiter.record_success(
+                        provider_name, model_key, latency_sec=time.perf_counter() - call_started
+                    )
+                    # "<provider>:<model_key>" of the model that served (limiter bucket / image-store key).
+                    result.metadata["served_by"] = image_rate_limiter.bucket_key(provider_name, model_key)
                     duration_ms = int((time.perf_counter() - started_at) * 1000)
                     # round-robin: next call starts after the successful model
                     self._persist_round_robin_index(tier_name, model_key, candidates)
@@ -1029,8 +1047,7 @@ class ImageClient:
                 payload["attempt"] = attempt
             if errors:
                 payload["errors"] = errors
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            segmented_log.append_jsonl(log_path, payload)
         except Exception as exc:  # pragma: no cover - logging must not break generation
             logging.debug("ImageClient: failed to write usage log (%s)", exc)
 
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from factory_common import paths as repo_paths
+
+try:  # POSIX only; elsewhere the state is still shared via the file, just without a lock.
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+# NOTE:
+# Image generation used one module-global "N requests per 60s" window for every provider, and
+# waiting workers slept inside the thread pool, so one throttled provider stalled the whole batch.
+# Requests are now admitted by one token bucket per provider/model ("<provider>:<model_key>"):
+# - rate starts at the operator ceiling (SRT2IMAGES_IMAGE_MAX_PER_MINUTE) and never exceeds it
+# - a 429/quota error (ImageClient._set_provider_cooldown) halves the rate of every bucket of that
+#   provider and drains its tokens; each success adds the rate back additively (AIMD)
+# - successes whose latency is far above the best seen (provider saturating) do not raise the rate
+# - bucket state lives in one JSON file (flock-guarded), so parallel runs share the budget
+# - callers open an `admission()` block; ImageClient takes the token (`admit`) for the model it actually
+#   calls, so tier round-robin is charged to the serving bucket and cache hits never take a token
+#
+# Env toggles:
+# - IMAGE_RATE_LIMIT_ADAPTIVE_DISABLE=1  -> legacy fixed per-minute window (process-local)
+# - IMAGE_RATE_LIMIT_STATE_PATH=/path    -> override state file (default: workspaces/logs/image_rate_limits.json)
+# - IMAGE_RATE_LIMIT_MIN_PER_MINUTE=1    -> floor the adaptive rate may drop to
+STATE_SCHEMA = "ytm.image_rate_limits.v1"
+
+_RECOVERY_PER_SUCCESS = 0.5  # requests/min added back per success
+_SLOW_LATENCY_FACTOR = 3.0
+_LATENCY_ALPHA = 0.3
+_IDLE_RESET_SEC = 6 * 3600  # forget adapted rates after a long idle period
+
+_LOCAL_LOCK = threading.Lock()
+
+
+def adaptive_enabled() -> bool:
+    return (os.getenv("IMAGE_RATE_LIMIT_ADAPTIVE_DISABLE") or "").strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def state_path() -> Path:
+    raw = (os.getenv("IMAGE_RATE_LIMIT_STATE_PATH") or "").strip()
+    if raw:
+        return Path(raw)
+    return repo_paths.logs_root() / "image_rate_limits.json"
+
+
+def _min_per_minute() -> float:
+    try:
+        return max(0.1, float(os.getenv("IMAGE_RATE_LIMIT_MIN_PER_MINUTE") or "1"))
+    except ValueError:
+        return 1.0
+
+
+def bucket_key(provider: Optional[str], model_key: Optional[str]) -> str:
+    return f"{(provider or '').strip() or 'unknown'}:{(model_key or '').strip() or '*'}"
+
+
+@dataclass
+class BucketState:
+    ceiling_per_min: float
+    rate_per_min: float
+    tokens: float
+    updated_at: float
+    ewma_latency_sec: Optional[float] = None
+    best_latency_sec: Optional[float] = None
+    successes: int = 0
+    throttles: int = 0
+
+    @property
+    def capacity(self) -> float:
+        # Small burst: ~10s worth of the ceiling (at least one request).
+        return max(1.0, self.ceiling_per_min / 6.0)
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_min / 60.0)
+        self.updated_at = now
+
+
+@contextmanager
+def _locked_state() -> Iterator[Dict[str, BucketState]]:
+    """Load all buckets under an exclusive (thread + process) lock; changes are written back."""
+    path = state_path()
+    with _LOCAL_LOCK:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_suffix(path.suffix + ".lock"), "a+") as lock_fh:
+            if fcntl is not None:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            try:
+                buckets: Dict[str, BucketState] = {}
+                try:
+                    raw = json.loads(path.read_text(encoding="utf-8") or "{}")
+                    for key, val in (raw.get("buckets") or {}).items():
+                        try:
+                            buckets[str(key)] = BucketState(**val)
+                        except TypeError:
+                            continue
+                except (FileNotFoundError, ValueError, AttributeError):
+                    pass
+                before = {k: asdict(v) for k, v in buckets.items()}
+                yield buckets
+                after = {k: asdict(v) for k, v in buckets.items()}
+                if after != before:
+                    tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+                    tmp.write_text(
+                        json.dumps({"schema": STATE_SCHEMA, "buckets": after}, ensure_ascii=False),
+                        encoding="utf-8",
+                    )
+                    os.replace(tmp, path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+
+def _bucket(buckets: Dict[str, BucketState], key: str, ceiling_per_min: float, now: float) -> BucketState:
+    ceiling = max(_min_per_minute(), float(ceiling_per_min))
+    b = buckets.get(key)
+    if b is None or now - b.updated_at > _IDLE_RESET_SEC:
+        b = BucketState(ceiling_per_min=ceiling, rate_per_min=ceiling, tokens=0.0, updated_at=now)
+        b.tokens = b.capacity
+        buckets[key] = b
+    if b.ceiling_per_min != ceiling:
+        b.ceiling_per_min = ceiling
+        b.rate_per_min = min(b.rate_per_min, ceiling)
+    b.refill(now)
+    return b
+
+
+def try_acquire(key: str, *, ceiling_per_min: float) -> float:
+    """Take one request token for `key`. Returns 0.0 when granted, else seconds until one is available."""
+    now = time.time()
+    with _locked_state() as buckets:
+        b = _bucket(buckets, key, ceiling_per_min, now)
+        if b.tokens >= 1.0:
+            b.tokens -= 1.0
+            return 0.0
+        return max(0.05, (1.0 - b.tokens) * 60.0 / max(b.rate_per_min, 1e-6))
+
+
+def acquire(key: str, *, ceiling_per_min: float) -> float:
+    """Block until a token for `key` is granted. Returns the seconds waited."""
+    waited = 0.0
+    while True:
+        wait = try_acquire(key, ceiling_per_min=ceiling_per_min)
+        if wait <= 0:
+            return waited
+        time.sleep(wait)
+        waited += wait
+
+
+def refund(key: str) -> None:
+    """Return one unused token to `key` (e.g. granted at dispatch, then served by another model)."""
+    if not state_path().exists():
+        return
+    try:
+        with _locked_state() as buckets:
+            b = buckets.get(key)
+            if b is None:
+                return
+            b.refill(time.time())
+            b.tokens = min(b.capacity, b.tokens + 1.0)
+    except Exception:
+        return
+
+
+_ADMISSION = threading.local()
+
+
+@contextmanager
+def admission(ceiling_per_min: float, *, granted: Optional[str] = None) -> Iterator[None]:
+    """
+    Rate-limit the image calls made by this thread inside the block (see `admit`).
+
+    `granted`: bucket whose token the caller already took at dispatch time; it is used by the first
+    call to that bucket and refunded when the block ends unused (store hit, other model served).
+    """
+    prev = getattr(_ADMISSION, "ctx", None)
+    ctx = {"ceiling": float(ceiling_per_min), "granted": granted}
+    _ADMISSION.ctx = ctx
+    try:
+        yield
+    finally:
+        _ADMISSION.ctx = prev
+        if ctx["granted"]:
+            refund(str(ctx["granted"]))
+
+
+def admit(provider: Optional[str], model_key: Optional[str]) -> float:
+    """Take a token for the model about to be called (no-op outside `admission`). Returns seconds waited."""
+    ctx = getattr(_ADMISSION, "ctx", None)
+    if ctx is None or not adaptive_enabled():
+        return 0.0
+    key = bucket_key(provider, model_key)
+    if ctx["granted"] == key:
+        ctx["granted"] = None
+        return 0.0
+    return acquire(key, ceiling_per_min=ctx["ceiling"])
+
+
+def record_success(provider: Optional[str], model_key: Optional[str], *, latency_sec: float) -> None:
+    """Feed a successful generation: additive rate recovery unless the provider is slowing down."""
+    if not adaptive_enabled():
+        return
+    key = bucket_key(provider, model_key)
+    if not state_path().exists():
+        return  # no caller has been rate limited yet (e.g. direct ImageClient use)
+    try:
+        with _locked_state() as buckets:
+            b = buckets.get(key)
+            if b is None:
+                return
+            lat = max(0.0, float(latency_sec))
+            b.successes += 1
+            b.best_latency_sec = lat if b.best_latency_sec is None else min(b.best_latency_sec, lat)
+            prev = b.ewma_latency_sec
+            b.ewma_latency_sec = lat if prev is None else (_LATENCY_ALPHA * lat + (1 - _LATENCY_ALPHA) * prev)
+            slow = b.best_latency_sec > 0 and b.ewma_latency_sec > _SLOW_LATENCY_FACTOR * b.best_latency_sec
+            if not slow:
+                b.rate_per_min = min(b.ceiling_per_min, b.rate_per_min + _RECOVERY_PER_SUCCESS)
+    except Exception:
+        # Fail-soft: rate feedback must never break generation.
+        return
+
+
+def record_throttle(provider: Optional[str]) -> None:
+    """Feed a 429/quota response: halve every bucket of `provider` and drain its tokens."""
+    if not adaptive_enabled() or not provider:
+        return
+    prefix = bucket_key(provider, None)[: -len("*")]
+    floor = _min_per_minute()
+    if not state_path().exists():
+        return
+    try:
+        with _locked_state() as buckets:
+            now = time.time()
+            for key, b in buckets.items():
+                if not key.startswith(prefix):
+                    continue
+                b.refill(now)
+                b.rate_per_min = max(floor, b.rate_per_min / 2.0)
+                b.tokens = 0.0
+                b.throttles += 1
+    except Exception:
+        # Fail-soft: rate feedback must never break generation.
+        return
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    """Current bucket states (for logs/diagnostics)."""
+    with _locked_state() as buckets:
+        return {k: asdict(v) for k, v in buckets.items()}
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from factory_common.agent_mode import PROJECT_ROOT, compute_task_id
 from factory_common.paths import logs_root
@@ -28,6 +32,16 @@ SCHEMA_VERSION = 1
 # - LLM_API_CACHE_EXCLUDE_TASKS=csv     -> additional exact task excludes
 # - LLM_API_CACHE_EXCLUDE_PREFIXES=csv  -> additional prefix excludes
 # - LLM_API_CACHE_PURGE_EXPIRED=1       -> delete expired entries
+# - LLM_API_CACHE_MAX_MB=...            -> byte budget; least-recently-used entries are evicted on write
+#                                          (default: 2048, 0 = unlimited)
+# - LLM_API_CACHE_MEMORY_ENTRIES=...    -> in-process memory tier size (parsed entries; default: 256, 0 = off)
+# - LLM_API_CACHE_INDEX_DISABLE=1       -> no SQLite index (plain files; no eviction / access tracking)
+#
+# Layout:
+# - Entries stay one JSON file per request (`<task>/<xx>/<digest>.json`), so paths in logs remain valid.
+# - `index.sqlite3` (WAL) in the cache dir tracks bytes / last access / hits per entry; it drives LRU
+#   eviction and `scripts/ops/llm_api_cache.py` (stats/inspect/compact/reindex). Entries written before
+#   the index existed are indexed on their next hit (or via `reindex`).
 #
 # Default behavior:
 # - Enabled (unless *_DISABLE=1)
@@ -119,6 +133,261 @@ def cache_path(task_id: str) -> Path:
     return base / digest[:2] / f"{digest}.json"
 
 
+def _max_bytes() -> int:
+    raw = (os.getenv("LLM_API_CACHE_MAX_MB") or "").strip()
+    try:
+        mb = max(0, int(raw)) if raw else 2048
+    except Exception:
+        mb = 2048
+    return mb * 1024 * 1024
+
+
+def _memory_entries() -> int:
+    raw = (os.getenv("LLM_API_CACHE_MEMORY_ENTRIES") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else 256
+    except Exception:
+        return 256
+
+
+def _index_enabled() -> bool:
+    return not _truthy_env("LLM_API_CACHE_INDEX_DISABLE")
+
+
+# ---------------------------------------------------------------------------
+# Metrics + memory tier (process-local)
+# ---------------------------------------------------------------------------
+
+_LOCK = threading.Lock()
+_COUNTERS: Dict[str, int] = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "misses": 0,
+    "expired": 0,
+    "writes": 0,
+    "bytes_written": 0,
+    "bytes_read": 0,
+    "evicted": 0,
+    "bytes_evicted": 0,
+}
+# task_id -> (entry, file mtime, last index touch)
+_MEMORY: "OrderedDict[str, Tuple[Dict[str, Any], float, float]]" = OrderedDict()
+_TOUCH_INTERVAL_SEC = 60.0
+
+
+def _count(key: str, n: int = 1) -> None:
+    with _LOCK:
+        _COUNTERS[key] = _COUNTERS.get(key, 0) + n
+
+
+def _memory_get(task_id: str) -> Optional[Tuple[Dict[str, Any], float, float]]:
+    with _LOCK:
+        ent = _MEMORY.get(task_id)
+        if ent is not None:
+            _MEMORY.move_to_end(task_id)
+        return ent
+
+
+def _memory_put(task_id: str, obj: Dict[str, Any], mtime: float, touched: float) -> None:
+    limit = _memory_entries()
+    if limit <= 0:
+        return
+    with _LOCK:
+        _MEMORY[task_id] = (obj, mtime, touched)
+        _MEMORY.move_to_end(task_id)
+        while len(_MEMORY) > limit:
+            _MEMORY.popitem(last=False)
+
+
+def _memory_drop(task_id: str) -> None:
+    with _LOCK:
+        _MEMORY.pop(task_id, None)
+
+
+def clear_memory_tier() -> None:
+    with _LOCK:
+        _MEMORY.clear()
+
+
+# ---------------------------------------------------------------------------
+# SQLite index (bytes / last access / hits per entry)
+# ---------------------------------------------------------------------------
+
+_INDEX_FILENAME = "index.sqlite3"
+_LOCAL = threading.local()
+
+
+def index_path() -> Path:
+    return cache_dir() / _INDEX_FILENAME
+
+
+def _index_conn() -> Optional[sqlite3.Connection]:
+    """Thread-local connection to the index for the current cache dir (None when disabled/unavailable)."""
+    if not _index_enabled():
+        return None
+    path = index_path()
+    conns: Dict[str, sqlite3.Connection] = getattr(_LOCAL, "conns", None) or {}
+    _LOCAL.conns = conns
+    key = str(path)
+    conn = conns.get(key)
+    if conn is not None:
+        return conn
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(key, timeout=10.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " task_id TEXT PRIMARY KEY,"
+            " task TEXT NOT NULL,"
+            " path TEXT NOT NULL,"
+            " bytes INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access)")
+    except Exception:
+        return None
+    conns[key] = conn
+    return conn
+
+
+def _rel_path(path: Path) -> str:
+    try:
+        return str(path.relative_to(cache_dir()))
+    except Exception:
+        return str(path)
+
+
+def _index_upsert(task_id: str, task: str, path: Path, size: int, *, created_at: float, hit: bool) -> None:
+    conn = _index_conn()
+    if conn is None:
+        return
+    now = time.time()
+    try:
+        conn.execute(
+            "INSERT INTO entries(task_id, task, path, bytes, created_at, last_access, hits) VALUES(?,?,?,?,?,?,?)"
+            " ON CONFLICT(task_id) DO UPDATE SET bytes=excluded.bytes, path=excluded.path,"
+            " created_at=excluded.created_at, last_access=excluded.last_access, hits=entries.hits + excluded.hits",
+            (task_id, task, _rel_path(path), int(size), float(created_at), now, 1 if hit else 0),
+        )
+    except Exception:
+        pass
+
+
+def _index_touch(task_id: str) -> bool:
+    """Record a hit. Returns False if the entry is not indexed yet."""
+    conn = _index_conn()
+    if conn is None:
+        return True
+    try:
+        cur = conn.execute(
+            "UPDATE entries SET last_access=?, hits=hits + 1 WHERE task_id=?",
+            (time.time(), task_id),
+        )
+        return cur.rowcount > 0
+    except Exception:
+        return True
+
+
+def _index_delete(task_ids: List[str]) -> None:
+    conn = _index_conn()
+    if conn is None or not task_ids:
+        return
+    try:
+        conn.executemany("DELETE FROM entries WHERE task_id=?", [(t,) for t in task_ids])
+    except Exception:
+        pass
+
+
+def evict(max_bytes: Optional[int] = None, *, low_watermark: float = 0.9) -> Dict[str, int]:
+    """
+    Evict least-recently-used entries until the indexed total fits the byte budget.
+    Stops at `low_watermark * budget` so eviction doesn't run on every write near the cap.
+    """
+    budget = _max_bytes() if max_bytes is None else max(0, int(max_bytes))
+    out = {"evicted": 0, "bytes_evicted": 0}
+    conn = _index_conn()
+    if conn is None or budget <= 0:
+        return out
+    try:
+        total = int(conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0])
+        if total <= budget:
+            return out
+        target = int(budget * low_watermark)
+        root = cache_dir()
+        victims: List[str] = []
+        for task_id, rel, size in conn.execute("SELECT task_id, path, bytes FROM entries ORDER BY last_access ASC"):
+            if total <= target:
+                break
+            try:
+                (root / rel).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception:
+                continue
+            victims.append(task_id)
+            total -= int(size or 0)
+            out["evicted"] += 1
+            out["bytes_evicted"] += int(size or 0)
+        _index_delete(victims)
+        for task_id in victims:
+            _memory_drop(task_id)
+    except Exception:
+        return out
+    _count("evicted", out["evicted"])
+    _count("bytes_evicted", out["bytes_evicted"])
+    return out
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Process counters + index totals (entries/bytes/budget)."""
+    with _LOCK:
+        stats: Dict[str, Any] = dict(_COUNTERS)
+        stats["memory_entries"] = len(_MEMORY)
+    stats["max_bytes"] = _max_bytes()
+    conn = _index_conn()
+    if conn is not None:
+        try:
+            n, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+            stats["indexed_entries"] = int(n)
+            stats["indexed_bytes"] = int(total)
+        except Exception:
+            pass
+    lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+    stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else None
+    return stats
+
+
+def _load_entry(path: Path, task_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        raw = path.read_text(encoding="utf-8")
+        obj = json.loads(raw)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    if obj.get("schema_version") != SCHEMA_VERSION:
+        return None
+    if obj.get("task_id") != task_id:
+        return None
+    _count("bytes_read", len(raw))
+    return obj
+
+
+def _expire(path: Path, task_id: str) -> None:
+    _count("expired")
+    _memory_drop(task_id)
+    if _purge_expired():
+        try:
+            path.unlink()
+        except Exception:
+            pass
+        _index_delete([task_id])
+
+
 def read_cache(task: str, messages: List[Dict[str, str]], options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if _truthy_env("LLM_API_CACHE_READ_DISABLE"):
         return None
@@ -130,35 +399,45 @@ def read_cache(task: str, messages: List[Dict[str, str]], options: Dict[str, Any
     except Exception:
         return None
     path = cache_path(task_id)
-    if not path.exists():
-        return None
-
     ttl = _ttl_sec()
-    if ttl:
-        try:
-            age = time.time() - path.stat().st_mtime
-            if age > ttl:
-                if _purge_expired():
-                    try:
-                        path.unlink()
-                    except Exception:
-                        pass
-                return None
-        except Exception:
-            # If we can't stat, don't trust it.
+    now = time.time()
+
+    # 1. Memory tier: no stat/read/parse on hot prompts (copies keep callers from mutating the tier).
+    ent = _memory_get(task_id)
+    if ent is not None:
+        obj, mtime, touched = ent
+        if ttl and now - mtime > ttl:
+            _expire(path, task_id)
             return None
+        if now - touched >= _TOUCH_INTERVAL_SEC:
+            _index_touch(task_id)
+            _memory_put(task_id, obj, mtime, now)
+        _count("memory_hits")
+        return copy.deepcopy(obj)
 
+    # 2. Disk
     try:
-        obj = json.loads(path.read_text(encoding="utf-8"))
-        if not isinstance(obj, dict):
-            return None
-        if obj.get("schema_version") != SCHEMA_VERSION:
-            return None
-        if obj.get("task_id") != task_id:
-            return None
-        return obj
+        st = path.stat()
+    except FileNotFoundError:
+        _count("misses")
+        return None
     except Exception:
+        # If we can't stat, don't trust it.
+        _count("misses")
         return None
+    if ttl and now - st.st_mtime > ttl:
+        _expire(path, task_id)
+        return None
+
+    obj = _load_entry(path, task_id)
+    if obj is None:
+        _count("misses")
+        return None
+    if not _index_touch(task_id):
+        _index_upsert(task_id, task, path, st.st_size, created_at=st.st_mtime, hit=True)
+    _memory_put(task_id, obj, st.st_mtime, now)
+    _count("disk_hits")
+    return copy.deepcopy(obj)
 
 
 def write_cache(task: str, messages: List[Dict[str, str]], options: Dict[str, Any], payload: Dict[str, Any]) -> Optional[Path]:
@@ -180,10 +459,106 @@ def write_cache(task: str, messages: List[Dict[str, str]], options: Dict[str, An
         **payload,
     }
     try:
+        data = json.dumps(out, ensure_ascii=False, separators=(",", ":")) + "\n"
         path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(json.dumps(out, ensure_ascii=False, separators=(",", ":")) + "\n", encoding="utf-8")
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(data, encoding="utf-8")
         tmp.replace(path)
-        return path
     except Exception:
         return None
+    size = len(data.encode("utf-8"))
+    now = time.time()
+    _count("writes")
+    _count("bytes_written", size)
+    _index_upsert(task_id, task, path, size, created_at=now, hit=False)
+    # Parsed copy for the memory tier (the same request is often re-read within a run).
+    _memory_put(task_id, json.loads(data), now, now)
+    evict()
+    return path
+
+
+def reindex() -> Dict[str, int]:
+    """Scan the cache dir and (re)build index rows; drops rows whose file is gone."""
+    out = {"indexed": 0, "dropped": 0}
+    conn = _index_conn()
+    if conn is None:
+        return out
+    root = cache_dir()
+    seen: set[str] = set()
+    for p in root.glob("*/*/*.json"):
+        try:
+            obj = json.loads(p.read_text(encoding="utf-8"))
+            st = p.stat()
+        except Exception:
+            continue
+        if not isinstance(obj, dict) or not obj.get("task_id"):
+            continue
+        task_id = str(obj["task_id"])
+        seen.add(task_id)
+        try:
+            conn.execute(
+                "INSERT INTO entries(task_id, task, path, bytes, created_at, last_access, hits) VALUES(?,?,?,?,?,?,0)"
+                " ON CONFLICT(task_id) DO UPDATE SET bytes=excluded.bytes, path=excluded.path",
+                (task_id, str(obj.get("task") or p.parent.parent.name), _rel_path(p), st.st_size, st.st_mtime, st.st_mtime),
+            )
+            out["indexed"] += 1
+        except Exception:
+            continue
+    stale = [row[0] for row in conn.execute("SELECT task_id FROM entries") if row[0] not in seen]
+    _index_delete(stale)
+    out["dropped"] = len(stale)
+    return out
+
+
+def compact(max_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """reindex -> evict to budget (no low watermark) -> purge stray tmp files -> VACUUM."""
+    report: Dict[str, Any] = {"reindex": reindex()}
+    report["evict"] = evict(max_bytes, low_watermark=1.0)
+    tmp_removed = 0
+    for p in cache_dir().glob("*/*/.*.tmp"):
+        try:
+            if time.time() - p.stat().st_mtime > 3600:
+                p.unlink()
+                tmp_removed += 1
+        except Exception:
+            continue
+    report["tmp_removed"] = tmp_removed
+    conn = _index_conn()
+    if conn is not None:
+        try:
+            conn.execute("VACUUM")
+        except Exception:
+            pass
+    return report
+
+
+def inspect_entries(*, task: Optional[str] = None, order: str = "last_access", limit: int = 20) -> List[Dict[str, Any]]:
+    conn = _index_conn()
+    if conn is None:
+        return []
+    order_sql = {"last_access": "last_access DESC", "hits": "hits DESC", "bytes": "bytes DESC", "oldest": "last_access ASC"}.get(
+        order, "last_access DESC"
+    )
+    sql = "SELECT task_id, task, path, bytes, created_at, last_access, hits FROM entries"
+    args: List[Any] = []
+    if task:
+        sql += " WHERE task=?"
+        args.append(task)
+    sql += f" ORDER BY {order_sql} LIMIT ?"
+    args.append(int(limit))
+    cols = ("task_id", "task", "path", "bytes", "created_at", "last_access", "hits")
+    return [dict(zip(cols, row)) for row in conn.execute(sql, args)]
+
+
+def task_summary() -> List[Dict[str, Any]]:
+    conn = _index_conn()
+    if conn is None:
+        return []
+    rows = conn.execute(
+        "SELECT task, COUNT(*), COALESCE(SUM(bytes), 0), COALESCE(SUM(hits), 0), MAX(last_access)"
+        " FROM entries GROUP BY task ORDER BY SUM(bytes) DESC"
+    )
+    return [
+        {"task": t, "entries": int(n), "bytes": int(b), "hits": int(h), "last_access": la}
+        for t, n, b, h, la in rows
+    ]
@@ -18,6 +18,7 @@ from factory_common.agent_mode import (
     results_path,
     select_runbook,
 )
+from factory_common import segmented_log
 from factory_common.paths import logs_root
 
 
@@ -37,9 +38,7 @@ def _append_jsonl(path: Path, payload: Dict[str, Any]) -> None:
     if os.getenv("LLM_ROUTER_LOG_DISABLE") == "1" or os.getenv("LLM_USAGE_LOG_DISABLE") == "1":
         return
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        segmented_log.append_jsonl(path, payload)
     except Exception:
         return
 
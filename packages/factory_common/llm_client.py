@@ -378,8 +378,8 @@ class LLMClient:
         if extra:
             entry.update(extra)
         try:
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            from factory_common import segmented_log
+
+            segmented_log.append_jsonl(log_path, entry)
         except Exception:  # best-effort logging
             pass
@@ -6,12 +6,17 @@ import json
 import hashlib
 import logging
 import inspect
+import functools
 import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Union
 from pathlib import Path
 from dotenv import load_dotenv
 
+from factory_common import segmented_log
 from factory_common.llm_param_guard import sanitize_params
 from factory_common.agent_mode import maybe_handle_agent_mode
 from factory_common.llm_api_cache import (
@@ -56,6 +61,13 @@ _FIREWORKS_BUDGET_STATE: Dict[str, Any] = {
     "total": {"calls": 0, "tokens": 0},
     "per_routing_key": {},
 }
+# Serializes lease refresh/rotation/release across concurrent calls sharing the router singleton.
+# Each in-flight Fireworks call holds a reference on the lease it runs on (`_FIREWORKS_CALL_LEASE`);
+# a lease is released only when its last holder finishes, even if the router rotated away from it.
+_FIREWORKS_LEASE_LOCK = threading.RLock()
+_FIREWORKS_CALL_LEASE: "contextvars.ContextVar[Optional[Any]]" = contextvars.ContextVar(
+    "llm_router_fireworks_call_lease", default=None
+)
 
 def _env_truthy(name: str, default: str = "0") -> bool:
     raw = (os.getenv(name) or "").strip()
@@ -346,6 +358,77 @@ def _lazy_import_genai():
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("LLMRouter")
 
+# ---------------------------------------------------------------------------
+# Concurrency (acall / call_many)
+# ---------------------------------------------------------------------------
+# NOTE:
+# LLMRouter is a process-wide singleton. Provider SDK clients are created once and share one persistent
+# HTTP connection pool per provider (kept across Fireworks key rotation), so concurrent requests reuse
+# warm connections instead of opening a new pool per client.
+# `acall()` / `call_many()` run the regular `call()` path on worker threads, so the fallback chain,
+# API cache, Fireworks key leases and budget checks behave exactly like `call()`.
+# In-flight requests are capped per provider by a semaphore around each provider request.
+#
+# Env toggles:
+# - LLM_ROUTER_MAX_WORKERS=16                 -> worker threads for acall()/call_many() (default: 16)
+# - LLM_ROUTER_PROVIDER_CONCURRENCY=4         -> default in-flight requests per provider (default: 4)
+# - LLM_ROUTER_PROVIDER_CONCURRENCY_<NAME>=N  -> per-provider override (e.g. LLM_ROUTER_PROVIDER_CONCURRENCY_FIREWORKS=2)
+# `providers.<name>.max_concurrency` in configs/llm_router.yaml is honored when no env override is set.
+
+_CONCURRENCY_LOCK = threading.Lock()
+_PROVIDER_SEMAPHORES: Dict[str, Any] = {}
+_HTTP_CLIENTS: Dict[str, Any] = {}
+_ASYNC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _router_max_workers() -> int:
+    return _env_int("LLM_ROUTER_MAX_WORKERS") or 16
+
+
+def _async_executor() -> ThreadPoolExecutor:
+    global _ASYNC_EXECUTOR
+    with _CONCURRENCY_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=_router_max_workers(), thread_name_prefix="llm-router")
+        return _ASYNC_EXECUTOR
+
+
+@contextmanager
+def _provider_slot(provider: str, limit: int) -> Iterator[None]:
+    """Hold one of `limit` in-flight slots for `provider` (process-wide)."""
+    key = str(provider or "")
+    with _CONCURRENCY_LOCK:
+        ent = _PROVIDER_SEMAPHORES.get(key)
+        if ent is None or ent[0] != limit:
+            ent = (limit, threading.BoundedSemaphore(limit))
+            _PROVIDER_SEMAPHORES[key] = ent
+        sem = ent[1]
+    with sem:
+        yield
+
+
+def _shared_http_client_kwargs(provider: str, limit: int) -> Dict[str, Any]:
+    """
+    `http_client=` kwargs for OpenAI-compatible SDK clients: one persistent httpx pool per provider.
+    Returns {} when httpx is unavailable (SDK default client is used).
+    """
+    try:
+        import httpx  # type: ignore
+    except Exception:
+        return {}
+    with _CONCURRENCY_LOCK:
+        client = _HTTP_CLIENTS.get(provider)
+        if client is None:
+            try:
+                client = httpx.Client(
+                    limits=httpx.Limits(max_connections=max(limit * 2, 8), max_keepalive_connections=max(limit, 4)),
+                    timeout=httpx.Timeout(600.0, connect=10.0),
+                )
+            except Exception:
+                return {}
+            _HTTP_CLIENTS[provider] = client
+    return {"http_client": client}
+
 PROJECT_ROOT = repo_root()
 _BASE_CONFIG_PATH = PROJECT_ROOT / "configs" / "llm_router.yaml"
 _LOCAL_CONFIG_PATH = PROJECT_ROOT / "configs" / "llm_router.local.yaml"
@@ -454,11 +537,8 @@ def _append_llm_trace_event(event: Dict[str, Any]) -> None:
 
     safe_key = _safe_trace_key(key) if key else "_global"
     try:
-        out_dir = logs_root() / "traces" / "llm"
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / f"{safe_key}.jsonl"
-        with out_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        out_path = logs_root() / "traces" / "llm" / f"{safe_key}.jsonl"
+        segmented_log.append_jsonl(out_path, event)
     except Exception:
         # Best-effort only; tracing must never break production.
         pass
@@ -928,9 +1008,7 @@ class LLMRouter:
             return
         log_path = Path(os.getenv("LLM_ROUTER_LOG_PATH") or DEFAULT_LOG_PATH)
         try:
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            segmented_log.append_jsonl(log_path, payload)
         except Exception as e:
             logger.debug(f"LLM usage log write failed: {e}")
 
@@ -1025,7 +1103,8 @@ class LLMRouter:
                 self.clients["azure"] = AzureOpenAI(
                     api_key=key,
                     api_version=ver,
-                    azure_endpoint=ep
+                    azure_endpoint=ep,
+                    **_shared_http_client_kwargs("azure", self._provider_concurrency("azure")),
                 )
 
         # OpenRouter
@@ -1047,6 +1126,7 @@ class LLMRouter:
                         api_key=key,
                         base_url=base,
                         default_headers=headers or None,
+                        **_shared_http_client_kwargs("openrouter", self._provider_concurrency("openrouter")),
                     )
                 except TypeError:
                     self.clients["openrouter"] = OpenAI(
@@ -1091,7 +1171,11 @@ class LLMRouter:
                 chosen = self._fireworks_keys[0] if self._fireworks_keys else None
                 if chosen:
                     try:
-                        self.clients["fireworks"] = OpenAI(api_key=chosen, base_url=base)
+                        self.clients["fireworks"] = OpenAI(
+                            api_key=chosen,
+                            base_url=base,
+                            **_shared_http_client_kwargs("fireworks", self._provider_concurrency("fireworks")),
+                        )
                     except TypeError:
                         self.clients["fireworks"] = OpenAI(api_key=chosen, base_url=str(base))
 
@@ -1105,11 +1189,23 @@ class LLMRouter:
                 self.clients["gemini"] = {"env_api_key": p.get("env_api_key")}  # configure-on-use
 
     def _fireworks_mark_current_key_dead(self, *, http_status: Optional[int] = None) -> None:
+        with _FIREWORKS_LEASE_LOCK:
+            self._fireworks_mark_key_dead_locked(http_status=http_status)
+
+    def _fireworks_mark_key_dead_locked(self, *, http_status: Optional[int] = None) -> None:
         keys = getattr(self, "_fireworks_keys", None)
         dead = getattr(self, "_fireworks_dead_keys", None)
         idx = getattr(self, "_fireworks_key_index", None)
         if not isinstance(keys, list) or not isinstance(dead, set) or not isinstance(idx, int):
             return
+        held = _FIREWORKS_CALL_LEASE.get()
+        if held is not None:
+            # The key this call failed on (another call may already have rotated the shared index).
+            held_fp = str(getattr(held, "key_fp", "") or "")
+            for i, cand in enumerate(keys):
+                if cand and _sha256_hex(cand) == held_fp:
+                    idx = i
+                    break
         if 0 <= idx < len(keys):
             k = keys[idx]
             dead.add(k)
@@ -1121,24 +1217,69 @@ class LLMRouter:
             elif http_status == 412:
                 _update_fireworks_key_state(k, status="suspended", http_status=http_status, note="412 precondition failed")
 
-            # Release exclusive lease (if we owned it).
+            # Release exclusive lease (if we owned it and no in-flight call still runs on it).
             lease = getattr(self, "_fireworks_lease", None)
             try:
                 fp = _sha256_hex(k)
             except Exception:
                 fp = None
             if lease is not None and fp and str(getattr(lease, "key_fp", "") or "") == fp:
-                try:
-                    fireworks_keys.release_lease(lease)
-                except Exception:
-                    pass
                 self._fireworks_lease = None
+                if not self._fireworks_lease_refs().get(id(lease)):
+                    try:
+                        fireworks_keys.release_lease(lease)
+                    except Exception:
+                        pass
+
+    def _fireworks_lease_refs(self) -> Dict[int, List[Any]]:
+        """id(lease) -> [lease, in-flight calls holding it] (guarded by `_FIREWORKS_LEASE_LOCK`)."""
+        refs = getattr(self, "_fireworks_refs", None)
+        if refs is None:
+            refs = {}
+            self._fireworks_refs = refs
+        return refs
+
+    def _fireworks_hold_lease(self) -> None:
+        """Record that the current call runs on the current lease (caller holds `_FIREWORKS_LEASE_LOCK`)."""
+        lease = getattr(self, "_fireworks_lease", None)
+        if lease is None:
+            return
+        entry = self._fireworks_lease_refs().setdefault(id(lease), [lease, 0])
+        entry[1] += 1
+        _FIREWORKS_CALL_LEASE.set(lease)
+
+    def _fireworks_drop_lease(self, lease: Any) -> None:
+        """Drop one reference; the last holder releases the lease (caller holds `_FIREWORKS_LEASE_LOCK`)."""
+        if lease is None:
+            return
+        refs = self._fireworks_lease_refs()
+        entry = refs.get(id(lease))
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            refs.pop(id(lease), None)
+        if getattr(self, "_fireworks_lease", None) is lease:
+            self._fireworks_lease = None
+        try:
+            fireworks_keys.release_lease(lease)
+        except Exception:
+            pass
 
     def _fireworks_rotate_client(self) -> Optional[Any]:
         """
         Rotate to the next available Fireworks API key (same provider).
         Returns the new OpenAI client, or None if no key is available.
+
+        Safe with concurrent calls: the shared key/client/lease are swapped under `_FIREWORKS_LEASE_LOCK`,
+        only the calling request moves its reference to the new lease, and the old lease is released when
+        its last in-flight holder finishes. If another call already rotated away from this call's key, the
+        call joins the current key instead of rotating again.
         """
+        with _FIREWORKS_LEASE_LOCK:
+            return self._fireworks_rotate_client_locked()
+
+    def _fireworks_rotate_client_locked(self) -> Optional[Any]:
         keys = getattr(self, "_fireworks_keys", None)
         dead = getattr(self, "_fireworks_dead_keys", None)
         idx = getattr(self, "_fireworks_key_index", None)
@@ -1152,6 +1293,14 @@ class LLMRouter:
 
         # Keep the current lease until we successfully swap to a new key.
         old_lease = getattr(self, "_fireworks_lease", None)
+        held = _FIREWORKS_CALL_LEASE.get()
+        if held is not None and old_lease is not None and old_lease is not held:
+            # Another call already rotated off this call's key: switch to the current key.
+            current = self.clients.get("fireworks")
+            if current is not None and 0 <= idx < len(keys) and keys[idx] not in dead:
+                self._fireworks_drop_lease(held)
+                self._fireworks_hold_lease()
+                return current
         ttl_sec = getattr(self, "_fireworks_lease_ttl_sec", 1800)
         purpose = f"llm_router:rotate:{(os.getenv('LLM_ROUTING_KEY') or '').strip() or 'global'}"
 
@@ -1170,13 +1319,22 @@ class LLMRouter:
             if lease is None:
                 continue
             try:
-                new_client = OpenAI(api_key=k, base_url=base_url)
+                # Reuse the provider's persistent connection pool across key rotation.
+                new_client = OpenAI(
+                    api_key=k,
+                    base_url=base_url,
+                    **_shared_http_client_kwargs("fireworks", self._provider_concurrency("fireworks")),
+                )
             except TypeError:
                 new_client = OpenAI(api_key=k, base_url=str(base_url))
             self._fireworks_key_index = ni
             self._fireworks_lease = lease
             self.clients["fireworks"] = new_client
-            if old_lease is not None:
+            if held is not None:
+                # This call moves to the new lease; the old one stays until its other holders finish.
+                self._fireworks_drop_lease(held)
+                self._fireworks_hold_lease()
+            if old_lease is not None and old_lease is not held and not self._fireworks_lease_refs().get(id(old_lease)):
                 try:
                     fireworks_keys.release_lease(old_lease)
                 except Exception:
@@ -1218,7 +1376,7 @@ class LLMRouter:
             return
 
         # Couldn't reclaim the same key → rotate.
-        self._fireworks_rotate_client()
+        self._fireworks_rotate_client_locked()
 
     def _fireworks_release_lease(self) -> None:
         """
@@ -1226,15 +1384,12 @@ class LLMRouter:
 
         Rationale:
         - Keep exclusivity strict per *call*, but avoid idle key hogging by long-lived processes.
+        - Concurrent calls (acall/call_many) share the lease; it is released when the last holder finishes.
         """
-        lease = getattr(self, "_fireworks_lease", None)
-        if lease is None:
-            return
-        try:
-            fireworks_keys.release_lease(lease)
-        except Exception:
-            pass
-        self._fireworks_lease = None
+        with _FIREWORKS_LEASE_LOCK:
+            lease = _FIREWORKS_CALL_LEASE.get()
+            _FIREWORKS_CALL_LEASE.set(None)
+            self._fireworks_drop_lease(lease)
 
     def _fireworks_budget_routing_key(self) -> str:
         rk = (os.getenv("LLM_ROUTING_KEY") or "").strip()
@@ -1252,12 +1407,17 @@ class LLMRouter:
         lim = self._fireworks_budget_limits()
         return any(int(v or 0) > 0 for v in lim.values())
 
-    def _fireworks_budget_check(self, provider_name: str) -> None:
+    def _fireworks_budget_check(self, provider_name: str, *, reserve: bool = False) -> bool:
+        """
+        Raise FireworksBudgetExceeded when a limit is reached.
+        With reserve=True the call is counted as in-flight (so concurrent callers cannot overshoot the call
+        budget) and True is returned; pair it with `_fireworks_budget_unreserve()`.
+        """
         if str(provider_name or "") != "fireworks":
-            return
+            return False
         lim = self._fireworks_budget_limits()
         if not any(int(v or 0) > 0 for v in lim.values()):
-            return
+            return False
 
         rk = self._fireworks_budget_routing_key()
         with _FIREWORKS_BUDGET_LOCK:
@@ -1266,26 +1426,68 @@ class LLMRouter:
             )
             total = _FIREWORKS_BUDGET_STATE.setdefault("total", {"calls": 0, "tokens": 0})  # type: ignore[call-arg]
 
-            if lim["max_calls_per_routing_key"] and int(per.get("calls") or 0) >= lim["max_calls_per_routing_key"]:
+            per_calls = int(per.get("calls") or 0) + int(per.get("inflight") or 0)
+            total_calls = int(total.get("calls") or 0) + int(total.get("inflight") or 0)
+            if lim["max_calls_per_routing_key"] and per_calls >= lim["max_calls_per_routing_key"]:
                 raise FireworksBudgetExceeded(
                     f"Fireworks budget exceeded: calls_per_routing_key "
-                    f"(routing_key={rk}, calls={int(per.get('calls') or 0)}, limit={lim['max_calls_per_routing_key']})"
+                    f"(routing_key={rk}, calls={per_calls}, limit={lim['max_calls_per_routing_key']})"
                 )
             if lim["max_tokens_per_routing_key"] and int(per.get("tokens") or 0) >= lim["max_tokens_per_routing_key"]:
                 raise FireworksBudgetExceeded(
                     f"Fireworks budget exceeded: tokens_per_routing_key "
                     f"(routing_key={rk}, tokens={int(per.get('tokens') or 0)}, limit={lim['max_tokens_per_routing_key']})"
                 )
-            if lim["max_calls_total"] and int(total.get("calls") or 0) >= lim["max_calls_total"]:
+            if lim["max_calls_total"] and total_calls >= lim["max_calls_total"]:
                 raise FireworksBudgetExceeded(
                     f"Fireworks budget exceeded: calls_total "
-                    f"(calls={int(total.get('calls') or 0)}, limit={lim['max_calls_total']})"
+                    f"(calls={total_calls}, limit={lim['max_calls_total']})"
                 )
             if lim["max_tokens_total"] and int(total.get("tokens") or 0) >= lim["max_tokens_total"]:
                 raise FireworksBudgetExceeded(
                     f"Fireworks budget exceeded: tokens_total "
                     f"(tokens={int(total.get('tokens') or 0)}, limit={lim['max_tokens_total']})"
                 )
+            if not reserve:
+                return False
+            per["inflight"] = int(per.get("inflight") or 0) + 1
+            total["inflight"] = int(total.get("inflight") or 0) + 1
+            return True
+
+    def _fireworks_budget_unreserve(self) -> None:
+        rk = self._fireworks_budget_routing_key()
+        with _FIREWORKS_BUDGET_LOCK:
+            per = _FIREWORKS_BUDGET_STATE.setdefault("per_routing_key", {}).setdefault(  # type: ignore[call-arg]
+                rk, {"calls": 0, "tokens": 0}
+            )
+            total = _FIREWORKS_BUDGET_STATE.setdefault("total", {"calls": 0, "tokens": 0})  # type: ignore[call-arg]
+            per["inflight"] = max(0, int(per.get("inflight") or 0) - 1)
+            total["inflight"] = max(0, int(total.get("inflight") or 0) - 1)
+
+    def _provider_concurrency(self, provider: str) -> int:
+        n = _env_int(f"LLM_ROUTER_PROVIDER_CONCURRENCY_{str(provider or '').upper()}")
+        if not n:
+            providers = self.config.get("providers", {}) if isinstance(getattr(self, "config", None), dict) else {}
+            conf = providers.get(provider) if isinstance(providers, dict) else None
+            try:
+                n = max(0, int((conf or {}).get("max_concurrency") or 0))
+            except Exception:
+                n = 0
+        return n or _env_int("LLM_ROUTER_PROVIDER_CONCURRENCY") or 4
+
+    def _invoke_with_limits(self, provider_name, client, model_conf, messages, **options):
+        """
+        Budget check -> per-provider concurrency slot -> `_invoke_provider()` -> budget accounting.
+        """
+        reserved = self._fireworks_budget_check(provider_name, reserve=True)
+        try:
+            with _provider_slot(provider_name, self._provider_concurrency(provider_name)):
+                raw = self._invoke_provider(provider_name, client, model_conf, messages, return_raw=True, **options)
+        finally:
+            if reserved:
+                self._fireworks_budget_unreserve()
+        self._fireworks_budget_add_from_result(provider_name, raw)
+        return raw
 
     def _fireworks_budget_add_from_result(self, provider_name: str, result: Any) -> None:
         if str(provider_name or "") != "fireworks":
@@ -1637,6 +1839,67 @@ class LLMRouter:
         )
         return result
 
+    async def acall(self, task: str, messages: List[Dict[str, str]], **kwargs) -> Any:
+        """
+        Async variant of call(): same routing/fallback/cache/budget semantics, executed on the shared
+        router worker pool so independent requests can be awaited concurrently (e.g. asyncio.gather).
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(_async_executor(), functools.partial(ctx.run, self.call, task, messages, **kwargs))
+
+    async def acall_with_raw(self, task: str, messages: List[Dict[str, str]], **kwargs) -> Dict[str, Any]:
+        """Async variant of call_with_raw()."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            _async_executor(), functools.partial(ctx.run, self.call_with_raw, task, messages, **kwargs)
+        )
+
+    def call_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        *,
+        raw: bool = False,
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Issue independent requests concurrently and return results in input order.
+
+        Each request is the keyword arguments of call() (task, messages, temperature, ...).
+        raw=True returns call_with_raw() dicts. With return_exceptions=True a failed request yields its
+        exception in place; otherwise the first failure (in input order) is raised after all requests finish.
+        Per-provider in-flight limits still apply (LLM_ROUTER_PROVIDER_CONCURRENCY*).
+        """
+        reqs = [dict(r) for r in requests]
+        if not reqs:
+            return []
+        fn = self.call_with_raw if raw else self.call
+        workers = max(1, min(len(reqs), int(max_workers or _router_max_workers())))
+
+        def _one(req: Dict[str, Any]) -> Any:
+            try:
+                return fn(**req)
+            except Exception as e:
+                return e
+
+        if workers == 1:
+            results = [_one(r) for r in reqs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-call-many") as pool:
+                futures = [pool.submit(contextvars.copy_context().run, _one, r) for r in reqs]
+                results = [f.result() for f in futures]
+        if not return_exceptions:
+            for res in results:
+                if isinstance(res, Exception):
+                    raise res
+        return results
+
     def _call_internal(
         self,
         task: str,
@@ -2103,14 +2366,17 @@ class LLMRouter:
                 continue
             if provider_name == "fireworks":
                 # Cross-agent exclusivity: renew/reacquire Fireworks key lease before using the client.
-                self._fireworks_ensure_lease()
-                client = self.clients.get(provider_name)
-                if not client:
-                    logger.debug("Fireworks client not ready after lease refresh. Skipping %s", model_key)
-                    continue
-                if getattr(self, "_fireworks_lease", None) is None:
-                    logger.debug("Fireworks lease unavailable after refresh. Skipping %s", model_key)
-                    continue
+                with _FIREWORKS_LEASE_LOCK:
+                    self._fireworks_ensure_lease()
+                    client = self.clients.get(provider_name)
+                    if not client:
+                        logger.debug("Fireworks client not ready after lease refresh. Skipping %s", model_key)
+                        continue
+                    if getattr(self, "_fireworks_lease", None) is None:
+                        logger.debug("Fireworks lease unavailable after refresh. Skipping %s", model_key)
+                        continue
+                    # Released (ref-counted) by `_fireworks_release_lease()` when this call finishes.
+                    self._fireworks_hold_lease()
 
             try:
                 safe_options = sanitize_params(model_conf, base_options)
@@ -2135,16 +2401,7 @@ class LLMRouter:
                 logger.info(f"Router: Invoking {model_key} for {task}...")
                 start = time.time()
                 invoke_options = dict(safe_options)
-                self._fireworks_budget_check(provider_name)
-                raw_result = self._invoke_provider(
-                    provider_name,
-                    client,
-                    model_conf,
-                    messages,
-                    return_raw=True,
-                    **safe_options,
-                )
-                self._fireworks_budget_add_from_result(provider_name, raw_result)
+                raw_result = self._invoke_with_limits(provider_name, client, model_conf, messages, **safe_options)
                 finish_reason = _extract_finish_reason(raw_result)
 
                 # Retry-on-truncation (finish_reason == "length") to keep low default caps safe.
@@ -2207,16 +2464,7 @@ class LLMRouter:
                         base_options["max_tokens"] = new_max
                         retry_opts = dict(safe_options)
                         retry_opts[max_key] = new_max
-                        self._fireworks_budget_check(provider_name)
-                        raw_retry = self._invoke_provider(
-                            provider_name,
-                            client,
-                            model_conf,
-                            messages,
-                            return_raw=True,
-                            **retry_opts,
-                        )
-                        self._fireworks_budget_add_from_result(provider_name, raw_retry)
+                        raw_retry = self._invoke_with_limits(provider_name, client, model_conf, messages, **retry_opts)
                         finish_reason_retry = _extract_finish_reason(raw_retry)
                         retry_meta = {
                             "reason": "finish_reason_length",
@@ -2261,16 +2509,9 @@ class LLMRouter:
                                 attempt + 1,
                                 empty_retry,
                             )
-                            self._fireworks_budget_check(provider_name)
-                            raw_retry2 = self._invoke_provider(
-                                provider_name,
-                                client,
-                                model_conf,
-                                messages,
-                                return_raw=True,
-                                **invoke_options,
+                            raw_retry2 = self._invoke_with_limits(
+                                provider_name, client, model_conf, messages, **invoke_options
                             )
-                            self._fireworks_budget_add_from_result(provider_name, raw_retry2)
                             finish_reason2 = _extract_finish_reason(raw_retry2)
                             content2 = self._extract_content(provider_name, model_conf, raw_retry2)
                             if isinstance(content2, str) and content2.strip():
@@ -2340,13 +2581,19 @@ class LLMRouter:
                 if provider_name == "fireworks":
                     # For spend attribution / incident response:
                     # - Log only a stable fingerprint of the active Fireworks API key (never the raw key).
+                    # The key this call ran on (the shared index may have been rotated by a concurrent call).
                     try:
-                        keys = getattr(self, "_fireworks_keys", None)
-                        idx = getattr(self, "_fireworks_key_index", None)
-                        if isinstance(keys, list) and isinstance(idx, int) and 0 <= idx < len(keys):
-                            k = str(keys[idx] or "").strip()
-                            if k:
-                                log_payload["fireworks_key_fp"] = _sha256_hex(k)
+                        held = _FIREWORKS_CALL_LEASE.get()
+                        held_fp = str(getattr(held, "key_fp", "") or "").strip() if held is not None else ""
+                        if held_fp:
+                            log_payload["fireworks_key_fp"] = held_fp
+                        else:
+                            keys = getattr(self, "_fireworks_keys", None)
+                            idx = getattr(self, "_fireworks_key_index", None)
+                            if isinstance(keys, list) and isinstance(idx, int) and 0 <= idx < len(keys):
+                                k = str(keys[idx] or "").strip()
+                                if k:
+                                    log_payload["fireworks_key_fp"] = _sha256_hex(k)
                     except Exception:
                         pass
                 if routing:
@@ -0,0 +1,744 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+from factory_common import segmented_log
+from factory_common.paths import logs_root
+
+SCHEMA_VERSION = 1
+
+# NOTE:
+# Incremental analytics store for `llm_usage.jsonl` (LLMRouter usage log, incl. rotated segments).
+# The UI summary (/api/llm-usage/summary), scripts/aggregate_llm_usage.py and
+# scripts/ops/llm_usage_report.py used to re-read and re-parse the whole log on every query.
+#
+# - `ingest(log_path)` tails the log from a persisted byte offset (per source file; a shrunk or
+#   replaced file is re-ingested from 0). Only complete lines are consumed, in bounded batches.
+#   Rotated segments (factory_common/segmented_log.py) keep their offsets: sources are matched by the
+#   identity the file had while it was active.
+# - One row per call (`calls`), plus hourly success rollups per provider/task/model/routing_key
+#   (`rollups`). Range summaries read whole hours from rollups and only the partial edge hours from
+#   `calls`, so a 30-day summary touches a few thousand rollup rows instead of every log line.
+# - Queries ingest first, so results always include everything appended before the query.
+#
+# Env toggles:
+# - LLM_USAGE_INDEX_DISABLE=1     -> consumers fall back to scanning the JSONL
+# - LLM_USAGE_INDEX_PATH=/path    -> override SQLite path (default: workspaces/logs/llm_usage_index.sqlite3)
+
+_HOUR = 3600
+_UNDATED_HOUR = -1  # rollup bucket for records without a parseable timestamp
+_BATCH_LINES = 20000
+
+_METRICS = ("calls", "prompt_tokens", "completion_tokens", "total_tokens", "cache_hit_calls", "cache_hit_total_tokens")
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def index_enabled() -> bool:
+    return not _truthy_env("LLM_USAGE_INDEX_DISABLE")
+
+
+def index_path() -> Path:
+    raw = (os.getenv("LLM_USAGE_INDEX_PATH") or "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return logs_root() / "llm_usage_index.sqlite3"
+
+
+# ---------------------------------------------------------------------------
+# Record helpers (shared with the legacy scanners)
+# ---------------------------------------------------------------------------
+
+
+def record_datetime(obj: Dict[str, Any]) -> Optional[datetime]:
+    ts = obj.get("timestamp")
+    if isinstance(ts, (int, float)):
+        try:
+            return datetime.fromtimestamp(float(ts), tz=timezone.utc)
+        except Exception:
+            return None
+    if isinstance(ts, str) and ts.strip():
+        try:
+            return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        except Exception:
+            return None
+    ts2 = obj.get("ts")
+    if isinstance(ts2, str) and ts2.strip():
+        try:
+            return datetime.fromisoformat(ts2.replace("Z", "+00:00"))
+        except Exception:
+            return None
+    return None
+
+
+def infer_provider(obj: Dict[str, Any]) -> str:
+    provider = str(obj.get("provider") or "").strip()
+    if provider:
+        return provider
+    model = str(obj.get("model") or "").strip()
+    if model.startswith("or_"):
+        return "openrouter"
+    chain = obj.get("chain")
+    if isinstance(chain, list) and any(str(x).startswith("or_") for x in chain):
+        return "openrouter"
+    err = str(obj.get("error") or "").lower()
+    if "openrouter.ai" in err or "insufficient credits" in err:
+        return "openrouter"
+    return ""
+
+
+def usage_tokens(obj: Dict[str, Any]) -> Tuple[int, int, int]:
+    usage = obj.get("usage")
+    if not isinstance(usage, dict):
+        return (0, 0, 0)
+    prompt = int(usage.get("prompt_tokens") or 0)
+    completion = int(usage.get("completion_tokens") or 0)
+    total = int(usage.get("total_tokens") or 0)
+    if total <= 0:
+        total = prompt + completion
+    return (prompt, completion, total)
+
+
+def _scalar(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _opt_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _row_from_record(obj: Dict[str, Any]) -> Dict[str, Any]:
+    dt = record_datetime(obj)
+    ts: Optional[float] = None
+    if dt is not None:
+        ts = (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+    prompt, completion, total = usage_tokens(obj)
+    cache = obj.get("cache")
+    hit = cache.get("hit") if isinstance(cache, dict) else None
+    chain = obj.get("chain")
+    latency = obj.get("latency_ms") if "latency_ms" in obj else None
+    try:
+        latency = float(latency) if latency is not None else None
+    except (TypeError, ValueError):
+        latency = None
+    task = obj.get("task")
+    routing_key = str(obj.get("routing_key") or "").strip()
+    return {
+        "ts": ts,
+        "ts_iso": dt.isoformat() if dt else None,
+        "hour": int(ts // _HOUR) * _HOUR if ts is not None else _UNDATED_HOUR,
+        "status": str(obj.get("status") or "").strip(),
+        "status_code": _scalar(obj.get("status_code")),
+        "provider": infer_provider(obj),
+        "provider_raw": str(obj.get("provider") or "").strip(),
+        "task": None if task is None else str(task).strip(),
+        "model": _opt_str(obj.get("model")),
+        "routing_key": routing_key or None,
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "total_tokens": total,
+        # 1: hit is True (UI summary semantics), 2: other truthy hit values (report semantics)
+        "cache_hit": 1 if hit is True else (2 if hit else 0),
+        "latency_ms": latency,
+        "chain": json.dumps(chain, ensure_ascii=False) if isinstance(chain, list) and chain else None,
+        "finish_reason": _scalar(obj.get("finish_reason")),
+        "error": _scalar(obj.get("error")),
+    }
+
+
+# ---------------------------------------------------------------------------
+# SQLite
+# ---------------------------------------------------------------------------
+
+_LOCAL = threading.local()
+
+_CALL_COLUMNS = (
+    "log",
+    "source",
+    "ts",
+    "ts_iso",
+    "hour",
+    "status",
+    "status_code",
+    "provider",
+    "provider_raw",
+    "task",
+    "model",
+    "routing_key",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cache_hit",
+    "latency_ms",
+    "chain",
+    "finish_reason",
+    "error",
+)
+
+
+def _conn() -> Optional[sqlite3.Connection]:
+    """Thread-local connection (None when unavailable)."""
+    path = index_path()
+    conns: Dict[str, sqlite3.Connection] = getattr(_LOCAL, "conns", None) or {}
+    _LOCAL.conns = conns
+    key = str(path)
+    conn = conns.get(key)
+    if conn is not None:
+        return conn
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(key, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            " source TEXT PRIMARY KEY,"
+            " log TEXT NOT NULL,"
+            " ident TEXT NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " records INTEGER NOT NULL,"
+            " schema_version INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS calls ("
+            " seq INTEGER PRIMARY KEY,"
+            + ",".join(f" {c}" for c in _CALL_COLUMNS)
+            + ")"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS calls_log_ts ON calls(log, ts)")
+        conn.execute("CREATE INDEX IF NOT EXISTS calls_log_routing ON calls(log, routing_key)")
+        conn.execute("CREATE INDEX IF NOT EXISTS calls_log_tokens ON calls(log, total_tokens)")
+        conn.execute("CREATE INDEX IF NOT EXISTS calls_source ON calls(source)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rollups ("
+            " log TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " hour INTEGER NOT NULL,"
+            " provider TEXT NOT NULL,"
+            " task TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " routing_key TEXT NOT NULL,"
+            + ",".join(f" {m} INTEGER NOT NULL DEFAULT 0" for m in _METRICS)
+            + ", PRIMARY KEY(log, hour, provider, task, model, routing_key, source))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS rollups_source ON rollups(source)")
+    except Exception:
+        return None
+    conns[key] = conn
+    return conn
+
+
+def _delete_source(conn: sqlite3.Connection, source: str) -> None:
+    conn.execute("DELETE FROM calls WHERE source=?", (source,))
+    conn.execute("DELETE FROM rollups WHERE source=?", (source,))
+    conn.execute("DELETE FROM sources WHERE source=?", (source,))
+
+
+def _file_ident(st: os.stat_result) -> str:
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+def _flush(
+    conn: sqlite3.Connection,
+    *,
+    log: str,
+    source: str,
+    rows: List[Dict[str, Any]],
+    ident: str,
+    offset: int,
+    records: int,
+) -> None:
+    conn.executemany(
+        f"INSERT INTO calls({','.join(_CALL_COLUMNS)}) VALUES({','.join('?' for _ in _CALL_COLUMNS)})",
+        [tuple(log if c == "log" else source if c == "source" else row[c] for c in _CALL_COLUMNS) for row in rows],
+    )
+    deltas: Dict[Tuple[Any, ...], List[int]] = {}
+    for row in rows:
+        if row["status"] != "success":
+            continue
+        key = (
+            row["hour"],
+            row["provider"],
+            row["task"] or "",
+            row["model"] or "",
+            row["routing_key"] or "",
+        )
+        d = deltas.setdefault(key, [0] * len(_METRICS))
+        hit = row["cache_hit"] == 1
+        for i, v in enumerate(
+            (1, row["prompt_tokens"], row["completion_tokens"], row["total_tokens"], int(hit), row["total_tokens"] if hit else 0)
+        ):
+            d[i] += v
+    conn.executemany(
+        "INSERT INTO rollups(log, source, hour, provider, task, model, routing_key, "
+        + ", ".join(_METRICS)
+        + ") VALUES(?,?,?,?,?,?,?,"
+        + ",".join("?" for _ in _METRICS)
+        + ") ON CONFLICT(log, hour, provider, task, model, routing_key, source) DO UPDATE SET "
+        + ", ".join(f"{m}={m}+excluded.{m}" for m in _METRICS),
+        [(log, source, *key, *vals) for key, vals in deltas.items()],
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO sources(source, log, ident, offset, records, schema_version) VALUES(?,?,?,?,?,?)",
+        (source, log, ident, offset, records, SCHEMA_VERSION),
+    )
+
+
+# (source path, ident, uncompressed size, opener, compressed)
+_Source = Tuple[str, str, int, Callable[[], BinaryIO], bool]
+
+
+def _log_sources(log_path: Path, *, retry: bool = True) -> List[_Source]:
+    """Rotated segments (segmented_log manifest, oldest first) followed by the active file."""
+    out: List[_Source] = []
+    for seg in segmented_log.finalized_segments(log_path):
+        if seg.compressed:
+            out.append((str(seg.path), seg.ident, seg.raw_bytes, seg.open, True))
+            continue
+        try:
+            size = seg.path.stat().st_size
+        except FileNotFoundError:
+            if retry:  # compressed since the manifest was read
+                return _log_sources(log_path, retry=False)
+            continue
+        out.append((str(seg.path), seg.ident, size, seg.open, False))
+    try:
+        st = os.stat(log_path)
+    except FileNotFoundError:
+        return out
+    out.append((str(log_path), _file_ident(st), int(st.st_size), lambda: open(log_path, "rb"), False))
+    return out
+
+
+def _sync_sources(conn: sqlite3.Connection, log: str, sources: List[_Source]) -> bool:
+    """Follow rotated/compressed files by identity and drop sources that no longer exist."""
+    reset = False
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        known = {src: ident for src, ident in conn.execute("SELECT source, ident FROM sources WHERE log=?", (log,))}
+        for source, ident, *_ in sources:
+            if known.get(source) == ident:
+                continue
+            moved_from = next((src for src, i in known.items() if i == ident and src != source), None)
+            if moved_from is None:
+                continue
+            if source in known:
+                _delete_source(conn, source)
+            for table in ("sources", "calls", "rollups"):
+                conn.execute(f"UPDATE {table} SET source=? WHERE source=?", (source, moved_from))
+            known[source] = known.pop(moved_from)
+        current = {source for source, *_ in sources}
+        for source in [src for src in known if src not in current]:
+            _delete_source(conn, source)
+            reset = True
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return reset
+
+
+def _ingest_source(conn: sqlite3.Connection, log: str, src: _Source, out: Dict[str, Any]) -> None:
+    source, ident, size, opener, compressed = src
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT ident, offset, records, schema_version FROM sources WHERE source=?", (source,)
+        ).fetchone()
+        if row is not None and (row[0] != ident or int(row[1]) > size or int(row[3]) != SCHEMA_VERSION):
+            # Truncated / replaced / older schema: rebuild this source from the start.
+            _delete_source(conn, source)
+            row = None
+            out["reset"] = True
+        offset = int(row[1]) if row else 0
+        records = int(row[2]) if row else 0
+        if offset >= size:
+            conn.execute("COMMIT")
+            return
+
+        rows: List[Dict[str, Any]] = []
+        with opener() as handle:
+            if compressed:
+                remaining = offset
+                while remaining > 0:
+                    chunk = handle.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+            else:
+                handle.seek(offset)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break  # partial line: the writer has not finished it yet
+                offset += len(raw)
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except Exception:
+                    continue
+                if not isinstance(obj, dict):
+                    continue
+                rows.append(_row_from_record(obj))
+                records += 1
+                if len(rows) >= _BATCH_LINES:
+                    _flush(conn, log=log, source=source, rows=rows, ident=ident, offset=offset, records=records)
+                    out["ingested"] += len(rows)
+                    rows = []
+                    conn.execute("COMMIT")
+                    conn.execute("BEGIN IMMEDIATE")
+        _flush(conn, log=log, source=source, rows=rows, ident=ident, offset=offset, records=records)
+        out["ingested"] += len(rows)
+        conn.execute("COMMIT")
+    except BaseException:
+        try:
+            conn.execute("ROLLBACK")
+        except Exception:
+            pass
+        raise
+
+
+def ingest(log_path: Path) -> Dict[str, Any]:
+    """
+    Append records written to `log_path` since the last ingest.
+
+    Rotated segments (factory_common/segmented_log.py) are followed by file identity, so a rotation or
+    compression never re-ingests records. Returns ingest stats.
+    """
+    log = str(Path(log_path))
+    conn = _conn()
+    if conn is None:
+        raise RuntimeError(f"llm usage index unavailable: {index_path()}")
+    sources = _log_sources(Path(log_path))
+    out: Dict[str, Any] = {"log": log, "sources": len(sources), "ingested": 0, "reset": False}
+    out["reset"] = _sync_sources(conn, log, sources)
+    for src in sources:
+        _ingest_source(conn, log, src, out)
+    return out
+
+
+def line_count(log_path: Path) -> int:
+    """Parsed records of `log_path` currently in the index."""
+    conn = _conn()
+    if conn is None:
+        return 0
+    row = conn.execute("SELECT COALESCE(SUM(records), 0) FROM sources WHERE log=?", (str(Path(log_path)),)).fetchone()
+    return int(row[0] or 0)
+
+
+def drop_log(log_path: Path) -> None:
+    """Forget every indexed source of `log_path` (next ingest starts from byte 0)."""
+    conn = _conn()
+    if conn is None:
+        return
+    log = str(Path(log_path))
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for (source,) in conn.execute("SELECT source FROM sources WHERE log=?", (log,)).fetchall():
+            _delete_source(conn, source)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def index_stats(log_path: Path) -> Dict[str, Any]:
+    conn = _conn()
+    if conn is None:
+        return {"db": str(index_path()), "available": False}
+    log = str(Path(log_path))
+    sources = conn.execute("SELECT COUNT(*), COALESCE(SUM(offset), 0) FROM sources WHERE log=?", (log,)).fetchone()
+    return {
+        "db": str(index_path()),
+        "log": log,
+        "sources": int(sources[0]),
+        "bytes_indexed": int(sources[1]),
+        "records": line_count(log_path),
+        "calls": int(conn.execute("SELECT COUNT(*) FROM calls WHERE log=?", (log,)).fetchone()[0]),
+        "rollup_rows": int(conn.execute("SELECT COUNT(*) FROM rollups WHERE log=?", (log,)).fetchone()[0]),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+def _window_clause(since: Optional[float], until: Optional[float]) -> Tuple[str, List[Any]]:
+    # Undated records belong to every window (same as the JSONL scanners).
+    parts: List[str] = []
+    params: List[Any] = []
+    if since is not None:
+        parts.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        parts.append("ts <= ?")
+        params.append(until)
+    if not parts:
+        return "1", []
+    return f"(ts IS NULL OR ({' AND '.join(parts)}))", params
+
+
+def _empty_metrics() -> Dict[str, int]:
+    return {m: 0 for m in _METRICS}
+
+
+def _add_metrics(target: Dict[str, int], values: Iterable[Any]) -> None:
+    for m, v in zip(_METRICS, values):
+        target[m] += int(v or 0)
+
+
+def summarize(
+    log_path: Path,
+    *,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    provider: str = "",
+    top_calls: int = 20,
+    recent_failures: int = 50,
+) -> Dict[str, Any]:
+    """
+    Aggregates for [since, until] (either may be None), optionally for one (inferred) provider.
+
+    Returns metric dicts keyed by provider/task/model/routing_key/day (empty provider/task/model ->
+    "(unknown)"), failure counters, the first `recent_failures` failures in log order, and the
+    `top_calls` largest successful calls.
+    """
+    conn = _conn()
+    if conn is None:
+        raise RuntimeError(f"llm usage index unavailable: {index_path()}")
+    log = str(Path(log_path))
+    since_ts = since.timestamp() if since else None
+    until_ts = until.timestamp() if until else None
+    provider_filter = str(provider or "").strip().lower()
+
+    groups: Dict[str, Dict[str, Dict[str, int]]] = {
+        "providers": {},
+        "tasks": {},
+        "models": {},
+        "routing_keys": {},
+        "daily": {},
+    }
+    totals = _empty_metrics()
+
+    def _add_group(row: Tuple[Any, ...]) -> None:
+        hour, prov, task, model, rk, *vals = row
+        _add_metrics(totals, vals)
+        for name, key in (
+            ("providers", prov or "(unknown)"),
+            ("tasks", task or "(unknown)"),
+            ("models", model or "(unknown)"),
+            ("routing_keys", rk),
+        ):
+            if not key:
+                continue
+            _add_metrics(groups[name].setdefault(key, _empty_metrics()), vals)
+        if hour is not None and int(hour) != _UNDATED_HOUR:
+            day = datetime.fromtimestamp(int(hour), tz=timezone.utc).strftime("%Y-%m-%d")
+            _add_metrics(groups["daily"].setdefault(day, _empty_metrics()), vals)
+
+    prov_sql = " AND LOWER(provider) = ?" if provider_filter else ""
+    prov_params: List[Any] = [provider_filter] if provider_filter else []
+
+    # Whole hours inside the window (plus undated records) come from rollups.
+    first_hour = None if since_ts is None else int(math.ceil(since_ts / _HOUR)) * _HOUR
+    end_hour = None if until_ts is None else int(until_ts // _HOUR) * _HOUR
+    hour_parts = ["hour != ?"]
+    hour_params: List[Any] = [_UNDATED_HOUR]
+    if first_hour is not None:
+        hour_parts.append("hour >= ?")
+        hour_params.append(first_hour)
+    if end_hour is not None:
+        hour_parts.append("hour < ?")
+        hour_params.append(end_hour)
+    sums = ", ".join(f"SUM({m})" for m in _METRICS)
+    rollup_sql = (
+        f"SELECT hour, provider, task, model, routing_key, {sums} FROM rollups"
+        f" WHERE log = ? AND (hour = ? OR ({' AND '.join(hour_parts)})){prov_sql}"
+        " GROUP BY hour, provider, task, model, routing_key"
+    )
+    for row in conn.execute(rollup_sql, [log, _UNDATED_HOUR, *hour_params, *prov_params]):
+        _add_group(row)
+
+    # Partial edge hours come from individual calls.
+    edges: List[Tuple[float, str, float]] = []  # (lo, upper-bound operator, hi)
+    if first_hour is not None and end_hour is not None and first_hour >= end_hour:
+        edges.append((float(since_ts), "<=", float(until_ts)))  # type: ignore[arg-type]
+    else:
+        if since_ts is not None and first_hour is not None and since_ts < first_hour:
+            edges.append((since_ts, "<", float(first_hour)))
+        if end_hour is not None and until_ts is not None:
+            edges.append((float(end_hour), "<=", until_ts))
+    call_sums = (
+        "COUNT(*), SUM(prompt_tokens), SUM(completion_tokens), SUM(total_tokens),"
+        " SUM(cache_hit = 1), SUM(CASE WHEN cache_hit = 1 THEN total_tokens ELSE 0 END)"
+    )
+    for lo, hi_op, hi in edges:
+        edge_sql = (
+            f"SELECT (CAST(ts AS INTEGER) / {_HOUR}) * {_HOUR}, provider, COALESCE(task, ''), COALESCE(model, ''),"
+            f" COALESCE(routing_key, ''), {call_sums} FROM calls"
+            f" WHERE log = ? AND status = 'success' AND ts >= ? AND ts {hi_op} ?{prov_sql}"
+            " GROUP BY 1, 2, 3, 4, 5"
+        )
+        for row in conn.execute(edge_sql, [log, lo, hi, *prov_params]):
+            _add_group(row)
+
+    window_sql, window_params = _window_clause(since_ts, until_ts)
+
+    failures: Dict[str, Any] = {"total": 0, "by_status_code": Counter(), "by_task": Counter(), "by_provider": Counter()}
+    fail_sql = (
+        "SELECT status_code, COALESCE(task, ''), provider, COUNT(*) FROM calls"
+        f" WHERE log = ? AND status != 'success' AND {window_sql}{prov_sql} GROUP BY 1, 2, 3"
+    )
+    for code, task, prov, count in conn.execute(fail_sql, [log, *window_params, *prov_params]):
+        failures["total"] += int(count)
+        code = str(code or "").strip()
+        if code:
+            failures["by_status_code"][code] += int(count)
+        failures["by_task"][task or "(unknown)"] += int(count)
+        failures["by_provider"][prov or "(unknown)"] += int(count)
+
+    recent = [
+        {
+            "timestamp": ts_iso,
+            "status": status or None,
+            "status_code": status_code,
+            "task": task or None,
+            "routing_key": routing_key,
+            "provider": prov or None,
+            "model": model,
+            "error": error,
+        }
+        for ts_iso, status, status_code, task, routing_key, prov, model, error in conn.execute(
+            "SELECT ts_iso, status, status_code, task, routing_key, provider, model, error FROM calls"
+            f" WHERE log = ? AND status != 'success' AND {window_sql}{prov_sql} ORDER BY seq LIMIT ?",
+            [log, *window_params, *prov_params, int(recent_failures)],
+        )
+    ]
+
+    top = [
+        {
+            "timestamp": ts_iso,
+            "task": task or None,
+            "routing_key": routing_key or None,
+            "provider": prov or None,
+            "model": model,
+            "prompt_tokens": int(p or 0),
+            "completion_tokens": int(c or 0),
+            "total_tokens": int(t or 0),
+            "finish_reason": finish_reason,
+        }
+        for ts_iso, task, routing_key, prov, model, p, c, t, finish_reason in conn.execute(
+            "SELECT ts_iso, task, routing_key, provider, model, prompt_tokens, completion_tokens, total_tokens,"
+            " finish_reason FROM calls"
+            f" WHERE log = ? AND status = 'success' AND total_tokens > 0 AND {window_sql}{prov_sql}"
+            " ORDER BY total_tokens DESC, seq ASC LIMIT ?",
+            [log, *window_params, *prov_params, int(top_calls)],
+        )
+    ]
+
+    return {
+        "totals": totals,
+        **groups,
+        "failures": failures,
+        "recent_failures": recent,
+        "top_calls": top,
+    }
+
+
+def routing_key_usage(log_path: Path, routing_key: str, *, task_prefix: str = "") -> List[Dict[str, Any]]:
+    """
+    Successful calls of one routing_key grouped by (task, raw provider, model, cache hit).
+
+    Keys use scripts/ops/llm_usage_report.py semantics ("(unknown_task)" etc, any truthy cache hit).
+    """
+    conn = _conn()
+    if conn is None:
+        raise RuntimeError(f"llm usage index unavailable: {index_path()}")
+    sql = (
+        "SELECT COALESCE(NULLIF(task, ''), '(unknown_task)') AS t,"
+        " COALESCE(NULLIF(provider_raw, ''), '(unknown_provider)') AS p,"
+        " COALESCE(NULLIF(TRIM(model), ''), '(unknown_model)') AS m,"
+        " cache_hit > 0 AS hit,"
+        " COUNT(*), SUM(prompt_tokens), SUM(completion_tokens), SUM(total_tokens)"
+        " FROM calls WHERE log = ? AND routing_key = ? AND LOWER(status) = 'success'"
+    )
+    params: List[Any] = [str(Path(log_path)), str(routing_key or "").strip()]
+    if task_prefix:
+        sql += " AND SUBSTR(COALESCE(NULLIF(task, ''), '(unknown_task)'), 1, ?) = ?"
+        params += [len(task_prefix), task_prefix]
+    sql += " GROUP BY t, p, m, hit"
+    return [
+        {
+            "task": t,
+            "provider": p,
+            "model": m,
+            "cache_hit": bool(hit),
+            "calls": int(calls),
+            "prompt_tokens": int(pt or 0),
+            "completion_tokens": int(ct or 0),
+            "total_tokens": int(tt or 0),
+        }
+        for t, p, m, hit, calls, pt, ct, tt in conn.execute(sql, params)
+    ]
+
+
+def call_stats(log_path: Path) -> Dict[str, Any]:
+    """
+    All-time counters for scripts/aggregate_llm_usage.py: success calls + mean latency per model,
+    success calls per task, failures per task, and fallback chain counts (model/task None kept as None).
+    Keys are ordered by first appearance in the log, so `most_common()` ties break like a file scan.
+    """
+    conn = _conn()
+    if conn is None:
+        raise RuntimeError(f"llm usage index unavailable: {index_path()}")
+    log = str(Path(log_path))
+    models = [
+        (model, int(calls), float(avg or 0.0))
+        for model, calls, avg in conn.execute(
+            "SELECT model, COUNT(*), AVG(latency_ms) FROM calls WHERE log = ? AND status = 'success'"
+            " GROUP BY model ORDER BY MIN(seq)",
+            (log,),
+        )
+    ]
+    tasks = Counter(
+        {
+            task: int(calls)
+            for task, calls in conn.execute(
+                "SELECT task, COUNT(*) FROM calls WHERE log = ? AND status = 'success' GROUP BY task ORDER BY MIN(seq)",
+                (log,),
+            )
+        }
+    )
+    failures = Counter(
+        {
+            task: int(calls)
+            for task, calls in conn.execute(
+                "SELECT task, COUNT(*) FROM calls WHERE log = ? AND status != 'success' GROUP BY task ORDER BY MIN(seq)",
+                (log,),
+            )
+        }
+    )
+    chains = Counter(
+        {
+            tuple(json.loads(chain)): int(calls)
+            for chain, calls in conn.execute(
+                "SELECT chain, COUNT(*) FROM calls WHERE log = ? AND chain IS NOT NULL GROUP BY chain ORDER BY MIN(seq)",
+                (log,),
+            )
+        }
+    )
+    return {"records": line_count(log_path), "models": models, "tasks": tasks, "failures": failures, "chains": chains}
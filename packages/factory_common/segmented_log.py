@@ -0,0 +1,533 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import zstandard  # optional
+except ImportError:  # pragma: no cover - environment may not have zstandard
+    zstandard = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SCHEMA = "ytm.log_segments.v1"
+
+# NOTE:
+# Segmented append-only JSONL logs (llm_usage.jsonl, traces/llm/<key>.jsonl, image_usage.log,
+# agent coordination events.jsonl).
+#
+# - Writers append to the log path as before (one O_APPEND write per record; no lock on the hot path).
+# - When the active file exceeds the size / age budget it is renamed into `<log>.segments/NNNNNN.jsonl`
+#   (rename under an exclusive lock so only one process rotates) and the next append starts a new file.
+# - Closed segments are compressed (zstd when `zstandard` is installed, else gzip) once they have been
+#   idle for a short grace period, so an append racing the rename still lands in the raw segment.
+#   A segment is never old enough at its own rotation, so finalization runs later: on the first append
+#   after the grace has passed (same process), and from readers (`iter_lines` / `tail_records` /
+#   llm_usage_index ingest) that find a raw segment past the grace. Both skip when another process
+#   holds the rotation lock.
+# - `<log>.segments/manifest.json` lists segments with record counts and [first_ts, last_ts], so range
+#   readers (`iter_records(since=..., until=...)`) skip segments outside the window.
+#
+# Env toggles:
+# - YTM_LOG_SEGMENT_DISABLE=1         -> never rotate (plain append, legacy behavior)
+# - YTM_LOG_SEGMENT_MAX_MB=64         -> rotate when the active file reaches this size
+# - YTM_LOG_SEGMENT_MAX_HOURS=168     -> rotate when the oldest record of the active file is older (0: off)
+# - YTM_LOG_SEGMENT_COMPRESS=auto     -> auto | zstd | gzip | none
+
+_COMPRESS_GRACE_SEC = 30.0
+_TS_KEYS = ("timestamp", "ts", "generated_at", "created_at", "at")
+_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+# path -> (inode, oldest record ts) of the active file, so age checks read its first line once.
+_ACTIVE_STARTED: Dict[str, Tuple[int, Optional[float]]] = {}
+# path -> epoch sec after which this process's raw segments are past the grace (checked on append).
+_FINALIZE_DUE: Dict[str, float] = {}
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def rotation_enabled() -> bool:
+    return not _truthy_env("YTM_LOG_SEGMENT_DISABLE")
+
+
+def max_bytes() -> int:
+    return int(max(0.0, _env_float("YTM_LOG_SEGMENT_MAX_MB", 64.0)) * 1024 * 1024)
+
+
+def max_age_sec() -> float:
+    return max(0.0, _env_float("YTM_LOG_SEGMENT_MAX_HOURS", 168.0)) * 3600.0
+
+
+def compression() -> str:
+    raw = (os.getenv("YTM_LOG_SEGMENT_COMPRESS") or "auto").strip().lower()
+    if raw in {"none", "off", "0", "false"}:
+        return "none"
+    if raw == "gzip":
+        return "gzip"
+    if raw == "zstd" and zstandard is not None:
+        return "zstd"
+    return "zstd" if (raw == "auto" and zstandard is not None) else "gzip"
+
+
+def segments_dir(path: Path) -> Path:
+    p = Path(path)
+    return p.with_name(p.name + ".segments")
+
+
+def manifest_path(path: Path) -> Path:
+    return segments_dir(path) / "manifest.json"
+
+
+def record_ts(obj: Any) -> Optional[float]:
+    """Epoch seconds of a log record (first of timestamp/ts/generated_at/created_at/at), or None."""
+    if not isinstance(obj, dict):
+        return None
+    for key in _TS_KEYS:
+        value = obj.get(key)
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str) and value.strip():
+            try:
+                dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Segments
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Segment:
+    path: Path
+    ident: str  # "dev:inode" of the file while it was the active log (stable across compression)
+    raw_bytes: int  # uncompressed size (final once compressed)
+    records: Optional[int]  # None until the segment has been scanned/compressed
+    undated: Optional[int]
+    first_ts: Optional[float]
+    last_ts: Optional[float]
+
+    @property
+    def compressed(self) -> bool:
+        return self.path.suffix in _SUFFIXES
+
+    def overlaps(self, since: Optional[float], until: Optional[float]) -> bool:
+        if self.records is None or self.undated or self.first_ts is None or self.last_ts is None:
+            return True  # not scanned yet / contains undated records (they belong to every window)
+        if since is not None and self.last_ts < since:
+            return False
+        if until is not None and self.first_ts > until:
+            return False
+        return True
+
+    def open(self) -> BinaryIO:
+        return _open_binary(self.path)
+
+
+def _open_binary(path: Path) -> BinaryIO:
+    kind = _SUFFIXES.get(path.suffix)
+    if kind == "gzip":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if kind == "zstd":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        fh = path.open("rb")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(fh, closefd=True))  # type: ignore[arg-type]
+    return path.open("rb")
+
+
+def _file_ident(st: os.stat_result) -> str:
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+def _load_manifest(path: Path) -> Dict[str, Any]:
+    mp = manifest_path(path)
+    try:
+        obj = json.loads(mp.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        obj = None
+    except Exception as exc:
+        logger.warning("segment manifest unreadable (%s): %s", mp, exc)
+        obj = None
+    if not isinstance(obj, dict) or not isinstance(obj.get("segments"), list):
+        obj = {"schema": MANIFEST_SCHEMA, "log": Path(path).name, "next_seq": 1, "segments": []}
+    return obj
+
+
+def _save_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    mp = manifest_path(path)
+    tmp = mp.with_name(mp.name + f".tmp{os.getpid()}")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, mp)
+
+
+def _to_segment(path: Path, entry: Dict[str, Any]) -> Segment:
+    return Segment(
+        path=segments_dir(path) / str(entry.get("name")),
+        ident=str(entry.get("ident") or ""),
+        raw_bytes=int(entry.get("raw_bytes") or 0),
+        records=entry.get("records"),
+        undated=entry.get("undated"),
+        first_ts=entry.get("first_ts"),
+        last_ts=entry.get("last_ts"),
+    )
+
+
+def segments(path: Path) -> List[Segment]:
+    """Closed segments of `path`, oldest first (empty when the log never rotated)."""
+    if not manifest_path(path).exists():
+        return []
+    return [_to_segment(Path(path), e) for e in _load_manifest(Path(path))["segments"] if isinstance(e, dict)]
+
+
+@contextmanager
+def _rotation_lock(path: Path, *, blocking: bool) -> Iterator[bool]:
+    seg_dir = segments_dir(path)
+    seg_dir.mkdir(parents=True, exist_ok=True)
+    with (seg_dir / ".lock").open("a+") as lock_fh:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+
+def _scan_and_compress(raw_path: Path, kind: str) -> Tuple[Path, Dict[str, Any]]:
+    """One pass over a closed raw segment: record stats (+ compressed copy unless kind == "none")."""
+    stats: Dict[str, Any] = {"records": 0, "undated": 0, "first_ts": None, "last_ts": None, "raw_bytes": 0}
+    out_path = raw_path if kind == "none" else raw_path.with_name(raw_path.name + (".zst" if kind == "zstd" else ".gz"))
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    sink: Optional[BinaryIO] = None
+    sink_fh: Optional[BinaryIO] = None
+    if kind == "gzip":
+        sink = gzip.open(tmp, "wb", compresslevel=6)  # type: ignore[assignment]
+    elif kind == "zstd":
+        sink_fh = tmp.open("wb")
+        sink = zstandard.ZstdCompressor(level=10).stream_writer(sink_fh)  # type: ignore[union-attr]
+    try:
+        with raw_path.open("rb") as src:
+            for raw in src:
+                stats["raw_bytes"] += len(raw)
+                if sink is not None:
+                    sink.write(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except Exception:
+                    continue
+                stats["records"] += 1
+                ts = record_ts(obj)
+                if ts is None:
+                    stats["undated"] += 1
+                    continue
+                stats["first_ts"] = ts if stats["first_ts"] is None else min(stats["first_ts"], ts)
+                stats["last_ts"] = ts if stats["last_ts"] is None else max(stats["last_ts"], ts)
+    finally:
+        if sink is not None:
+            sink.close()
+        if sink_fh is not None and not sink_fh.closed:
+            sink_fh.close()
+    if kind != "none":
+        os.replace(tmp, out_path)
+    return out_path, stats
+
+
+def finalize_segments(path: Path, *, grace_sec: Optional[float] = None, blocking: bool = True) -> int:
+    """Scan (and compress) raw segments idle for `grace_sec` (default: the compression grace). Returns the number finalized."""
+    with _rotation_lock(Path(path), blocking=blocking) as acquired:
+        if not acquired:
+            return 0
+        return _finalize_locked(Path(path), grace_sec=grace_sec)
+
+
+def _past_grace(seg: Segment) -> bool:
+    if seg.records is not None:
+        return False
+    try:
+        return time.time() - seg.path.stat().st_mtime >= _COMPRESS_GRACE_SEC
+    except FileNotFoundError:
+        return False
+
+
+def finalized_segments(path: Path) -> List[Segment]:
+    """`segments(path)`, after finalizing raw segments past the grace period (skipped if another process holds the lock)."""
+    path = Path(path)
+    segs = segments(path)
+    if not any(_past_grace(seg) for seg in segs):
+        return segs
+    try:
+        if not finalize_segments(path, blocking=False):
+            return segs
+    except Exception as exc:
+        logger.debug("segment finalize failed (%s): %s", path, exc)
+        return segs
+    return segments(path)
+
+
+def _finalize_locked(path: Path, *, grace_sec: Optional[float] = None) -> int:
+    if grace_sec is None:
+        grace_sec = _COMPRESS_GRACE_SEC
+    manifest = _load_manifest(path)
+    kind = compression()
+    done = 0
+    for entry in manifest["segments"]:
+        if not isinstance(entry, dict) or entry.get("records") is not None:
+            continue
+        raw_path = segments_dir(path) / str(entry.get("name"))
+        try:
+            if time.time() - raw_path.stat().st_mtime < grace_sec:
+                continue
+            out_path, stats = _scan_and_compress(raw_path, kind)
+        except FileNotFoundError:
+            continue
+        except Exception as exc:
+            logger.warning("segment finalize failed (%s): %s", raw_path, exc)
+            continue
+        entry.update(stats)
+        entry["name"] = out_path.name
+        entry["compression"] = kind
+        _save_manifest(path, manifest)
+        if out_path != raw_path:
+            raw_path.unlink(missing_ok=True)
+        done += 1
+    pending = [e for e in manifest["segments"] if isinstance(e, dict) and e.get("records") is None]
+    if pending:
+        _FINALIZE_DUE[str(path)] = time.time() + grace_sec
+    else:
+        _FINALIZE_DUE.pop(str(path), None)
+    return done
+
+
+def _active_started(path: Path, st: os.stat_result) -> Optional[float]:
+    key = str(path)
+    cached = _ACTIVE_STARTED.get(key)
+    if cached is not None and cached[0] == st.st_ino:
+        return cached[1]
+    started: Optional[float] = None
+    try:
+        with path.open("rb") as fh:
+            first = fh.readline()
+        started = record_ts(json.loads(first)) if first.strip() else None
+    except Exception:
+        started = None
+    if started is None:
+        started = st.st_mtime
+    _ACTIVE_STARTED[key] = (st.st_ino, started)
+    return started
+
+
+def _needs_rotation(path: Path, st: os.stat_result) -> bool:
+    if st.st_size <= 0:
+        return False
+    limit = max_bytes()
+    if limit and st.st_size >= limit:
+        return True
+    age = max_age_sec()
+    if age:
+        started = _active_started(path, st)
+        if started is not None and time.time() - started >= age:
+            return True
+    return False
+
+
+def rotate(path: Path, *, force: bool = False, blocking: bool = False) -> Optional[Segment]:
+    """Close the active file into a new segment when over budget (or `force`). Returns the new segment."""
+    path = Path(path)
+    with _rotation_lock(path, blocking=blocking) as acquired:
+        if not acquired:
+            return None  # another process is rotating
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        if st.st_size <= 0 or not (force or _needs_rotation(path, st)):
+            return None
+        manifest = _load_manifest(path)
+        seq = int(manifest.get("next_seq") or 1)
+        entry = {
+            "name": f"{seq:06d}{path.suffix or '.log'}",
+            "ident": _file_ident(st),
+            "raw_bytes": int(st.st_size),
+            "records": None,
+            "undated": None,
+            "first_ts": None,
+            "last_ts": None,
+            "rotated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        os.rename(path, segments_dir(path) / entry["name"])
+        manifest["next_seq"] = seq + 1
+        manifest["segments"].append(entry)
+        _save_manifest(path, manifest)
+        _ACTIVE_STARTED.pop(str(path), None)
+        _finalize_locked(path)
+        return _to_segment(path, entry)
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+
+def append_jsonl(path: Path, payload: Any) -> None:
+    """Append one JSON record to `path` (raises on I/O errors; rotation problems are only logged)."""
+    append_line(path, json.dumps(payload, ensure_ascii=False))
+
+
+def append_line(path: Path, line: str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        f.flush()
+        st = os.fstat(f.fileno())
+    if not rotation_enabled():
+        return
+    try:
+        if _needs_rotation(path, st):
+            rotate(path)
+        else:
+            due = _FINALIZE_DUE.get(str(path))
+            if due is not None and time.time() >= due:
+                finalize_segments(path, blocking=False)
+    except Exception as exc:
+        logger.debug("log rotation failed (%s): %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+
+def _decoded(lines: Iterator[bytes]) -> Iterator[str]:
+    for raw in lines:
+        line = raw.decode("utf-8", errors="ignore").strip()
+        if line:
+            yield line
+
+
+def _segment_lines(path: Path, seg: Segment) -> Iterator[bytes]:
+    try:
+        fh = seg.open()
+    except FileNotFoundError:
+        # Compressed since the manifest was read: reopen under its new name.
+        fresh = [s for s in segments(path) if s.ident == seg.ident and s.path != seg.path]
+        if not fresh:
+            return
+        fh = fresh[0].open()
+    with fh:
+        yield from fh
+
+
+def iter_lines(path: Path, *, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[str]:
+    """Non-empty lines of every segment overlapping [since, until] (epoch sec), then the active file."""
+    path = Path(path)
+    for seg in finalized_segments(path):
+        if seg.overlaps(since, until):
+            yield from _decoded(_segment_lines(path, seg))
+    try:
+        fh = path.open("rb")
+    except FileNotFoundError:
+        return
+    with fh:
+        yield from _decoded(fh)
+
+
+def iter_records(path: Path, *, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[Any]:
+    """Parsed JSON values (unparseable lines skipped) across segments + active file, oldest first."""
+    for line in iter_lines(path, since=since, until=until):
+        try:
+            yield json.loads(line)
+        except Exception:
+            continue
+
+
+def _tail_file(path: Path, limit: int) -> List[Any]:
+    out: List[Any] = []
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        pos = handle.tell()
+        carry = b""
+        while pos > 0 and len(out) < limit:
+            step = min(pos, 64 * 1024)
+            pos -= step
+            handle.seek(pos)
+            chunk = handle.read(step) + carry
+            lines = chunk.split(b"\n")
+            carry = lines.pop(0) if pos > 0 else b""
+            for raw in reversed(lines):
+                line = raw.decode("utf-8", errors="ignore").strip()
+                if not line:
+                    continue
+                try:
+                    out.append(json.loads(line))
+                except Exception:
+                    continue
+                if len(out) >= limit:
+                    break
+    out.reverse()
+    return out
+
+
+def tail_records(path: Path, limit: int) -> List[Any]:
+    """Last `limit` parseable JSON lines, oldest first: the active file backwards, then the newest segments."""
+    path = Path(path)
+    if limit <= 0:
+        return []
+    out: List[Any] = _tail_file(path, limit) if path.exists() else []
+    for seg in reversed(finalized_segments(path)):
+        if len(out) >= limit:
+            break
+        if seg.compressed:
+            older: List[Any] = []
+            for line in _decoded(_segment_lines(path, seg)):
+                try:
+                    older.append(json.loads(line))
+                except Exception:
+                    continue
+        else:
+            try:
+                older = _tail_file(seg.path, limit - len(out))
+            except FileNotFoundError:
+                continue
+        out = older[-(limit - len(out)) :] + out
+    return out
@@ -0,0 +1,651 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from factory_common.fs_watch import InotifyWatcher
+from factory_common.paths import logs_root
+
+SCHEMA_VERSION = 2
+
+# NOTE:
+# Shared metadata index of the episode/run trees that UI endpoints and progress views used to
+# re-walk (and re-parse status.json / image_cues.json) on every request:
+#   - workspaces/scripts/CHxx/NNN         (kind=scripts:     parsed status.json, assembled.md present)
+#   - workspaces/audio/final/CHxx/NNN     (kind=audio_final: log.json mtime, final wav, chunk wav count)
+#   - workspaces/video/runs/<run_id>      (kind=video_runs:  recency mtimes, cue/prompt counts, image
+#                                          count/latest mtime, timeline manifest episode, draft info mtime)
+#
+# Freshness:
+# - Each queried root is watched with inotify (factory_common/fs_watch.py). Every query first drains the
+#   queued events and re-indexes only the touched episode/run dirs, so answers never lag behind writes
+#   that finished before the query, and an unchanged tree costs no disk walk at all.
+# - Without inotify (macOS, watch limit reached, YTM_FS_WATCH_DISABLE=1) queries run an incremental
+#   rescan instead: a stat walk that re-parses only files whose (mtime, size) changed. A rescan is reused
+#   for DEFAULT_POLL_SEC so a page that fires several queries does not stat the whole tree each time
+#   (answers may lag writes by up to that long; WORKSPACE_INDEX_POLL_SEC=0 rescans on every query).
+# - Queue overflow / directory renames trigger a full rescan.
+# - Entries persist in SQLite (workspaces/logs/workspace_index.sqlite3), so a restarted process only
+#   stats the tree instead of re-parsing everything.
+#
+# Env toggles:
+# - WORKSPACE_INDEX_DISABLE=1         -> callers use their legacy direct disk scans
+# - YTM_FS_WATCH_DISABLE=1            -> no inotify (incremental rescan per query)
+# - WORKSPACE_INDEX_POLL_SEC=...      -> rescan mode only: reuse a rescan for this many seconds (default: 2)
+# - WORKSPACE_INDEX_PATH=/path        -> override SQLite path
+
+KIND_SCRIPTS = "scripts"
+KIND_AUDIO_FINAL = "audio_final"
+KIND_VIDEO_RUNS = "video_runs"
+
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+# Rescan mode (no inotify): how long a stat walk is reused when WORKSPACE_INDEX_POLL_SEC is unset.
+DEFAULT_POLL_SEC = 2.0
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def index_enabled() -> bool:
+    return not _truthy_env("WORKSPACE_INDEX_DISABLE")
+
+
+def _poll_sec() -> float:
+    raw = (os.getenv("WORKSPACE_INDEX_POLL_SEC") or "").strip()
+    if not raw:
+        return DEFAULT_POLL_SEC
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_POLL_SEC
+
+
+def index_path() -> Path:
+    raw = (os.getenv("WORKSPACE_INDEX_PATH") or "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return logs_root() / "workspace_index.sqlite3"
+
+
+Sig = Optional[List[Any]]
+
+
+def _stat_sig(path: Path) -> Sig:
+    try:
+        st = path.stat()
+    except Exception:
+        return None
+    return [int(st.st_mtime_ns), int(st.st_size), float(st.st_mtime)]
+
+
+def _sig_mtime(sig: Sig) -> Optional[float]:
+    return float(sig[2]) if sig else None
+
+
+def _read_json(path: Path) -> Tuple[Any, Optional[str]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")), None
+    except Exception as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+# ---------------------------------------------------------------------------
+# Layouts: which dirs are index units, what to stat, what to derive
+# ---------------------------------------------------------------------------
+
+
+class _ScriptsLayout:
+    depth = 2
+    subdirs = ("content", "content/final", "audio_prep")
+
+    @staticmethod
+    def is_group(name: str) -> bool:
+        return name.upper().startswith("CH")
+
+    @staticmethod
+    def is_unit(name: str) -> bool:
+        return name.isdigit()
+
+    @staticmethod
+    def signature(unit_dir: Path) -> Dict[str, Sig]:
+        channel, video = unit_dir.parent.name, unit_dir.name
+        return {
+            "status": _stat_sig(unit_dir / "status.json"),
+            "assembled": _stat_sig(unit_dir / "content" / "assembled.md"),
+            # Not parsed: only there so entry versions move when these artifacts change.
+            "assembled_human": _stat_sig(unit_dir / "content" / "assembled_human.md"),
+            "assembled_legacy": _stat_sig(unit_dir / "content" / "final" / "assembled.md"),
+            "prep_wav": _stat_sig(unit_dir / "audio_prep" / f"{channel}-{video}.wav"),
+            "prep_srt": _stat_sig(unit_dir / "audio_prep" / f"{channel}-{video}.srt"),
+        }
+
+    @staticmethod
+    def build(unit_dir: Path, sig: Dict[str, Sig], prev: Optional[Tuple[Dict[str, Sig], Dict[str, Any]]], force: bool):
+        prev_sig, prev_data = prev if prev else ({}, {})
+        if prev and not force and prev_sig.get("status") == sig["status"]:
+            status, status_error = prev_data.get("status"), prev_data.get("status_error")
+        elif sig["status"] is None:
+            status, status_error = None, None
+        else:
+            status, status_error = _read_json(unit_dir / "status.json")
+        return {
+            "status": status,
+            "status_error": status_error,
+            "status_mtime": _sig_mtime(sig["status"]),
+            "assembled": sig["assembled"] is not None,
+        }
+
+
+class _AudioFinalLayout:
+    depth = 2
+    subdirs = ("chunks",)
+    is_group = staticmethod(_ScriptsLayout.is_group)
+    is_unit = staticmethod(_ScriptsLayout.is_unit)
+
+    @staticmethod
+    def signature(unit_dir: Path) -> Dict[str, Sig]:
+        channel, video = unit_dir.parent.name, unit_dir.name
+        return {
+            "log": _stat_sig(unit_dir / "log.json"),
+            "final_wav": _stat_sig(unit_dir / f"{channel}-{video}.wav"),
+            "chunks": _stat_sig(unit_dir / "chunks"),
+            # Not parsed: only there so entry versions move when these artifacts change.
+            "final_flac": _stat_sig(unit_dir / f"{channel}-{video}.flac"),
+            "final_mp3": _stat_sig(unit_dir / f"{channel}-{video}.mp3"),
+            "final_m4a": _stat_sig(unit_dir / f"{channel}-{video}.m4a"),
+            "final_srt": _stat_sig(unit_dir / f"{channel}-{video}.srt"),
+        }
+
+    @staticmethod
+    def build(unit_dir: Path, sig: Dict[str, Sig], prev: Optional[Tuple[Dict[str, Sig], Dict[str, Any]]], force: bool):
+        prev_sig, prev_data = prev if prev else ({}, {})
+        if prev and not force and prev_sig.get("chunks") == sig["chunks"]:
+            chunk_wavs = int(prev_data.get("chunk_wavs") or 0)
+        elif sig["chunks"] is None:
+            chunk_wavs = 0
+        else:
+            try:
+                chunk_wavs = len(list((unit_dir / "chunks").glob("*.wav")))
+            except Exception:
+                chunk_wavs = 0
+        return {
+            "log_mtime": _sig_mtime(sig["log"]),
+            "final_wav": sig["final_wav"] is not None,
+            "chunk_wavs": chunk_wavs,
+        }
+
+
+class _VideoRunsLayout:
+    depth = 1
+    subdirs = ("images",)
+
+    @staticmethod
+    def is_unit(name: str) -> bool:
+        return True
+
+    @staticmethod
+    def signature(unit_dir: Path) -> Dict[str, Sig]:
+        return {
+            "dir": _stat_sig(unit_dir),
+            "auto_run_info": _stat_sig(unit_dir / "auto_run_info.json"),
+            "image_cues": _stat_sig(unit_dir / "image_cues.json"),
+            "visual_cues_plan": _stat_sig(unit_dir / "visual_cues_plan.json"),
+            "images": _stat_sig(unit_dir / "images"),
+            "timeline_manifest": _stat_sig(unit_dir / "timeline_manifest.json"),
+            "capcut_draft_info": _stat_sig(unit_dir / "capcut_draft_info.json"),
+        }
+
+    @staticmethod
+    def build(unit_dir: Path, sig: Dict[str, Sig], prev: Optional[Tuple[Dict[str, Sig], Dict[str, Any]]], force: bool):
+        prev_sig, prev_data = prev if prev else ({}, {})
+
+        if prev and not force and prev_sig.get("image_cues") == sig["image_cues"]:
+            cue_count, prompt_count = prev_data.get("cue_count"), prev_data.get("prompt_count")
+        else:
+            cue_count, prompt_count = None, None
+            raw, _err = _read_json(unit_dir / "image_cues.json") if sig["image_cues"] else (None, None)
+            cues = raw.get("cues") if isinstance(raw, dict) else None
+            if isinstance(cues, list):
+                cue_count = len(cues)
+                prompt_count = sum(
+                    1
+                    for cue in cues
+                    if isinstance(cue, dict)
+                    and str(cue.get("refined_prompt") or cue.get("prompt") or cue.get("summary") or "").strip()
+                )
+
+        if prev and not force and prev_sig.get("images") == sig["images"]:
+            images_count, images_mtime = int(prev_data.get("images_count") or 0), prev_data.get("images_mtime")
+        else:
+            images_count, images_mtime = 0, None
+            if sig["images"] is not None:
+                try:
+                    for child in (unit_dir / "images").iterdir():
+                        if not child.is_file() or child.suffix.lower() not in IMAGE_EXTENSIONS:
+                            continue
+                        images_count += 1
+                        m = _sig_mtime(_stat_sig(child))
+                        if m is not None:
+                            images_mtime = m if images_mtime is None else max(images_mtime, m)
+                except Exception:
+                    images_count, images_mtime = 0, None
+
+        if prev and not force and prev_sig.get("timeline_manifest") == sig["timeline_manifest"]:
+            tm_episode = prev_data.get("tm_episode")
+        else:
+            raw, _err = _read_json(unit_dir / "timeline_manifest.json") if sig["timeline_manifest"] else (None, None)
+            ep = raw.get("episode") if isinstance(raw, dict) else None
+            tm_episode = ep if isinstance(ep, dict) else None
+
+        recency = [
+            _sig_mtime(sig[k]) for k in ("dir", "auto_run_info", "image_cues", "visual_cues_plan", "images") if sig[k]
+        ]
+        return {
+            "mtime": _sig_mtime(sig["dir"]) or 0.0,
+            "recency": max(recency) if recency else 0.0,
+            "cues_mtime": _sig_mtime(sig["image_cues"]),
+            "cue_count": cue_count,
+            "prompt_count": prompt_count,
+            "images_count": images_count,
+            "images_mtime": images_mtime,
+            "has_timeline_manifest": sig["timeline_manifest"] is not None,
+            "tm_episode": tm_episode,
+            "capcut_draft_info_mtime": _sig_mtime(sig["capcut_draft_info"]) or 0.0,
+        }
+
+
+_LAYOUTS = {
+    KIND_SCRIPTS: _ScriptsLayout,
+    KIND_AUDIO_FINAL: _AudioFinalLayout,
+    KIND_VIDEO_RUNS: _VideoRunsLayout,
+}
+
+
+# ---------------------------------------------------------------------------
+# Per-root index
+# ---------------------------------------------------------------------------
+
+Entry = Tuple[Dict[str, Sig], Dict[str, Any]]
+
+# Process-wide, so versions never repeat across re-created indexes (see RootIndex.version()).
+_VERSIONS = itertools.count(1)
+
+
+class RootIndex:
+    """Index of one root (e.g. workspaces/scripts). Query methods sync first; returned dicts are read-only."""
+
+    def __init__(self, kind: str, root: Path) -> None:
+        self.kind = kind
+        self.root = Path(root)
+        self.layout = _LAYOUTS[kind]
+        self.stats: Dict[str, int] = {"full_scans": 0, "unit_refreshes": 0, "events": 0}
+        self._lock = threading.RLock()
+        self._groups: set[str] = set()
+        self._units: Dict[str, Entry] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._watcher: Optional[InotifyWatcher] = None
+        self._loaded = False
+        self._last_scan = 0.0
+        self._root_present = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._epoch = 0
+        self._root_version = 0
+        self._group_versions: Dict[str, int] = {}
+        self._unit_versions: Dict[str, int] = {}
+
+    # -- queries ------------------------------------------------------------
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and not self._watcher.closed
+
+    def groups(self) -> List[str]:
+        with self._lock:
+            self.sync()
+            return sorted(self._groups)
+
+    def units(self, group: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """{unit_name: data} of one group (CHxx), or of the whole root for single-level layouts."""
+        with self._lock:
+            self.sync()
+            if group is None:
+                return {rel: data for rel, (_sig, data) in self._units.items()}
+            prefix = f"{group}/"
+            return {rel[len(prefix):]: data for rel, (_sig, data) in self._units.items() if rel.startswith(prefix)}
+
+    def unit(self, rel: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self.sync()
+            entry = self._units.get(rel)
+            return entry[1] if entry else None
+
+    def version(self, group: Optional[str] = None) -> int:
+        """
+        Token that changes whenever an entry (of `group`) is added, changed or dropped, or the group
+        dir itself appears/disappears. Compare for equality only (cache keys for derived views).
+        """
+        with self._lock:
+            self.sync()
+            if group is None:
+                return self._root_version
+            return self._group_versions.get(group, self._epoch)
+
+    def unit_version(self, rel: str) -> int:
+        with self._lock:
+            self.sync()
+            return self._unit_versions.get(rel, self._epoch)
+
+    # -- sync ---------------------------------------------------------------
+
+    def sync(self) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._epoch = self._root_version = next(_VERSIONS)
+                self._load()
+                self._watcher = InotifyWatcher.create()
+                self._full_scan()
+            elif self.watching and (self._root_present or not self.root.is_dir()):
+                self._pump()
+            elif time.monotonic() - self._last_scan >= _poll_sec():
+                self._full_scan()
+            self._persist()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.close()
+            self._watcher = None
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+            self._conn = None
+            self._loaded = False
+            self._units.clear()
+            self._groups.clear()
+            self._group_versions.clear()
+            self._unit_versions.clear()
+
+    def _watch(self, path: Path) -> None:
+        if self._watcher is None:
+            return
+        if not self._watcher.add(path) and path.is_dir():
+            # Watch limit (ENOSPC) or unsupported FS: degrade to rescans rather than miss events.
+            self._watcher.close()
+            self._watcher = None
+
+    def _full_scan(self) -> None:
+        self.stats["full_scans"] += 1
+        self._last_scan = time.monotonic()
+        seen: set[str] = set()
+        groups: set[str] = set()
+        self._root_present = self.root.is_dir()
+        if self._root_present:
+            self._watch(self.root)
+            try:
+                children = sorted(self.root.iterdir())
+            except Exception:
+                children = []
+            for child in children:
+                if not child.is_dir():
+                    continue
+                if self.layout.depth == 1:
+                    if self.layout.is_unit(child.name):
+                        self._refresh(child.name, child)
+                        seen.add(child.name)
+                    continue
+                if not self.layout.is_group(child.name):
+                    continue
+                groups.add(child.name)
+                seen.update(self._scan_group(child.name))
+        for group in groups ^ self._groups:
+            self._bump(group)
+        self._groups = groups
+        for rel in [r for r in self._units if r not in seen]:
+            self._drop(rel)
+
+    def _scan_group(self, group: str) -> set[str]:
+        group_dir = self.root / group
+        seen: set[str] = set()
+        if group_dir.is_dir():
+            self._watch(group_dir)
+            try:
+                children = sorted(group_dir.iterdir())
+            except Exception:
+                children = []
+            for child in children:
+                if child.is_dir() and self.layout.is_unit(child.name):
+                    rel = f"{group}/{child.name}"
+                    self._refresh(rel, child)
+                    seen.add(rel)
+        return seen
+
+    def _refresh(self, rel: str, unit_dir: Path, *, force: bool = False) -> None:
+        self._watch(unit_dir)
+        for sub in self.layout.subdirs:
+            if (unit_dir / sub).is_dir():
+                self._watch(unit_dir / sub)
+        sig = self.layout.signature(unit_dir)
+        prev = self._units.get(rel)
+        if prev is not None and prev[0] == sig and not force:
+            return
+        self.stats["unit_refreshes"] += 1
+        data = self.layout.build(unit_dir, sig, prev, force)
+        self._units[rel] = (sig, data)
+        self._dirty.add(rel)
+        self._removed.discard(rel)
+        if prev is None or prev[1] != data or prev[0] != sig:
+            self._bump(rel)
+
+    def _drop(self, rel: str) -> None:
+        if self._units.pop(rel, None) is not None:
+            self._removed.add(rel)
+            self._dirty.discard(rel)
+            self._bump(rel)
+
+    def _bump(self, rel: str) -> None:
+        version = next(_VERSIONS)
+        self._root_version = version
+        self._unit_versions[rel] = version
+        if self.layout.depth == 2:
+            self._group_versions[rel.split("/", 1)[0]] = version
+
+    def _pump(self) -> None:
+        assert self._watcher is not None
+        events = self._watcher.read_events(0.0)
+        if not events:
+            return
+        self.stats["events"] += len(events)
+        rescan_all = False
+        groups: set[str] = set()
+        units: set[str] = set()
+        for ev in events:
+            if ev.overflow or (ev.moved and ev.is_dir):
+                rescan_all = True
+                break
+            try:
+                parts = ev.path.relative_to(self.root).parts
+            except ValueError:
+                rescan_all = True
+                break
+            if not parts:
+                rescan_all = True  # the root itself was deleted/moved
+                break
+            if self.layout.depth == 1:
+                units.add(parts[0])
+            elif not self.layout.is_group(parts[0]):
+                continue
+            elif len(parts) == 1:
+                groups.add(parts[0])
+            else:
+                units.add(f"{parts[0]}/{parts[1]}")
+        if rescan_all:
+            # Renamed dirs keep stale watch paths: start over with a fresh watcher.
+            self._watcher.close()
+            self._watcher = InotifyWatcher.create()
+            self._full_scan()
+            return
+        for group in groups:
+            if not self.layout.is_group(group):
+                continue
+            if (self.root / group).is_dir():
+                if group not in self._groups:
+                    self._groups.add(group)
+                    self._bump(group)
+                seen = self._scan_group(group)
+            else:
+                if group in self._groups:
+                    self._groups.discard(group)
+                    self._bump(group)
+                seen = set()
+            for rel in [r for r in self._units if r.startswith(f"{group}/") and r not in seen]:
+                self._drop(rel)
+        for rel in units:
+            unit_dir = self.root / rel
+            if self.layout.depth == 2 and not self.layout.is_unit(unit_dir.name):
+                continue
+            if unit_dir.is_dir():
+                group = unit_dir.parent.name
+                if self.layout.depth == 2 and group not in self._groups:
+                    self._groups.add(group)
+                    self._bump(group)
+                self._refresh(rel, unit_dir, force=True)
+            else:
+                self._drop(rel)
+
+    # -- persistence --------------------------------------------------------
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            path = index_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), timeout=10.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS units ("
+                " root TEXT NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " rel TEXT NOT NULL,"
+                " sig TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " schema_version INTEGER NOT NULL,"
+                " indexed_at REAL NOT NULL,"
+                " PRIMARY KEY(root, kind, rel))"
+            )
+            # Forget roots that no longer exist (moved workspaces, temp trees).
+            stale = [
+                (r,) for (r,) in conn.execute("SELECT DISTINCT root FROM units").fetchall() if not Path(str(r)).is_dir()
+            ]
+            if stale:
+                conn.executemany("DELETE FROM units WHERE root=?", stale)
+        except Exception:
+            return None
+        self._conn = conn
+        return conn
+
+    def _load(self) -> None:
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            rows = conn.execute(
+                "SELECT rel, sig, data FROM units WHERE root=? AND kind=? AND schema_version=?",
+                (str(self.root), self.kind, SCHEMA_VERSION),
+            ).fetchall()
+        except Exception:
+            return
+        for rel, sig, data in rows:
+            try:
+                self._units[str(rel)] = (json.loads(sig), json.loads(data))
+            except Exception:
+                continue
+
+    def _persist(self) -> None:
+        if not self._dirty and not self._removed:
+            return
+        conn = self._db()
+        dirty, removed = self._dirty, self._removed
+        self._dirty, self._removed = set(), set()
+        if conn is None:
+            return
+        now = time.time()
+        root = str(self.root)
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR REPLACE INTO units(root, kind, rel, sig, data, schema_version, indexed_at) VALUES(?,?,?,?,?,?,?)",
+                [
+                    (root, self.kind, rel, json.dumps(self._units[rel][0]), json.dumps(self._units[rel][1], ensure_ascii=False), SCHEMA_VERSION, now)
+                    for rel in dirty
+                    if rel in self._units
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM units WHERE root=? AND kind=? AND rel=?", [(root, self.kind, rel) for rel in removed]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+
+
+# Each live index holds one inotify instance (kernel default: 128 per user); keep the most recently used.
+_MAX_LIVE_INDEXES = 16
+
+_INDEXES: "OrderedDict[Tuple[str, str], RootIndex]" = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(kind: str, root: Path) -> RootIndex:
+    """Process-wide index for (kind, root); created (and loaded from SQLite) on first use."""
+    if kind not in _LAYOUTS:
+        raise ValueError(f"unknown workspace index kind: {kind}")
+    key = (kind, str(Path(root)))
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = RootIndex(kind, Path(root))
+            _INDEXES[key] = idx
+            while len(_INDEXES) > _MAX_LIVE_INDEXES:
+                _key, evicted = _INDEXES.popitem(last=False)
+                evicted.close()
+        else:
+            _INDEXES.move_to_end(key)
+        return idx
+
+
+def reset_indexes() -> None:
+    """Close all watchers/connections (tests, or after moving workspaces)."""
+    with _INDEXES_LOCK:
+        for idx in _INDEXES.values():
+            idx.close()
+        _INDEXES.clear()
+
+
+def scripts_index(root: Path) -> RootIndex:
+    return get_index(KIND_SCRIPTS, root)
+
+
+def audio_final_index(root: Path) -> RootIndex:
+    return get_index(KIND_AUDIO_FINAL, root)
+
+
+def video_runs_index(root: Path) -> RootIndex:
+    return get_index(KIND_VIDEO_RUNS, root)
@@ -1,12 +1,15 @@
 "Stage runner for script_pipeline (isolated from existing flows)."
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
+import threading
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Set
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 from .sot import load_status, save_status, init_status, status_path, Status, StageState
 from .offline_generator import (
@@ -17,7 +20,7 @@ from .offline_generator import (
 from .validator import validate_stage, validate_a_text
 from .tools import optional_fields_registry as opt_fields
 from .tools.planning_input_contract import apply_planning_input_contract
-from factory_common.artifacts.utils import atomic_write_json, utc_now_iso
+from factory_common.artifacts.utils import atomic_write_json, atomic_write_text, utc_now_iso
 from factory_common.artifacts.llm_text_output import (
     SourceFile,
     artifact_path_for_output,
@@ -5285,7 +5288,7 @@ def _normalize_llm_output(out_path: Path, stage: str) -> None:
         except Exception:
             pass
 
-    out_path.write_text(text + "\n", encoding="utf-8")
+    atomic_write_text(out_path, text + "\n")
 
 
 def _lines_over_limit(path: Path, limit: int) -> List[Tuple[int, int]]:
@@ -5375,7 +5378,7 @@ def _collect_llm_sources(placeholders: Dict[str, Any], base: Path, st: Status) -
 
     sources: Dict[str, SourceFile] = {}
     for key, raw in (placeholders or {}).items():
-        if key == "__log_suffix":
+        if key in ("__log_suffix", "__log_tag"):
             continue
         try:
             resolved = _resolve_placeholder_value(str(raw), base, st, st.channel, st.video)
@@ -5415,22 +5418,76 @@ def _write_prompt_snapshot(prompt_dir: Path, filename: str, prompt: str, *, base
     except Exception:
         return None
 
+_LLM_CALLS_LOCK = threading.Lock()  # chapter drafts may append concurrently
+
+
 def _append_llm_call(st: Status, stage: str, payload: Dict[str, Any]) -> None:
     try:
-        state = st.stages.get(stage)
-        if state is None:
-            state = StageState()
-            st.stages[stage] = state
-        calls = state.details.get("llm_calls")
-        if not isinstance(calls, list):
-            calls = []
-        calls.append(payload)
-        state.details["llm_calls"] = calls
+        with _LLM_CALLS_LOCK:
+            state = st.stages.get(stage)
+            if state is None:
+                state = StageState()
+                st.stages[stage] = state
+            calls = state.details.get("llm_calls")
+            if not isinstance(calls, list):
+                calls = []
+            calls.append(payload)
+            state.details["llm_calls"] = calls
     except Exception:
         # best-effort only
         pass
 
 
+def _chapter_draft_workers(channel: str, chapter_count: int) -> int:
+    """
+    Worker count for drafting chapters in `script_draft`.
+
+    Serial by default: parallel drafting changes script output, so channels opt in with
+    `chapter_draft_workers` in configs/sources.yaml. Channels that rely on cross-chapter continuity
+    set `chapter_draft_mode: serial` (wins over everything).
+
+    Priority: channel serial mode > env SCRIPT_CHAPTER_DRAFT_WORKERS > channels.<CH>.chapter_draft_workers
+    > script_globals.chapter_draft_workers > 1
+    """
+    if chapter_count <= 1:
+        return 1
+    sources = _load_sources(channel)
+    if str(sources.get("chapter_draft_mode") or "").strip().lower() == "serial":
+        return 1
+    raw = (os.getenv("SCRIPT_CHAPTER_DRAFT_WORKERS") or "").strip()
+    if not raw:
+        raw = str(sources.get("chapter_draft_workers") or "").strip()
+    if not raw:
+        raw = str(_load_script_globals().get("chapter_draft_workers") or "").strip()
+    try:
+        workers = int(raw) if raw else 1
+    except Exception:
+        workers = 1
+    return max(1, min(workers, chapter_count))
+
+
+def _run_chapter_jobs_concurrently(jobs: List[Tuple[int, Callable[[], bool]]], workers: int) -> bool:
+    """
+    Run per-chapter jobs on a bounded thread pool. Returns True if any job ran an LLM.
+
+    All started jobs are allowed to finish (each writes its own chapter/artifact), then the failure of the
+    lowest chapter number is re-raised so the stage stops exactly like the serial loop (incl. SystemExit
+    for THINK/pending artifacts).
+    """
+    ran = False
+    failures: List[Tuple[int, BaseException]] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="script-draft") as pool:
+        futures = [(num, pool.submit(fn)) for num, fn in jobs]
+        for num, fut in futures:
+            try:
+                ran = bool(fut.result()) or ran
+            except BaseException as e:  # noqa: BLE001 - SystemExit carries the pending-artifact message
+                failures.append((num, e))
+    if failures:
+        raise min(failures, key=lambda item: item[0])[1]
+    return ran
+
+
 def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates: Dict[str, Dict[str, Any]], extra_placeholders: Dict[str, str] | None = None, output_override: Path | None = None) -> bool:
     """
     Run an LLM-backed stage and write its primary output.
@@ -5468,6 +5525,8 @@ def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates:
     log_suffix = ""
     if extra_placeholders and "__log_suffix" in extra_placeholders:
         log_suffix = str(extra_placeholders.get("__log_suffix") or "")
+    # `__log_tag` only separates prompt/response logs (e.g. per chapter); artifact paths stay unchanged.
+    log_tag = str((extra_placeholders or {}).get("__log_tag") or "")
 
     placeholders = llm_cfg.get("placeholders") or {}
     if extra_placeholders:
@@ -5499,7 +5558,7 @@ def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates:
             )
         if not art.content.strip():
             raise SystemExit(f"[{stage}] LLM artifact is ready but content is empty: {artifact_path}")
-        out_path.write_text(art.content.rstrip("\n") + "\n", encoding="utf-8")
+        atomic_write_text(out_path, art.content.rstrip("\n") + "\n")
         _normalize_llm_output(out_path, stage)
         _append_llm_call(
             st,
@@ -5530,7 +5589,7 @@ def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates:
     # 2. Prepare Prompt
     ph_values: Dict[str, str] = {}
     for k, v in placeholders.items():
-        if k == "__log_suffix":
+        if k in ("__log_suffix", "__log_tag"):
             continue
         resolved_val = _resolve_placeholder_value(str(v), base, st, st.channel, st.video)
         if resolved_val.startswith("@"):
@@ -5573,13 +5632,13 @@ def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates:
     # Log path preparation
     stage_log_dir = base / "logs"
     stage_log_dir.mkdir(parents=True, exist_ok=True)
-    prompt_log = stage_log_dir / f"{stage}{log_suffix}_prompt.txt"
+    prompt_log = stage_log_dir / f"{stage}{log_suffix}{log_tag}_prompt.txt"
     try:
         prompt_log.write_text(prompt_text, encoding="utf-8")
     except Exception:
         pass
     
-    resp_log = stage_log_dir / f"{stage}{log_suffix}_response.json"
+    resp_log = stage_log_dir / f"{stage}{log_suffix}{log_tag}_response.json"
 
     try:
         # Optional params
@@ -5622,7 +5681,7 @@ def _run_llm(stage: str, base: Path, st: Status, sd: Dict[str, Any], templates:
             raise RuntimeError("LLM returned empty content")
 
         # Success - Save Output
-        out_path.write_text(content + "\n", encoding="utf-8")
+        atomic_write_text(out_path, content + "\n")
         
         # Log response
         try:
@@ -6727,7 +6786,10 @@ def run_stage(channel: str, video: str, stage_name: str, title: str | None = Non
             gen_paths = generate_chapter_drafts_offline(base, st, chapters, per_chapter_target=per_chapter)
             st.stages[stage_name].details["offline"] = True
         else:
-            for num, heading in chapters:
+            workers = _chapter_draft_workers(st.channel, len(chapters))
+            st.stages[stage_name].details["draft_workers"] = workers
+
+            def _draft_chapter(num: int, heading: str) -> bool:
                 out_path = base / "content" / "chapters" / f"chapter_{num}.md"
                 brief_obj = _load_chapter_brief(base, num)
                 extra_ph = {
@@ -6743,12 +6805,32 @@ def run_stage(channel: str, video: str, stage_name: str, title: str | None = Non
                     "META_JSON": json.dumps(st.metadata, ensure_ascii=False),
                     "BRIEF_JSON": json.dumps(brief_obj, ensure_ascii=False) if brief_obj else "{}",
                     "CHANNEL_STYLE_GUIDE": "from_style",
+                    # Per-chapter prompt/response logs, named the same for serial and parallel runs.
+                    "__log_tag": f"_chapter_{num}",
                 }
-                ran_llm = (
-                    _run_llm(stage_name, base, st, sd, templates, extra_placeholders=extra_ph, output_override=out_path)
-                    or ran_llm
-                )
-                gen_paths.append(str(out_path.relative_to(base)))
+                return _run_llm(stage_name, base, st, sd, templates, extra_placeholders=extra_ph, output_override=out_path)
+
+            if workers <= 1:
+                for num, heading in chapters:
+                    ran_llm = _draft_chapter(num, heading) or ran_llm
+            else:
+                # Routing key is process-global env: pin it once for the whole fan-out.
+                prev_routing_key = os.environ.get("LLM_ROUTING_KEY")
+                os.environ["LLM_ROUTING_KEY"] = f"{st.channel}-{st.video}"
+                try:
+                    ran_llm = (
+                        _run_chapter_jobs_concurrently(
+                            [(num, functools.partial(_draft_chapter, num, heading)) for num, heading in chapters],
+                            workers,
+                        )
+                        or ran_llm
+                    )
+                finally:
+                    if prev_routing_key is None:
+                        os.environ.pop("LLM_ROUTING_KEY", None)
+                    else:
+                        os.environ["LLM_ROUTING_KEY"] = prev_routing_key
+            gen_paths = [str((base / "content" / "chapters" / f"chapter_{num}.md").relative_to(base)) for num, _ in chapters]
         st.stages[stage_name].details["generated"] = gen_paths
         # Invalidate downstream assembly/QC when chapter drafts are (re)generated.
         #
@@ -382,16 +382,27 @@ def _fit_three_lines(
         max(size_min, int(s3 * scale)),
     )
 
-    for _ in range(200):
-        h = total_height(sizes)
-        if h <= max_height:
-            return sizes
-        s1, s2, s3 = sizes
-        if s1 <= size_min and s2 <= size_min and s3 <= size_min:
-            return sizes
-        sizes = (max(size_min, s1 - 1), max(size_min, s2 - 1), max(size_min, s3 - 1))
-
-    return sizes
+    # Uniform shrink: step k lowers every line by k px (floored at size_min). Height only drops as
+    # k grows, so bisect for the first step that fits (or bottoms out) instead of walking 200 steps.
+    scaled = sizes
+
+    def shrunk(k: int) -> Tuple[int, int, int]:
+        return (max(size_min, scaled[0] - k), max(size_min, scaled[1] - k), max(size_min, scaled[2] - k))
+
+    def settles(k: int) -> bool:
+        cand = shrunk(k)
+        return total_height(cand) <= max_height or all(s <= size_min for s in cand)
+
+    lo, hi = 0, 199
+    best = 200
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if settles(mid):
+            best = mid
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    return shrunk(best)
 
 
 def compose_buddha_3line(
@@ -11,8 +11,9 @@ import subprocess
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
 
 from factory_common import paths as fpaths
@@ -100,11 +101,8 @@ def _build_vertical_gradient(size: Tuple[int, int], stops: Sequence[Sequence[Any
         return Image.new("RGBA", size, (255, 255, 255, 255))
     parsed.sort(key=lambda it: it[1])
 
-    img = Image.new("RGBA", size)
-    px = img.load()
-    if px is None:
-        return img
-
+    # One color per row (same float math as the old per-pixel loop), then broadcast across X.
+    rows: List[RGBA] = []
     for y in range(h):
         t = y / max(1, (h - 1))
         lo = parsed[0]
@@ -115,13 +113,14 @@ def _build_vertical_gradient(size: Tuple[int, int], stops: Sequence[Sequence[Any
                 hi = parsed[i + 1]
                 break
         if hi[1] == lo[1]:
-            col = lo[0]
+            rows.append(lo[0])
         else:
             local_t = (t - lo[1]) / (hi[1] - lo[1])
-            col = _lerp_rgba(lo[0], hi[0], local_t)
-        for x in range(w):
-            px[x, y] = col
-    return img
+            rows.append(_lerp_rgba(lo[0], hi[0], local_t))
+    # Stops outside 0..1 extrapolate; PIL pixel writes clamp, so clamp here too.
+    col = np.clip(np.asarray(rows, dtype=np.int64), 0, 255).astype(np.uint8)
+    arr = np.ascontiguousarray(np.broadcast_to(col[:, None, :], (h, w, 4)))
+    return Image.fromarray(arr)
 
 
 def _tokenize_for_wrap(text: str) -> List[str]:
@@ -248,7 +247,14 @@ def _wrap_tokens_to_lines(
     max_lines: int,
     stroke_width: int,
     tracking: int,
+    *,
+    measure: Optional[Callable[[str], Tuple[int, int]]] = None,
 ) -> Tuple[List[str], bool]:
+    if measure is None:
+
+        def measure(s: str) -> Tuple[int, int]:
+            return _measure_line(font, s, stroke_width=stroke_width, tracking=tracking)
+
     lines: List[str] = []
     cur = ""
     overflow = False
@@ -272,7 +278,7 @@ def _wrap_tokens_to_lines(
         if tok == " " and not cur:
             continue
         candidate = cur + tok
-        w, _ = _measure_line(font, candidate, stroke_width=stroke_width, tracking=tracking)
+        w, _ = measure(candidate)
         if w <= max_width:
             cur = candidate
             continue
@@ -284,7 +290,7 @@ def _wrap_tokens_to_lines(
             hard = ""
             for ch in tok:
                 cand = hard + ch
-                w2, _ = _measure_line(font, cand, stroke_width=stroke_width, tracking=tracking)
+                w2, _ = measure(cand)
                 if w2 <= max_width or not hard:
                     hard = cand
                     continue
@@ -306,6 +312,95 @@ def _wrap_tokens_to_lines(
     return lines, overflow
 
 
+# NOTE:
+# Layout search re-wraps the same slot text at many candidate sizes, and the same (text, box) is
+# fitted again for auto top-band sizing and per-slot renders. `_TextMetrics` memoizes glyph
+# advances/bboxes, line measurements and wrap results per (font, size, stroke, tracking); the
+# memo tables are bounded and simply reset when full. Measurements are computed exactly like
+# `_measure_line` / `_bbox_text_with_tracking`, so cached and uncached layouts are identical.
+_TEXT_METRICS_MEMO_MAX = 4096
+# Ladder steps re-probed above the bisected fit boundary (absorbs line-height jitter).
+_FIT_REFINE_STEPS = 3
+
+
+class _TextMetrics:
+    def __init__(self, font_ref: str, size: int, stroke_width: int, tracking: int) -> None:
+        self.font = _load_truetype(font_ref, int(size))
+        self.stroke_width = int(stroke_width or 0)
+        self.tracking = int(tracking or 0)
+        self._glyphs: Dict[str, Tuple[int, Tuple[int, int, int, int]]] = {}
+        self._lines: Dict[str, Tuple[int, int]] = {}
+        self._wraps: Dict[Tuple[Tuple[str, ...], int, int], Tuple[Tuple[str, ...], bool]] = {}
+
+    def _glyph(self, ch: str) -> Tuple[int, Tuple[int, int, int, int]]:
+        hit = self._glyphs.get(ch)
+        if hit is None:
+            hit = (
+                _font_advance_px(self.font, ch),
+                self.font.getbbox(ch, stroke_width=self.stroke_width, anchor="la"),
+            )
+            self._glyphs[ch] = hit
+        return hit
+
+    def _line_bbox(self, text: str) -> Tuple[int, int, int, int]:
+        if not text or self.tracking == 0:
+            return self.font.getbbox(text or "", stroke_width=self.stroke_width, anchor="la")
+        # Same accumulation as _iter_text_glyph_offsets + _bbox_text_with_tracking.
+        x0 = y0 = x1 = y1 = 0
+        x = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            adv, bbox = self._glyph(ch)
+            gx0 = int(x + bbox[0])
+            gx1 = int(x + bbox[2])
+            if i == 0:
+                x0, y0, x1, y1 = gx0, int(bbox[1]), gx1, int(bbox[3])
+            else:
+                x0 = min(x0, gx0)
+                y0 = min(y0, int(bbox[1]))
+                x1 = max(x1, gx1)
+                y1 = max(y1, int(bbox[3]))
+            if i < last:
+                x += int(adv + self.tracking)
+        return (x0, y0, x1, y1)
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        if not text:
+            return (0, 0)
+        hit = self._lines.get(text)
+        if hit is None:
+            bbox = self._line_bbox(text)
+            hit = (max(0, int(bbox[2] - bbox[0])), max(0, int(bbox[3] - bbox[1])))
+            if len(self._lines) >= _TEXT_METRICS_MEMO_MAX:
+                self._lines.clear()
+            self._lines[text] = hit
+        return hit
+
+    def wrap(self, tokens: Tuple[str, ...], max_width: int, max_lines: int) -> Tuple[List[str], bool]:
+        key = (tokens, int(max_width), int(max_lines))
+        hit = self._wraps.get(key)
+        if hit is None:
+            lines, overflow = _wrap_tokens_to_lines(
+                tokens,
+                self.font,
+                max_width=max_width,
+                max_lines=max_lines,
+                stroke_width=self.stroke_width,
+                tracking=self.tracking,
+                measure=self.measure,
+            )
+            hit = (tuple(lines), overflow)
+            if len(self._wraps) >= _TEXT_METRICS_MEMO_MAX:
+                self._wraps.clear()
+            self._wraps[key] = hit
+        return list(hit[0]), hit[1]
+
+
+@lru_cache(maxsize=256)
+def _text_metrics(font_ref: str, size: int, stroke_width: int, tracking: int) -> _TextMetrics:
+    return _TextMetrics(font_ref, size, stroke_width, tracking)
+
+
 @dataclass(frozen=True)
 class FitResult:
     lines: List[str]
@@ -329,36 +424,88 @@ def _fit_text_to_box(
     if not raw:
         return FitResult(lines=[], font_size=base_size, line_gap=0, stroke_width=stroke_width)
 
-    tokens = _tokenize_for_wrap(raw)
-    size = max(min_size, int(base_size))
-    tr = int(tracking or 0)
-    while size >= min_size:
-        font = _load_truetype(font_path, size)
-        lines, overflow = _wrap_tokens_to_lines(
-            tokens,
-            font,
-            max_width=max_width,
-            max_lines=max_lines,
-            stroke_width=stroke_width,
-            tracking=tr,
-        )
+    lines, size, gap = _fit_text_to_box_cached(
+        raw,
+        str(font_path),
+        max(min_size, int(base_size)),
+        int(max_width),
+        int(max_height),
+        int(max_lines),
+        int(stroke_width),
+        int(tracking or 0),
+        int(min_size),
+    )
+    return FitResult(lines=list(lines), font_size=size, line_gap=gap, stroke_width=stroke_width)
+
+
+@lru_cache(maxsize=2048)
+def _fit_text_to_box_cached(
+    raw: str,
+    font_path: str,
+    start_size: int,
+    max_width: int,
+    max_height: int,
+    max_lines: int,
+    stroke_width: int,
+    tr: int,
+    min_size: int,
+) -> Tuple[Tuple[str, ...], int, int]:
+    """
+    Largest size on the start_size, start_size-2, ... >= min_size ladder whose wrap fits the box.
+
+    Fit-ness is monotone in font size up to bbox jitter (tight line heights change with
+    descenders; hard-split tokens re-break), so the ladder is bisected and the few sizes just
+    above the boundary are re-probed. Falls back to min_size when nothing fits.
+    """
+    tokens = tuple(_tokenize_for_wrap(raw))
+    ladder = list(range(start_size, min_size - 1, -2))
+    probed: Dict[int, Optional[Tuple[Tuple[str, ...], int, int]]] = {}
+
+    def attempt(idx: int) -> Optional[Tuple[Tuple[str, ...], int, int]]:
+        if idx not in probed:
+            probed[idx] = _attempt_size(ladder[idx])
+        return probed[idx]
+
+    def _attempt_size(size: int) -> Optional[Tuple[Tuple[str, ...], int, int]]:
+        metrics = _text_metrics(font_path, size, stroke_width, tr)
+        lines, overflow = metrics.wrap(tokens, max_width, max_lines)
+        if overflow:
+            return None
         gap = max(2, int(round(size * 0.03)))
         total_h = 0
         max_w = 0
         for idx, line in enumerate(lines):
-            w, h = _measure_line(font, line, stroke_width=stroke_width, tracking=tr)
+            w, h = metrics.measure(line)
             max_w = max(max_w, w)
             total_h += h
             if idx > 0:
                 total_h += gap
-        if (not overflow) and max_w <= max_width and total_h <= max_height:
-            return FitResult(lines=lines, font_size=size, line_gap=gap, stroke_width=stroke_width)
-        size -= 2
+        if max_w <= max_width and total_h <= max_height:
+            return (tuple(lines), size, gap)
+        return None
+
+    # Most slots fit at their authored size: one probe, no search.
+    if attempt(0) is not None:
+        return probed[0]  # type: ignore[return-value]
+    best_idx: Optional[int] = None
+    lo, hi = 1, len(ladder) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if attempt(mid) is not None:
+            best_idx = mid
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    if best_idx is not None:
+        idx = best_idx - 1
+        while idx >= 1 and idx >= best_idx - _FIT_REFINE_STEPS:
+            if attempt(idx) is not None:
+                best_idx = idx
+            idx -= 1
+        return probed[best_idx]  # type: ignore[return-value]
 
-    font = _load_truetype(font_path, min_size)
-    lines, _ = _wrap_tokens_to_lines(tokens, font, max_width=max_width, max_lines=max_lines, stroke_width=stroke_width, tracking=tr)
-    gap = max(2, int(round(min_size * 0.03)))
-    return FitResult(lines=lines, font_size=min_size, line_gap=gap, stroke_width=stroke_width)
+    lines, _ = _text_metrics(font_path, min_size, stroke_width, tr).wrap(tokens, max_width, max_lines)
+    return (tuple(lines), min_size, max(2, int(round(min_size * 0.03))))
 
 
 def _total_text_height_px(
@@ -911,6 +1058,26 @@ def _resolve_font_path_from_spec(fonts: Dict[str, Any], font_key: str) -> str:
     return _fallback_font_path()
 
 
+def resolve_layout_font_files(text_layout_spec: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Font file each `fonts` key of a text layout spec resolves to (same lookup as rendering).
+
+    The fallback font is reported under the empty key. Unresolvable fonts map to None.
+    """
+    fonts = text_layout_spec.get("fonts") if isinstance(text_layout_spec, dict) else None
+    keys = [""] + sorted(str(k) for k in fonts.keys()) if isinstance(fonts, dict) else [""]
+    out: Dict[str, Optional[str]] = {}
+    for key in keys:
+        try:
+            ref = _resolve_font_path_from_spec(fonts, key) if key else _fallback_font_path()
+        except Exception:
+            out[key] = None
+            continue
+        path, _index, _variation = _split_font_ref(ref)
+        out[key] = _resolve_font_file_path(path) or None
+    return out
+
+
 def _render_text_lines(
     base: Image.Image,
     *,
@@ -1096,6 +1263,16 @@ def _normalize_video_id(channel: str, video: str) -> str:
     return f"{ch}-{v}"
 
 
+def _linear_alpha_ramp(n: int, start_px: int, end_px: int, a0: float, a1: float) -> "np.ndarray":
+    """uint8 ramp of length n: a0..a1 over [start_px, end_px), zero elsewhere."""
+    values = np.zeros(n, dtype=np.uint8)
+    span = max(1, end_px - start_px)
+    t = np.arange(end_px - start_px, dtype=np.float64) / span
+    alpha = (a0 * (1.0 - t)) + (a1 * t)
+    values[start_px:end_px] = np.rint(alpha * 255).astype(np.uint8)
+    return values
+
+
 def _apply_horizontal_overlay(
     base: Image.Image,
     *,
@@ -1124,16 +1301,8 @@ def _apply_horizontal_overlay(
     if end_px <= start_px:
         return img
 
-    values: List[int] = [0] * w
-    span = max(1, end_px - start_px)
-    for x in range(start_px, end_px):
-        t = (x - start_px) / span
-        alpha = (a0 * (1.0 - t)) + (a1 * t)
-        values[x] = int(round(alpha * 255))
-
-    mask_row = Image.new("L", (w, 1), 0)
-    mask_row.putdata(values)
-    mask = mask_row.resize((w, h))
+    values = _linear_alpha_ramp(w, start_px, end_px, a0, a1)
+    mask = Image.fromarray(np.ascontiguousarray(np.broadcast_to(values[None, :], (h, w))))
 
     overlay = Image.new("RGBA", (w, h), (color[0], color[1], color[2], 255))
     overlay.putalpha(mask)
@@ -1167,16 +1336,8 @@ def _apply_vertical_overlay(
     if end_px <= start_px:
         return img
 
-    values: List[int] = [0] * h
-    span = max(1, end_px - start_px)
-    for y in range(start_px, end_px):
-        t = (y - start_px) / span
-        alpha = (a0 * (1.0 - t)) + (a1 * t)
-        values[y] = int(round(alpha * 255))
-
-    mask_col = Image.new("L", (1, h), 0)
-    mask_col.putdata(values)
-    mask = mask_col.resize((w, h))
+    values = _linear_alpha_ramp(h, start_px, end_px, a0, a1)
+    mask = Image.fromarray(np.ascontiguousarray(np.broadcast_to(values[:, None], (h, w))))
 
     overlay = Image.new("RGBA", (w, h), (color[0], color[1], color[2], 255))
     overlay.putalpha(mask)
@@ -1187,27 +1348,35 @@ def _stable_seed_u64(key: str) -> int:
     return int.from_bytes(digest[:8], "big", signed=False)
 
 
-def _smooth_noise(values: List[float], *, window: int) -> List[float]:
-    if not values:
-        return []
+def _smooth_noise_array(values: "np.ndarray", *, window: int) -> "np.ndarray":
+    """
+    Centered moving average (window shrinks at the ends).
+
+    Offsets are summed in the same left-to-right order as the scalar loop it replaced, so the
+    float results are bit-identical (adding 0.0 for out-of-range taps is exact).
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    n = int(vals.shape[0])
     w = max(1, int(window))
-    if w <= 1:
-        return list(values)
+    if n == 0 or w <= 1:
+        return vals.copy()
     if w % 2 == 0:
         w += 1
     half = w // 2
-    n = len(values)
-    out: List[float] = [0.0] * n
-    for i in range(n):
-        s = 0.0
-        c = 0
-        lo = max(0, i - half)
-        hi = min(n - 1, i + half)
-        for j in range(lo, hi + 1):
-            s += float(values[j])
-            c += 1
-        out[i] = s / float(c or 1)
-    return out
+    padded = np.zeros(n + 2 * half, dtype=np.float64)
+    padded[half : half + n] = vals
+    s = np.zeros(n, dtype=np.float64)
+    for k in range(w):
+        s += padded[k : k + n]
+    idx = np.arange(n)
+    counts = np.minimum(n - 1, idx + half) - np.maximum(0, idx - half) + 1
+    return s / counts.astype(np.float64)
+
+
+def _smooth_noise(values: List[float], *, window: int) -> List[float]:
+    if not values:
+        return []
+    return _smooth_noise_array(np.asarray(values, dtype=np.float64), window=window).tolist()
 
 
 def _build_brush_band_mask(
@@ -1243,21 +1412,17 @@ def _build_brush_band_mask(
 
     rng = random.Random(int(seed) & 0xFFFFFFFF_FFFFFFFF)
 
-    # Low-frequency noise curve along X
+    # Low-frequency noise curve along X (piecewise-linear between control points; each x takes
+    # the segment that starts at or before it, matching the old overwrite order).
     step = max(18, int(round(w / 72.0)))
-    cps = [rng.uniform(-1.0, 1.0) for _ in range((w // step) + 3)]
-    raw_noise: List[float] = [0.0] * w
-    for i in range(len(cps) - 1):
-        x0 = i * step
-        x1 = min(w - 1, (i + 1) * step)
-        if x0 >= w:
-            break
-        v0, v1 = cps[i], cps[i + 1]
-        span = max(1, x1 - x0)
-        for x in range(x0, x1 + 1):
-            t = (x - x0) / float(span)
-            raw_noise[x] = (v0 * (1.0 - t)) + (v1 * t)
-    noise = _smooth_noise(raw_noise, window=max(5, step // 2))
+    cps = np.asarray([rng.uniform(-1.0, 1.0) for _ in range((w // step) + 3)], dtype=np.float64)
+    xs = np.arange(w)
+    seg = xs // step
+    seg_x0 = seg * step
+    seg_span = np.maximum(1, np.minimum(w - 1, seg_x0 + step) - seg_x0)
+    t = (xs - seg_x0) / seg_span.astype(np.float64)
+    raw_noise = (cps[seg] * (1.0 - t)) + (cps[seg + 1] * t)
+    noise = _smooth_noise_array(raw_noise, window=max(5, step // 2))
 
     # Edge curve (near the far side of the band so the text region stays solid).
     if edge_key == "bottom":
@@ -1271,28 +1436,15 @@ def _build_brush_band_mask(
         max_edge = int(round(h * 0.20))
 
     amp = max(1, int(round(h * rough)))
-    curve: List[int] = [0] * w
-    for x in range(w):
-        ey = base_edge + int(round(noise[x] * amp))
-        curve[x] = max(min_edge, min(max_edge, ey))
+    curve = np.clip(base_edge + np.rint(noise * amp).astype(np.int64), min_edge, max_edge)
 
-    mask = Image.new("L", (w, h), 0)
-    pix = mask.load()
-
-    for x in range(w):
-        ey = int(curve[x])
-        if edge_key == "bottom":
-            for y in range(0, max(0, min(h, ey))):
-                pix[x, y] = a
-            for y in range(max(0, ey), max(0, min(h, ey + feather))):
-                t = (y - ey) / float(feather)
-                pix[x, y] = int(round(a * (1.0 - t)))
-        else:
-            for y in range(max(0, ey), h):
-                pix[x, y] = a
-            for y in range(max(0, ey - feather), max(0, min(h, ey))):
-                t = (ey - y) / float(feather)
-                pix[x, y] = int(round(a * (1.0 - t)))
+    # Solid side + linear feather, per column.
+    d = np.arange(h, dtype=np.int64)[:, None] - curve[None, :]
+    if edge_key == "top":
+        d = -d
+    ramp = np.rint(a * (1.0 - (d / float(feather)))).astype(np.int64)
+    arr = np.where(d < 0, a, np.where(d < feather, ramp, 0)).astype(np.uint8)
+    mask = Image.fromarray(arr)
 
     # Punch a few "bristle holes" near the rough edge.
     holes = max(0, int(hole_count))
@@ -1315,37 +1467,28 @@ def _build_brush_band_mask(
     # Add dry-brush texture near the rough edge (avoid "flat rectangle" look).
     if a > 0 and rough > 0.0:
         edge_band = int(round(max(18.0, float(feather) * 1.6, float(h) * 0.10)))
-        edge_band = max(8, min(h, edge_band))
+        # Bands shorter than 8px used to index past the mask (IndexError / wrapped rows).
+        edge_band = min(h, max(8, edge_band))
         # Higher-res noise to avoid large "bubble" artifacts.
         nw = max(96, w // 24)
         nh = max(24, edge_band // 3)
         noise_small = Image.new("L", (nw, nh), 0)
         noise_small.putdata([rng.randint(0, 255) for _ in range(nw * nh)])
-        noise = noise_small.resize((w, edge_band), resample=Image.BILINEAR)
-        noise_px = noise.load()
+        tex = np.asarray(noise_small.resize((w, edge_band), resample=Image.BILINEAR), dtype=np.float64)
 
+        f = 0.60 + (0.40 * (tex / 255.0))
+        rows = np.arange(edge_band, dtype=np.float64)
         if edge_key == "bottom":
             y_start = h - edge_band
-            for y in range(y_start, h):
-                wy = (y - y_start) / float(max(1, edge_band - 1))  # 0..1 (strong near bottom)
-                for x in range(w):
-                    cur = int(pix[x, y] or 0)
-                    if cur <= 0:
-                        continue
-                    n = float(noise_px[x, y - y_start]) / 255.0
-                    f = 0.60 + (0.40 * n)
-                    pix[x, y] = int(round(cur * ((1.0 - wy) + (wy * f))))
+            wy = rows / float(max(1, edge_band - 1))  # 0..1 (strong near bottom)
         else:
-            y_end = edge_band
-            for y in range(0, y_end):
-                wy = (y_end - 1 - y) / float(max(1, y_end - 1))  # 0..1 (strong near top)
-                for x in range(w):
-                    cur = int(pix[x, y] or 0)
-                    if cur <= 0:
-                        continue
-                    n = float(noise_px[x, y]) / 255.0
-                    f = 0.60 + (0.40 * n)
-                    pix[x, y] = int(round(cur * ((1.0 - wy) + (wy * f))))
+            y_start = 0
+            wy = ((edge_band - 1) - rows) / float(max(1, edge_band - 1))  # 0..1 (strong near top)
+        arr = np.array(mask, dtype=np.uint8)
+        cur = arr[y_start : y_start + edge_band].astype(np.float64)
+        scaled = np.rint(cur * ((1.0 - wy[:, None]) + (wy[:, None] * f)))
+        arr[y_start : y_start + edge_band] = scaled.astype(np.uint8)
+        mask = Image.fromarray(arr)
 
     if blur:
         mask = mask.filter(ImageFilter.GaussianBlur(radius=float(blur)))
@@ -1408,18 +1551,17 @@ def _build_brush_stroke_mask(
     mask = ImageChops.darker(top, bottom)
 
     # End taper: fade alpha near left/right ends so it reads as a brush stroke, not a rectangle.
+    # The curve only depends on the distance to the nearer end (saturating at end_span), so
+    # evaluate it once per distance; Python's pow keeps the values identical across platforms.
     end_span = max(10, int(round(w * (0.14 + (0.10 * rough)))))
-    taper_vals: List[int] = [0] * w
-    for x in range(w):
-        dist = min(x, (w - 1) - x)
-        t = min(1.0, float(dist) / float(end_span))
-        # Ease-in to keep center solid and ends thin.
-        t = t ** 0.70
-        factor = 0.10 + (0.90 * t)
-        taper_vals[x] = int(round(255 * factor))
-    taper_mask = Image.new("L", (w, 1), 0)
-    taper_mask.putdata(taper_vals)
-    taper_mask = taper_mask.resize((w, h), resample=Image.BILINEAR)
+    taper_lut = np.asarray(
+        [int(round(255 * (0.10 + (0.90 * (min(1.0, float(d) / float(end_span)) ** 0.70))))) for d in range(end_span + 1)],
+        dtype=np.uint8,
+    )
+    xs = np.arange(w)
+    dist = np.minimum(np.minimum(xs, (w - 1) - xs), end_span)
+    taper = taper_lut[dist]
+    taper_mask = Image.fromarray(np.ascontiguousarray(np.broadcast_to(taper[None, :], (h, w))))
     mask = ImageChops.multiply(mask, taper_mask)
 
     draw = ImageDraw.Draw(mask)
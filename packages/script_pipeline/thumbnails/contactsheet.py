@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from factory_common import paths as fpaths
+from script_pipeline.thumbnails.io_utils import PngOutputMode, resolve_png_save_options
+
+# NOTE:
+# QC contact sheets for 200+ variants used to decode every full-size thumbnail and paste it into
+# one in-memory canvas. Tiles now come from a preview cache (downscaled PNGs keyed by source
+# path/size/mtime + tile size) and the sheet is encoded one grid row at a time, so memory stays
+# at one row of tiles regardless of the sheet size and re-running QC only decodes changed sources.
+#
+# Env toggles:
+# - THUMB_QC_TILE_CACHE_DISABLE=1   -> always decode sources (nothing written to the cache)
+# - THUMB_QC_TILE_CACHE_DIR=/path   -> override cache dir (default: workspaces/thumbnails/_cache/qc_tiles)
+# - THUMB_QC_TILE_CACHE_MAX_MB=...  -> byte budget enforced after each sheet (default: 1024, 0 = unlimited)
+TILE_CACHE_VERSION = 1
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_IDAT_CHUNK_BYTES = 1 << 20
+
+
+def _truthy_env(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def tile_cache_enabled() -> bool:
+    return not _truthy_env("THUMB_QC_TILE_CACHE_DISABLE")
+
+
+def tile_cache_dir() -> Path:
+    raw = (os.getenv("THUMB_QC_TILE_CACHE_DIR") or "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return fpaths.thumbnails_root() / "_cache" / "qc_tiles"
+
+
+def _max_cache_bytes() -> int:
+    raw = (os.getenv("THUMB_QC_TILE_CACHE_MAX_MB") or "").strip()
+    try:
+        return max(0, int(raw)) * 1024 * 1024 if raw else 1024 * 1024 * 1024
+    except Exception:
+        return 1024 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SheetTile:
+    """One grid cell: `path=None` (or a missing file) renders the placeholder."""
+
+    label: str
+    path: Optional[Path]
+
+
+def pick_label_font(size: int = 28) -> ImageFont.ImageFont:
+    for cand in ("/System/Library/Fonts/Helvetica.ttc", "/System/Library/Fonts/Supplemental/Arial Unicode.ttf"):
+        try:
+            return ImageFont.truetype(cand, size)
+        except Exception:
+            continue
+    return ImageFont.load_default()
+
+
+def tile_cache_key(src: Path, tile_w: int, tile_h: int) -> Optional[str]:
+    """Cache key for a downscaled tile of `src` (None when the source is missing)."""
+    try:
+        st = Path(src).stat()
+    except OSError:
+        return None
+    raw = json.dumps(
+        {
+            "v": TILE_CACHE_VERSION,
+            "path": str(Path(src).resolve()),
+            "size": int(st.st_size),
+            "mtime_ns": int(st.st_mtime_ns),
+            "tile": [int(tile_w), int(tile_h)],
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _decode_tile(src: Path, tile_w: int, tile_h: int) -> Image.Image:
+    with Image.open(src) as im:
+        # JPEG/WebP sources decode at reduced scale; PNG ignores the draft request.
+        im.draft("RGB", (int(tile_w), int(tile_h)))
+        return im.convert("RGB").resize((int(tile_w), int(tile_h)), Image.LANCZOS, reducing_gap=3.0)
+
+
+def load_tile(src: Path, tile_w: int, tile_h: int, *, cache_root: Optional[Path] = None) -> Image.Image:
+    """RGB tile of `src` resized to (tile_w, tile_h), served from the preview cache when fresh."""
+    key = tile_cache_key(src, tile_w, tile_h) if tile_cache_enabled() else None
+    if key is None:
+        return _decode_tile(src, tile_w, tile_h)
+    root = Path(cache_root) if cache_root is not None else tile_cache_dir()
+    cached = root / key[:2] / f"{key}.png"
+    if cached.exists():
+        try:
+            with Image.open(cached) as im:
+                tile = im.convert("RGB")
+            if tile.size == (int(tile_w), int(tile_h)):
+                os.utime(cached)  # LRU signal for prune_tile_cache()
+                return tile
+        except Exception:
+            pass
+    tile = _decode_tile(src, tile_w, tile_h)
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f".{cached.name}.{os.getpid()}.tmp")
+        tile.save(tmp, format="PNG", compress_level=1)
+        os.replace(tmp, cached)
+    except Exception:
+        pass
+    return tile
+
+
+def prune_tile_cache(max_bytes: Optional[int] = None, *, cache_root: Optional[Path] = None) -> int:
+    """Evict least-recently-used tiles until the cache fits the byte budget. Returns bytes freed."""
+    budget = _max_cache_bytes() if max_bytes is None else max(0, int(max_bytes))
+    root = Path(cache_root) if cache_root is not None else tile_cache_dir()
+    if not budget or not root.exists():
+        return 0
+    entries: List[Tuple[float, int, Path]] = []
+    total = 0
+    for p in root.glob("*/*.png"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    freed = 0
+    for _mtime, size, p in sorted(entries):
+        if total - freed <= budget:
+            break
+        try:
+            p.unlink()
+            freed += size
+        except OSError:
+            continue
+    return freed
+
+
+class _PngRowWriter:
+    """Minimal streaming RGB8 PNG encoder (Sub filter on every scanline)."""
+
+    def __init__(self, fp: BinaryIO, width: int, height: int, *, compress_level: int) -> None:
+        self.fp = fp
+        self.width = int(width)
+        self.height = int(height)
+        self.rows_written = 0
+        self._z = zlib.compressobj(max(0, min(9, int(compress_level))))
+        self._pending = bytearray()
+        fp.write(_PNG_SIGNATURE)
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0))
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self.fp.write(struct.pack(">I", len(data)))
+        self.fp.write(kind)
+        self.fp.write(data)
+        self.fp.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)) & 0xFFFFFFFF))
+
+    def _emit(self, data: bytes, *, final: bool = False) -> None:
+        self._pending += data
+        while len(self._pending) >= _IDAT_CHUNK_BYTES or (final and self._pending):
+            self._chunk(b"IDAT", bytes(self._pending[:_IDAT_CHUNK_BYTES]))
+            del self._pending[:_IDAT_CHUNK_BYTES]
+
+    def write_rows(self, band: Image.Image) -> None:
+        arr = np.asarray(band.convert("RGB"), dtype=np.uint8)
+        if arr.shape[1] != self.width:
+            raise ValueError(f"band width {arr.shape[1]} != sheet width {self.width}")
+        sub = arr.copy()
+        sub[:, 1:, :] -= arr[:, :-1, :]
+        lines = np.empty((arr.shape[0], 1 + self.width * 3), dtype=np.uint8)
+        lines[:, 0] = 1
+        lines[:, 1:] = sub.reshape(arr.shape[0], -1)
+        self._emit(self._z.compress(lines.tobytes()))
+        self.rows_written += int(arr.shape[0])
+
+    def close(self) -> None:
+        if self.rows_written != self.height:
+            raise ValueError(f"wrote {self.rows_written} rows, expected {self.height}")
+        self._emit(self._z.flush(), final=True)
+        self._chunk(b"IEND", b"")
+
+
+def render_contactsheet(
+    tiles: Sequence[SheetTile],
+    out_path: Path,
+    *,
+    tile_w: int,
+    tile_h: int,
+    cols: int,
+    pad: int,
+    output_mode: PngOutputMode = "final",
+    font: Optional[ImageFont.ImageFont] = None,
+    missing_label: str = "NEEDS_RESTORE",
+    workers: int = 4,
+    cache_root: Optional[Path] = None,
+) -> Path:
+    """
+    Render a QC grid to `out_path` one grid row at a time (temp file + replace).
+
+    Each tile is labelled at its top-right corner; missing sources get a dark placeholder
+    tagged with `missing_label`.
+    """
+    if not tiles:
+        raise ValueError("render_contactsheet: no tiles")
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tile_w, tile_h = int(tile_w), int(tile_h)
+    cols = max(1, int(cols))
+    pad = max(0, int(pad))
+    rows = (len(tiles) + cols - 1) // cols
+    width = cols * tile_w + (cols + 1) * pad
+    height = rows * tile_h + (rows + 1) * pad
+    font = font or pick_label_font()
+    opts = resolve_png_save_options(output_mode)
+
+    def _tile_image(tile: SheetTile) -> Optional[Image.Image]:
+        if tile.path is None or not Path(tile.path).exists():
+            return None
+        return load_tile(Path(tile.path), tile_w, tile_h, cache_root=cache_root)
+
+    handle = tempfile.NamedTemporaryFile(
+        prefix=f"{out_path.name}.", suffix=out_path.suffix + ".tmp", dir=str(out_path.parent), delete=False
+    )
+    tmp_path = Path(handle.name)
+    try:
+        with handle, ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="qc_tile") as pool:
+            writer = _PngRowWriter(handle, width, height, compress_level=opts.compress_level)
+            for r in range(rows):
+                row_tiles = list(tiles[r * cols : (r + 1) * cols])
+                band = Image.new("RGB", (width, pad + tile_h), (0, 0, 0))
+                draw = ImageDraw.Draw(band)
+                for c, (tile, im) in enumerate(zip(row_tiles, pool.map(_tile_image, row_tiles))):
+                    x = pad + c * (tile_w + pad)
+                    if im is None:
+                        band.paste(Image.new("RGB", (tile_w, tile_h), (30, 30, 30)), (x, pad))
+                        draw.text((x + 10, pad + 10), f"{missing_label} {tile.label}", fill=(255, 80, 80), font=font)
+                        continue
+                    band.paste(im, (x, pad))
+                    bbox = draw.textbbox((0, 0), tile.label, font=font)
+                    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+                    # Keep the label away from the typical "top-left title" area of the thumbnail.
+                    lx, ly = x + tile_w - 10 - tw, pad + 10
+                    draw.rectangle((lx - 6, ly - 4, lx + tw + 6, ly + th + 4), fill=(0, 0, 0))
+                    draw.text((lx, ly), tile.label, fill=(255, 255, 255), font=font)
+                writer.write_rows(band)
+            if pad:
+                writer.write_rows(Image.new("RGB", (width, pad), (0, 0, 0)))
+            writer.close()
+        with Image.open(tmp_path) as probe:
+            probe.verify()
+        os.replace(tmp_path, out_path)
+    finally:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+    if tile_cache_enabled():
+        prune_tile_cache(cache_root=cache_root)
+    return out_path
+
+
+def contactsheet_cache_key(
+    tiles: Sequence[SheetTile], *, tile_w: int, tile_h: int, cols: int, pad: int, output_mode: PngOutputMode
+) -> str:
+    """Digest of a sheet's full input (tile sources + grid); lets callers reuse a rendered sheet."""
+    parts = [
+        [t.label, tile_cache_key(Path(t.path), tile_w, tile_h) if t.path is not None else None] for t in tiles
+    ]
+    raw = json.dumps(
+        {"v": TILE_CACHE_VERSION, "tiles": parts, "grid": [tile_w, tile_h, cols, pad], "mode": output_mode},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
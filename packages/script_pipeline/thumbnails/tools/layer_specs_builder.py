@@ -4,19 +4,24 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
+import multiprocessing
 import re
 import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import yaml
 from PIL import Image, ImageDraw, ImageOps
 
 from factory_common import paths as fpaths
 from factory_common.image_client import ImageClient
+from script_pipeline.thumbnails.compiler.compose_text_layout import resolve_layout_font_files
 from script_pipeline.thumbnails.compiler.layer_specs import (
     find_text_layout_item_for_video,
     load_image_prompts_v3_typed,
@@ -211,12 +216,56 @@ def upsert_fs_variant(
     - de-dup by image_path
     - do not overwrite selected_variant_id if already set
     """
+    upsert_fs_variants(
+        [
+            {
+                "channel": channel,
+                "video": video,
+                "title": title,
+                "image_rel_path": image_rel_path,
+                "label": label,
+                "status": status,
+            }
+        ]
+    )
+
+
+def upsert_fs_variants(variants: Sequence[Dict[str, Any]]) -> None:
+    """
+    Batch form of `upsert_fs_variant`: load projects.json once, apply every variant in order, write once.
+
+    Each item takes the `upsert_fs_variant` keyword arguments.
+    """
+    if not variants:
+        return
     doc = _load_thumbnail_projects()
     projects = doc.get("projects")
     if not isinstance(projects, list):
         projects = []
         doc["projects"] = projects
+    for item in variants:
+        _apply_fs_variant(
+            projects,
+            channel=str(item["channel"]),
+            video=str(item["video"]),
+            title=item.get("title"),
+            image_rel_path=str(item["image_rel_path"]),
+            label=str(item["label"]),
+            status=str(item.get("status", "review") or ""),
+        )
+    _write_thumbnail_projects(doc)
 
+
+def _apply_fs_variant(
+    projects: List[Any],
+    *,
+    channel: str,
+    video: str,
+    title: Optional[str],
+    image_rel_path: str,
+    label: str,
+    status: str,
+) -> None:
     project: Optional[Dict[str, Any]] = None
     for entry in projects:
         if not isinstance(entry, dict):
@@ -243,7 +292,6 @@ def upsert_fs_variant(
             variant["status"] = status
             variant["updated_at"] = datetime.now(timezone.utc).isoformat()
             project["updated_at"] = datetime.now(timezone.utc).isoformat()
-            _write_thumbnail_projects(doc)
             return
 
     variant_id = f"fs::{channel.lower()}_{video}_{Path(image_rel_path).stem}"
@@ -262,7 +310,6 @@ def upsert_fs_variant(
     project["updated_at"] = datetime.now(timezone.utc).isoformat()
     if not project.get("selected_variant_id"):
         project["selected_variant_id"] = variant_id
-    _write_thumbnail_projects(doc)
 
 
 def _resolve_model_key_from_templates(channel: str) -> Optional[str]:
@@ -1088,6 +1135,1210 @@ def _compose_text_canva_like(
     save_png_atomic(base, out_path, mode=output_mode, verify=True)
 
 
+@dataclass(frozen=True)
+class _ChannelBuildContext:
+    """Per-run settings shared by every target (picklable: shipped once to each build worker)."""
+
+    channel: str
+    width: int
+    height: int
+    stable_thumb_name: str
+    stable_id: Optional[str]
+    resolved_variant_label: str
+    update_projects: bool
+    force: bool
+    skip_generate: bool
+    continue_on_error: bool
+    max_gen_attempts: int
+    export_flat: bool
+    flat_name_suffix: str
+    sleep_sec: float
+    regen_bg: bool
+    build_id: str
+    output_mode: PngOutputMode
+    img_id: Optional[str]
+    txt_id: str
+    text_spec: Dict[str, Any]
+    text_spec_typed: TextLayoutSpecV3
+    image_spec: Optional[ImagePromptsSpecV3]
+    model_key: Optional[str]
+    assets_root: Path
+    portrait_policy: Dict[str, Any]
+    font_files: Dict[str, Optional[str]]
+    text_template_id_override: Optional[str]
+    effects_override_base: Optional[Dict[str, Any]]
+    overlays_override_base: Optional[Dict[str, Any]]
+    text_override_base: Optional[Dict[str, str]]
+    base_bg_brightness: float
+    base_bg_contrast: float
+    base_bg_color: float
+    base_bg_gamma: float
+    base_bg_zoom: float
+    base_bg_pan_x: float
+    base_bg_pan_y: float
+    base_band_x0: float
+    base_band_x1: float
+    base_band_power: float
+    base_band_brightness: float
+    base_band_contrast: float
+    base_band_color: float
+    base_band_gamma: float
+
+
+@dataclass(frozen=True)
+class _TargetBackground:
+    bg_src: Path
+    legacy_moved_from: Optional[str]
+    generated: Optional[Dict[str, Any]]
+
+
+def _target_paths(ctx: _ChannelBuildContext, target: BuildTarget) -> Tuple[Path, Path, Path, Optional[Path]]:
+    """(video_dir, out_bg, stable_thumb, flat_out) for a target."""
+    video_dir = ctx.assets_root / target.video
+    video_dir.mkdir(parents=True, exist_ok=True)
+    bg_name = "10_bg.png" if ctx.stable_id is None else f"10_bg.{ctx.stable_id}.png"
+    flat_out: Optional[Path] = None
+    if ctx.export_flat:
+        suffix = str(ctx.flat_name_suffix or "").strip()
+        if suffix and not suffix.startswith("_"):
+            suffix = "_" + suffix
+        flat_out = ctx.assets_root / f"{target.video}{suffix}.png"
+    return video_dir, video_dir / bg_name, video_dir / ctx.stable_thumb_name, flat_out
+
+
+# NOTE:
+# Incremental rebuild: every composed thumbnail records a fingerprint of its render inputs in
+# `compiler/<stable stem>.render.json` (next to the per-build dirs). The fingerprint covers the
+# per-run settings (canvas, text layout id, style overrides, bg defaults), the video's text layout
+# item + shared templates/fonts config, planning copy, thumb_spec/text_line_spec/elements specs,
+# and content digests of the background, portrait, element images and font files.
+# The image prompt is covered through the background digest: it only feeds generation, and the
+# image prompts spec is not loaded at all for --skip-generate runs.
+# Bump RENDER_FINGERPRINT_VERSION when the compositor output changes for identical inputs.
+RENDER_FINGERPRINT_VERSION = 1
+
+
+@lru_cache(maxsize=2048)
+def _file_digest_cached(path: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _file_digest(path: Optional[Path]) -> Optional[str]:
+    """sha256 of a file (memoized per path/size/mtime); None when missing."""
+    if path is None:
+        return None
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return _file_digest_cached(str(path), int(st.st_size), int(st.st_mtime_ns))
+
+
+def _render_record_path(video_dir: Path, stable_thumb_name: str) -> Path:
+    return video_dir / "compiler" / f"{Path(stable_thumb_name).stem}.render.json"
+
+
+def _read_render_record(video_dir: Path, stable_thumb_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        payload = json.loads(_render_record_path(video_dir, stable_thumb_name).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) and payload.get("fingerprint") else None
+
+
+def _render_fingerprint(ctx: _ChannelBuildContext, target: BuildTarget, bg_path: Path) -> str:
+    """Digest of everything `_compose_target` reads for this target (background = `bg_path`)."""
+    ch = ctx.channel
+    video_dir = ctx.assets_root / target.video
+    text_spec = ctx.text_spec if isinstance(ctx.text_spec, dict) else {}
+    thumb_spec = load_thumb_spec(ch, target.video, stable=ctx.stable_id)
+    elements = _load_elements_spec_elements(ch, target.video, stable=ctx.stable_id)
+    element_files = {
+        str(el.get("src_path")): _file_digest(_resolve_element_src_file(ch, target.video, str(el.get("src_path") or "")))
+        for el in elements
+        if isinstance(el, dict) and el.get("src_path")
+    }
+    payload = {
+        "version": RENDER_FINGERPRINT_VERSION,
+        "canvas": [ctx.width, ctx.height],
+        "output_mode": ctx.output_mode,
+        "stable": [ctx.stable_thumb_name, ctx.stable_id],
+        "text_layout_id": ctx.txt_id,
+        "text_layout_item": find_text_layout_item_for_video(text_spec, target.video_id),
+        "text_layout_shared": {k: v for k, v in text_spec.items() if k != "items"},
+        "planning_copy": _load_planning_copy(ch, target.video),
+        "thumb_spec": thumb_spec.payload if thumb_spec else None,
+        "text_line_spec": _load_text_line_spec_lines(ch, target.video, stable=ctx.stable_id),
+        "elements": elements,
+        "element_files": element_files,
+        "overrides": [
+            ctx.text_template_id_override,
+            ctx.effects_override_base,
+            ctx.overlays_override_base,
+            ctx.text_override_base,
+        ],
+        "bg_defaults": [
+            ctx.base_bg_brightness,
+            ctx.base_bg_contrast,
+            ctx.base_bg_color,
+            ctx.base_bg_gamma,
+            ctx.base_bg_zoom,
+            ctx.base_bg_pan_x,
+            ctx.base_bg_pan_y,
+            ctx.base_band_x0,
+            ctx.base_band_x1,
+            ctx.base_band_power,
+            ctx.base_band_brightness,
+            ctx.base_band_contrast,
+            ctx.base_band_color,
+            ctx.base_band_gamma,
+        ],
+        "portrait_policy": ctx.portrait_policy,
+        "background": _file_digest(bg_path),
+        "portrait": _file_digest(find_existing_portrait(video_dir)),
+        "fonts": {key: _file_digest(Path(path)) if path else None for key, path in ctx.font_files.items()},
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _skip_reason(ctx: _ChannelBuildContext, idx: int, total: int, target: BuildTarget) -> Optional[str]:
+    """
+    Why an already-built target is left alone ("unchanged" / "kept"); None when it must be (re)built.
+
+    A thumbnail with a render record is rebuilt only when its render-input fingerprint changed.
+    Thumbnails without a record (built before fingerprints existed) or replaced outside the
+    builder keep the previous behavior: skipped until --force.
+    """
+    video_dir, _out_bg, stable_thumb, flat_out = _target_paths(ctx, target)
+    if not stable_thumb.exists() or ctx.force:
+        return None
+    reason = "kept"
+    note = "skip (already built)"
+    record = _read_render_record(video_dir, ctx.stable_thumb_name)
+    if record is not None:
+        if record.get("thumb_sha256") != _file_digest(stable_thumb):
+            note = "skip (edited outside the builder; use --force to rebuild)"
+        else:
+            bg = _resolve_existing_background(ctx, target)
+            if bg is not None:
+                if record.get("fingerprint") != _render_fingerprint(ctx, target, bg.bg_src):
+                    print(f"[{idx}/{total}] {target.video_id}: inputs changed -> rebuild")
+                    return None
+                reason = "unchanged"
+                note = "skip (unchanged)"
+    if flat_out and not flat_out.exists():
+        flat_out.write_bytes(stable_thumb.read_bytes())
+        print(f"[{idx}/{total}] {target.video_id}: export-flat -> {flat_out.name}")
+    else:
+        print(f"[{idx}/{total}] {target.video_id}: {note}")
+    return reason
+
+
+def _resolve_existing_background(ctx: _ChannelBuildContext, target: BuildTarget) -> Optional[_TargetBackground]:
+    video_dir, out_bg, _stable_thumb, _flat_out = _target_paths(ctx, target)
+    bg_source = resolve_background_source(video_dir=video_dir, channel_root=ctx.assets_root, video=target.video)
+    bg_src = bg_source.bg_src
+    if ctx.stable_id is not None and out_bg.exists():
+        bg_src = out_bg
+    if bg_src is None:
+        return None
+    return _TargetBackground(bg_src=bg_src, legacy_moved_from=bg_source.legacy_moved_from, generated=None)
+
+
+def _existing_target_background(ctx: _ChannelBuildContext, target: BuildTarget) -> Optional[_TargetBackground]:
+    """Background already on disk (None when it must be generated)."""
+    bg = _resolve_existing_background(ctx, target)
+    if ctx.regen_bg:
+        return None
+    return bg
+
+
+def _generate_target_background(
+    ctx: _ChannelBuildContext,
+    idx: int,
+    total: int,
+    target: BuildTarget,
+    client: Optional[ImageClient],
+) -> Optional[_TargetBackground]:
+    """Generate the AI background (rate-limited step). None when skipped under continue_on_error."""
+    ch = ctx.channel
+    video_dir, _out_bg, _stable_thumb, _flat_out = _target_paths(ctx, target)
+    prompt = None
+    use_image_spec_prompt = True
+    if (
+        ch in {"CH01", "CH32"}
+        and str(ctx.text_template_id_override or "").strip() == "CH01_canva_gold_right_stack_3line_v1"
+        and str(ctx.img_id or "").strip() == "ch01_image_prompts_memo9_v1"
+    ):
+        # Gold/canva style wants LEFT-subject composition; memo9 prompts are RIGHT-subject.
+        # Prefer Planning prompt (if authored) or a style fallback prompt instead of reusing memo9 prompts.
+        use_image_spec_prompt = False
+    if ctx.image_spec is not None and use_image_spec_prompt:
+        prompt = next((it.prompt_ja for it in ctx.image_spec.items if it.video_id == target.video_id), None)
+    if not isinstance(prompt, str) or not prompt.strip():
+        prompt = _load_planning_image_prompt(ch, target.video)
+    if not isinstance(prompt, str) or not prompt.strip():
+        prompt = _fallback_image_prompt_for_style(ch, text_template_id=ctx.text_template_id_override)
+    if not isinstance(prompt, str) or not prompt.strip():
+        raise RuntimeError(
+            f"image prompt missing for {target.video_id} "
+            f"(layer_specs image_prompts item or Planning CSV image prompt column is required)"
+        )
+    prompt = _sanitize_prompt_for_generation(channel=ch, prompt=prompt)
+    negative_prompt = _negative_prompt_for_generation(channel=ch)
+    try:
+        raw_name = "90_bg_ai_raw.png" if ctx.stable_id is None else f"90_bg_ai_raw.{ctx.stable_id}.png"
+        gen = generate_background_with_retries(
+            client=client,
+            prompt=prompt,
+            model_key=ctx.model_key,
+            negative_prompt=negative_prompt,
+            out_raw_path=video_dir / raw_name,
+            video_id=target.video_id,
+            max_attempts=int(ctx.max_gen_attempts),
+            sleep_sec=float(ctx.sleep_sec),
+        )
+    except Exception as exc:  # noqa: BLE001
+        msg = f"[{idx}/{total}] {target.video_id}: generation failed ({exc})"
+        if ctx.continue_on_error:
+            print(msg)
+            return None
+        raise
+    if not gen.raw_path:
+        raise RuntimeError(f"background source resolution failed for {target.video_id}")
+    return _TargetBackground(bg_src=gen.raw_path, legacy_moved_from=None, generated=gen.generated)
+
+
+def _compose_target(
+    ctx: _ChannelBuildContext,
+    idx: int,
+    total: int,
+    target: BuildTarget,
+    bg: _TargetBackground,
+) -> Optional[Dict[str, Any]]:
+    """
+    Composite one target onto its resolved background (local CPU work only).
+
+    Returns the projects.json variant to register (None when update_projects is off); the
+    caller merges those once per run.
+    """
+    ch = ctx.channel
+    width = ctx.width
+    height = ctx.height
+    stable_thumb_name = ctx.stable_thumb_name
+    stable_id = ctx.stable_id
+    resolved_variant_label = ctx.resolved_variant_label
+    update_projects = ctx.update_projects
+    build_id = ctx.build_id
+    output_mode = ctx.output_mode
+    img_id = ctx.img_id
+    txt_id = ctx.txt_id
+    text_spec = ctx.text_spec
+    text_spec_typed = ctx.text_spec_typed
+    image_spec = ctx.image_spec
+    model_key = ctx.model_key
+    portrait_policy = ctx.portrait_policy
+    text_template_id_override = ctx.text_template_id_override
+    effects_override_base = ctx.effects_override_base
+    overlays_override_base = ctx.overlays_override_base
+    text_override_base = ctx.text_override_base
+    base_bg_brightness = ctx.base_bg_brightness
+    base_bg_contrast = ctx.base_bg_contrast
+    base_bg_color = ctx.base_bg_color
+    base_bg_gamma = ctx.base_bg_gamma
+    base_bg_zoom = ctx.base_bg_zoom
+    base_bg_pan_x = ctx.base_bg_pan_x
+    base_bg_pan_y = ctx.base_bg_pan_y
+    base_band_x0 = ctx.base_band_x0
+    base_band_x1 = ctx.base_band_x1
+    base_band_power = ctx.base_band_power
+    base_band_brightness = ctx.base_band_brightness
+    base_band_contrast = ctx.base_band_contrast
+    base_band_color = ctx.base_band_color
+    base_band_gamma = ctx.base_band_gamma
+
+    video_dir, out_bg, stable_thumb, flat_out = _target_paths(ctx, target)
+    bg_src = bg.bg_src
+    legacy_moved_from = bg.legacy_moved_from
+    generated = bg.generated
+
+    build_dir = video_dir / "compiler" / build_id
+    build_dir.mkdir(parents=True, exist_ok=True)
+    build_thumb = build_dir / "out_01.png"
+    build_meta_path = build_dir / "build_meta.json"
+
+    thumb_spec = load_thumb_spec(ch, target.video, stable=stable_id)
+    overrides_leaf = extract_normalized_override_leaf(thumb_spec.payload) if thumb_spec else {}
+
+    video_bg_brightness = float(overrides_leaf.get("overrides.bg_enhance.brightness", base_bg_brightness))
+    video_bg_contrast = float(overrides_leaf.get("overrides.bg_enhance.contrast", base_bg_contrast))
+    video_bg_color = float(overrides_leaf.get("overrides.bg_enhance.color", base_bg_color))
+    video_bg_gamma = float(overrides_leaf.get("overrides.bg_enhance.gamma", base_bg_gamma))
+
+    video_bg_zoom = float(overrides_leaf.get("overrides.bg_pan_zoom.zoom", base_bg_zoom))
+    video_bg_pan_x = float(overrides_leaf.get("overrides.bg_pan_zoom.pan_x", base_bg_pan_x))
+    video_bg_pan_y = float(overrides_leaf.get("overrides.bg_pan_zoom.pan_y", base_bg_pan_y))
+
+    video_band_x0 = float(overrides_leaf.get("overrides.bg_enhance_band.x0", base_band_x0))
+    video_band_x1 = float(overrides_leaf.get("overrides.bg_enhance_band.x1", base_band_x1))
+    video_band_power = float(overrides_leaf.get("overrides.bg_enhance_band.power", base_band_power))
+    video_band_brightness = float(overrides_leaf.get("overrides.bg_enhance_band.brightness", base_band_brightness))
+    video_band_contrast = float(overrides_leaf.get("overrides.bg_enhance_band.contrast", base_band_contrast))
+    video_band_color = float(overrides_leaf.get("overrides.bg_enhance_band.color", base_band_color))
+    video_band_gamma = float(overrides_leaf.get("overrides.bg_enhance_band.gamma", base_band_gamma))
+
+    video_text_scale = float(overrides_leaf.get("overrides.text_scale", 1.0))
+    video_text_offset_x = float(overrides_leaf.get("overrides.text_offset_x", 0.0))
+    video_text_offset_y = float(overrides_leaf.get("overrides.text_offset_y", 0.0))
+
+    template_id_override = str(overrides_leaf.get("overrides.text_template_id") or "").strip() or None
+    if not template_id_override:
+        template_id_override = str(text_template_id_override or "").strip() or None
+
+    effects_override: Optional[Dict[str, Any]] = None
+    overlays_override: Optional[Dict[str, Any]] = None
+    if overrides_leaf:
+        stroke: Dict[str, Any] = {}
+        shadow: Dict[str, Any] = {}
+        glow: Dict[str, Any] = {}
+        fills: Dict[str, Any] = {}
+        if "overrides.text_effects.stroke.width_px" in overrides_leaf:
+            stroke["width_px"] = overrides_leaf["overrides.text_effects.stroke.width_px"]
+        if "overrides.text_effects.stroke.color" in overrides_leaf:
+            stroke["color"] = overrides_leaf["overrides.text_effects.stroke.color"]
+        if "overrides.text_effects.shadow.alpha" in overrides_leaf:
+            shadow["alpha"] = overrides_leaf["overrides.text_effects.shadow.alpha"]
+        if "overrides.text_effects.shadow.offset_px" in overrides_leaf:
+            off = overrides_leaf["overrides.text_effects.shadow.offset_px"]
+            if isinstance(off, tuple) and len(off) == 2:
+                shadow["offset_px"] = [int(off[0]), int(off[1])]
+            else:
+                shadow["offset_px"] = off
+        if "overrides.text_effects.shadow.blur_px" in overrides_leaf:
+            shadow["blur_px"] = overrides_leaf["overrides.text_effects.shadow.blur_px"]
+        if "overrides.text_effects.shadow.color" in overrides_leaf:
+            shadow["color"] = overrides_leaf["overrides.text_effects.shadow.color"]
+        if "overrides.text_effects.glow.alpha" in overrides_leaf:
+            glow["alpha"] = overrides_leaf["overrides.text_effects.glow.alpha"]
+        if "overrides.text_effects.glow.blur_px" in overrides_leaf:
+            glow["blur_px"] = overrides_leaf["overrides.text_effects.glow.blur_px"]
+        if "overrides.text_effects.glow.color" in overrides_leaf:
+            glow["color"] = overrides_leaf["overrides.text_effects.glow.color"]
+
+        for fill_key in ("white_fill", "red_fill", "yellow_fill", "hot_red_fill", "purple_fill"):
+            p = f"overrides.text_fills.{fill_key}.color"
+            if p in overrides_leaf:
+                fills[fill_key] = {"color": overrides_leaf[p]}
+        eff = {}
+        if stroke:
+            eff["stroke"] = stroke
+        if shadow:
+            eff["shadow"] = shadow
+        if glow:
+            eff["glow"] = glow
+        if fills:
+            eff.update(fills)
+        if eff:
+            effects_override = eff
+
+        left_tsz: Dict[str, Any] = {}
+        top_band: Dict[str, Any] = {}
+        bottom_band: Dict[str, Any] = {}
+        for k in ("enabled", "color", "alpha_left", "alpha_right", "x0", "x1"):
+            p = f"overrides.overlays.left_tsz.{k}"
+            if p in overrides_leaf:
+                left_tsz[k] = overrides_leaf[p]
+        for k in (
+            "enabled",
+            "color",
+            "alpha_top",
+            "alpha_bottom",
+            "y0",
+            "y1",
+            "mode",
+            "alpha",
+            "roughness",
+            "feather_px",
+            "hole_count",
+            "blur_px",
+            "seed",
+        ):
+            p = f"overrides.overlays.top_band.{k}"
+            if p in overrides_leaf:
+                top_band[k] = overrides_leaf[p]
+        for k in (
+            "enabled",
+            "color",
+            "alpha_top",
+            "alpha_bottom",
+            "y0",
+            "y1",
+            "mode",
+            "alpha",
+            "roughness",
+            "feather_px",
+            "hole_count",
+            "blur_px",
+            "seed",
+        ):
+            p = f"overrides.overlays.bottom_band.{k}"
+            if p in overrides_leaf:
+                bottom_band[k] = overrides_leaf[p]
+        ov = {}
+        if left_tsz:
+            ov["left_tsz"] = left_tsz
+        if top_band:
+            ov["top_band"] = top_band
+        if bottom_band:
+            ov["bottom_band"] = bottom_band
+        if ov:
+            overlays_override = ov
+
+    def _deep_merge_dict(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+        out: Dict[str, Any] = dict(base)
+        for key, value in patch.items():
+            if isinstance(value, dict) and isinstance(out.get(key), dict):
+                out[key] = _deep_merge_dict(out[key], value)
+            else:
+                out[key] = value
+        return out
+
+    effects_override_final: Optional[Dict[str, Any]] = None
+    if isinstance(effects_override_base, dict) and effects_override_base:
+        effects_override_final = dict(effects_override_base)
+    if isinstance(effects_override, dict) and effects_override:
+        effects_override_final = _deep_merge_dict(effects_override_final or {}, effects_override)
+
+    overlays_override_final: Optional[Dict[str, Any]] = None
+    if isinstance(overlays_override_base, dict) and overlays_override_base:
+        overlays_override_final = dict(overlays_override_base)
+    if isinstance(overlays_override, dict) and overlays_override:
+        overlays_override_final = _deep_merge_dict(overlays_override_final or {}, overlays_override)
+
+    copy_override: Dict[str, str] = {}
+    for k in ("upper", "title", "lower"):
+        p = f"overrides.copy_override.{k}"
+        if p in overrides_leaf and isinstance(overrides_leaf.get(p), str):
+            copy_override[k] = str(overrides_leaf[p]).strip()
+
+
+    crop_resize_to_16x9(bg_src, out_bg, width=width, height=height, output_mode=output_mode)
+    render_fingerprint = _render_fingerprint(ctx, target, out_bg)
+
+    print(f"[{idx}/{total}] {target.video_id}: composing text ...")
+    bg_params = BgEnhanceParams(
+        brightness=float(video_bg_brightness),
+        contrast=float(video_bg_contrast),
+        color=float(video_bg_color),
+        gamma=float(video_bg_gamma),
+    )
+    band_params = BgEnhanceParams(
+        brightness=float(video_band_brightness),
+        contrast=float(video_band_contrast),
+        color=float(video_band_color),
+        gamma=float(video_band_gamma),
+    )
+    item = find_text_layout_item_for_video(text_spec, target.video_id) if isinstance(text_spec, dict) else None
+    template_id = str(item.get("template_id") or "").strip() if isinstance(item, dict) else ""
+    if template_id_override:
+        template_id = str(template_id_override).strip() or template_id
+    if not template_id:
+        template_id = _default_text_template_id(text_spec)
+    templates = text_spec.get("templates") if isinstance(text_spec, dict) else None
+    slots = None
+    if template_id and isinstance(templates, dict):
+        tpl = templates.get(template_id)
+        slots = tpl.get("slots") if isinstance(tpl, dict) else None
+    text_payload = item.get("text") if isinstance(item, dict) else None
+    planning_copy = _load_planning_copy(ch, target.video)
+    if copy_override:
+        for k, v in copy_override.items():
+            if v:
+                planning_copy[k] = v
+
+    def _override_for_slot(slot_name: str) -> str:
+        name = str(slot_name or "").strip().lower()
+        if name in {"line1", "upper", "top"}:
+            return str(copy_override.get("upper") or "").strip()
+        if name in {"line2", "title", "main"}:
+            return str(copy_override.get("title") or "").strip()
+        if name in {"line3", "lower", "accent"}:
+            return str(copy_override.get("lower") or "").strip()
+        return ""
+
+    text_override: Dict[str, str] = {}
+    if isinstance(slots, dict):
+        for slot_name in slots.keys():
+            slot_key = str(slot_name or "").strip()
+            if not slot_key:
+                continue
+            forced = _override_for_slot(slot_key)
+            if forced:
+                text_override[slot_key] = forced
+                continue
+            authored = str(text_payload.get(slot_key) or "").strip() if isinstance(text_payload, dict) else ""
+            if authored:
+                continue
+            val = _planning_value_for_slot(slot_key, planning_copy)
+            if val:
+                text_override[slot_key] = val
+
+    text_line_spec_lines = _load_text_line_spec_lines(ch, target.video, stable=stable_id)
+
+    text_spec_for_render = text_spec
+    if not isinstance(item, dict) and template_id:
+        text_spec_for_render = _ensure_text_layout_item(
+            text_layout_spec=text_spec_for_render,
+            video_id=target.video_id,
+            template_id=template_id,
+            title=str(target.video_id),
+        )
+    needs_text_mutation = bool(text_line_spec_lines) or abs(float(video_text_scale) - 1.0) > 1e-6 or (
+        abs(float(video_text_offset_x)) > 1e-9 or abs(float(video_text_offset_y)) > 1e-9
+    )
+    if needs_text_mutation and isinstance(text_spec, dict):
+        text_spec_for_render = copy.deepcopy(text_spec)
+        templates_out = text_spec_for_render.get("templates") if isinstance(text_spec_for_render, dict) else None
+        tpl_out = templates_out.get(template_id) if isinstance(templates_out, dict) and template_id else None
+        slots_out = tpl_out.get("slots") if isinstance(tpl_out, dict) else None
+        if isinstance(slots_out, dict):
+            for slot_key, slot_cfg in slots_out.items():
+                if not isinstance(slot_cfg, dict):
+                    continue
+                if abs(float(video_text_scale) - 1.0) > 1e-6:
+                    base_size = slot_cfg.get("base_size_px")
+                    if isinstance(base_size, (int, float)):
+                        scaled = int(round(float(base_size) * float(video_text_scale)))
+                        slot_cfg["base_size_px"] = max(1, scaled)
+                line = text_line_spec_lines.get(str(slot_key).strip()) if isinstance(slot_key, str) else None
+                if isinstance(line, dict):
+                    line_scale = line.get("scale", 1.0)
+                    try:
+                        line_scale_f = float(line_scale)
+                    except Exception:
+                        line_scale_f = 1.0
+                    if abs(float(line_scale_f) - 1.0) > 1e-6:
+                        base_size = slot_cfg.get("base_size_px")
+                        if isinstance(base_size, (int, float)):
+                            scaled = int(round(float(base_size) * float(line_scale_f)))
+                            slot_cfg["base_size_px"] = max(1, scaled)
+    if not isinstance(item, dict) and template_id:
+        text_spec_for_render = _ensure_text_layout_item(
+            text_layout_spec=text_spec_for_render,
+            video_id=target.video_id,
+            template_id=template_id,
+            title=str(target.video_id),
+        )
+
+    resolved_text_by_slot: Dict[str, str] = {}
+    if isinstance(slots, dict):
+        for slot_name in slots.keys():
+            slot_key = str(slot_name or "").strip()
+            if not slot_key:
+                continue
+            forced = _override_for_slot(slot_key)
+            authored = str(text_payload.get(slot_key) or "").strip() if isinstance(text_payload, dict) else ""
+            planned = _planning_value_for_slot(slot_key, planning_copy)
+            resolved_text_by_slot[slot_key] = forced or authored or planned or ""
+
+    if isinstance(slots, dict) and isinstance(text_override_base, dict) and text_override_base:
+        for raw_key, raw_val in text_override_base.items():
+            if not isinstance(raw_key, str) or not raw_key.strip():
+                continue
+            slot_key = raw_key.strip()
+            if slot_key not in slots:
+                continue
+            val = str(raw_val or "").strip()
+            if not val:
+                continue
+            if str(resolved_text_by_slot.get(slot_key) or "").strip():
+                continue
+            resolved_text_by_slot[slot_key] = val
+            text_override.setdefault(slot_key, val)
+
+    use_canva_text = abs(float(video_text_offset_x)) > 1e-9 or abs(float(video_text_offset_y)) > 1e-9
+    if not use_canva_text:
+        for line in (text_line_spec_lines or {}).values():
+            if not isinstance(line, dict):
+                continue
+            try:
+                ox = float(line.get("offset_x", 0.0))
+                oy = float(line.get("offset_y", 0.0))
+                rot = float(line.get("rotate_deg", 0.0))
+            except Exception:
+                continue
+            if abs(float(ox)) > 1e-9 or abs(float(oy)) > 1e-9 or abs(float(rot)) > 1e-6:
+                use_canva_text = True
+                break
+
+    elements_spec = _load_elements_spec_elements(ch, target.video, stable=stable_id)
+    elements_below = sorted(
+        [el for el in elements_spec if str(el.get("layer") or "above_portrait") == "below_portrait"],
+        key=lambda el: int(el.get("z", 0)) if isinstance(el.get("z"), (int, float, str)) else 0,
+    )
+    elements_above = sorted(
+        [el for el in elements_spec if str(el.get("layer") or "above_portrait") != "below_portrait"],
+        key=lambda el: int(el.get("z", 0)) if isinstance(el.get("z"), (int, float, str)) else 0,
+    )
+
+    with enhanced_bg_path(
+        out_bg,
+        params=bg_params,
+        zoom=float(video_bg_zoom),
+        pan_x=float(video_bg_pan_x),
+        pan_y=float(video_bg_pan_y),
+        band_params=band_params,
+        band_x0=float(video_band_x0),
+        band_x1=float(video_band_x1),
+        band_power=float(video_band_power),
+        temp_prefix=f"{target.video_id}_bg_",
+    ) as base_for_text:
+        portrait_path = find_existing_portrait(video_dir)
+        portrait_used = False
+        if portrait_path is not None:
+            portrait_enabled = bool(overrides_leaf.get("overrides.portrait.enabled", stable_id != "00_thumb_2"))
+            if not portrait_enabled:
+                base_for_text_out = base_for_text
+                if elements_below:
+                    base_for_text_out = _apply_elements_to_path(
+                        base_for_text_out,
+                        channel=ch,
+                        video=target.video,
+                        elements=elements_below,
+                        out_path=build_dir / "base__elements_below.png",
+                    )
+                if elements_above:
+                    base_for_text_out = _apply_elements_to_path(
+                        base_for_text_out,
+                        channel=ch,
+                        video=target.video,
+                        elements=elements_above,
+                        out_path=build_dir / "base__elements_above.png",
+                    )
+                if use_canva_text:
+                    _compose_text_canva_like(
+                        base_for_text_out,
+                        text_layout_spec=text_spec_for_render,
+                        video_id=target.video_id,
+                        out_path=build_thumb,
+                        output_mode=output_mode,
+                        template_id=template_id,
+                        resolved_text_by_slot=resolved_text_by_slot,
+                        text_line_spec_lines=text_line_spec_lines,
+                        text_offset_x=float(video_text_offset_x),
+                        text_offset_y=float(video_text_offset_y),
+                        template_id_override=template_id_override,
+                        effects_override=effects_override_final,
+                        overlays_override=overlays_override_final,
+                    )
+                else:
+                    compose_text_to_png(
+                        base_for_text_out,
+                        text_layout_spec=text_spec_for_render,
+                        video_id=target.video_id,
+                        out_path=build_thumb,
+                        output_mode=output_mode,
+                        text_override=text_override if text_override else None,
+                        template_id_override=template_id_override,
+                        effects_override=effects_override_final,
+                        overlays_override=overlays_override_final,
+                    )
+            else:
+                # CH26 benchmark: portrait is composited as a separate layer (本人肖像素材を使用)
+                dest_box_norm_default = (0.29, 0.06, 0.42, 0.76)
+                dest_box_norm = dest_box_norm_default
+                anchor = "bottom_center"
+                portrait_zoom = 1.0
+                portrait_offset_px = (0, 0)
+                off_norm = (0.0, 0.0)
+                trim_transparent = False
+
+                fg_brightness = 1.20
+                fg_contrast = 1.08
+                fg_color = 0.98
+
+                if ch == "CH26":
+                    cfg_defaults = (
+                        portrait_policy.get("defaults") if isinstance(portrait_policy.get("defaults"), dict) else {}
+                    )
+                    cfg_overrides = (
+                        portrait_policy.get("overrides") if isinstance(portrait_policy.get("overrides"), dict) else {}
+                    )
+                    ov = cfg_overrides.get(target.video) if isinstance(cfg_overrides, dict) else None
+                    ov = ov if isinstance(ov, dict) else {}
+
+                    dest_box_norm = _as_norm_box(
+                        ov.get("dest_box") or cfg_defaults.get("dest_box"), dest_box_norm_default
+                    )
+                    anchor = str(ov.get("anchor") or cfg_defaults.get("anchor") or anchor).strip() or anchor
+                    portrait_zoom = _as_float(ov.get("zoom") if "zoom" in ov else cfg_defaults.get("zoom"), 1.0)
+                    off_norm = _as_norm_offset(
+                        ov.get("offset") if "offset" in ov else cfg_defaults.get("offset"), (0.0, 0.0)
+                    )
+                    trim_transparent = bool(
+                        ov.get("trim_transparent") if "trim_transparent" in ov else cfg_defaults.get("trim_transparent")
+                    )
+
+                    fg_defaults = cfg_defaults.get("fg") if isinstance(cfg_defaults.get("fg"), dict) else {}
+                    fg_override = ov.get("fg") if isinstance(ov.get("fg"), dict) else {}
+                    fg_brightness = _as_float(
+                        fg_override.get("brightness") if "brightness" in fg_override else fg_defaults.get("brightness"),
+                        1.26,
+                    )
+                    fg_contrast = _as_float(
+                        fg_override.get("contrast") if "contrast" in fg_override else fg_defaults.get("contrast"),
+                        1.10,
+                    )
+                    fg_color = _as_float(
+                        fg_override.get("color") if "color" in fg_override else fg_defaults.get("color"), 1.00
+                    )
+
+                # Per-video thumb_spec overrides should win over channel policy.
+                # These are normalized offsets (relative to canvas width/height).
+                if "overrides.portrait.zoom" in overrides_leaf:
+                    portrait_zoom = float(overrides_leaf["overrides.portrait.zoom"])
+                off_x = float(off_norm[0]) if isinstance(off_norm, tuple) and len(off_norm) == 2 else 0.0
+                off_y = float(off_norm[1]) if isinstance(off_norm, tuple) and len(off_norm) == 2 else 0.0
+                if "overrides.portrait.offset_x" in overrides_leaf:
+                    off_x = float(overrides_leaf["overrides.portrait.offset_x"])
+                if "overrides.portrait.offset_y" in overrides_leaf:
+                    off_y = float(overrides_leaf["overrides.portrait.offset_y"])
+                portrait_offset_px = (int(round(width * off_x)), int(round(height * off_y)))
+                if "overrides.portrait.trim_transparent" in overrides_leaf:
+                    trim_transparent = bool(overrides_leaf["overrides.portrait.trim_transparent"])
+                if "overrides.portrait.fg_brightness" in overrides_leaf:
+                    fg_brightness = float(overrides_leaf["overrides.portrait.fg_brightness"])
+                if "overrides.portrait.fg_contrast" in overrides_leaf:
+                    fg_contrast = float(overrides_leaf["overrides.portrait.fg_contrast"])
+                if "overrides.portrait.fg_color" in overrides_leaf:
+                    fg_color = float(overrides_leaf["overrides.portrait.fg_color"])
+
+                dest_box_px = (
+                    int(round(width * dest_box_norm[0])),
+                    int(round(height * dest_box_norm[1])),
+                    int(round(width * dest_box_norm[2])),
+                    int(round(height * dest_box_norm[3])),
+                )
+                suppress_box_px = dest_box_px
+                if portrait_offset_px != (0, 0):
+                    shifted_box_px = (
+                        int(dest_box_px[0]) + int(portrait_offset_px[0]),
+                        int(dest_box_px[1]) + int(portrait_offset_px[1]),
+                        int(dest_box_px[2]),
+                        int(dest_box_px[3]),
+                    )
+                    left = min(int(dest_box_px[0]), int(shifted_box_px[0]))
+                    top = min(int(dest_box_px[1]), int(shifted_box_px[1]))
+                    right = max(
+                        int(dest_box_px[0]) + int(dest_box_px[2]),
+                        int(shifted_box_px[0]) + int(shifted_box_px[2]),
+                    )
+                    bottom = max(
+                        int(dest_box_px[1]) + int(dest_box_px[3]),
+                        int(shifted_box_px[1]) + int(shifted_box_px[3]),
+                    )
+                    suppress_box_px = (left, top, max(1, right - left), max(1, bottom - top))
+                suppress_bg = bool(overrides_leaf.get("overrides.portrait.suppress_bg", ch == "CH26"))
+                # CH26 backgrounds may already contain a portrait; when portrait is enabled we must suppress it.
+                if ch == "CH26":
+                    suppress_bg = True
+                if suppress_bg:
+                    # CH26 (and any channel opting into suppress_bg) must not leave a recognizable "ghost face"
+                    # behind the overlaid portrait. Use a hard suppression that effectively blacks-out the region.
+                    suppress_kwargs = {
+                        "pad_ratio": 0.25,
+                        "mask_blur_ratio": 0.01,
+                        "brightness": 0.0,
+                        "contrast": 1.0,
+                    }
+                    with suppressed_center_region_path(
+                        base_for_text,
+                        dest_box_px=suppress_box_px,
+                        temp_prefix=f"{target.video_id}_bg_supp_",
+                        **suppress_kwargs,
+                    ) as suppressed_bg:
+                        base_for_portrait = suppressed_bg
+                        if elements_below:
+                            base_for_portrait = _apply_elements_to_path(
+                                base_for_portrait,
+                                channel=ch,
+                                video=target.video,
+                                elements=elements_below,
+                                out_path=build_dir / "base__elements_below.png",
+                            )
+                        with composited_portrait_path(
+                            base_for_portrait,
+                            portrait_path=portrait_path,
+                            dest_box_px=dest_box_px,
+                            temp_prefix=f"{target.video_id}_base_",
+                            anchor=anchor,
+                            portrait_zoom=float(portrait_zoom),
+                            portrait_offset_px=portrait_offset_px,
+                            trim_transparent=bool(trim_transparent),
+                            fg_brightness=fg_brightness,
+                            fg_contrast=fg_contrast,
+                            fg_color=fg_color,
+                        ) as base_with_portrait:
+                            portrait_used = True
+                            base_for_text_out = base_with_portrait
+                            if elements_above:
+                                base_for_text_out = _apply_elements_to_path(
+                                    base_for_text_out,
+                                    channel=ch,
+                                    video=target.video,
+                                    elements=elements_above,
+                                    out_path=build_dir / "base__elements_above.png",
+                                )
+                            if use_canva_text:
+                                _compose_text_canva_like(
+                                    base_for_text_out,
+                                    text_layout_spec=text_spec_for_render,
+                                    video_id=target.video_id,
+                                    out_path=build_thumb,
+                                    output_mode=output_mode,
+                                    template_id=template_id,
+                                    resolved_text_by_slot=resolved_text_by_slot,
+                                    text_line_spec_lines=text_line_spec_lines,
+                                    text_offset_x=float(video_text_offset_x),
+                                    text_offset_y=float(video_text_offset_y),
+                                    template_id_override=template_id_override,
+                                    effects_override=effects_override_final,
+                                    overlays_override=overlays_override_final,
+                                )
+                            else:
+                                compose_text_to_png(
+                                    base_for_text_out,
+                                    text_layout_spec=text_spec_for_render,
+                                    video_id=target.video_id,
+                                    out_path=build_thumb,
+                                    output_mode=output_mode,
+                                    text_override=text_override if text_override else None,
+                                    template_id_override=template_id_override,
+                                    effects_override=effects_override_final,
+                                    overlays_override=overlays_override_final,
+                                )
+                else:
+                    base_for_portrait = base_for_text
+                    if elements_below:
+                        base_for_portrait = _apply_elements_to_path(
+                            base_for_portrait,
+                            channel=ch,
+                            video=target.video,
+                            elements=elements_below,
+                            out_path=build_dir / "base__elements_below.png",
+                        )
+                    with composited_portrait_path(
+                        base_for_portrait,
+                        portrait_path=portrait_path,
+                        dest_box_px=dest_box_px,
+                        temp_prefix=f"{target.video_id}_base_",
+                        anchor=anchor,
+                        portrait_zoom=float(portrait_zoom),
+                        portrait_offset_px=portrait_offset_px,
+                        trim_transparent=bool(trim_transparent),
+                        fg_brightness=fg_brightness,
+                        fg_contrast=fg_contrast,
+                        fg_color=fg_color,
+                    ) as base_with_portrait:
+                        portrait_used = True
+                        base_for_text_out = base_with_portrait
+                        if elements_above:
+                            base_for_text_out = _apply_elements_to_path(
+                                base_for_text_out,
+                                channel=ch,
+                                video=target.video,
+                                elements=elements_above,
+                                out_path=build_dir / "base__elements_above.png",
+                            )
+                        if use_canva_text:
+                            _compose_text_canva_like(
+                                base_for_text_out,
+                                text_layout_spec=text_spec_for_render,
+                                video_id=target.video_id,
+                                out_path=build_thumb,
+                                output_mode=output_mode,
+                                template_id=template_id,
+                                resolved_text_by_slot=resolved_text_by_slot,
+                                text_line_spec_lines=text_line_spec_lines,
+                                text_offset_x=float(video_text_offset_x),
+                                text_offset_y=float(video_text_offset_y),
+                                template_id_override=template_id_override,
+                                effects_override=effects_override_final,
+                                overlays_override=overlays_override_final,
+                            )
+                        else:
+                            compose_text_to_png(
+                                base_for_text_out,
+                                text_layout_spec=text_spec_for_render,
+                                video_id=target.video_id,
+                                out_path=build_thumb,
+                                output_mode=output_mode,
+                                text_override=text_override if text_override else None,
+                                template_id_override=template_id_override,
+                                effects_override=effects_override_final,
+                                overlays_override=overlays_override_final,
+                            )
+        else:
+            base_for_text_out = base_for_text
+            if elements_below:
+                base_for_text_out = _apply_elements_to_path(
+                    base_for_text_out,
+                    channel=ch,
+                    video=target.video,
+                    elements=elements_below,
+                    out_path=build_dir / "base__elements_below.png",
+                )
+            if elements_above:
+                base_for_text_out = _apply_elements_to_path(
+                    base_for_text_out,
+                    channel=ch,
+                    video=target.video,
+                    elements=elements_above,
+                    out_path=build_dir / "base__elements_above.png",
+                )
+            if use_canva_text:
+                _compose_text_canva_like(
+                    base_for_text_out,
+                    text_layout_spec=text_spec_for_render,
+                    video_id=target.video_id,
+                    out_path=build_thumb,
+                    output_mode=output_mode,
+                    template_id=template_id,
+                    resolved_text_by_slot=resolved_text_by_slot,
+                    text_line_spec_lines=text_line_spec_lines,
+                    text_offset_x=float(video_text_offset_x),
+                    text_offset_y=float(video_text_offset_y),
+                    template_id_override=template_id_override,
+                    effects_override=effects_override_final,
+                    overlays_override=overlays_override_final,
+                )
+            else:
+                compose_text_to_png(
+                    base_for_text_out,
+                    text_layout_spec=text_spec_for_render,
+                    video_id=target.video_id,
+                    out_path=build_thumb,
+                    output_mode=output_mode,
+                    text_override=text_override if text_override else None,
+                    template_id_override=template_id_override,
+                    effects_override=effects_override_final,
+                    overlays_override=overlays_override_final,
+                )
+    # Update stable artifact (00_thumb.png) from this build output.
+    tmp_stable = stable_thumb.with_suffix(stable_thumb.suffix + ".tmp")
+    tmp_stable.write_bytes(build_thumb.read_bytes())
+    tmp_stable.replace(stable_thumb)
+
+    if flat_out:
+        flat_out.write_bytes(stable_thumb.read_bytes())
+
+    record_path = _render_record_path(video_dir, stable_thumb_name)
+    tmp_record = record_path.with_suffix(record_path.suffix + ".tmp")
+    tmp_record.write_text(
+        json.dumps(
+            {
+                "schema": "ytm.thumbnail.layer_specs.render_record.v1",
+                "fingerprint": render_fingerprint,
+                "build_id": build_id,
+                "thumb_sha256": _file_digest(stable_thumb),
+                "built_at": datetime.now(timezone.utc).isoformat(),
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    tmp_record.replace(record_path)
+
+    variant: Optional[Dict[str, Any]] = None
+    if update_projects:
+        title = _resolve_title_from_specs(
+            channel=ch, video_id=target.video_id, image_spec=image_spec, text_spec=text_spec_typed
+        )
+        rel_thumb = f"{ch}/{target.video}/{stable_thumb_name}"
+        variant = {
+            "channel": ch,
+            "video": target.video,
+            "title": title,
+            "image_rel_path": rel_thumb,
+            "label": resolved_variant_label,
+            "status": "review",
+        }
+
+    overrides_leaf_json: Dict[str, Any] = {}
+    for k, v in overrides_leaf.items():
+        if isinstance(v, tuple):
+            overrides_leaf_json[k] = list(v)
+        else:
+            overrides_leaf_json[k] = v
+
+    meta: Dict[str, Any] = {
+        "schema": "ytm.thumbnail.layer_specs.build.v1",
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "channel": ch,
+        "video": target.video,
+        "video_id": target.video_id,
+        "model_key": model_key,
+        "build_id": build_id,
+        "output_mode": output_mode,
+        "render_fingerprint": render_fingerprint,
+        "layer_specs": {"image_prompts_id": img_id, "text_layout_id": txt_id},
+        "thumb_spec": {
+            "path": str(thumb_spec.path.relative_to(fpaths.repo_root())) if thumb_spec else None,
+            "overrides_leaf": overrides_leaf_json or None,
+        },
+        "text": {
+            "template_id": template_id,
+            "template_id_override": template_id_override,
+            "planning_copy": planning_copy,
+            "text_override": text_override if text_override else None,
+            "effects_override": effects_override,
+            "overlays_override": overlays_override,
+        },
+        "output": {
+            "bg_path": str(out_bg.relative_to(fpaths.repo_root())),
+            "stable_thumb_path": str(stable_thumb.relative_to(fpaths.repo_root())),
+            "build_thumb_path": str(build_thumb.relative_to(fpaths.repo_root())),
+            "width": width,
+            "height": height,
+        },
+        "bg_enhance": {
+            "brightness": bg_params.brightness,
+            "contrast": bg_params.contrast,
+            "color": bg_params.color,
+            "gamma": bg_params.gamma,
+        },
+        "bg_pan_zoom": {
+            "zoom": float(video_bg_zoom),
+            "pan_x": float(video_bg_pan_x),
+            "pan_y": float(video_bg_pan_y),
+        },
+        "bg_enhance_band": {
+            "x0": float(video_band_x0),
+            "x1": float(video_band_x1),
+            "power": float(video_band_power),
+            "brightness": band_params.brightness,
+            "contrast": band_params.contrast,
+            "color": band_params.color,
+            "gamma": band_params.gamma,
+        },
+        "sources": {
+            "legacy_moved_from": legacy_moved_from,
+            "bg_src": str(bg_src.relative_to(fpaths.repo_root())),
+        },
+        "portrait": {
+            "used": bool(portrait_used),
+            "portrait_path": str(portrait_path.relative_to(fpaths.repo_root())) if portrait_used and portrait_path else None,
+        },
+        "generated": generated,
+    }
+    tmp_meta = build_meta_path.with_suffix(build_meta_path.suffix + ".tmp")
+    tmp_meta.write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp_meta.replace(build_meta_path)
+    print(f"[{idx}/{total}] {target.video_id}: OK -> {stable_thumb}")
+    return variant
+
+
+# NOTE:
+# Parallel build (workers > 1): compositing is CPU-bound PIL work, so targets are composed in a
+# process pool; each worker receives the run context once through the pool initializer.
+# Background generation stays in the parent on its own bounded thread pool (gen_workers,
+# default 1) because the image API is rate-limited; every finished background is handed to the
+# compose pool right away. projects.json is merged once per run (serial builds too) instead of
+# being rewritten per target.
+_BUILD_WORKER_CTX: Optional[_ChannelBuildContext] = None
+
+
+def _init_build_worker(ctx: _ChannelBuildContext) -> None:
+    global _BUILD_WORKER_CTX
+    _BUILD_WORKER_CTX = ctx
+
+
+def _compose_target_in_worker(idx: int, total: int, target: BuildTarget, bg: _TargetBackground) -> Optional[Dict[str, Any]]:
+    if _BUILD_WORKER_CTX is None:
+        raise RuntimeError("build worker context not initialized")
+    return _compose_target(_BUILD_WORKER_CTX, idx, total, target, bg)
+
+
+def _build_targets_parallel(
+    ctx: _ChannelBuildContext,
+    targets: List[BuildTarget],
+    *,
+    client: Optional[ImageClient],
+    workers: int,
+    gen_workers: int,
+    variants: List[Tuple[int, Dict[str, Any]]],
+    counts: Dict[str, int],
+) -> None:
+    total = len(targets)
+    pool = ProcessPoolExecutor(
+        max_workers=int(workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_build_worker,
+        initargs=(ctx,),
+    )
+    compose_futs: Dict[Future, Tuple[int, BuildTarget]] = {}
+    gen_pool: Optional[ThreadPoolExecutor] = None
+    try:
+        to_generate: List[Tuple[int, BuildTarget]] = []
+        for idx, target in enumerate(targets, start=1):
+            skipped = _skip_reason(ctx, idx, total, target)
+            if skipped:
+                counts[skipped] += 1
+                continue
+            bg = _existing_target_background(ctx, target)
+            if bg is not None:
+                compose_futs[pool.submit(_compose_target_in_worker, idx, total, target, bg)] = (idx, target)
+                continue
+            if ctx.skip_generate:
+                print(f"[{idx}/{total}] {target.video_id}: missing bg (skip_generate)")
+                counts["missing_bg"] += 1
+                continue
+            to_generate.append((idx, target))
+
+        if to_generate:
+            gen_pool = ThreadPoolExecutor(max_workers=max(1, int(gen_workers)), thread_name_prefix="thumb_bg_gen")
+            gen_futs = {
+                gen_pool.submit(_generate_target_background, ctx, idx, total, target, client): (idx, target)
+                for idx, target in to_generate
+            }
+            for fut in as_completed(gen_futs):
+                bg = fut.result()
+                if bg is None:
+                    counts["failed"] += 1
+                    continue
+                idx, target = gen_futs[fut]
+                compose_futs[pool.submit(_compose_target_in_worker, idx, total, target, bg)] = (idx, target)
+
+        for fut in as_completed(compose_futs):
+            idx, _target = compose_futs[fut]
+            # Same as the serial path: continue_on_error covers background generation only,
+            # a compose error aborts the run (finished variants are still recorded below).
+            variant = fut.result()
+            counts["rebuilt"] += 1
+            if variant:
+                variants.append((idx, variant))
+    except BaseException:
+        # Keep whatever already finished so projects.json still reflects it.
+        for fut, (idx, _target) in compose_futs.items():
+            if fut.done() and not fut.cancelled() and fut.exception() is None and fut.result():
+                if all(i != idx for i, _ in variants):
+                    variants.append((idx, fut.result()))
+        if gen_pool is not None:
+            gen_pool.shutdown(wait=True, cancel_futures=True)
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    if gen_pool is not None:
+        gen_pool.shutdown(wait=True)
+    pool.shutdown(wait=True)
+
+
 def build_channel_thumbnails(
     *,
     channel: str,
@@ -1127,7 +2378,9 @@ def build_channel_thumbnails(
     effects_override_base: Optional[Dict[str, Any]] = None,
     overlays_override_base: Optional[Dict[str, Any]] = None,
     text_override_base: Optional[Dict[str, str]] = None,
-) -> None:
+    workers: int = 1,
+    gen_workers: int = 1,
+) -> Dict[str, int]:
     if bool(regen_bg) and bool(skip_generate):
         raise ValueError("regen_bg cannot be used with skip_generate")
     stable_thumb_name = str(stable_thumb_name or "").strip() or "00_thumb.png"
@@ -1197,834 +2450,93 @@ def build_channel_thumbnails(
     base_band_color = _default_float(float(bg_band_color), band_defaults, "color", identity=1.0)
     base_band_gamma = _default_float(float(bg_band_gamma), band_defaults, "gamma", identity=1.0)
 
-    for idx, target in enumerate(targets, start=1):
-        video_dir = assets_root / target.video
-        video_dir.mkdir(parents=True, exist_ok=True)
-
-        bg_name = "10_bg.png" if stable_id is None else f"10_bg.{stable_id}.png"
-        out_bg = video_dir / bg_name
-        stable_thumb = video_dir / stable_thumb_name
-        flat_out: Optional[Path] = None
-        if export_flat:
-            suffix = str(flat_name_suffix or "").strip()
-            if suffix and not suffix.startswith("_"):
-                suffix = "_" + suffix
-            flat_out = assets_root / f"{target.video}{suffix}.png"
-
-        if stable_thumb.exists() and not force:
-            if flat_out and not flat_out.exists():
-                flat_out.write_bytes(stable_thumb.read_bytes())
-                print(f"[{idx}/{len(targets)}] {target.video_id}: export-flat -> {flat_out.name}")
-            else:
-                print(f"[{idx}/{len(targets)}] {target.video_id}: skip (already built)")
-            continue
+    ctx = _ChannelBuildContext(
+        channel=ch,
+        width=int(width),
+        height=int(height),
+        stable_thumb_name=stable_thumb_name,
+        stable_id=stable_id,
+        resolved_variant_label=resolved_variant_label,
+        update_projects=bool(update_projects),
+        force=bool(force),
+        skip_generate=bool(skip_generate),
+        continue_on_error=bool(continue_on_error),
+        max_gen_attempts=int(max_gen_attempts),
+        export_flat=bool(export_flat),
+        flat_name_suffix=str(flat_name_suffix or ""),
+        sleep_sec=float(sleep_sec),
+        regen_bg=bool(regen_bg),
+        build_id=build_id,
+        output_mode=output_mode,
+        img_id=img_id,
+        txt_id=txt_id,
+        text_spec=text_spec,
+        text_spec_typed=text_spec_typed,
+        image_spec=image_spec,
+        model_key=model_key,
+        assets_root=assets_root,
+        portrait_policy=portrait_policy,
+        font_files=resolve_layout_font_files(text_spec) if isinstance(text_spec, dict) else {},
+        text_template_id_override=text_template_id_override,
+        effects_override_base=effects_override_base,
+        overlays_override_base=overlays_override_base,
+        text_override_base=text_override_base,
+        base_bg_brightness=base_bg_brightness,
+        base_bg_contrast=base_bg_contrast,
+        base_bg_color=base_bg_color,
+        base_bg_gamma=base_bg_gamma,
+        base_bg_zoom=base_bg_zoom,
+        base_bg_pan_x=base_bg_pan_x,
+        base_bg_pan_y=base_bg_pan_y,
+        base_band_x0=base_band_x0,
+        base_band_x1=base_band_x1,
+        base_band_power=base_band_power,
+        base_band_brightness=base_band_brightness,
+        base_band_contrast=base_band_contrast,
+        base_band_color=base_band_color,
+        base_band_gamma=base_band_gamma,
+    )
 
-        build_dir = video_dir / "compiler" / build_id
-        build_dir.mkdir(parents=True, exist_ok=True)
-        build_thumb = build_dir / "out_01.png"
-        build_meta_path = build_dir / "build_meta.json"
-
-        thumb_spec = load_thumb_spec(ch, target.video, stable=stable_id)
-        overrides_leaf = extract_normalized_override_leaf(thumb_spec.payload) if thumb_spec else {}
-
-        video_bg_brightness = float(overrides_leaf.get("overrides.bg_enhance.brightness", base_bg_brightness))
-        video_bg_contrast = float(overrides_leaf.get("overrides.bg_enhance.contrast", base_bg_contrast))
-        video_bg_color = float(overrides_leaf.get("overrides.bg_enhance.color", base_bg_color))
-        video_bg_gamma = float(overrides_leaf.get("overrides.bg_enhance.gamma", base_bg_gamma))
-
-        video_bg_zoom = float(overrides_leaf.get("overrides.bg_pan_zoom.zoom", base_bg_zoom))
-        video_bg_pan_x = float(overrides_leaf.get("overrides.bg_pan_zoom.pan_x", base_bg_pan_x))
-        video_bg_pan_y = float(overrides_leaf.get("overrides.bg_pan_zoom.pan_y", base_bg_pan_y))
-
-        video_band_x0 = float(overrides_leaf.get("overrides.bg_enhance_band.x0", base_band_x0))
-        video_band_x1 = float(overrides_leaf.get("overrides.bg_enhance_band.x1", base_band_x1))
-        video_band_power = float(overrides_leaf.get("overrides.bg_enhance_band.power", base_band_power))
-        video_band_brightness = float(overrides_leaf.get("overrides.bg_enhance_band.brightness", base_band_brightness))
-        video_band_contrast = float(overrides_leaf.get("overrides.bg_enhance_band.contrast", base_band_contrast))
-        video_band_color = float(overrides_leaf.get("overrides.bg_enhance_band.color", base_band_color))
-        video_band_gamma = float(overrides_leaf.get("overrides.bg_enhance_band.gamma", base_band_gamma))
-
-        video_text_scale = float(overrides_leaf.get("overrides.text_scale", 1.0))
-        video_text_offset_x = float(overrides_leaf.get("overrides.text_offset_x", 0.0))
-        video_text_offset_y = float(overrides_leaf.get("overrides.text_offset_y", 0.0))
-
-        template_id_override = str(overrides_leaf.get("overrides.text_template_id") or "").strip() or None
-        if not template_id_override:
-            template_id_override = str(text_template_id_override or "").strip() or None
-
-        effects_override: Optional[Dict[str, Any]] = None
-        overlays_override: Optional[Dict[str, Any]] = None
-        if overrides_leaf:
-            stroke: Dict[str, Any] = {}
-            shadow: Dict[str, Any] = {}
-            glow: Dict[str, Any] = {}
-            fills: Dict[str, Any] = {}
-            if "overrides.text_effects.stroke.width_px" in overrides_leaf:
-                stroke["width_px"] = overrides_leaf["overrides.text_effects.stroke.width_px"]
-            if "overrides.text_effects.stroke.color" in overrides_leaf:
-                stroke["color"] = overrides_leaf["overrides.text_effects.stroke.color"]
-            if "overrides.text_effects.shadow.alpha" in overrides_leaf:
-                shadow["alpha"] = overrides_leaf["overrides.text_effects.shadow.alpha"]
-            if "overrides.text_effects.shadow.offset_px" in overrides_leaf:
-                off = overrides_leaf["overrides.text_effects.shadow.offset_px"]
-                if isinstance(off, tuple) and len(off) == 2:
-                    shadow["offset_px"] = [int(off[0]), int(off[1])]
-                else:
-                    shadow["offset_px"] = off
-            if "overrides.text_effects.shadow.blur_px" in overrides_leaf:
-                shadow["blur_px"] = overrides_leaf["overrides.text_effects.shadow.blur_px"]
-            if "overrides.text_effects.shadow.color" in overrides_leaf:
-                shadow["color"] = overrides_leaf["overrides.text_effects.shadow.color"]
-            if "overrides.text_effects.glow.alpha" in overrides_leaf:
-                glow["alpha"] = overrides_leaf["overrides.text_effects.glow.alpha"]
-            if "overrides.text_effects.glow.blur_px" in overrides_leaf:
-                glow["blur_px"] = overrides_leaf["overrides.text_effects.glow.blur_px"]
-            if "overrides.text_effects.glow.color" in overrides_leaf:
-                glow["color"] = overrides_leaf["overrides.text_effects.glow.color"]
-
-            for fill_key in ("white_fill", "red_fill", "yellow_fill", "hot_red_fill", "purple_fill"):
-                p = f"overrides.text_fills.{fill_key}.color"
-                if p in overrides_leaf:
-                    fills[fill_key] = {"color": overrides_leaf[p]}
-            eff = {}
-            if stroke:
-                eff["stroke"] = stroke
-            if shadow:
-                eff["shadow"] = shadow
-            if glow:
-                eff["glow"] = glow
-            if fills:
-                eff.update(fills)
-            if eff:
-                effects_override = eff
-
-            left_tsz: Dict[str, Any] = {}
-            top_band: Dict[str, Any] = {}
-            bottom_band: Dict[str, Any] = {}
-            for k in ("enabled", "color", "alpha_left", "alpha_right", "x0", "x1"):
-                p = f"overrides.overlays.left_tsz.{k}"
-                if p in overrides_leaf:
-                    left_tsz[k] = overrides_leaf[p]
-            for k in (
-                "enabled",
-                "color",
-                "alpha_top",
-                "alpha_bottom",
-                "y0",
-                "y1",
-                "mode",
-                "alpha",
-                "roughness",
-                "feather_px",
-                "hole_count",
-                "blur_px",
-                "seed",
-            ):
-                p = f"overrides.overlays.top_band.{k}"
-                if p in overrides_leaf:
-                    top_band[k] = overrides_leaf[p]
-            for k in (
-                "enabled",
-                "color",
-                "alpha_top",
-                "alpha_bottom",
-                "y0",
-                "y1",
-                "mode",
-                "alpha",
-                "roughness",
-                "feather_px",
-                "hole_count",
-                "blur_px",
-                "seed",
-            ):
-                p = f"overrides.overlays.bottom_band.{k}"
-                if p in overrides_leaf:
-                    bottom_band[k] = overrides_leaf[p]
-            ov = {}
-            if left_tsz:
-                ov["left_tsz"] = left_tsz
-            if top_band:
-                ov["top_band"] = top_band
-            if bottom_band:
-                ov["bottom_band"] = bottom_band
-            if ov:
-                overlays_override = ov
-
-        def _deep_merge_dict(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
-            out: Dict[str, Any] = dict(base)
-            for key, value in patch.items():
-                if isinstance(value, dict) and isinstance(out.get(key), dict):
-                    out[key] = _deep_merge_dict(out[key], value)
-                else:
-                    out[key] = value
-            return out
-
-        effects_override_final: Optional[Dict[str, Any]] = None
-        if isinstance(effects_override_base, dict) and effects_override_base:
-            effects_override_final = dict(effects_override_base)
-        if isinstance(effects_override, dict) and effects_override:
-            effects_override_final = _deep_merge_dict(effects_override_final or {}, effects_override)
-
-        overlays_override_final: Optional[Dict[str, Any]] = None
-        if isinstance(overlays_override_base, dict) and overlays_override_base:
-            overlays_override_final = dict(overlays_override_base)
-        if isinstance(overlays_override, dict) and overlays_override:
-            overlays_override_final = _deep_merge_dict(overlays_override_final or {}, overlays_override)
-
-        copy_override: Dict[str, str] = {}
-        for k in ("upper", "title", "lower"):
-            p = f"overrides.copy_override.{k}"
-            if p in overrides_leaf and isinstance(overrides_leaf.get(p), str):
-                copy_override[k] = str(overrides_leaf[p]).strip()
-
-        bg_source = resolve_background_source(video_dir=video_dir, channel_root=assets_root, video=target.video)
-        bg_src = None if bool(regen_bg) else bg_source.bg_src
-        legacy_moved_from = None if bool(regen_bg) else bg_source.legacy_moved_from
-        if stable_id is not None and not bool(regen_bg) and out_bg.exists():
-            bg_src = out_bg
-
-        generated: Optional[Dict[str, Any]] = None
-        if bg_src is None:
-            if skip_generate:
-                print(f"[{idx}/{len(targets)}] {target.video_id}: missing bg (skip_generate)")
-                continue
-            prompt = None
-            use_image_spec_prompt = True
-            if (
-                ch in {"CH01", "CH32"}
-                and str(text_template_id_override or "").strip() == "CH01_canva_gold_right_stack_3line_v1"
-                and str(img_id or "").strip() == "ch01_image_prompts_memo9_v1"
-            ):
-                # Gold/canva style wants LEFT-subject composition; memo9 prompts are RIGHT-subject.
-                # Prefer Planning prompt (if authored) or a style fallback prompt instead of reusing memo9 prompts.
-                use_image_spec_prompt = False
-            if image_spec is not None and use_image_spec_prompt:
-                prompt = next((it.prompt_ja for it in image_spec.items if it.video_id == target.video_id), None)
-            if not isinstance(prompt, str) or not prompt.strip():
-                prompt = _load_planning_image_prompt(ch, target.video)
-            if not isinstance(prompt, str) or not prompt.strip():
-                prompt = _fallback_image_prompt_for_style(ch, text_template_id=text_template_id_override)
-            if not isinstance(prompt, str) or not prompt.strip():
-                raise RuntimeError(
-                    f"image prompt missing for {target.video_id} "
-                    f"(layer_specs image_prompts item or Planning CSV image prompt column is required)"
-                )
-            prompt = _sanitize_prompt_for_generation(channel=ch, prompt=prompt)
-            negative_prompt = _negative_prompt_for_generation(channel=ch)
-            try:
-                raw_name = "90_bg_ai_raw.png" if stable_id is None else f"90_bg_ai_raw.{stable_id}.png"
-                gen = generate_background_with_retries(
-                    client=client,
-                    prompt=prompt,
-                    model_key=model_key,
-                    negative_prompt=negative_prompt,
-                    out_raw_path=video_dir / raw_name,
-                    video_id=target.video_id,
-                    max_attempts=int(max_gen_attempts),
-                    sleep_sec=float(sleep_sec),
-                )
-            except Exception as exc:  # noqa: BLE001
-                msg = f"[{idx}/{len(targets)}] {target.video_id}: generation failed ({exc})"
-                if continue_on_error:
-                    print(msg)
-                    continue
-                raise
-            bg_src = gen.raw_path
-            generated = gen.generated
-
-        if not bg_src:
-            raise RuntimeError(f"background source resolution failed for {target.video_id}")
-        crop_resize_to_16x9(bg_src, out_bg, width=width, height=height, output_mode=output_mode)
-
-        print(f"[{idx}/{len(targets)}] {target.video_id}: composing text ...")
-        bg_params = BgEnhanceParams(
-            brightness=float(video_bg_brightness),
-            contrast=float(video_bg_contrast),
-            color=float(video_bg_color),
-            gamma=float(video_bg_gamma),
-        )
-        band_params = BgEnhanceParams(
-            brightness=float(video_band_brightness),
-            contrast=float(video_band_contrast),
-            color=float(video_band_color),
-            gamma=float(video_band_gamma),
-        )
-        item = find_text_layout_item_for_video(text_spec, target.video_id) if isinstance(text_spec, dict) else None
-        template_id = str(item.get("template_id") or "").strip() if isinstance(item, dict) else ""
-        if template_id_override:
-            template_id = str(template_id_override).strip() or template_id
-        if not template_id:
-            template_id = _default_text_template_id(text_spec)
-        templates = text_spec.get("templates") if isinstance(text_spec, dict) else None
-        slots = None
-        if template_id and isinstance(templates, dict):
-            tpl = templates.get(template_id)
-            slots = tpl.get("slots") if isinstance(tpl, dict) else None
-        text_payload = item.get("text") if isinstance(item, dict) else None
-        planning_copy = _load_planning_copy(ch, target.video)
-        if copy_override:
-            for k, v in copy_override.items():
-                if v:
-                    planning_copy[k] = v
-
-        def _override_for_slot(slot_name: str) -> str:
-            name = str(slot_name or "").strip().lower()
-            if name in {"line1", "upper", "top"}:
-                return str(copy_override.get("upper") or "").strip()
-            if name in {"line2", "title", "main"}:
-                return str(copy_override.get("title") or "").strip()
-            if name in {"line3", "lower", "accent"}:
-                return str(copy_override.get("lower") or "").strip()
-            return ""
-
-        text_override: Dict[str, str] = {}
-        if isinstance(slots, dict):
-            for slot_name in slots.keys():
-                slot_key = str(slot_name or "").strip()
-                if not slot_key:
-                    continue
-                forced = _override_for_slot(slot_key)
-                if forced:
-                    text_override[slot_key] = forced
-                    continue
-                authored = str(text_payload.get(slot_key) or "").strip() if isinstance(text_payload, dict) else ""
-                if authored:
-                    continue
-                val = _planning_value_for_slot(slot_key, planning_copy)
-                if val:
-                    text_override[slot_key] = val
-
-        text_line_spec_lines = _load_text_line_spec_lines(ch, target.video, stable=stable_id)
-
-        text_spec_for_render = text_spec
-        if not isinstance(item, dict) and template_id:
-            text_spec_for_render = _ensure_text_layout_item(
-                text_layout_spec=text_spec_for_render,
-                video_id=target.video_id,
-                template_id=template_id,
-                title=str(target.video_id),
-            )
-        needs_text_mutation = bool(text_line_spec_lines) or abs(float(video_text_scale) - 1.0) > 1e-6 or (
-            abs(float(video_text_offset_x)) > 1e-9 or abs(float(video_text_offset_y)) > 1e-9
-        )
-        if needs_text_mutation and isinstance(text_spec, dict):
-            text_spec_for_render = copy.deepcopy(text_spec)
-            templates_out = text_spec_for_render.get("templates") if isinstance(text_spec_for_render, dict) else None
-            tpl_out = templates_out.get(template_id) if isinstance(templates_out, dict) and template_id else None
-            slots_out = tpl_out.get("slots") if isinstance(tpl_out, dict) else None
-            if isinstance(slots_out, dict):
-                for slot_key, slot_cfg in slots_out.items():
-                    if not isinstance(slot_cfg, dict):
-                        continue
-                    if abs(float(video_text_scale) - 1.0) > 1e-6:
-                        base_size = slot_cfg.get("base_size_px")
-                        if isinstance(base_size, (int, float)):
-                            scaled = int(round(float(base_size) * float(video_text_scale)))
-                            slot_cfg["base_size_px"] = max(1, scaled)
-                    line = text_line_spec_lines.get(str(slot_key).strip()) if isinstance(slot_key, str) else None
-                    if isinstance(line, dict):
-                        line_scale = line.get("scale", 1.0)
-                        try:
-                            line_scale_f = float(line_scale)
-                        except Exception:
-                            line_scale_f = 1.0
-                        if abs(float(line_scale_f) - 1.0) > 1e-6:
-                            base_size = slot_cfg.get("base_size_px")
-                            if isinstance(base_size, (int, float)):
-                                scaled = int(round(float(base_size) * float(line_scale_f)))
-                                slot_cfg["base_size_px"] = max(1, scaled)
-        if not isinstance(item, dict) and template_id:
-            text_spec_for_render = _ensure_text_layout_item(
-                text_layout_spec=text_spec_for_render,
-                video_id=target.video_id,
-                template_id=template_id,
-                title=str(target.video_id),
+    total = len(targets)
+    variants: List[Tuple[int, Dict[str, Any]]] = []
+    counts: Dict[str, int] = {"rebuilt": 0, "unchanged": 0, "kept": 0, "missing_bg": 0, "failed": 0}
+    try:
+        if int(workers) > 1 and total > 1:
+            _build_targets_parallel(
+                ctx,
+                targets,
+                client=client,
+                workers=int(workers),
+                gen_workers=int(gen_workers),
+                variants=variants,
+                counts=counts,
             )
-
-        resolved_text_by_slot: Dict[str, str] = {}
-        if isinstance(slots, dict):
-            for slot_name in slots.keys():
-                slot_key = str(slot_name or "").strip()
-                if not slot_key:
-                    continue
-                forced = _override_for_slot(slot_key)
-                authored = str(text_payload.get(slot_key) or "").strip() if isinstance(text_payload, dict) else ""
-                planned = _planning_value_for_slot(slot_key, planning_copy)
-                resolved_text_by_slot[slot_key] = forced or authored or planned or ""
-
-        if isinstance(slots, dict) and isinstance(text_override_base, dict) and text_override_base:
-            for raw_key, raw_val in text_override_base.items():
-                if not isinstance(raw_key, str) or not raw_key.strip():
-                    continue
-                slot_key = raw_key.strip()
-                if slot_key not in slots:
-                    continue
-                val = str(raw_val or "").strip()
-                if not val:
-                    continue
-                if str(resolved_text_by_slot.get(slot_key) or "").strip():
-                    continue
-                resolved_text_by_slot[slot_key] = val
-                text_override.setdefault(slot_key, val)
-
-        use_canva_text = abs(float(video_text_offset_x)) > 1e-9 or abs(float(video_text_offset_y)) > 1e-9
-        if not use_canva_text:
-            for line in (text_line_spec_lines or {}).values():
-                if not isinstance(line, dict):
-                    continue
-                try:
-                    ox = float(line.get("offset_x", 0.0))
-                    oy = float(line.get("offset_y", 0.0))
-                    rot = float(line.get("rotate_deg", 0.0))
-                except Exception:
+        else:
+            for idx, target in enumerate(targets, start=1):
+                skipped = _skip_reason(ctx, idx, total, target)
+                if skipped:
+                    counts[skipped] += 1
                     continue
-                if abs(float(ox)) > 1e-9 or abs(float(oy)) > 1e-9 or abs(float(rot)) > 1e-6:
-                    use_canva_text = True
-                    break
-
-        elements_spec = _load_elements_spec_elements(ch, target.video, stable=stable_id)
-        elements_below = sorted(
-            [el for el in elements_spec if str(el.get("layer") or "above_portrait") == "below_portrait"],
-            key=lambda el: int(el.get("z", 0)) if isinstance(el.get("z"), (int, float, str)) else 0,
-        )
-        elements_above = sorted(
-            [el for el in elements_spec if str(el.get("layer") or "above_portrait") != "below_portrait"],
-            key=lambda el: int(el.get("z", 0)) if isinstance(el.get("z"), (int, float, str)) else 0,
-        )
-
-        with enhanced_bg_path(
-            out_bg,
-            params=bg_params,
-            zoom=float(video_bg_zoom),
-            pan_x=float(video_bg_pan_x),
-            pan_y=float(video_bg_pan_y),
-            band_params=band_params,
-            band_x0=float(video_band_x0),
-            band_x1=float(video_band_x1),
-            band_power=float(video_band_power),
-            temp_prefix=f"{target.video_id}_bg_",
-        ) as base_for_text:
-            portrait_path = find_existing_portrait(video_dir)
-            portrait_used = False
-            if portrait_path is not None:
-                portrait_enabled = bool(overrides_leaf.get("overrides.portrait.enabled", stable_id != "00_thumb_2"))
-                if not portrait_enabled:
-                    base_for_text_out = base_for_text
-                    if elements_below:
-                        base_for_text_out = _apply_elements_to_path(
-                            base_for_text_out,
-                            channel=ch,
-                            video=target.video,
-                            elements=elements_below,
-                            out_path=build_dir / "base__elements_below.png",
-                        )
-                    if elements_above:
-                        base_for_text_out = _apply_elements_to_path(
-                            base_for_text_out,
-                            channel=ch,
-                            video=target.video,
-                            elements=elements_above,
-                            out_path=build_dir / "base__elements_above.png",
-                        )
-                    if use_canva_text:
-                        _compose_text_canva_like(
-                            base_for_text_out,
-                            text_layout_spec=text_spec_for_render,
-                            video_id=target.video_id,
-                            out_path=build_thumb,
-                            output_mode=output_mode,
-                            template_id=template_id,
-                            resolved_text_by_slot=resolved_text_by_slot,
-                            text_line_spec_lines=text_line_spec_lines,
-                            text_offset_x=float(video_text_offset_x),
-                            text_offset_y=float(video_text_offset_y),
-                            template_id_override=template_id_override,
-                            effects_override=effects_override_final,
-                            overlays_override=overlays_override_final,
-                        )
-                    else:
-                        compose_text_to_png(
-                            base_for_text_out,
-                            text_layout_spec=text_spec_for_render,
-                            video_id=target.video_id,
-                            out_path=build_thumb,
-                            output_mode=output_mode,
-                            text_override=text_override if text_override else None,
-                            template_id_override=template_id_override,
-                            effects_override=effects_override_final,
-                            overlays_override=overlays_override_final,
-                        )
-                else:
-                    # CH26 benchmark: portrait is composited as a separate layer (本人肖像素材を使用)
-                    dest_box_norm_default = (0.29, 0.06, 0.42, 0.76)
-                    dest_box_norm = dest_box_norm_default
-                    anchor = "bottom_center"
-                    portrait_zoom = 1.0
-                    portrait_offset_px = (0, 0)
-                    off_norm = (0.0, 0.0)
-                    trim_transparent = False
-
-                    fg_brightness = 1.20
-                    fg_contrast = 1.08
-                    fg_color = 0.98
-
-                    if ch == "CH26":
-                        cfg_defaults = (
-                            portrait_policy.get("defaults") if isinstance(portrait_policy.get("defaults"), dict) else {}
-                        )
-                        cfg_overrides = (
-                            portrait_policy.get("overrides") if isinstance(portrait_policy.get("overrides"), dict) else {}
-                        )
-                        ov = cfg_overrides.get(target.video) if isinstance(cfg_overrides, dict) else None
-                        ov = ov if isinstance(ov, dict) else {}
-
-                        dest_box_norm = _as_norm_box(
-                            ov.get("dest_box") or cfg_defaults.get("dest_box"), dest_box_norm_default
-                        )
-                        anchor = str(ov.get("anchor") or cfg_defaults.get("anchor") or anchor).strip() or anchor
-                        portrait_zoom = _as_float(ov.get("zoom") if "zoom" in ov else cfg_defaults.get("zoom"), 1.0)
-                        off_norm = _as_norm_offset(
-                            ov.get("offset") if "offset" in ov else cfg_defaults.get("offset"), (0.0, 0.0)
-                        )
-                        trim_transparent = bool(
-                            ov.get("trim_transparent") if "trim_transparent" in ov else cfg_defaults.get("trim_transparent")
-                        )
-
-                        fg_defaults = cfg_defaults.get("fg") if isinstance(cfg_defaults.get("fg"), dict) else {}
-                        fg_override = ov.get("fg") if isinstance(ov.get("fg"), dict) else {}
-                        fg_brightness = _as_float(
-                            fg_override.get("brightness") if "brightness" in fg_override else fg_defaults.get("brightness"),
-                            1.26,
-                        )
-                        fg_contrast = _as_float(
-                            fg_override.get("contrast") if "contrast" in fg_override else fg_defaults.get("contrast"),
-                            1.10,
-                        )
-                        fg_color = _as_float(
-                            fg_override.get("color") if "color" in fg_override else fg_defaults.get("color"), 1.00
-                        )
-
-                    # Per-video thumb_spec overrides should win over channel policy.
-                    # These are normalized offsets (relative to canvas width/height).
-                    if "overrides.portrait.zoom" in overrides_leaf:
-                        portrait_zoom = float(overrides_leaf["overrides.portrait.zoom"])
-                    off_x = float(off_norm[0]) if isinstance(off_norm, tuple) and len(off_norm) == 2 else 0.0
-                    off_y = float(off_norm[1]) if isinstance(off_norm, tuple) and len(off_norm) == 2 else 0.0
-                    if "overrides.portrait.offset_x" in overrides_leaf:
-                        off_x = float(overrides_leaf["overrides.portrait.offset_x"])
-                    if "overrides.portrait.offset_y" in overrides_leaf:
-                        off_y = float(overrides_leaf["overrides.portrait.offset_y"])
-                    portrait_offset_px = (int(round(width * off_x)), int(round(height * off_y)))
-                    if "overrides.portrait.trim_transparent" in overrides_leaf:
-                        trim_transparent = bool(overrides_leaf["overrides.portrait.trim_transparent"])
-                    if "overrides.portrait.fg_brightness" in overrides_leaf:
-                        fg_brightness = float(overrides_leaf["overrides.portrait.fg_brightness"])
-                    if "overrides.portrait.fg_contrast" in overrides_leaf:
-                        fg_contrast = float(overrides_leaf["overrides.portrait.fg_contrast"])
-                    if "overrides.portrait.fg_color" in overrides_leaf:
-                        fg_color = float(overrides_leaf["overrides.portrait.fg_color"])
-
-                    dest_box_px = (
-                        int(round(width * dest_box_norm[0])),
-                        int(round(height * dest_box_norm[1])),
-                        int(round(width * dest_box_norm[2])),
-                        int(round(height * dest_box_norm[3])),
-                    )
-                    suppress_box_px = dest_box_px
-                    if portrait_offset_px != (0, 0):
-                        shifted_box_px = (
-                            int(dest_box_px[0]) + int(portrait_offset_px[0]),
-                            int(dest_box_px[1]) + int(portrait_offset_px[1]),
-                            int(dest_box_px[2]),
-                            int(dest_box_px[3]),
-                        )
-                        left = min(int(dest_box_px[0]), int(shifted_box_px[0]))
-                        top = min(int(dest_box_px[1]), int(shifted_box_px[1]))
-                        right = max(
-                            int(dest_box_px[0]) + int(dest_box_px[2]),
-                            int(shifted_box_px[0]) + int(shifted_box_px[2]),
-                        )
-                        bottom = max(
-                            int(dest_box_px[1]) + int(dest_box_px[3]),
-                            int(shifted_box_px[1]) + int(shifted_box_px[3]),
-                        )
-                        suppress_box_px = (left, top, max(1, right - left), max(1, bottom - top))
-                    suppress_bg = bool(overrides_leaf.get("overrides.portrait.suppress_bg", ch == "CH26"))
-                    # CH26 backgrounds may already contain a portrait; when portrait is enabled we must suppress it.
-                    if ch == "CH26":
-                        suppress_bg = True
-                    if suppress_bg:
-                        # CH26 (and any channel opting into suppress_bg) must not leave a recognizable "ghost face"
-                        # behind the overlaid portrait. Use a hard suppression that effectively blacks-out the region.
-                        suppress_kwargs = {
-                            "pad_ratio": 0.25,
-                            "mask_blur_ratio": 0.01,
-                            "brightness": 0.0,
-                            "contrast": 1.0,
-                        }
-                        with suppressed_center_region_path(
-                            base_for_text,
-                            dest_box_px=suppress_box_px,
-                            temp_prefix=f"{target.video_id}_bg_supp_",
-                            **suppress_kwargs,
-                        ) as suppressed_bg:
-                            base_for_portrait = suppressed_bg
-                            if elements_below:
-                                base_for_portrait = _apply_elements_to_path(
-                                    base_for_portrait,
-                                    channel=ch,
-                                    video=target.video,
-                                    elements=elements_below,
-                                    out_path=build_dir / "base__elements_below.png",
-                                )
-                            with composited_portrait_path(
-                                base_for_portrait,
-                                portrait_path=portrait_path,
-                                dest_box_px=dest_box_px,
-                                temp_prefix=f"{target.video_id}_base_",
-                                anchor=anchor,
-                                portrait_zoom=float(portrait_zoom),
-                                portrait_offset_px=portrait_offset_px,
-                                trim_transparent=bool(trim_transparent),
-                                fg_brightness=fg_brightness,
-                                fg_contrast=fg_contrast,
-                                fg_color=fg_color,
-                            ) as base_with_portrait:
-                                portrait_used = True
-                                base_for_text_out = base_with_portrait
-                                if elements_above:
-                                    base_for_text_out = _apply_elements_to_path(
-                                        base_for_text_out,
-                                        channel=ch,
-                                        video=target.video,
-                                        elements=elements_above,
-                                        out_path=build_dir / "base__elements_above.png",
-                                    )
-                                if use_canva_text:
-                                    _compose_text_canva_like(
-                                        base_for_text_out,
-                                        text_layout_spec=text_spec_for_render,
-                                        video_id=target.video_id,
-                                        out_path=build_thumb,
-                                        output_mode=output_mode,
-                                        template_id=template_id,
-                                        resolved_text_by_slot=resolved_text_by_slot,
-                                        text_line_spec_lines=text_line_spec_lines,
-                                        text_offset_x=float(video_text_offset_x),
-                                        text_offset_y=float(video_text_offset_y),
-                                        template_id_override=template_id_override,
-                                        effects_override=effects_override_final,
-                                        overlays_override=overlays_override_final,
-                                    )
-                                else:
-                                    compose_text_to_png(
-                                        base_for_text_out,
-                                        text_layout_spec=text_spec_for_render,
-                                        video_id=target.video_id,
-                                        out_path=build_thumb,
-                                        output_mode=output_mode,
-                                        text_override=text_override if text_override else None,
-                                        template_id_override=template_id_override,
-                                        effects_override=effects_override_final,
-                                        overlays_override=overlays_override_final,
-                                    )
-                    else:
-                        base_for_portrait = base_for_text
-                        if elements_below:
-                            base_for_portrait = _apply_elements_to_path(
-                                base_for_portrait,
-                                channel=ch,
-                                video=target.video,
-                                elements=elements_below,
-                                out_path=build_dir / "base__elements_below.png",
-                            )
-                        with composited_portrait_path(
-                            base_for_portrait,
-                            portrait_path=portrait_path,
-                            dest_box_px=dest_box_px,
-                            temp_prefix=f"{target.video_id}_base_",
-                            anchor=anchor,
-                            portrait_zoom=float(portrait_zoom),
-                            portrait_offset_px=portrait_offset_px,
-                            trim_transparent=bool(trim_transparent),
-                            fg_brightness=fg_brightness,
-                            fg_contrast=fg_contrast,
-                            fg_color=fg_color,
-                        ) as base_with_portrait:
-                            portrait_used = True
-                            base_for_text_out = base_with_portrait
-                            if elements_above:
-                                base_for_text_out = _apply_elements_to_path(
-                                    base_for_text_out,
-                                    channel=ch,
-                                    video=target.video,
-                                    elements=elements_above,
-                                    out_path=build_dir / "base__elements_above.png",
-                                )
-                            if use_canva_text:
-                                _compose_text_canva_like(
-                                    base_for_text_out,
-                                    text_layout_spec=text_spec_for_render,
-                                    video_id=target.video_id,
-                                    out_path=build_thumb,
-                                    output_mode=output_mode,
-                                    template_id=template_id,
-                                    resolved_text_by_slot=resolved_text_by_slot,
-                                    text_line_spec_lines=text_line_spec_lines,
-                                    text_offset_x=float(video_text_offset_x),
-                                    text_offset_y=float(video_text_offset_y),
-                                    template_id_override=template_id_override,
-                                    effects_override=effects_override_final,
-                                    overlays_override=overlays_override_final,
-                                )
-                            else:
-                                compose_text_to_png(
-                                    base_for_text_out,
-                                    text_layout_spec=text_spec_for_render,
-                                    video_id=target.video_id,
-                                    out_path=build_thumb,
-                                    output_mode=output_mode,
-                                    text_override=text_override if text_override else None,
-                                    template_id_override=template_id_override,
-                                    effects_override=effects_override_final,
-                                    overlays_override=overlays_override_final,
-                                )
-            else:
-                base_for_text_out = base_for_text
-                if elements_below:
-                    base_for_text_out = _apply_elements_to_path(
-                        base_for_text_out,
-                        channel=ch,
-                        video=target.video,
-                        elements=elements_below,
-                        out_path=build_dir / "base__elements_below.png",
-                    )
-                if elements_above:
-                    base_for_text_out = _apply_elements_to_path(
-                        base_for_text_out,
-                        channel=ch,
-                        video=target.video,
-                        elements=elements_above,
-                        out_path=build_dir / "base__elements_above.png",
-                    )
-                if use_canva_text:
-                    _compose_text_canva_like(
-                        base_for_text_out,
-                        text_layout_spec=text_spec_for_render,
-                        video_id=target.video_id,
-                        out_path=build_thumb,
-                        output_mode=output_mode,
-                        template_id=template_id,
-                        resolved_text_by_slot=resolved_text_by_slot,
-                        text_line_spec_lines=text_line_spec_lines,
-                        text_offset_x=float(video_text_offset_x),
-                        text_offset_y=float(video_text_offset_y),
-                        template_id_override=template_id_override,
-                        effects_override=effects_override_final,
-                        overlays_override=overlays_override_final,
-                    )
-                else:
-                    compose_text_to_png(
-                        base_for_text_out,
-                        text_layout_spec=text_spec_for_render,
-                        video_id=target.video_id,
-                        out_path=build_thumb,
-                        output_mode=output_mode,
-                        text_override=text_override if text_override else None,
-                        template_id_override=template_id_override,
-                        effects_override=effects_override_final,
-                        overlays_override=overlays_override_final,
-                    )
-        # Update stable artifact (00_thumb.png) from this build output.
-        tmp_stable = stable_thumb.with_suffix(stable_thumb.suffix + ".tmp")
-        tmp_stable.write_bytes(build_thumb.read_bytes())
-        tmp_stable.replace(stable_thumb)
-
-        if flat_out:
-            flat_out.write_bytes(stable_thumb.read_bytes())
-
-        if update_projects:
-            title = _resolve_title_from_specs(
-                channel=ch, video_id=target.video_id, image_spec=image_spec, text_spec=text_spec_typed
-            )
-            rel_thumb = f"{ch}/{target.video}/{stable_thumb_name}"
-            upsert_fs_variant(
-                channel=ch,
-                video=target.video,
-                title=title,
-                image_rel_path=rel_thumb,
-                label=resolved_variant_label,
-                status="review",
-            )
-
-        overrides_leaf_json: Dict[str, Any] = {}
-        for k, v in overrides_leaf.items():
-            if isinstance(v, tuple):
-                overrides_leaf_json[k] = list(v)
-            else:
-                overrides_leaf_json[k] = v
-
-        meta: Dict[str, Any] = {
-            "schema": "ytm.thumbnail.layer_specs.build.v1",
-            "built_at": datetime.now(timezone.utc).isoformat(),
-            "channel": ch,
-            "video": target.video,
-            "video_id": target.video_id,
-            "model_key": model_key,
-            "build_id": build_id,
-            "output_mode": output_mode,
-            "layer_specs": {"image_prompts_id": img_id, "text_layout_id": txt_id},
-            "thumb_spec": {
-                "path": str(thumb_spec.path.relative_to(fpaths.repo_root())) if thumb_spec else None,
-                "overrides_leaf": overrides_leaf_json or None,
-            },
-            "text": {
-                "template_id": template_id,
-                "template_id_override": template_id_override,
-                "planning_copy": planning_copy,
-                "text_override": text_override if text_override else None,
-                "effects_override": effects_override,
-                "overlays_override": overlays_override,
-            },
-            "output": {
-                "bg_path": str(out_bg.relative_to(fpaths.repo_root())),
-                "stable_thumb_path": str(stable_thumb.relative_to(fpaths.repo_root())),
-                "build_thumb_path": str(build_thumb.relative_to(fpaths.repo_root())),
-                "width": width,
-                "height": height,
-            },
-            "bg_enhance": {
-                "brightness": bg_params.brightness,
-                "contrast": bg_params.contrast,
-                "color": bg_params.color,
-                "gamma": bg_params.gamma,
-            },
-            "bg_pan_zoom": {
-                "zoom": float(video_bg_zoom),
-                "pan_x": float(video_bg_pan_x),
-                "pan_y": float(video_bg_pan_y),
-            },
-            "bg_enhance_band": {
-                "x0": float(video_band_x0),
-                "x1": float(video_band_x1),
-                "power": float(video_band_power),
-                "brightness": band_params.brightness,
-                "contrast": band_params.contrast,
-                "color": band_params.color,
-                "gamma": band_params.gamma,
-            },
-            "sources": {
-                "legacy_moved_from": legacy_moved_from,
-                "bg_src": str(bg_src.relative_to(fpaths.repo_root())),
-            },
-            "portrait": {
-                "used": bool(portrait_used),
-                "portrait_path": str(portrait_path.relative_to(fpaths.repo_root())) if portrait_used and portrait_path else None,
-            },
-            "generated": generated,
-        }
-        tmp_meta = build_meta_path.with_suffix(build_meta_path.suffix + ".tmp")
-        tmp_meta.write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        tmp_meta.replace(build_meta_path)
-        print(f"[{idx}/{len(targets)}] {target.video_id}: OK -> {stable_thumb}")
+                bg = _existing_target_background(ctx, target)
+                if bg is None:
+                    if skip_generate:
+                        print(f"[{idx}/{total}] {target.video_id}: missing bg (skip_generate)")
+                        counts["missing_bg"] += 1
+                        continue
+                    bg = _generate_target_background(ctx, idx, total, target, client)
+                    if bg is None:
+                        counts["failed"] += 1
+                        continue
+                variant = _compose_target(ctx, idx, total, target, bg)
+                counts["rebuilt"] += 1
+                if variant:
+                    variants.append((idx, variant))
+    finally:
+        if variants:
+            upsert_fs_variants([v for _idx, v in sorted(variants, key=lambda it: it[0])])
+    print(
+        f"[build] {ch}: rebuilt={counts['rebuilt']} skipped={counts['unchanged'] + counts['kept']}"
+        f" (unchanged={counts['unchanged']} kept={counts['kept']})"
+        f" missing_bg={counts['missing_bg']} failed={counts['failed']}"
+    )
+    return counts
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# NOTE:
+# capcut_bulk_insert runs ~20 post-processing passes over draft_content.json / draft_info.json and
+# each pass used to re-read and re-write the whole file with indent=2 (pure-Python encoder, several
+# MB per pass on long episodes). This module coalesces those writes: inside a
+# `coalesce_draft_writes()` block, `write_draft_json` keeps the latest (compact) text of each file in
+# a DraftWriteBuffer and `read_draft_json` parses from that buffer, so the files are read from disk
+# once and written once, atomically (temp file + os.replace), when the block ends or before any code
+# that reads the files from disk (pyJianYingDraft, channel hooks, other tools).
+#
+# This is write coalescing only, not a shared draft model: every `read_draft_json` still returns a
+# private parsed copy (a pass that mutates its data and then bails out without writing must leave
+# the draft untouched), so each pass keeps its own json.loads/json.dumps (C codec, compact).
+# Read-only validators may take the buffer's cached parse (`shared=True`).
+#
+# Env toggles:
+# - CAPCUT_DRAFT_WRITE_COALESCE_DISABLE=1 -> no buffering; every pass reads/writes the files directly (legacy)
+DRAFT_JSON_FILES = ("draft_content.json", "draft_info.json")
+
+
+def draft_write_coalescing_enabled() -> bool:
+    return (os.getenv("CAPCUT_DRAFT_WRITE_COALESCE_DISABLE") or "").strip().lower() not in {"1", "true", "yes", "on"}
+
+
+class DraftWriteBuffer:
+    """
+    Pending text of draft_content.json / draft_info.json of one CapCut draft dir.
+
+    Files are loaded lazily on first access; `write()` replaces the buffered text and marks the
+    file dirty; `flush()` writes dirty files back (compact JSON, atomic replace).
+    """
+
+    def __init__(self, draft_dir: Path):
+        self.draft_dir = Path(draft_dir)
+        self._text: Dict[str, str] = {}
+        self._view: Dict[str, Any] = {}
+        self._dirty: set[str] = set()
+        self.stats = {"reads": 0, "disk_reads": 0, "writes": 0, "flushed": 0}
+
+    def manages(self, path: Path) -> bool:
+        path = Path(path)
+        return path.name in DRAFT_JSON_FILES and path.parent.resolve() == self.draft_dir.resolve()
+
+    def _load_text(self, name: str) -> str:
+        if name not in self._text:
+            self._text[name] = (self.draft_dir / name).read_text(encoding="utf-8")
+            self.stats["disk_reads"] += 1
+        return self._text[name]
+
+    def read(self, name: str) -> Any:
+        """Private parsed copy of `name` (raises like reading the file would)."""
+        self.stats["reads"] += 1
+        return json.loads(self._load_text(name))
+
+    def view(self, name: str) -> Any:
+        """Shared parsed object for read-only passes; callers must not mutate it."""
+        if name not in self._view:
+            self._view[name] = json.loads(self._load_text(name))
+        return self._view[name]
+
+    def write(self, name: str, data: Any) -> None:
+        self._text[name] = json.dumps(data, ensure_ascii=False)
+        self._view.pop(name, None)
+        self._dirty.add(name)
+        self.stats["writes"] += 1
+
+    @property
+    def dirty(self) -> List[str]:
+        return sorted(self._dirty)
+
+    def flush(self) -> List[str]:
+        """Write dirty files to disk. Returns the file names written."""
+        written: List[str] = []
+        for name in sorted(self._dirty):
+            target = self.draft_dir / name
+            try:
+                mode = target.stat().st_mode & 0o777
+            except OSError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=str(self.draft_dir))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(self._text[name])
+                os.chmod(tmp, mode)
+                os.replace(tmp, target)
+            finally:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+            written.append(name)
+        self._dirty.clear()
+        self.stats["flushed"] += len(written)
+        return written
+
+    def invalidate(self) -> None:
+        """Drop cached state after something outside the buffer rewrote the files (flush first)."""
+        if self._dirty:
+            raise RuntimeError(f"invalidate() with unflushed changes: {self.dirty}")
+        self._text.clear()
+        self._view.clear()
+
+
+_ACTIVE: Dict[Path, DraftWriteBuffer] = {}
+
+
+def active_write_buffer(path: Path) -> Optional[DraftWriteBuffer]:
+    """Write buffer of the enclosing `coalesce_draft_writes()` block for `path` (a draft JSON file)."""
+    path = Path(path)
+    if not _ACTIVE or path.name not in DRAFT_JSON_FILES:
+        return None
+    buf = _ACTIVE.get(path.parent.resolve())
+    return buf if buf is not None and buf.manages(path) else None
+
+
+@contextmanager
+def coalesce_draft_writes(draft_dir: Path) -> Iterator[Optional[DraftWriteBuffer]]:
+    """
+    Route draft JSON reads/writes under `draft_dir` through one write buffer.
+
+    Changes are flushed on exit, also when a pass raises (matching the old per-pass writes).
+    Yields None when disabled via CAPCUT_DRAFT_WRITE_COALESCE_DISABLE.
+    """
+    if not draft_write_coalescing_enabled():
+        yield None
+        return
+    key = Path(draft_dir).resolve()
+    if key in _ACTIVE:
+        yield _ACTIVE[key]
+        return
+    buf = DraftWriteBuffer(Path(draft_dir))
+    _ACTIVE[key] = buf
+    try:
+        yield buf
+    finally:
+        _ACTIVE.pop(key, None)
+        buf.flush()
+
+
+@contextmanager
+def draft_files_on_disk(draft_dir: Path) -> Iterator[None]:
+    """
+    Bracket code that reads or writes the draft files directly (pyJianYingDraft, hooks, other tools):
+    pending changes are flushed before, cached state is dropped after.
+    """
+    buf = active_write_buffer(Path(draft_dir) / DRAFT_JSON_FILES[0])
+    if buf is None:
+        yield
+        return
+    buf.flush()
+    try:
+        yield
+    finally:
+        buf.invalidate()
+
+
+def read_draft_json(path: Path, *, shared: bool = False) -> Any:
+    """
+    Parsed draft JSON from the active write buffer (or from disk).
+
+    `shared=True` returns the buffer's cached parse instead of a private copy; only for
+    passes that never mutate what they read.
+    """
+    path = Path(path)
+    buf = active_write_buffer(path)
+    if buf is None:
+        return json.loads(path.read_text(encoding="utf-8"))
+    return buf.view(path.name) if shared else buf.read(path.name)
+
+
+def write_draft_json(path: Path, data: Any, *, indent: Optional[int] = 2) -> None:
+    """Store `data` in the active write buffer, or write it to disk with the legacy formatting."""
+    path = Path(path)
+    buf = active_write_buffer(path)
+    if buf is None:
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
+        return
+    buf.write(path.name, data)
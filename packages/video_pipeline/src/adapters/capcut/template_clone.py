@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# NOTE:
+# Every draft build used to `copytree` the whole CapCut template (BGM, effect packs, belt images,
+# fonts - often 100MB+) even though only the draft JSON files are ever rewritten. Templates are now
+# cloned per file:
+#   1) copy-on-write clone (Linux FICLONE / macOS clonefile) when the filesystem supports it,
+#   2) otherwise a hardlink for media assets under the draft's subdirectories (never rewritten in
+#      place: the pipeline only adds new files or unlinks before replacing),
+#   3) otherwise a plain copy (always for JSON/text and for draft-owned files at the draft root such
+#      as draft_cover.jpg, which CapCut regenerates in place when it saves the draft).
+#
+# Env toggles:
+# - CAPCUT_TEMPLATE_CLONE_MODE=auto    -> 1) -> 2) -> 3) (default)
+# - CAPCUT_TEMPLATE_CLONE_MODE=reflink -> 1) -> 3) (no hardlinks shared with the template)
+# - CAPCUT_TEMPLATE_CLONE_MODE=copy    -> plain copytree (legacy)
+LINKABLE_SUFFIXES = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp", ".heic",
+        ".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg",
+        ".mp4", ".mov", ".m4v", ".webm",
+        ".ttf", ".otf", ".ttc",
+    }
+)
+
+
+def _linkable(rel_dir: Path, name: str) -> bool:
+    if not rel_dir.parts or name.startswith("draft_"):
+        return False
+    return Path(name).suffix.lower() in LINKABLE_SUFFIXES
+
+
+_FICLONE = 0x40049409
+_NO_CLONE_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.ENOSYS}
+
+
+def clone_mode() -> str:
+    raw = (os.getenv("CAPCUT_TEMPLATE_CLONE_MODE") or "").strip().lower()
+    return raw if raw in {"auto", "reflink", "copy"} else "auto"
+
+
+@dataclass
+class CloneStats:
+    files: int = 0
+    reflinked: int = 0
+    linked: int = 0
+    copied: int = 0
+    bytes_copied: int = 0
+    elapsed_sec: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.files} files (reflink={self.reflinked} link={self.linked} copy={self.copied}, "
+            f"{self.bytes_copied / (1024 * 1024):.1f}MB copied) in {self.elapsed_sec:.2f}s"
+        )
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Copy-on-write clone of `src` to `dst`; raises OSError when unsupported."""
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def clone_template_dir(template_dir: Path, dest_dir: Path, *, mode: Optional[str] = None) -> CloneStats:
+    """
+    Replace `dest_dir` with a clone of `template_dir` (see NOTE above for the per-file strategy).
+    """
+    template_dir = Path(template_dir)
+    dest_dir = Path(dest_dir)
+    mode = mode or clone_mode()
+    started = time.perf_counter()
+    stats = CloneStats()
+    if dest_dir.exists():
+        shutil.rmtree(dest_dir)
+
+    if mode == "copy":
+        shutil.copytree(template_dir, dest_dir)
+        for p in dest_dir.rglob("*"):
+            if p.is_file():
+                stats.files += 1
+                stats.copied += 1
+                stats.bytes_copied += p.stat().st_size
+        stats.elapsed_sec = time.perf_counter() - started
+        return stats
+
+    can_reflink = True
+    can_link = mode == "auto"
+    for root, dirs, files in os.walk(template_dir):
+        rel = Path(root).relative_to(template_dir)
+        out_dir = dest_dir / rel
+        out_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copystat(root, out_dir)
+        for name in files:
+            src = Path(root) / name
+            dst = out_dir / name
+            stats.files += 1
+            if src.is_symlink():
+                os.symlink(os.readlink(src), dst)
+                stats.copied += 1
+                continue
+            if can_reflink:
+                try:
+                    _reflink(src, dst)
+                    stats.reflinked += 1
+                    continue
+                except (OSError, AttributeError) as exc:
+                    if getattr(exc, "errno", None) in _NO_CLONE_ERRNOS or isinstance(exc, AttributeError):
+                        can_reflink = False  # filesystem-wide; stop probing
+            if can_link and _linkable(rel, name):
+                try:
+                    os.link(src, dst)
+                    stats.linked += 1
+                    continue
+                except OSError:
+                    can_link = False
+            shutil.copy2(src, dst)
+            stats.copied += 1
+            stats.bytes_copied += src.stat().st_size
+    stats.elapsed_sec = time.perf_counter() - started
+    return stats
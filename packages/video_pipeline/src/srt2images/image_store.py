@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from factory_common.paths import video_state_root
+
+STORE_SCHEMA = "ytm.image_store.v1"
+
+# NOTE:
+# Content-addressed store for generated images, shared by every run/channel.
+#
+# Redo runs and run_dir rebuilds used to pay for a new API generation whenever `force` was set or the
+# PNG was missing, even when the exact same request had already been fulfilled for another run.
+# Generated images are now kept under a fingerprint of the full request
+# (model + final prompt + input image *contents* + size + seed) and materialised into
+# run_dir/images/ by hardlink (copy fallback).
+#
+# Env toggles:
+# - SRT2IMAGES_IMAGE_STORE=0            -> disable (always call the API, never store)
+# - SRT2IMAGES_IMAGE_STORE_DIR=/path    -> override store dir (default: workspaces/video/_state/image_store)
+# - SRT2IMAGES_IMAGE_STORE_MAX_GB=...   -> byte budget; least-recently-used objects are evicted on put
+#                                          (default: 20, 0 = unlimited)
+#
+# Layout:
+# - objects/<xx>/<fingerprint>.png (one file per request), `index.sqlite3` (WAL) with bytes / mtime /
+#   last use / hits per object plus persistent hit/miss counters (`scripts/ops/image_store.py`).
+# - Objects share an inode with the run files they were materialised into. Writers that rewrite a PNG
+#   in place call `detach()` first (private copy); an object whose size/mtime no longer matches its
+#   index row was modified through a link anyway and is dropped instead of being served.
+
+_INDEX_FILENAME = "index.sqlite3"
+_LOCAL = threading.local()
+_LOCK = threading.Lock()
+_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+
+
+def store_enabled() -> bool:
+    raw = (os.getenv("SRT2IMAGES_IMAGE_STORE") or "").strip().lower()
+    if not raw:
+        return True
+    return raw not in {"0", "false", "no", "off", "disabled"}
+
+
+def store_dir() -> Path:
+    raw = (os.getenv("SRT2IMAGES_IMAGE_STORE_DIR") or "").strip()
+    if raw:
+        return Path(raw).expanduser()
+    return video_state_root() / "image_store"
+
+
+def index_path() -> Path:
+    return store_dir() / _INDEX_FILENAME
+
+
+def object_path(fingerprint: str) -> Path:
+    # Shard by 2 chars to avoid huge directories.
+    return store_dir() / "objects" / fingerprint[:2] / f"{fingerprint}.png"
+
+
+def _max_bytes() -> int:
+    raw = (os.getenv("SRT2IMAGES_IMAGE_STORE_MAX_GB") or "").strip()
+    try:
+        gb = max(0.0, float(raw)) if raw else 20.0
+    except Exception:
+        gb = 20.0
+    return int(gb * 1024 * 1024 * 1024)
+
+
+def _file_digest(path: str) -> str:
+    """sha256 of a reference image's bytes (memoized by path/size/mtime); missing files hash by name."""
+    p = Path(str(path)).expanduser()
+    try:
+        st = p.stat()
+    except Exception:
+        return "missing:" + os.path.normpath(str(p))
+    key = (str(p.resolve()), int(st.st_size), int(st.st_mtime_ns))
+    with _LOCK:
+        cached = _DIGESTS.get(key)
+    if cached:
+        return cached
+    h = hashlib.sha256()
+    with open(p, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _LOCK:
+        _DIGESTS[key] = digest
+    return digest
+
+
+def request_fingerprint(
+    *,
+    model: str,
+    prompt: str,
+    input_images: Iterable[str] = (),
+    width: int,
+    height: int,
+    seed: Optional[int] = None,
+) -> str:
+    """Stable key for one generation request. Reference images are keyed by content, not path."""
+    payload = {
+        "schema": STORE_SCHEMA,
+        "model": str(model or ""),
+        "prompt": str(prompt or ""),
+        "inputs": [_file_digest(str(x)) for x in (input_images or []) if str(x).strip()],
+        "size": [int(width), int(height)],
+        "seed": seed,
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# SQLite index (bytes / mtime / last use / hits per object + counters)
+# ---------------------------------------------------------------------------
+
+
+def _index_conn() -> Optional[sqlite3.Connection]:
+    """Thread-local connection to the index for the current store dir (None when unavailable)."""
+    path = index_path()
+    conns: Dict[str, sqlite3.Connection] = getattr(_LOCAL, "conns", None) or {}
+    _LOCAL.conns = conns
+    key = str(path)
+    conn = conns.get(key)
+    if conn is not None:
+        return conn
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(key, timeout=10.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS objects ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " bytes INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS objects_last_access ON objects(last_access)")
+        conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    except Exception:
+        return None
+    conns[key] = conn
+    return conn
+
+
+def _count(conn: sqlite3.Connection, name: str, n: int = 1) -> None:
+    try:
+        conn.execute(
+            "INSERT INTO counters(name, value) VALUES(?, ?) ON CONFLICT(name) DO UPDATE SET value=value + excluded.value",
+            (name, int(n)),
+        )
+    except Exception:
+        pass
+
+
+def _drop(conn: sqlite3.Connection, fingerprint: str) -> None:
+    try:
+        object_path(fingerprint).unlink()
+    except FileNotFoundError:
+        pass
+    except Exception:
+        return
+    try:
+        conn.execute("DELETE FROM objects WHERE fingerprint=?", (fingerprint,))
+    except Exception:
+        pass
+
+
+def lookup(fingerprint: str) -> Optional[Path]:
+    """Path of the stored object for `fingerprint` (None on miss or when the object was altered)."""
+    if not store_enabled():
+        return None
+    conn = _index_conn()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT bytes, mtime_ns FROM objects WHERE fingerprint=?", (fingerprint,)).fetchone()
+    except Exception:
+        return None
+    path = object_path(fingerprint)
+    if row is None:
+        _count(conn, "misses")
+        return None
+    try:
+        st = path.stat()
+    except Exception:
+        st = None
+    if st is None or int(st.st_size) != int(row[0]) or int(st.st_mtime_ns) != int(row[1]):
+        # Gone, or rewritten in place through a materialised link: never serve it.
+        _drop(conn, fingerprint)
+        _count(conn, "stale")
+        _count(conn, "misses")
+        return None
+    return path
+
+
+def detach(path: str | Path) -> None:
+    """Give a hardlinked `path` its own copy (same bytes) so an in-place rewrite cannot alter the store."""
+    try:
+        p = Path(path)
+        if not p.is_file() or p.stat().st_nlink <= 1:
+            return
+        tmp = p.with_name(f".{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copy2(p, tmp)
+        os.replace(tmp, p)
+    except Exception:
+        pass
+
+
+def materialize(fingerprint: str, dest: str | Path) -> bool:
+    """Place the stored image for `fingerprint` at `dest` (hardlink, copy fallback). False on miss."""
+    src = lookup(fingerprint)
+    if src is None:
+        return False
+    dest_p = Path(dest)
+    try:
+        dest_p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest_p.with_name(f".{dest_p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.link(src, tmp)
+        except Exception:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest_p)
+    except Exception:
+        return False
+    conn = _index_conn()
+    if conn is not None:
+        try:
+            conn.execute(
+                "UPDATE objects SET last_access=?, hits=hits + 1 WHERE fingerprint=?", (time.time(), fingerprint)
+            )
+        except Exception:
+            pass
+        _count(conn, "hits")
+    return True
+
+
+def put(fingerprint: str, src: str | Path, *, model: str = "") -> Optional[Path]:
+    """Store a freshly generated image (linked from `src` when possible). Fail-soft: returns None on error."""
+    if not store_enabled():
+        return None
+    conn = _index_conn()
+    if conn is None:
+        return None
+    path = object_path(fingerprint)
+    try:
+        src_p = Path(src)
+        if not src_p.is_file() or src_p.stat().st_size <= 0:
+            return None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.link(src_p, tmp)
+        except Exception:
+            shutil.copyfile(src_p, tmp)
+        os.replace(tmp, path)
+        st = path.stat()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO objects(fingerprint, model, bytes, mtime_ns, created_at, last_access, hits) VALUES(?,?,?,?,?,?,0)"
+            " ON CONFLICT(fingerprint) DO UPDATE SET model=excluded.model, bytes=excluded.bytes,"
+            " mtime_ns=excluded.mtime_ns, created_at=excluded.created_at, last_access=excluded.last_access",
+            (fingerprint, str(model or ""), int(st.st_size), int(st.st_mtime_ns), now, now),
+        )
+    except Exception:
+        return None
+    _count(conn, "writes")
+    evict()
+    return path
+
+
+def evict(max_bytes: Optional[int] = None, *, low_watermark: float = 0.9) -> Dict[str, int]:
+    """
+    Evict least-recently-used objects until the indexed total fits the byte budget.
+    Run files materialised from an evicted object keep their own link and are unaffected.
+    """
+    budget = _max_bytes() if max_bytes is None else max(0, int(max_bytes))
+    out = {"evicted": 0, "bytes_evicted": 0}
+    conn = _index_conn()
+    if conn is None or budget <= 0:
+        return out
+    try:
+        total = int(conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM objects").fetchone()[0])
+        if total <= budget:
+            return out
+        target = int(budget * low_watermark)
+        victims: List[Tuple[str, int]] = []
+        for fingerprint, size in conn.execute("SELECT fingerprint, bytes FROM objects ORDER BY last_access ASC"):
+            if total <= target:
+                break
+            victims.append((str(fingerprint), int(size or 0)))
+            total -= int(size or 0)
+        for fingerprint, size in victims:
+            _drop(conn, fingerprint)
+            out["evicted"] += 1
+            out["bytes_evicted"] += size
+    except Exception:
+        return out
+    _count(conn, "evicted", out["evicted"])
+    return out
+
+
+def store_stats() -> Dict[str, Any]:
+    """Persistent counters (hits/misses/writes/stale/evicted) + index totals."""
+    stats: Dict[str, Any] = {"store_dir": str(store_dir()), "enabled": store_enabled(), "max_bytes": _max_bytes()}
+    conn = _index_conn()
+    if conn is None:
+        return stats
+    try:
+        for name, value in conn.execute("SELECT name, value FROM counters"):
+            stats[str(name)] = int(value)
+        n, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM objects").fetchone()
+        stats["objects"] = int(n)
+        stats["bytes"] = int(total)
+        stats["models"] = [
+            {"model": m, "objects": int(c), "bytes": int(b), "hits": int(h)}
+            for m, c, b, h in conn.execute(
+                "SELECT model, COUNT(*), SUM(bytes), SUM(hits) FROM objects GROUP BY model ORDER BY SUM(bytes) DESC"
+            )
+        ]
+    except Exception:
+        pass
+    hits, misses = int(stats.get("hits") or 0), int(stats.get("misses") or 0)
+    stats["hit_rate"] = round(hits / (hits + misses), 4) if hits + misses else None
+    return stats
+
+
+def compact(max_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """Drop index rows whose object is gone/altered, evict to budget (no low watermark), remove stray tmp files."""
+    report: Dict[str, Any] = {"dropped": 0, "tmp_removed": 0}
+    conn = _index_conn()
+    if conn is None:
+        return report
+    try:
+        rows = list(conn.execute("SELECT fingerprint, bytes, mtime_ns FROM objects"))
+    except Exception:
+        rows = []
+    for fingerprint, size, mtime_ns in rows:
+        try:
+            st = object_path(str(fingerprint)).stat()
+            if int(st.st_size) == int(size) and int(st.st_mtime_ns) == int(mtime_ns):
+                continue
+        except Exception:
+            pass
+        _drop(conn, str(fingerprint))
+        report["dropped"] += 1
+    report["evict"] = evict(max_bytes, low_watermark=1.0)
+    for p in (store_dir() / "objects").glob("*/.*.tmp"):
+        try:
+            if time.time() - p.stat().st_mtime > 3600:
+                p.unlink()
+                report["tmp_removed"] += 1
+        except Exception:
+            continue
+    try:
+        conn.execute("VACUUM")
+    except Exception:
+        pass
+    return report
@@ -11,11 +11,12 @@ import threading
 import time
 from collections import deque
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 import json
 from typing import Any, Dict, List, Optional, Tuple
 from functools import lru_cache
 
+from factory_common import image_rate_limiter
 from factory_common.image_client import (
     ImageClient,
     ImageGenerationError,
@@ -27,6 +28,7 @@ from factory_common.paths import repo_root
 from factory_common.routing_lockdown import lockdown_active
 
 from video_pipeline.src.core.config import config
+from video_pipeline.src.srt2images import image_store
 
 
 # ==== 429 Resilient Pipeline: QuotaExhaustedError ====
@@ -454,7 +456,9 @@ def _run_direct(
     seed: int | None = None,
     *,
     max_retries: int = 3,
+    served: Dict[str, str] | None = None,
 ) -> bool:
+    """Generate one image via ImageClient. On success `served["model"]` is the serving "<provider>:<model_key>"."""
     image_client: ImageClient | None = None
     router = None
 
@@ -515,6 +519,8 @@ def _run_direct(
                 with open(output_path, 'wb') as f:
                     f.write(image_data)
 
+                if served is not None:
+                    served["model"] = str((result.metadata or {}).get("served_by") or "")
                 run_dir_name = Path(output_path).parent.parent.name
                 logging.info(
                     f"[{run_dir_name}][image_gen][OK] engine={result.model} output={output_path}"
@@ -566,7 +572,8 @@ def _run_direct(
 
 
 def _gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_path: str | None, timeout_sec: int, config_path: str | None,
-             retry_until_success: bool = False, max_retries: int = 6, placeholder_text: str | None = None):
+             retry_until_success: bool = False, max_retries: int = 6, placeholder_text: str | None = None,
+             key_for: Optional["_BucketKeyResolver"] = None):
     import glob
     import os
     import shutil
@@ -653,6 +660,32 @@ def _gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_pat
             model_key = mk.strip()
     except Exception:
         model_key = None
+    seed = int(cue.get("seed")) if str(cue.get("seed") or "").strip().isdigit() else None
+
+    # Content-addressed store: an identical request (any run/channel) is materialised, not regenerated.
+    fingerprint = None
+    store_model = ""
+    if image_store.store_enabled():
+        try:
+            store_model = (key_for or _BucketKeyResolver())(cue)
+            fingerprint = image_store.request_fingerprint(
+                model=store_model, prompt=prompt, input_images=input_images, width=width, height=height, seed=seed
+            )
+            if image_store.materialize(fingerprint, out_path):
+                logging.info(
+                    "[%s][image_gen][STORE_HIT] model=%s output=%s",
+                    Path(out_path).parent.parent.name,
+                    store_model,
+                    out_path,
+                )
+                return
+        except Exception as exc:
+            logging.warning("image store lookup skipped: %s", exc)
+            fingerprint = None
+    # Generators write the output in place: never rewrite a store object through a materialised hardlink.
+    image_store.detach(out_path)
+
+    served: Dict[str, str] = {}
     ok = _run_direct(
         prompt,
         out_path,
@@ -662,8 +695,9 @@ def _gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_pat
         timeout_sec,
         input_images=input_images,
         model_key=model_key,
-        seed=(int(cue.get("seed")) if str(cue.get("seed") or "").strip().isdigit() else None),
+        seed=seed,
         max_retries=max_retries,
+        served=served,
     )
         
     # Log image generation status for direct mode
@@ -694,6 +728,14 @@ def _gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_pat
         else:
             # Fallback to original conversion logic
             _convert_to_16_9(out_path, width, height)
+        if fingerprint:
+            # Stored under the model that actually served (tier round-robin may differ from the lookup model).
+            served_model = served.get("model") or store_model
+            if served_model != store_model:
+                fingerprint = image_store.request_fingerprint(
+                    model=served_model, prompt=prompt, input_images=input_images, width=width, height=height, seed=seed
+                )
+            image_store.put(fingerprint, out_path, model=served_model)
     else:
         if not retry_until_success:
             _ensure_pillow()
@@ -707,16 +749,60 @@ def _gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_pat
 
 # 単純なトークンバケット的なレートリミット用のキュー
 # 「直近60秒間に何回叩いたか」を見るためのもの
+# (IMAGE_RATE_LIMIT_ADAPTIVE_DISABLE=1 の旧経路のみ。通常は factory_common.image_rate_limiter)
 _REQUEST_TIMES: deque[float] = deque()
 _REQUEST_LOCK = threading.Lock()
 
 
+class _BucketKeyResolver:
+    """cue -> rate-limit bucket key ("<provider>:<model_key>"), resolved like ImageClient routes it."""
+
+    def __init__(self, task: str = "visual_image_gen"):
+        self.task = task
+        self._cache: Dict[str, str] = {}
+        self._default_selector: Optional[str] = None
+        try:
+            client = ImageClient()
+            forced = client._resolve_forced_model_key(task=task)  # type: ignore[attr-defined]
+            if not forced:
+                override = client._resolve_profile_task_override(task=task)  # type: ignore[attr-defined]
+                mk = override.get("model_key") if isinstance(override, dict) else None
+                forced = mk.strip() if isinstance(mk, str) and mk.strip() else None
+            self._default_selector = forced
+        except Exception:
+            self._default_selector = None
+
+    def __call__(self, cue: Dict) -> str:
+        mk = cue.get("image_model_key") if isinstance(cue, dict) else None
+        selector = mk.strip() if isinstance(mk, str) and mk.strip() else (self._default_selector or "")
+        if selector not in self._cache:
+            try:
+                model_key, model_conf = _resolve_model_conf_for_task(task=self.task, selector=selector or None)
+                key = image_rate_limiter.bucket_key(str(model_conf.get("provider") or ""), model_key)
+            except Exception:
+                key = image_rate_limiter.bucket_key(None, selector or None)
+            self._cache[selector] = key
+        return self._cache[selector]
+
+
 def _rate_limited_gen_one(cue: Dict, mode: str, force: bool, width: int, height: int, bin_path: str | None, timeout_sec: int, config_path: str | None,
-                         retry_until_success: bool, max_retries: int, placeholder_text: str | None, max_per_minute: int):
+                         retry_until_success: bool, max_retries: int, placeholder_text: str | None, max_per_minute: int,
+                         bucket_key: str | None = None, key_for: Optional["_BucketKeyResolver"] = None):
     """
     `_gen_one` を呼ぶ前に、「1分あたりの最大リクエスト数」を超えないように待機する。
-    - max_per_minute: 1分あたりに許可する最大リクエスト数
+    - max_per_minute: 1分あたりに許可する最大リクエスト数（adaptive 時は上限値）
+    - bucket_key: 呼び出し側が取得済みのトークンのバケット（None なら未取得）
+    - key_for: バッチ共有の resolver（ImageClient/モデル設定の解決をcue毎に繰り返さない）
+
+    adaptive 時はここでは待たない: image store の確認後、ImageClient が実際に呼ぶモデルのバケットで
+    トークンを取る（tier round-robin でも成功/429 と同じバケットに課金される）。
     """
+    if image_rate_limiter.adaptive_enabled():
+        with image_rate_limiter.admission(max_per_minute, granted=bucket_key):
+            _gen_one(cue, mode, force, width, height, bin_path, timeout_sec, config_path,
+                     retry_until_success, max_retries, placeholder_text, key_for=key_for)
+        return
+
     window = 60.0  # 秒
     sleep_for = 0.0
     while True:
@@ -739,7 +825,192 @@ def _rate_limited_gen_one(cue: Dict, mode: str, force: bool, width: int, height:
 
     # 実際に画像生成処理を呼び出す
     _gen_one(cue, mode, force, width, height, bin_path, timeout_sec, config_path,
-             retry_until_success, max_retries, placeholder_text)
+             retry_until_success, max_retries, placeholder_text, key_for=key_for)
+
+
+def _run_bucketed_pool(cues: List[Dict], *, concurrency: int, max_per_minute: int, key_for, gen, needs_token=None) -> None:
+    """
+    Dispatch cues to a thread pool only once their provider/model bucket grants a token.
+
+    Workers never sleep on the rate limit: while one bucket is throttled, cues for other
+    buckets keep the pool busy. Cues for which `needs_token(cue)` is False (existing
+    images on resume) are dispatched without consuming a token.
+    """
+    pending: Dict[str, deque] = {}
+    free: List[Dict] = []
+    for cue in cues:
+        if needs_token is not None and not needs_token(cue):
+            free.append(cue)
+        else:
+            pending.setdefault(key_for(cue), deque()).append(cue)
+    not_before: Dict[str, float] = {}
+    in_flight: set = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        for fut in as_completed([ex.submit(gen, cue) for cue in free]):
+            fut.result()
+        while pending or in_flight:
+            now = time.monotonic()
+            next_wake: Optional[float] = None
+            for key in list(pending):
+                if len(in_flight) >= concurrency:
+                    break
+                if not_before.get(key, 0.0) > now:
+                    next_wake = min(next_wake or not_before[key], not_before[key])
+                    continue
+                wait_sec = image_rate_limiter.try_acquire(key, ceiling_per_min=max_per_minute)
+                if wait_sec > 0:
+                    not_before[key] = now + wait_sec
+                    next_wake = min(next_wake or not_before[key], not_before[key])
+                    continue
+                queue = pending[key]
+                in_flight.add(ex.submit(gen, queue.popleft()))
+                if not queue:
+                    del pending[key]
+            timeout = None if next_wake is None else max(0.0, next_wake - time.monotonic())
+            if pending and len(in_flight) < concurrency and timeout is None:
+                continue  # tokens granted this round; try the next bucket round immediately
+            if not in_flight:
+                time.sleep(timeout or 0.05)
+                continue
+            done, in_flight = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                fut.result()
+
+
+# NOTE:
+# persona の前フレーム連鎖は「直前の cue の出力」にしか依存しないが、以前は persona cue が1つでも
+# あるとバッチ全体を直列で回していた（persona 多用チャンネルだけ N 倍遅い）。
+# 依存関係（persona cue -> 直前の cue、input_images が他 cue の出力を指す場合 -> その cue）で
+# cue を連結成分（チェーン）に分け、チェーン内は従来どおり直列・チェーン同士は並列に生成する。
+# 前フレーム連鎖はセグメント単位: cue の `persona_segment`（明示境界）、無ければ `section_type` が
+# 直前の cue と変わる所で切る（CH01 等は全 cue が use_persona=True なので、切らないと全体が1チェーンになる）。
+# 差分（concurrency>1 のパイプライン時のみ）: セグメント先頭の persona cue には前フレームを渡さない。
+# チェーン先頭の画像が生成できなかった場合、前のチェーンの最終フレームは参照しない。
+# concurrency<=1 の直列実行は従来どおり（セグメント境界なし）。
+# - SRT2IMAGES_PERSONA_CHAIN_SERIAL=1 -> 旧来の全体直列（セグメント境界なしで前フレームを連鎖）に戻す
+def _persona_chain_serial() -> bool:
+    return (os.getenv("SRT2IMAGES_PERSONA_CHAIN_SERIAL") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _existing_output(cue: Dict) -> Optional[str]:
+    try:
+        out_path = cue.get("image_path")
+        if isinstance(out_path, str) and out_path:
+            p = Path(out_path)
+            if p.exists() and p.is_file():
+                return str(p)
+    except Exception:
+        pass
+    return None
+
+
+def _persona_segment(cue: Dict) -> str:
+    seg = cue.get("persona_segment")
+    if seg is None:
+        seg = cue.get("section_type")
+    return str(seg or "").strip()
+
+
+def _continues_persona(prev: object, cue: object) -> bool:
+    """True when `cue` takes `prev`'s frame as a reference (persona cue in the same persona segment)."""
+    if not isinstance(prev, dict) or not isinstance(cue, dict) or cue.get("use_persona") is not True:
+        return False
+    return _persona_segment(prev) == _persona_segment(cue)
+
+
+def _run_persona_chain(cues: List[Dict], gen, *, segmented: bool = True) -> None:
+    """
+    Generate `cues` in order; persona cues get the previous generated frame as an extra reference.
+
+    With `segmented`, the previous frame is dropped at persona segment boundaries (see `_continues_persona`).
+    """
+    previous_image_path: str | None = None
+    prev_cue: Dict | None = None
+    for cue in cues:
+        if segmented and not _continues_persona(prev_cue, cue):
+            previous_image_path = None
+        prev_cue = cue
+        # If persona/character consistency is required, feed the previous generated frame
+        # as an additional reference image (guide + prev). This reduces identity drift.
+        try:
+            if previous_image_path and cue.get("use_persona") is True:
+                cur_inputs = cue.get("input_images")
+                if not isinstance(cur_inputs, list):
+                    cur_inputs = []
+                # Preserve order (guide first), avoid duplicates.
+                merged_inputs: list[str] = []
+                for item in cur_inputs:
+                    s = str(item).strip()
+                    if s and s not in merged_inputs:
+                        merged_inputs.append(s)
+                if previous_image_path not in merged_inputs:
+                    merged_inputs.append(previous_image_path)
+                cue["input_images"] = merged_inputs
+        except Exception:
+            pass
+
+        gen(cue)
+        previous_image_path = _existing_output(cue) or previous_image_path
+
+
+def _persona_chains(cues: List[Dict]) -> List[List[int]]:
+    """
+    Split cue indices into independent chains (connected components of the reference graph).
+
+    Edges: a persona cue depends on the cue right before it (previous frame) unless a persona segment
+    starts there, and any cue whose `input_images` names another cue's `image_path` depends on that cue. Each chain keeps the
+    original cue order; chains are returned in order of their first cue.
+    """
+    parent = list(range(len(cues)))
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(a: int, b: int) -> None:
+        ra, rb = _find(a), _find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    def _norm(path: object) -> str:
+        try:
+            return os.path.normpath(os.path.abspath(str(path).strip()))
+        except Exception:
+            return ""
+
+    by_output: Dict[str, int] = {}
+    for i, cue in enumerate(cues):
+        out = cue.get("image_path") if isinstance(cue, dict) else None
+        if isinstance(out, str) and out.strip():
+            by_output.setdefault(_norm(out), i)
+    for i, cue in enumerate(cues):
+        if not isinstance(cue, dict):
+            continue
+        if i > 0 and _continues_persona(cues[i - 1], cue):
+            _union(i, i - 1)
+        refs = cue.get("input_images")
+        if isinstance(refs, list):
+            for ref in refs:
+                j = by_output.get(_norm(ref))
+                if j is not None and j != i:
+                    _union(i, j)
+
+    chains: Dict[int, List[int]] = {}
+    for i in range(len(cues)):
+        chains.setdefault(_find(i), []).append(i)
+    return [chains[root] for root in sorted(chains)]
+
+
+def _run_persona_chains_pipelined(cues: List[Dict], *, concurrency: int, gen) -> None:
+    """Run independent persona chains concurrently; each chain stays serial (see `_persona_chains`)."""
+    chains = [[cues[i] for i in idx] for idx in _persona_chains(cues)]
+    # Longest chains first so the tail of the batch is not one long serial chain.
+    chains.sort(key=len, reverse=True)
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chains)))) as ex:
+        for f in as_completed([ex.submit(_run_persona_chain, chain, gen) for chain in chains]):
+            f.result()
 
 
 # ==== Gemini Batch (Developer API Batch) ====
@@ -1208,6 +1479,7 @@ def _generate_images_via_gemini_batch(
                     shutil.copy2(out_path, bdir / out_path.name)
                 except Exception:
                     pass
+            image_store.detach(out_path)
             out_path.write_bytes(img_bytes)
             _convert_to_16_9(str(out_path), width, height)
         except Exception as exc:
@@ -1259,7 +1531,7 @@ def generate_image_batch(cues: List[Dict], mode: str, concurrency: int, force: b
     """
     複数のプロンプトから画像を生成する。
     - 1分あたりのリクエスト数を `max_per_minute` 以下に制御する
-    - `concurrency>1` の場合、可能な範囲で並列化する（personaの前フレーム連鎖が必要な場合は直列にフォールバック）
+    - `concurrency>1` の場合、可能な範囲で並列化する（personaの前フレーム連鎖はチェーン単位で直列、チェーン同士は並列）
 
     max_per_minute が None の場合は、環境変数 SRT2IMAGES_IMAGE_MAX_PER_MINUTE
     （未設定なら 30）を上限として使う。
@@ -1296,40 +1568,43 @@ def generate_image_batch(cues: List[Dict], mode: str, concurrency: int, force: b
     except Exception:
         needs_persona_chain = False
 
-    if effective_concurrency <= 1 or needs_persona_chain:
-        previous_image_path: str | None = None
-        for cue in cues:
-            # If persona/character consistency is required, feed the previous generated frame
-            # as an additional reference image (guide + prev). This reduces identity drift.
-            try:
-                if previous_image_path and cue.get("use_persona") is True:
-                    cur_inputs = cue.get("input_images")
-                    if not isinstance(cur_inputs, list):
-                        cur_inputs = []
-                    # Preserve order (guide first), avoid duplicates.
-                    merged_inputs: list[str] = []
-                    for item in cur_inputs:
-                        s = str(item).strip()
-                        if s and s not in merged_inputs:
-                            merged_inputs.append(s)
-                    if previous_image_path not in merged_inputs:
-                        merged_inputs.append(previous_image_path)
-                    cue["input_images"] = merged_inputs
-            except Exception:
-                pass
+    # One resolver per batch: rate-limit buckets and image-store keys both need cue -> model routing.
+    key_for = (
+        _BucketKeyResolver() if image_rate_limiter.adaptive_enabled() or image_store.store_enabled() else None
+    )
+
+    def _gen_limited(cue: Dict) -> None:
+        _rate_limited_gen_one(
+            cue, mode, force, width, height, bin_path, timeout_sec, config_path,
+            retry_until_success, max_retries, placeholder_text, max_per_minute,
+            key_for=key_for,
+        )
 
+    if effective_concurrency <= 1 or (needs_persona_chain and _persona_chain_serial()):
+        # Serial: one unbroken chain, exactly as before (segment boundaries only apply when pipelined).
+        _run_persona_chain(cues, _gen_limited, segmented=False)
+    elif needs_persona_chain:
+        _run_persona_chains_pipelined(cues, concurrency=effective_concurrency, gen=_gen_limited)
+    elif image_rate_limiter.adaptive_enabled():
+        def _needs_token(cue: Dict) -> bool:
+            return mode_norm != "none" and (force or not os.path.exists(str(cue.get("image_path") or "")))
+
+        def _gen_dispatched(cue: Dict) -> None:
+            # The dispatch token is handed to ImageClient (refunded on a store hit / when another model serves).
             _rate_limited_gen_one(
                 cue, mode, force, width, height, bin_path, timeout_sec, config_path,
-                retry_until_success, max_retries, placeholder_text, max_per_minute
+                retry_until_success, max_retries, placeholder_text, max_per_minute,
+                bucket_key=key_for(cue) if _needs_token(cue) else None, key_for=key_for,
             )
-            try:
-                out_path = cue.get("image_path")
-                if isinstance(out_path, str) and out_path:
-                    p = Path(out_path)
-                    if p.exists() and p.is_file():
-                        previous_image_path = str(p)
-            except Exception:
-                pass
+
+        _run_bucketed_pool(
+            cues,
+            concurrency=effective_concurrency,
+            max_per_minute=max_per_minute,
+            key_for=key_for,
+            gen=_gen_dispatched,
+            needs_token=_needs_token,
+        )
     else:
         with ThreadPoolExecutor(max_workers=effective_concurrency) as ex:
             futures = [
@@ -1347,6 +1622,8 @@ def generate_image_batch(cues: List[Dict], mode: str, concurrency: int, force: b
                     max_retries,
                     placeholder_text,
                     max_per_minute,
+                    None,
+                    key_for,
                 )
                 for cue in cues
             ]
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Build many CapCut drafts in one batch (worker pool) instead of one capcut_bulk_insert process each.
+
+Why:
+  - Spawning `capcut_bulk_insert.py` per episode pays interpreter startup, the pyJianYingDraft
+    import, template validation and a full template copy every time.
+  - Here each worker imports capcut_bulk_insert once and runs `main(argv)` for many episodes;
+    templates are validated once up front (and memoized per worker), and drafts are cloned from
+    the template with COW/hardlinks (see video_pipeline/src/adapters/capcut/template_clone.py).
+
+Manifest (JSON):
+  {
+    "common": ["--draft-root", "<root>", "--channel", "CH02", "--template", "CH02-テンプレ"],
+    "episodes": [
+      {"name": "CH02-034", "args": ["--run", "<run_dir>", "--new", "<draft>", "--srt-file", "<srt>"]},
+      ...
+    ]
+  }
+  `common + args` must be a valid capcut_bulk_insert command line.
+
+Usage:
+  PYTHONPATH=".:packages" python3 -m video_pipeline.tools.capcut_batch_insert \\
+    --manifest batch.json --workers 3 --report workspaces/logs/capcut_batch_report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from video_pipeline.tools._tool_bootstrap import bootstrap as tool_bootstrap
+except Exception:
+    from _tool_bootstrap import bootstrap as tool_bootstrap  # type: ignore
+
+tool_bootstrap(load_env=False)
+
+
+@dataclass
+class EpisodeJob:
+    name: str
+    argv: List[str]
+
+
+@dataclass
+class EpisodeResult:
+    name: str
+    ok: bool
+    returncode: int
+    elapsed_sec: float
+    draft: Optional[str] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    log: Optional[str] = None
+    error: Optional[str] = None
+
+
+def load_manifest(path: Path) -> List[EpisodeJob]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("episodes"), list):
+        raise SystemExit(f"invalid manifest (expected {{'common': [...], 'episodes': [...]}}): {path}")
+    common = [str(x) for x in (data.get("common") or [])]
+    jobs: List[EpisodeJob] = []
+    seen: set[str] = set()
+    for i, ep in enumerate(data["episodes"]):
+        if not isinstance(ep, dict) or not isinstance(ep.get("args"), list):
+            raise SystemExit(f"invalid manifest episode #{i}: expected {{'name': ..., 'args': [...]}}")
+        name = str(ep.get("name") or f"episode_{i + 1:03d}")
+        if name in seen:
+            raise SystemExit(f"duplicate episode name in manifest: {name}")
+        seen.add(name)
+        jobs.append(EpisodeJob(name=name, argv=common + [str(x) for x in ep["args"]]))
+    return jobs
+
+
+def _option(argv: List[str], flag: str) -> Optional[str]:
+    """Last value of `flag` in argv (argparse semantics for repeated options)."""
+    value = None
+    for i, tok in enumerate(argv):
+        if tok == flag and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif tok.startswith(flag + "="):
+            value = tok.split("=", 1)[1]
+    return value
+
+
+def _validate_templates(jobs: List[EpisodeJob]) -> Dict[str, str]:
+    """Validate each episode's arguments and each distinct (draft_root, template) once. Returns {episode_name: error}."""
+    from video_pipeline.src.config.channel_resolver import ChannelPresetResolver
+    from video_pipeline.tools import capcut_bulk_insert as cbi
+
+    ap = cbi.build_arg_parser()
+    resolver = ChannelPresetResolver()
+    verdicts: Dict[Tuple[str, str], str] = {}
+    errors: Dict[str, str] = {}
+    for job in jobs:
+        usage = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(usage):
+                ns, _unknown = ap.parse_known_args(job.argv)
+        except SystemExit:
+            # argparse exits on a missing/invalid argument: fail this episode only, not the batch.
+            lines = usage.getvalue().strip().splitlines()
+            errors[job.name] = lines[-1].split("error: ", 1)[-1] if lines else "invalid arguments"
+            continue
+        template = ns.template
+        if not template and ns.channel:
+            preset = resolver.resolve(ns.channel)
+            template = getattr(preset, "capcut_template", "") if preset else ""
+        if not template:
+            continue  # resolved inside main() (channel inferred from paths)
+        key = (str(Path(ns.draft_root).expanduser()), template)
+        if key not in verdicts:
+            ok, msg = cbi.validate_template(Path(key[0]), template)
+            verdicts[key] = "" if ok else msg
+        if verdicts[key]:
+            errors[job.name] = verdicts[key]
+    return errors
+
+
+_WORKER_CBI = None
+
+
+def _init_worker() -> None:
+    global _WORKER_CBI
+    from video_pipeline.tools import capcut_bulk_insert as cbi
+
+    _WORKER_CBI = cbi
+
+
+def _run_episode(job: EpisodeJob, log_path: Optional[str]) -> EpisodeResult:
+    if _WORKER_CBI is None:
+        _init_worker()
+    cbi = _WORKER_CBI
+    root = logging.getLogger()
+    handler: Optional[logging.Handler] = None
+    started = time.perf_counter()
+    returncode, error = 0, None
+    with contextlib.ExitStack() as stack:
+        if log_path:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            fh = stack.enter_context(open(log_path, "w", encoding="utf-8"))
+            handler = logging.StreamHandler(fh)
+            handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+            root.addHandler(handler)
+            stack.callback(root.removeHandler, handler)
+            stack.enter_context(contextlib.redirect_stdout(fh))
+        try:
+            cbi.main(list(job.argv))
+        except SystemExit as exc:
+            code = exc.code
+            returncode = code if isinstance(code, int) else (0 if code is None else 1)
+            if returncode:
+                error = f"exit {returncode}"
+        except Exception as exc:
+            returncode, error = 1, f"{type(exc).__name__}: {exc}"
+            logging.getLogger(__name__).exception("episode %s failed", job.name)
+    draft_root, draft_name = _option(job.argv, "--draft-root"), _option(job.argv, "--new")
+    return EpisodeResult(
+        name=job.name,
+        ok=returncode == 0,
+        returncode=returncode,
+        elapsed_sec=round(time.perf_counter() - started, 3),
+        draft=str(Path(draft_root) / draft_name) if draft_root and draft_name else None,
+        phases=dict(cbi.RUN_TIMINGS),
+        log=log_path,
+        error=error,
+    )
+
+
+def run_batch(jobs: List[EpisodeJob], *, workers: int, log_dir: Optional[Path] = None) -> List[EpisodeResult]:
+    """Run all episodes; results are returned in manifest order."""
+    invalid = _validate_templates(jobs)
+    results: Dict[str, EpisodeResult] = {
+        name: EpisodeResult(name=name, ok=False, returncode=1, elapsed_sec=0.0, error=msg)
+        for name, msg in invalid.items()
+    }
+    todo = [j for j in jobs if j.name not in invalid]
+
+    def _log_path(job: EpisodeJob) -> Optional[str]:
+        return str(Path(log_dir) / f"{job.name}.log") if log_dir else None
+
+    if workers <= 1 or len(todo) <= 1:
+        for job in todo:
+            results[job.name] = _run_episode(job, _log_path(job))
+            _print_result(results[job.name])
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(todo)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            futures = {pool.submit(_run_episode, job, _log_path(job)): job for job in todo}
+            for fut, job in futures.items():
+                try:
+                    results[job.name] = fut.result()
+                except Exception as exc:  # worker crashed (BrokenProcessPool etc.)
+                    results[job.name] = EpisodeResult(
+                        name=job.name, ok=False, returncode=1, elapsed_sec=0.0, error=f"{type(exc).__name__}: {exc}"
+                    )
+                _print_result(results[job.name])
+    return [results[j.name] for j in jobs]
+
+
+def _print_result(res: EpisodeResult) -> None:
+    phases = " ".join(f"{k}={v:.2f}" for k, v in res.phases.items())
+    status = "ok" if res.ok else f"FAILED ({res.error})"
+    print(f"[batch] {res.name}: {status} {res.elapsed_sec:.2f}s {phases}".rstrip(), flush=True)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--manifest", type=Path, required=True, help="Batch manifest JSON (see module docstring)")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("CAPCUT_BATCH_WORKERS") or "2"),
+        help="Worker processes (default: 2; override via CAPCUT_BATCH_WORKERS). 1 = run in this process.",
+    )
+    ap.add_argument("--log-dir", type=Path, help="Write one log file per episode (<log-dir>/<name>.log)")
+    ap.add_argument("--report", type=Path, help="Write the per-episode timing report JSON here")
+    args = ap.parse_args()
+
+    jobs = load_manifest(args.manifest)
+    if not jobs:
+        raise SystemExit("manifest has no episodes")
+
+    started = time.perf_counter()
+    results = run_batch(jobs, workers=max(1, int(args.workers)), log_dir=args.log_dir)
+    report: Dict[str, Any] = {
+        "manifest": str(args.manifest),
+        "workers": max(1, int(args.workers)),
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+        "ok": sum(1 for r in results if r.ok),
+        "failed": sum(1 for r in results if not r.ok),
+        "episodes": [asdict(r) for r in results],
+    }
+    print(
+        f"[batch] done: ok={report['ok']} failed={report['failed']} elapsed={report['elapsed_sec']:.2f}s",
+        flush=True,
+    )
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
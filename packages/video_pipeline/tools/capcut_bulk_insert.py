@@ -56,6 +56,13 @@ import traceback
 from video_pipeline.src.config.channel_resolver import ChannelPresetResolver, infer_channel_id_from_path  # noqa: E402
 from video_pipeline.src.config.style_resolver import StyleResolver  # noqa: E402
 from video_pipeline.src.adapters.capcut.style_mapper import CapCutStyleAdapter  # noqa: E402
+from video_pipeline.src.adapters.capcut.template_clone import clone_template_dir  # noqa: E402
+from video_pipeline.src.adapters.capcut.draft_writes import (  # noqa: E402
+    draft_files_on_disk,
+    coalesce_draft_writes,
+    read_draft_json,
+    write_draft_json,
+)
 
 # Channel-specific post processors (per-channel hooks)
 CHANNEL_HOOKS = {}
@@ -72,7 +79,7 @@ def _apply_ch02_overrides(draft_dir: Path, belt_text: Optional[str] = None):
             path = draft_dir / fname
             if not path.exists():
                 continue
-            data = json.loads(path.read_text())
+            data = read_draft_json(path)
             # belt_main text update if provided
             if belt_text:
                 belt = next((t for t in data.get("tracks", []) if t.get("name") == "belt_main"), None)
@@ -87,7 +94,7 @@ def _apply_ch02_overrides(draft_dir: Path, belt_text: Optional[str] = None):
                                 m["content"] = belt_text if fname.endswith("info.json") else {"text": belt_text}
                             m["base_content"] = belt_text
                             m["name"] = m.get("name") or "belt_main_text"
-            path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+            write_draft_json(path, data)
     except Exception as exc:
         logger.warning(f"CH02 override failed: {exc}")
 
@@ -112,6 +119,17 @@ except Exception:  # pragma: no cover - optional dependency
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-phase wall time (seconds) of the last main() call; capcut_batch_insert reports it per episode.
+RUN_TIMINGS: dict[str, float] = {}
+_phase_started = [0.0]
+
+
+def _mark_phase(name: str) -> None:
+    now = time.perf_counter()
+    RUN_TIMINGS[name] = round(now - _phase_started[0], 3)
+    _phase_started[0] = now
+
+
 # Determine pyJianYingDraft API expectations for Video_material
 try:
     _VIDEO_MATERIAL_REQUIRES_TYPE = (
@@ -125,6 +143,11 @@ except Exception:
 # 🛡️ DEFENSE SYSTEM - Template Validation
 # ========================================
 
+# (template JSON path, size, mtime_ns) -> validate_template() result. Batch workers build many
+# drafts from one template; the JSON parse only happens again when the template changes.
+_TEMPLATE_VALIDATION_CACHE: dict[tuple[str, int, int], tuple[bool, str]] = {}
+
+
 def validate_template(draft_root: Path, template_name: str) -> tuple[bool, str]:
     """
     Validate template existence and basic draft structure.
@@ -151,20 +174,28 @@ def validate_template(draft_root: Path, template_name: str) -> tuple[bool, str]:
     # Reject "empty" templates that have JSON but no tracks.
     # These produce broken drafts (missing audio/effects/belt layers) and are a major source of
     # 'which one is the correct draft?' chaos.
+    src = draft_content if has_content else draft_info
+    st = src.stat()
+    cache_key = (str(src.resolve()), st.st_size, st.st_mtime_ns)
+    cached = _TEMPLATE_VALIDATION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        src = draft_content if has_content else draft_info
         data = json.loads(src.read_text(encoding="utf-8"))
         tracks = data.get("tracks", None) if isinstance(data, dict) else None
         if not isinstance(tracks, list) or len(tracks) == 0:
-            return (
+            result = (
                 False,
                 f"❌ Template '{template_name}' looks empty (tracks[] is missing/empty): {src}. "
                 "Use a template project that already contains the required layers.",
             )
+        else:
+            result = (True, "")
     except Exception as exc:
-        return False, f"❌ Template '{template_name}' JSON is not readable: {type(exc).__name__}: {exc}"
+        result = (False, f"❌ Template '{template_name}' JSON is not readable: {type(exc).__name__}: {exc}")
 
-    return True, ""
+    _TEMPLATE_VALIDATION_CACHE[cache_key] = result
+    return result
 
 
 def list_valid_templates(draft_root: Path, prefix: str = "") -> list[tuple[str, float]]:
@@ -221,7 +252,7 @@ def _try_load_json_file(path: Path) -> tuple[Optional[dict], str]:
     except Exception:
         return None, "stat_failed"
     try:
-        return json.loads(path.read_text(encoding="utf-8")), ""
+        return read_draft_json(path), ""
     except Exception as exc:
         return None, f"invalid:{type(exc).__name__}"
 
@@ -450,7 +481,7 @@ def _localize_external_audio_assets(draft_dir: Path, logger: logging.Logger) ->
                 file_changed = True
 
         if file_changed:
-            path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            write_draft_json(path, data, indent=None)
             changed_any = True
 
     if changed_any:
@@ -665,7 +696,7 @@ def _ensure_bgm_covers_duration(draft_dir: Path, logger: logging.Logger) -> None
         changed_any = True
 
     if changed_any:
-        content_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(content_path, data)
 
 
 def _drop_unwanted_bgm_by_suffix(
@@ -766,7 +797,7 @@ def _drop_unwanted_bgm_by_suffix(
     mats["audios"] = [m for m in audios if isinstance(m, dict) and str(m.get("id") or "") in referenced]
     removed_mats = before_mats - len(mats["audios"])
 
-    content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_draft_json(content_path, data)
     logger.info(
         "🔇 Dropped unwanted BGM by suffix: segments=%d tracks=%d materials=%d",
         removed_segments,
@@ -863,7 +894,7 @@ def _purge_unreferenced_placeholder_video_materials(draft_dir: Path, logger: log
 
         if removed_here:
             mats["videos"] = kept
-            path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            write_draft_json(path, data)
             total_removed += removed_here
 
     if total_removed:
@@ -1010,7 +1041,7 @@ def _repair_draft_info_material_paths_from_content(draft_dir: Path, logger: logg
     if not changed:
         return 0
 
-    info_path.write_text(_json2.dumps(info, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_draft_json(info_path, info)
     logger.info("🛠️ Repaired draft_info.json material paths from draft_content.json (changed=%d)", changed)
     return changed
 
@@ -1083,7 +1114,7 @@ def _trim_all_tracks_to_duration(
         tr["segments"] = out
 
     if trimmed_segments or dropped_segments:
-        content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(content_path, data)
         logger.info("✂️  Trimmed template tails to duration: trimmed=%d dropped=%d", trimmed_segments, dropped_segments)
 
 
@@ -1628,7 +1659,7 @@ def _load_draft_track_indices(draft_dir: Path) -> list[int]:
     indices: list[int] = []
     try:
         info_path = draft_dir / 'draft_info.json'
-        data = _json2.loads(info_path.read_text(encoding='utf-8'))
+        data = read_draft_json(info_path)
         tracks = data.get('tracks') or data.get('script', {}).get('tracks')
         it = []
         if isinstance(tracks, dict):
@@ -1675,7 +1706,7 @@ def _compute_abs_index_for_rank(draft_dir: Path, rank_from_top: int = 3, default
 def _read_tracks_meta(draft_dir: Path):
     try:
         info_path = draft_dir / 'draft_info.json'
-        data = _json2.loads(info_path.read_text(encoding='utf-8'))
+        data = read_draft_json(info_path)
         tracks = data.get('tracks') or data.get('script', {}).get('tracks')
         if isinstance(tracks, dict):
             items = []
@@ -1722,8 +1753,7 @@ def fix_image_track_render_timerange(draft_dir: Path) -> bool:
             logger.warning("Cannot fix render_timerange: draft_content.json not found")
             return False
 
-        with open(draft_content_path, 'r', encoding='utf-8') as f:
-            data = _json2.load(f)
+        data = read_draft_json(draft_content_path)
 
         # Backup
         backup_path = draft_dir / "draft_content.json.bak_render_fix"
@@ -1758,8 +1788,7 @@ def fix_image_track_render_timerange(draft_dir: Path) -> bool:
         logger.info(f"   Fixed render_timerange for {fixed_count} video segments")
 
         # Save
-        with open(draft_content_path, 'w', encoding='utf-8') as f:
-            _json2.dump(data, f, ensure_ascii=False, indent=2)
+        write_draft_json(draft_content_path, data)
 
         return True
 
@@ -1776,8 +1805,8 @@ def _merge_info_tracks_into_content(draft_dir: Path) -> None:
         return
 
     try:
-        content_data = _json2.loads(content_path.read_text(encoding='utf-8'))
-        info_data = _json2.loads(info_path.read_text(encoding='utf-8'))
+        content_data = read_draft_json(content_path)
+        info_data = read_draft_json(info_path)
 
         content_tracks = content_data.get('tracks', [])
         info_tracks = info_data.get('tracks', [])
@@ -1806,7 +1835,7 @@ def _merge_info_tracks_into_content(draft_dir: Path) -> None:
                 else:
                     content_list.append(item)
 
-        content_path.write_text(_json2.dumps(content_data, ensure_ascii=False, indent=2), encoding='utf-8')
+        write_draft_json(content_path, content_data)
     except Exception as exc:
         logger.warning(f"Failed to merge draft_info into draft_content: {exc}")
 
@@ -1867,7 +1896,7 @@ def _transplant_track_segments(
         tracks.pop(rm_idx)
 
     data["tracks"] = tracks
-    content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_draft_json(content_path, data)
 
     if logger:
         logger.info(
@@ -1926,7 +1955,7 @@ def _rename_track_in_content(
     if not changed:
         return False
 
-    content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_draft_json(content_path, data)
     if logger:
         logger.info("✅ Renamed %s track: %s -> %s", track_type, old_name, new_name)
     return True
@@ -1966,12 +1995,12 @@ def ensure_absolute_indices(draft_dir: Path) -> None:
                 elif ttype == "video":
                     tr["absolute_index"] = 600_000 - idx
 
-        content_data = _json2.loads(content_path.read_text(encoding="utf-8"))
-        info_data = _json2.loads(info_path.read_text(encoding="utf-8"))
+        content_data = read_draft_json(content_path)
+        info_data = read_draft_json(info_path)
         _assign(content_data.get("tracks"))
         _assign(info_data.get("tracks"))
-        content_path.write_text(_json2.dumps(content_data, ensure_ascii=False, indent=2), encoding="utf-8")
-        info_path.write_text(_json2.dumps(info_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(content_path, content_data)
+        write_draft_json(info_path, info_data)
     except Exception as exc:
         logger.warning(f"Failed to enforce absolute_index: {exc}")
 
@@ -2092,7 +2121,7 @@ def _apply_common_subtitle_style(
         path = draft_dir / fname
         if not path.exists():
             continue
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_draft_json(path)
         tracks = [t for t in data.get("tracks", []) if t.get("name") == "subtitles_text"]
         if not tracks:
             continue
@@ -2139,7 +2168,7 @@ def _apply_common_subtitle_style(
                     text_val = bc
             m["content"] = json.dumps(_default_style_content(text_val), ensure_ascii=False)
 
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(path, data)
 
     # No subtitles_text track present; not an error.
     if not touched:
@@ -2171,7 +2200,7 @@ def _restore_template_belt_design(
         raise FileNotFoundError(f"draft_info.json not found: {info_path}")
 
     t_info = json.loads(template_info_path.read_text(encoding="utf-8"))
-    d_info = json.loads(info_path.read_text(encoding="utf-8"))
+    d_info = read_draft_json(info_path)
     if not isinstance(t_info, dict) or not isinstance(d_info, dict):
         raise RuntimeError("draft_info.json payload invalid (expected dict)")
 
@@ -2236,7 +2265,7 @@ def _restore_template_belt_design(
         d_mats["effects"] = existing_other + restored
         d_info["materials"] = d_mats
 
-    info_path.write_text(json.dumps(d_info, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    write_draft_json(info_path, d_info)
 
 
 def _apply_channel_hook(channel_id: Optional[str], draft_dir: Path) -> None:
@@ -2273,8 +2302,8 @@ def sync_draft_info_with_content(draft_dir: Path) -> bool:
             return False
 
         # Load both files
-        content_data = _json2.loads(draft_content_path.read_text(encoding="utf-8"))
-        info_data = _json2.loads(draft_info_path.read_text(encoding="utf-8"))
+        content_data = read_draft_json(draft_content_path)
+        info_data = read_draft_json(draft_info_path)
 
         content_tracks = content_data.get("tracks", [])
         info_tracks = info_data.get("tracks", [])
@@ -2537,7 +2566,7 @@ def sync_draft_info_with_content(draft_dir: Path) -> bool:
         info_data["duration"] = content_duration
 
         # Save updated draft_info.json
-        draft_info_path.write_text(_json2.dumps(info_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(draft_info_path, info_data)
 
         logger.info(
             "✅ Synced draft_info.json: %d tracks, %d video materials",
@@ -2569,7 +2598,7 @@ def _dedupe_tracks_and_materials(draft_dir: Path):
         content_path = draft_dir / "draft_content.json"
         if not content_path.exists():
             return
-        data = _json2.loads(content_path.read_text(encoding="utf-8"))
+        data = read_draft_json(content_path)
         tracks = data.get("tracks", [])
         deduped = []
         seen = set()
@@ -2649,7 +2678,7 @@ def _dedupe_tracks_and_materials(draft_dir: Path):
         dedup_vid.reverse()
         data.setdefault("materials", {})["videos"] = dedup_vid
 
-        content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(content_path, data)
     except Exception:
         pass
 
@@ -2666,7 +2695,7 @@ def _fallback_set_main_belt_title(draft_dir: Path, title: str) -> None:
             if not path.exists():
                 continue
             is_info = fname == "draft_info.json"
-            data = _json2.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
             tracks = data.get("tracks", [])
             mats = data.get("materials", {}).get("texts", [])
             # find main belt-like track
@@ -2710,7 +2739,7 @@ def _fallback_set_main_belt_title(draft_dir: Path, title: str) -> None:
                     m["base_content"] = title
                     m["name"] = m.get("name") or "belt_main_text"
                     break
-            path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            write_draft_json(path, data)
     except Exception as exc:
         logger.warning(f"Fallback belt title inject failed: {exc}")
 
@@ -2737,7 +2766,7 @@ def _force_video_scale(draft_dir: Path, scale: float) -> None:
         content_path = draft_dir / "draft_content.json"
         if not content_path.exists():
             return
-        data = _json2.loads(content_path.read_text(encoding="utf-8"))
+        data = read_draft_json(content_path)
         mats = data.get("materials") or {}
         id_to_path: dict[str, str] = {}
         for key in ("videos", "images"):
@@ -2777,7 +2806,7 @@ def _force_video_scale(draft_dir: Path, scale: float) -> None:
                 changed = True
 
         if changed:
-            content_path.write_text(_json2.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            write_draft_json(content_path, data)
     except Exception:
         pass
 
@@ -2803,7 +2832,7 @@ def apply_auto_fade_transitions(draft_dir: Path, track_name: str, fade_duration_
         return 0
 
     try:
-        draft_data = _auto_load_fade_json(draft_content_path)
+        draft_data = read_draft_json(draft_content_path)
     except Exception as exc:
         logger.warning(f"Failed to load draft_content.json for fade injection: {exc}")
         return 0
@@ -2818,8 +2847,9 @@ def apply_auto_fade_transitions(draft_dir: Path, track_name: str, fade_duration_
         return 0
 
     try:
-        _auto_backup_file(draft_content_path)
-        _auto_save_fade_json(draft_content_path, draft_data)
+        with draft_files_on_disk(draft_dir):
+            _auto_backup_file(draft_content_path)
+        write_draft_json(draft_content_path, draft_data)
         # IMPORTANT:
         # Do NOT call fix_fade_transitions_correct.sync_draft_info() here.
         # That function replaces draft_info.json with draft_content.json and wipes
@@ -2867,7 +2897,7 @@ def apply_belt_config(belt_data, opening_offset, draft_dir, logger, title=None,
 
         draft_content_path = draft_dir / 'draft_content.json'
         import json as _json_belt
-        content_data = _json_belt.loads(draft_content_path.read_text(encoding='utf-8'))
+        content_data = read_draft_json(draft_content_path)
 
         SEC = 1_000_000
         opening_offset_us = int(opening_offset * SEC)
@@ -3202,7 +3232,7 @@ def apply_belt_config(belt_data, opening_offset, draft_dir, logger, title=None,
             if m.get("id"):
                 existing[m["id"]] = m
         content_data["materials"]["texts"] = list(existing.values())
-        draft_content_path.write_text(_json_belt.dumps(content_data, ensure_ascii=False, indent=2))
+        write_draft_json(draft_content_path, content_data)
         logger.info("  ✅ 帯トラック更新完了")
 
     except Exception as e:
@@ -3219,8 +3249,7 @@ def adjust_effect_duration(script, total_duration_sec, draft_dir, logger):
     """
     try:
         draft_content_path = draft_dir / 'draft_content.json'
-        import json as _json_effect
-        content_data = _json_effect.loads(draft_content_path.read_text(encoding='utf-8'))
+        content_data = read_draft_json(draft_content_path)
 
         SEC = 1_000_000
         total_duration_us = int(total_duration_sec * SEC)
@@ -3255,7 +3284,7 @@ def adjust_effect_duration(script, total_duration_sec, draft_dir, logger):
                     segment['material_timerange']['duration'] = total_duration_us
 
         # 更新されたコンテンツを保存
-        draft_content_path.write_text(_json_effect.dumps(content_data, ensure_ascii=False, indent=2))
+        write_draft_json(draft_content_path, content_data)
         logger.info("  ✅ エフェクト調整完了")
 
     except Exception as e:
@@ -3275,8 +3304,7 @@ def fix_subtitle_style_direct(draft_info_path: str, adapter: CapCutStyleAdapter)
             logger.warning(f"draft_content.json not found at {draft_content_path}")
             return
 
-        with open(draft_content_path, 'r', encoding='utf-8') as f:
-            content = json.load(f)
+        content = read_draft_json(draft_content_path)
 
         # Get authoritative config from adapter
         config = adapter.get_subtitle_config()
@@ -3315,8 +3343,7 @@ def fix_subtitle_style_direct(draft_info_path: str, adapter: CapCutStyleAdapter)
         # But since we are here, let's ensure specific attributes that pyJianYingDraft might miss
         
         # Save changes
-        with open(draft_content_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=4, ensure_ascii=False)
+        write_draft_json(draft_content_path, content, indent=4)
         
         logger.info(f"Applied direct JSON fixes from Adapter to {draft_content_path}")
 
@@ -3415,7 +3442,7 @@ def _detect_keep_generic_text_tracks(draft_dir: Path, logger: logging.Logger) ->
         content_path = draft_dir / "draft_content.json"
         if not content_path.exists():
             return keep
-        data = json.loads(content_path.read_text(encoding="utf-8"))
+        data = read_draft_json(content_path)
         tracks = data.get("tracks", []) or []
         if not isinstance(tracks, list):
             return keep
@@ -3485,7 +3512,7 @@ def _purge_generic_template_placeholders(
         path = draft_dir / fname
         if not path.exists():
             continue
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = read_draft_json(path)
         tracks = data.get("tracks", []) or []
         if not isinstance(tracks, list):
             continue
@@ -3511,7 +3538,7 @@ def _purge_generic_template_placeholders(
                 tr["segments"] = []
                 changed = True
         if changed:
-            path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            write_draft_json(path, data)
 
     if removed:
         uniq = {}
@@ -3549,7 +3576,7 @@ def _purge_stale_managed_tracks_in_template_copy(
         if not path.exists():
             continue
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
         except Exception:
             continue
 
@@ -3591,7 +3618,7 @@ def _purge_stale_managed_tracks_in_template_copy(
         if not changed:
             continue
         set_tracks(kept)
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(path, data)
 
     if removed:
         uniq: dict[tuple[str, str], int] = {}
@@ -3622,7 +3649,7 @@ def _purge_belt_tracks_in_template_copy(draft_dir: Path, logger: logging.Logger)
         if not path.exists():
             continue
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
         except Exception:
             continue
 
@@ -3653,7 +3680,7 @@ def _purge_belt_tracks_in_template_copy(draft_dir: Path, logger: logging.Logger)
         if not changed:
             continue
         set_tracks(kept)
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(path, data)
 
     if removed:
         pretty = ", ".join(
@@ -3688,7 +3715,7 @@ def _purge_effect_tracks_in_template_copy(draft_dir: Path, logger: logging.Logge
         if not path.exists():
             continue
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
         except Exception:
             continue
 
@@ -3719,7 +3746,7 @@ def _purge_effect_tracks_in_template_copy(draft_dir: Path, logger: logging.Logge
                 cleared_effect_mats += len(eff)
                 mats["effects"] = []
 
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_draft_json(path, data)
 
     if removed_tracks or cleared_effect_mats:
         logger.info(
@@ -3749,7 +3776,7 @@ def _post_flight_validate_draft(
     if not content_path.exists():
         raise FileNotFoundError(f"draft_content.json not found: {content_path}")
 
-    data = json.loads(content_path.read_text(encoding="utf-8"))
+    data = read_draft_json(content_path, shared=True)
     tracks = data.get("tracks", []) or []
     if not isinstance(tracks, list):
         raise ValueError("draft_content.json tracks is not a list")
@@ -3794,7 +3821,7 @@ def _post_flight_validate_draft(
     info_path = draft_dir / "draft_info.json"
     try:
         if info_path.exists():
-            info = json.loads(info_path.read_text(encoding="utf-8"))
+            info = read_draft_json(info_path, shared=True)
             mats = info.get("materials") if isinstance(info, dict) else None
             if isinstance(mats, dict):
                 placeholder_tokens = ("##_material_placeholder_", "##_draftpath_placeholder_")
@@ -3930,7 +3957,7 @@ def _sanitize_draft_meta_info(draft_dir: Path, logger: logging.Logger) -> None:
         # Align draft_id/draft_name with draft_info.json (primary key + listing consistency).
         info_path = draft_dir / "draft_info.json"
         try:
-            info = json.loads(info_path.read_text(encoding="utf-8")) if info_path.exists() else {}
+            info = read_draft_json(info_path) if info_path.exists() else {}
         except Exception:
             info = {}
         if isinstance(info, dict):
@@ -3968,7 +3995,7 @@ def _shift_audio_in_json(draft_dir: Path, offset_us: int):
             continue
         try:
             import json as _json
-            data = _json.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
             modified = False
             for tr in data.get("tracks", []):
                 if tr.get("type") != "audio":
@@ -3982,7 +4009,7 @@ def _shift_audio_in_json(draft_dir: Path, offset_us: int):
                                 tt["start"] = start + offset_us
                                 modified = True
             if modified:
-                path.write_text(_json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+                write_draft_json(path, data)
         except Exception as e:
             logger.warning("Failed to shift audio in %s: %s", fname, e)
 
@@ -4001,7 +4028,7 @@ def _shift_tracks_in_json(draft_dir: Path, offset_us: int):
             continue
         try:
             import json as _json
-            data = _json.loads(path.read_text(encoding="utf-8"))
+            data = read_draft_json(path)
             modified = False
             for tr in data.get("tracks", []):
                 name = tr.get("name") or ""
@@ -4018,7 +4045,7 @@ def _shift_tracks_in_json(draft_dir: Path, offset_us: int):
                                 tt["start"] = start + offset_us
                                 modified = True
             if modified:
-                path.write_text(_json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+                write_draft_json(path, data)
         except Exception as e:
             logger.warning("Failed to shift tracks in %s: %s", fname, e)
 
@@ -4036,7 +4063,7 @@ def _validate_opening_offset(draft_dir: Path, opening_offset_us: int, logger: lo
         if not content_path.exists() or opening_offset_us <= 0:
             return
         import json as _json
-        data = _json.loads(content_path.read_text(encoding="utf-8"))
+        data = read_draft_json(content_path, shared=True)
         offenders = []
         tracks = data.get("tracks", [])
         for tr in tracks:
@@ -4074,7 +4101,7 @@ def _validate_opening_offset(draft_dir: Path, opening_offset_us: int, logger: lo
     except Exception as e:
         logger.warning(f"Opening offset validation skipped: {e}")
 
-def main():
+def build_arg_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser()
     ap.add_argument("--run", required=True, help="srt2images output run dir (contains image_cues.json and images/)")
     ap.add_argument("--draft-root", default=str(Path.home() / "Movies/CapCut/User Data/Projects/com.lveditor.draft"))
@@ -4104,7 +4131,14 @@ def main():
     ap.add_argument("--opening-offset", type=float, default=3.0, help="Opening duration offset (seconds) - all elements start after this (default: 3.0)")
     ap.add_argument("--belt-config", help="Belt layer config JSON file (belt_config.json)")
     ap.add_argument("--validate-only", action="store_true", help="Validate inputs without creating draft (dry-run mode)")
-    args = ap.parse_args()
+    return ap
+
+
+def main(argv: Optional[list[str]] = None):
+    RUN_TIMINGS.clear()
+    _phase_started[0] = time.perf_counter()
+    ap = build_arg_parser()
+    args = ap.parse_args(argv)
 
     if args.fade_duration is None:
         args.fade_duration = args.crossfade
@@ -4261,72 +4295,66 @@ def main():
     template_dir = draft_root / template_name
     draft_dir = draft_root / args.new
 
-    # Prefer pyJianYingDraft duplication, but some templates only have draft_info.json.
-    use_manual_copy = (template_dir / "draft_info.json").exists() and not (template_dir / "draft_content.json").exists()
-    if use_manual_copy:
-        if draft_dir.exists():
-            shutil.rmtree(draft_dir)
-        shutil.copytree(template_dir, draft_dir)
-        logger.info(f"✅ Copied template directory to: {args.new} (manual copy)")
-    else:
-        try:
-            df.duplicate_as_template(template_name, args.new, allow_replace=True)
-            logger.info(f"✅ Duplicated template to: {args.new}")
-        except Exception as e:
-            logger.info(f"pyJianYingDraft duplication failed; falling back to manual copy: {e}")
-            if draft_dir.exists():
-                shutil.rmtree(draft_dir)
-            shutil.copytree(template_dir, draft_dir)
-            logger.info(f"✅ Copied template directory to: {args.new} (fallback manual copy)")
+    # Clone the template ourselves (COW/hardlinks for media, see template_clone.py) instead of
+    # Draft_folder.duplicate_as_template(), which copies every asset and parses the template once
+    # more only to return a Script_file we never used (load_template below parses the clone).
+    # Some templates only have draft_info.json; _normalize_draft_dir_for_pyjiaying derives content.
+    clone_stats = clone_template_dir(template_dir, draft_dir)
+    logger.info(f"✅ Cloned template to: {args.new} ({clone_stats.summary()})")
+    _mark_phase("clone_template")
 
     # Normalize JSON + track names BEFORE loading with pyJianYingDraft.
     _normalize_draft_dir_for_pyjiaying(draft_dir)
 
-    # Detect belt/title tracks that must be preserved (some templates store styling on text_1, etc.)
-    keep_generic_text_tracks = _detect_keep_generic_text_tracks(draft_dir, logger)
-
-    # Purge generic placeholder tracks from template BEFORE loading with pyJianYingDraft.
-    # (If we purge after load, in-memory script.content will overwrite the JSON back.)
-    keep_generic_track_names = set(keep_generic_text_tracks)
-    template_background_video_track_name: str | None = None
-    if args.inject_into_main:
-        # When injecting into the template's primary image layer, keep that generic video track's
-        # segments pre-load so pyJianYingDraft will actually load the track (some versions drop
-        # empty tracks). We'll clear segments in-memory after selecting the target track.
-        try:
-            content_path = draft_dir / "draft_content.json"
-            if content_path.exists():
-                _data = _json2.loads(content_path.read_text(encoding="utf-8"))
-                _tracks = _data.get("tracks", []) or []
-                if isinstance(_tracks, list):
-                    for _tr in _tracks:
-                        if not isinstance(_tr, dict):
-                            continue
-                        if (_tr.get("type") or "") != "video":
-                            continue
-                        _name = _tr.get("name")
-                        if not isinstance(_name, str) or not _name:
-                            continue
-                        if _name.startswith("srt2images_"):
-                            continue
-                        template_background_video_track_name = _name
-                        keep_generic_track_names.add(_name)
-                        break
-        except Exception:
-            pass
-    _purge_generic_template_placeholders(draft_dir, logger, keep_track_names=keep_generic_track_names)
-    _purge_stale_managed_tracks_in_template_copy(
-        draft_dir,
-        logger,
-        keep_srt2images_video=bool(getattr(args, "inject_into_main", False)),
-    )
-    if not belt_enabled:
-        _purge_belt_tracks_in_template_copy(draft_dir, logger)
-    if args.inject_into_main:
-        _purge_effect_tracks_in_template_copy(draft_dir, logger)
-    _localize_external_audio_assets(draft_dir, logger)
+    # Pre-load passes coalesce their draft writes; they are flushed before pyJianYingDraft reads the files.
+    with coalesce_draft_writes(draft_dir):
+        # Detect belt/title tracks that must be preserved (some templates store styling on text_1, etc.)
+        keep_generic_text_tracks = _detect_keep_generic_text_tracks(draft_dir, logger)
+
+        # Purge generic placeholder tracks from template BEFORE loading with pyJianYingDraft.
+        # (If we purge after load, in-memory script.content will overwrite the JSON back.)
+        keep_generic_track_names = set(keep_generic_text_tracks)
+        template_background_video_track_name: str | None = None
+        if args.inject_into_main:
+            # When injecting into the template's primary image layer, keep that generic video track's
+            # segments pre-load so pyJianYingDraft will actually load the track (some versions drop
+            # empty tracks). We'll clear segments in-memory after selecting the target track.
+            try:
+                content_path = draft_dir / "draft_content.json"
+                if content_path.exists():
+                    _data = read_draft_json(content_path)
+                    _tracks = _data.get("tracks", []) or []
+                    if isinstance(_tracks, list):
+                        for _tr in _tracks:
+                            if not isinstance(_tr, dict):
+                                continue
+                            if (_tr.get("type") or "") != "video":
+                                continue
+                            _name = _tr.get("name")
+                            if not isinstance(_name, str) or not _name:
+                                continue
+                            if _name.startswith("srt2images_"):
+                                continue
+                            template_background_video_track_name = _name
+                            keep_generic_track_names.add(_name)
+                            break
+            except Exception:
+                pass
+        _purge_generic_template_placeholders(draft_dir, logger, keep_track_names=keep_generic_track_names)
+        _purge_stale_managed_tracks_in_template_copy(
+            draft_dir,
+            logger,
+            keep_srt2images_video=bool(getattr(args, "inject_into_main", False)),
+        )
+        if not belt_enabled:
+            _purge_belt_tracks_in_template_copy(draft_dir, logger)
+        if args.inject_into_main:
+            _purge_effect_tracks_in_template_copy(draft_dir, logger)
+        _localize_external_audio_assets(draft_dir, logger)
+    _mark_phase("preload_passes")
 
     script = df.load_template(args.new)
+    _mark_phase("load_template")
     assets_dir = draft_dir / 'assets' / 'image'
     assets_dir.mkdir(parents=True, exist_ok=True)
 
@@ -4361,7 +4389,7 @@ def main():
             content_path = draft_dir / "draft_content.json"
             if not content_path.exists():
                 return None
-            data = _json2.loads(content_path.read_text(encoding="utf-8"))
+            data = read_draft_json(content_path)
             tracks = data.get("tracks", []) or []
             if not isinstance(tracks, list):
                 return None
@@ -4413,7 +4441,7 @@ def main():
             content_path = draft_dir / "draft_content.json"
             if not content_path.exists():
                 return None
-            data = _json2.loads(content_path.read_text(encoding="utf-8"))
+            data = read_draft_json(content_path)
             tracks = data.get("tracks", []) or []
             if not isinstance(tracks, list):
                 return None
@@ -5039,254 +5067,259 @@ def main():
 
     # Save back to JSON (in-place)
     script.save()
-
-    # In inject-into-main mode, move generated segments onto the template-provided tracks.
-    # This avoids creating new "image layer" or "subtitle layer" tracks in the final draft.
-    if args.inject_into_main and template_video_track_name:
-        _transplant_track_segments(
-            draft_dir,
-            src_track_name=track_name,
-            dst_track_name=template_video_track_name,
-            track_type="video",
-            logger=logger,
-        )
-        # Downstream helpers (fade injection etc.) should target the real template track.
-        track_name = template_video_track_name
-        insert_video_track_name = template_video_track_name
-        # Subtitles: transplant if we generated on a temp track.
-        temp_sub = f"subtitles_gen_{run_dir.name}"
-        transplanted_subs = _transplant_track_segments(
-            draft_dir,
-            src_track_name=temp_sub,
-            dst_track_name="subtitles_text",
-            track_type="text",
-            logger=logger,
-        )
-        if not transplanted_subs:
-            # Template may not include a subtitles_text track; rename the generated track to canonical name.
-            _rename_track_in_content(
+    _mark_phase("insert")
+
+    # Post-processing passes below still read/write draft_content.json / draft_info.json one pass
+    # at a time; the file writes are coalesced and done once, when this block ends (see draft_writes.py).
+    with coalesce_draft_writes(draft_dir):
+        # In inject-into-main mode, move generated segments onto the template-provided tracks.
+        # This avoids creating new "image layer" or "subtitle layer" tracks in the final draft.
+        if args.inject_into_main and template_video_track_name:
+            _transplant_track_segments(
                 draft_dir,
+                src_track_name=track_name,
+                dst_track_name=template_video_track_name,
+                track_type="video",
+                logger=logger,
+            )
+            # Downstream helpers (fade injection etc.) should target the real template track.
+            track_name = template_video_track_name
+            insert_video_track_name = template_video_track_name
+            # Subtitles: transplant if we generated on a temp track.
+            temp_sub = f"subtitles_gen_{run_dir.name}"
+            transplanted_subs = _transplant_track_segments(
+                draft_dir,
+                src_track_name=temp_sub,
+                dst_track_name="subtitles_text",
                 track_type="text",
-                old_name=temp_sub,
-                new_name="subtitles_text",
                 logger=logger,
             )
+            if not transplanted_subs:
+                # Template may not include a subtitles_text track; rename the generated track to canonical name.
+                _rename_track_in_content(
+                    draft_dir,
+                    track_type="text",
+                    old_name=temp_sub,
+                    new_name="subtitles_text",
+                    logger=logger,
+                )
 
-    # Deduplicate tracks/materials (template carryover cleanup)
-    _dedupe_tracks_and_materials(draft_dir)
-    # CH01: user requested to not include specific template BGM variants.
-    if bool(getattr(args, "inject_into_main", False)) and str(channel_id or "") == "CH01":
-        _drop_unwanted_bgm_by_suffix(
-            draft_dir,
-            banned_suffixes=[
-                "06_お寺の雰囲気.mp3",
-                "70_OnAPianoAcloudNatureSounds.mp3",
-            ],
-            logger=logger,
-        )
-    # Enforce fixed scale on video segments
-    _force_video_scale(draft_dir, float(args.scale))
-    # Trim any lingering template segments (background/BGM) to the actual episode duration.
-    try:
-        _target_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
-    except Exception:
-        _target_us = 0
-    if _target_us > 0:
-        _trim_all_tracks_to_duration(draft_dir, target_us=int(_target_us), logger=logger)
-
-    fade_target = args.fade_duration if args.fade_duration is not None else args.crossfade
-    if not getattr(args, "disable_auto_fade", False):
+        # Deduplicate tracks/materials (template carryover cleanup)
+        _dedupe_tracks_and_materials(draft_dir)
+        # CH01: user requested to not include specific template BGM variants.
+        if bool(getattr(args, "inject_into_main", False)) and str(channel_id or "") == "CH01":
+            _drop_unwanted_bgm_by_suffix(
+                draft_dir,
+                banned_suffixes=[
+                    "06_お寺の雰囲気.mp3",
+                    "70_OnAPianoAcloudNatureSounds.mp3",
+                ],
+                logger=logger,
+            )
+        # Enforce fixed scale on video segments
+        _force_video_scale(draft_dir, float(args.scale))
+        # Trim any lingering template segments (background/BGM) to the actual episode duration.
         try:
-            fade_val = float(fade_target or 0.0)
-            applied = apply_auto_fade_transitions(draft_dir, track_name, fade_val)
-            if applied == 0:
-                logger.warning("⚠️ Auto-fade (%.2fs) skipped (helper missing / track empty).", fade_val)
-            else:
-                logger.info("✅ Auto-fade transitions applied: %d (%.2fs)", applied, fade_val)
-        except Exception as exc:
-            logger.warning("Auto-fade injection failed (non-fatal): %s", exc)
-
-    # IMPORTANT: Do NOT merge draft_info -> draft_content.
-    # draft_info often contains stale template tracks and merging can overwrite newly inserted segments.
-    # We instead sync draft_content -> draft_info later (sync_draft_info_with_content).
-    _dedupe_tracks_and_materials(draft_dir)
-    if not args.inject_into_main:
-        _ensure_bgm_covers_duration(draft_dir, logger)
-
-    # Keep template effect tracks (if any) spanning the full draft duration even when belt is disabled.
-    try:
-        total_end_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
-        total_duration_sec = float(total_end_us) / 1_000_000.0
-    except Exception:
-        total_duration_sec = 0.0
-    if total_duration_sec > 0:
-        adjust_effect_duration(None, total_duration_sec, draft_dir, logger)
-
-    print(f"Inserted {len(cues)} images into draft: {args.new}\nLocation: {args.draft_root}/{args.new}")
-
-    # ========================================
-    # 🔧 CRITICAL FIX: Set render_timerange for image segments
-    # ========================================
-    # pyJianYingDraft doesn't set render_timerange correctly, causing images not to display
-    logger.info("🖼️  Fixing render_timerange for image segments...")
-    if fix_image_track_render_timerange(draft_dir):
-        logger.info("✅ Image render_timerange fixed")
-    else:
-        logger.warning("⚠️  render_timerange fix failed - images may not display")
-
-    # Purge template-carryover placeholder video materials to avoid CapCut "missing media" warnings.
-    _purge_unreferenced_placeholder_video_materials(draft_dir, logger=logger)
-
-    # ========================================
-    # 🔧 CRITICAL: Sync draft_info.json with draft_content.json
-    # ========================================
-    # pyJianYingDraft 0.2.3 only updates draft_content.json
-    # CapCut requires BOTH files to be in sync to recognize tracks/materials
-    logger.info("🔄 Syncing draft_info.json with draft_content.json...")
-    if sync_draft_info_with_content(draft_dir):
-        logger.info("✅ Draft files synchronized - CapCut will now recognize all changes")
-    else:
-        logger.warning("⚠️  Draft sync failed - manual sync may be required")
-        logger.warning(f"   Run: PYTHONPATH=\".:packages\" python3 -m video_pipeline.tools.sync_draft_files_complete '{draft_dir}'")
+            _target_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
+        except Exception:
+            _target_us = 0
+        if _target_us > 0:
+            _trim_all_tracks_to_duration(draft_dir, target_us=int(_target_us), logger=logger)
 
-    # Ensure absolute_index is populated so CapCut shows inserted tracks
-    ensure_absolute_indices(draft_dir)
+        fade_target = args.fade_duration if args.fade_duration is not None else args.crossfade
+        if not getattr(args, "disable_auto_fade", False):
+            try:
+                fade_val = float(fade_target or 0.0)
+                applied = apply_auto_fade_transitions(draft_dir, track_name, fade_val)
+                if applied == 0:
+                    logger.warning("⚠️ Auto-fade (%.2fs) skipped (helper missing / track empty).", fade_val)
+                else:
+                    logger.info("✅ Auto-fade transitions applied: %d (%.2fs)", applied, fade_val)
+            except Exception as exc:
+                logger.warning("Auto-fade injection failed (non-fatal): %s", exc)
 
-    # ========================================
-    # 🎯 帯ポストプロセッシング（チャンネル共通）
-    #    CH01固定のスタイルは排除し、belt_config + layout_configのみで適用
-    # ========================================
-    # NOTE: layout_cfg is also used by the final subtitle-style normalization step.
-    # It must be defined even when --belt-config is not provided.
-    layout_cfg = preset.config_model.layout if preset and preset.config_model else None
+        # IMPORTANT: Do NOT merge draft_info -> draft_content.
+        # draft_info often contains stale template tracks and merging can overwrite newly inserted segments.
+        # We instead sync draft_content -> draft_info later (sync_draft_info_with_content).
+        _dedupe_tracks_and_materials(draft_dir)
+        if not args.inject_into_main:
+            _ensure_bgm_covers_duration(draft_dir, logger)
 
-    if belt_enabled and args.belt_config:
+        # Keep template effect tracks (if any) spanning the full draft duration even when belt is disabled.
         try:
-            import json as _json
-            belt_config_path = Path(args.belt_config)
-            if belt_config_path.exists():
-                belt_data = _json.loads(belt_config_path.read_text(encoding='utf-8'))
+            total_end_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
+            total_duration_sec = float(total_end_us) / 1_000_000.0
+        except Exception:
+            total_duration_sec = 0.0
+        if total_duration_sec > 0:
+            adjust_effect_duration(None, total_duration_sec, draft_dir, logger)
+
+        print(f"Inserted {len(cues)} images into draft: {args.new}\nLocation: {args.draft_root}/{args.new}")
+
+        # ========================================
+        # 🔧 CRITICAL FIX: Set render_timerange for image segments
+        # ========================================
+        # pyJianYingDraft doesn't set render_timerange correctly, causing images not to display
+        logger.info("🖼️  Fixing render_timerange for image segments...")
+        if fix_image_track_render_timerange(draft_dir):
+            logger.info("✅ Image render_timerange fixed")
+        else:
+            logger.warning("⚠️  render_timerange fix failed - images may not display")
+
+        # Purge template-carryover placeholder video materials to avoid CapCut "missing media" warnings.
+        _purge_unreferenced_placeholder_video_materials(draft_dir, logger=logger)
+
+        # ========================================
+        # 🔧 CRITICAL: Sync draft_info.json with draft_content.json
+        # ========================================
+        # pyJianYingDraft 0.2.3 only updates draft_content.json
+        # CapCut requires BOTH files to be in sync to recognize tracks/materials
+        logger.info("🔄 Syncing draft_info.json with draft_content.json...")
+        if sync_draft_info_with_content(draft_dir):
+            logger.info("✅ Draft files synchronized - CapCut will now recognize all changes")
+        else:
+            logger.warning("⚠️  Draft sync failed - manual sync may be required")
+            logger.warning(f"   Run: PYTHONPATH=\".:packages\" python3 -m video_pipeline.tools.sync_draft_files_complete '{draft_dir}'")
 
-                logger.info("🎯 帯ポストプロセッシング開始")
+        # Ensure absolute_index is populated so CapCut shows inserted tracks
+        ensure_absolute_indices(draft_dir)
 
-                # ステップ1: 帯レイヤーを上書き・最上位に移動
-                logger.info("📝 帯レイヤーを上書き・最上位に移動...")
-                apply_belt_config(
-                    belt_data,
-                    args.opening_offset,
-                    draft_dir,
-                    logger,
-                    title=args.title,
-                    layout_config=layout_cfg,
-                    channel_id=preset.channel_id if preset else None,
-                )
+        # ========================================
+        # 🎯 帯ポストプロセッシング（チャンネル共通）
+        #    CH01固定のスタイルは排除し、belt_config + layout_configのみで適用
+        # ========================================
+        # NOTE: layout_cfg is also used by the final subtitle-style normalization step.
+        # It must be defined even when --belt-config is not provided.
+        layout_cfg = preset.config_model.layout if preset and preset.config_model else None
 
-                # ステップ2: エフェクトのエンド位置調整
-                logger.info("✨ エフェクト終了位置を調整...")
-                # Do not trust belt_config.total_duration here; it can be stale after retiming.
-                # Use the cues-derived schedule end (already includes opening_offset).
-                try:
-                    total_end_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
-                    total_duration_sec = float(total_end_us) / 1_000_000.0
-                except Exception:
-                    total_duration_sec = 0.0
-                adjust_effect_duration(None, total_duration_sec, draft_dir, logger)
-
-                # 再度同期（ポストプロセッシング後）
-                logger.info("🔄 ポストプロセッシング後の同期...")
-                # CH01など冒頭ブランクを確実に反映（テンプレ由来トラックをシフト）
-                if opening_offset_us > 0:
-                    _shift_tracks_in_json(draft_dir, opening_offset_us)
-                
-                # 字幕スタイルは最終段で CapCut デフォルト（黒背景）に統一する。
-                # ここでは adapter-based の直接修正は行わない（ブレと警告の温床になる）。
+        if belt_enabled and args.belt_config:
+            try:
+                import json as _json
+                belt_config_path = Path(args.belt_config)
+                if belt_config_path.exists():
+                    belt_data = _json.loads(belt_config_path.read_text(encoding='utf-8'))
+
+                    logger.info("🎯 帯ポストプロセッシング開始")
+
+                    # ステップ1: 帯レイヤーを上書き・最上位に移動
+                    logger.info("📝 帯レイヤーを上書き・最上位に移動...")
+                    apply_belt_config(
+                        belt_data,
+                        args.opening_offset,
+                        draft_dir,
+                        logger,
+                        title=args.title,
+                        layout_config=layout_cfg,
+                        channel_id=preset.channel_id if preset else None,
+                    )
 
-                if sync_draft_info_with_content(draft_dir):
-                    logger.info("✅ ドラフト作成完了 (帯/字幕反映)")
-                else:
-                    logger.warning("⚠️  同期失敗")
+                    # ステップ2: エフェクトのエンド位置調整
+                    logger.info("✨ エフェクト終了位置を調整...")
+                    # Do not trust belt_config.total_duration here; it can be stale after retiming.
+                    # Use the cues-derived schedule end (already includes opening_offset).
+                    try:
+                        total_end_us = max((int(s) + int(d) for (s, d) in schedule), default=0)
+                        total_duration_sec = float(total_end_us) / 1_000_000.0
+                    except Exception:
+                        total_duration_sec = 0.0
+                    adjust_effect_duration(None, total_duration_sec, draft_dir, logger)
+
+                    # 再度同期（ポストプロセッシング後）
+                    logger.info("🔄 ポストプロセッシング後の同期...")
+                    # CH01など冒頭ブランクを確実に反映（テンプレ由来トラックをシフト）
+                    if opening_offset_us > 0:
+                        _shift_tracks_in_json(draft_dir, opening_offset_us)
+                
+                    # 字幕スタイルは最終段で CapCut デフォルト（黒背景）に統一する。
+                    # ここでは adapter-based の直接修正は行わない（ブレと警告の温床になる）。
 
-            else:
-                logger.warning(f"Belt config file not found: {belt_config_path}")
-        except Exception as e:
-            logger.error(f"Belt layer processing failed: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+                    if sync_draft_info_with_content(draft_dir):
+                        logger.info("✅ ドラフト作成完了 (帯/字幕反映)")
+                    else:
+                        logger.warning("⚠️  同期失敗")
 
-    # 最終チェック: 開始オフセット違反を検出（BGM・背景トラックのみ除外）
-    _validate_opening_offset(draft_dir, opening_offset_us, logger)
+                else:
+                    logger.warning(f"Belt config file not found: {belt_config_path}")
+            except Exception as e:
+                logger.error(f"Belt layer processing failed: {e}")
+                import traceback
+                logger.debug(traceback.format_exc())
 
-    # 強制的にスケールを反映（pyJianYingDraftがリセットする場合のガード）
-    _force_video_scale(draft_dir, float(args.scale))
-    sync_draft_info_with_content(draft_dir)
+        # 最終チェック: 開始オフセット違反を検出（BGM・背景トラックのみ除外）
+        _validate_opening_offset(draft_dir, opening_offset_us, logger)
 
-    # Ensure draft_info has name/id for CapCut discoverability
-    try:
-        import uuid
-        info_path = draft_dir / "draft_info.json"
-        if info_path.exists():
-            info_data = json.loads(info_path.read_text(encoding="utf-8"))
-            if not info_data.get("draft_name"):
-                info_data["draft_name"] = args.new
-            if not info_data.get("draft_id"):
-                info_data["draft_id"] = str(uuid.uuid4()).upper()
-            info_path.write_text(json.dumps(info_data, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        logger.warning("Could not update draft_info.json with name/id")
+        # 強制的にスケールを反映（pyJianYingDraftがリセットする場合のガード）
+        _force_video_scale(draft_dir, float(args.scale))
+        sync_draft_info_with_content(draft_dir)
 
-    # FINAL POSTPROCESS:
-    # - Enforce CapCut default subtitle style (black background) across channels.
-    # - Restore template belt styling only for CH02 (some styling lives only in draft_info.json).
-    # Must run AFTER all sync/post-processing so it won't be wiped.
-    try:
-        _apply_common_subtitle_style(draft_dir, adapter=adapter, layout_config=layout_cfg)
-        logger.info("✅ Subtitle style normalized (CapCut default: black background)")
-    except Exception as exc:
-        logger.error(f"❌ Subtitle style normalization failed: {exc}")
-        sys.exit(1)
+        # Ensure draft_info has name/id for CapCut discoverability
+        try:
+            import uuid
+            info_path = draft_dir / "draft_info.json"
+            if info_path.exists():
+                info_data = read_draft_json(info_path)
+                if not info_data.get("draft_name"):
+                    info_data["draft_name"] = args.new
+                if not info_data.get("draft_id"):
+                    info_data["draft_id"] = str(uuid.uuid4()).upper()
+                write_draft_json(info_path, info_data)
+        except Exception:
+            logger.warning("Could not update draft_info.json with name/id")
 
-    if channel_id == "CH02":
+        # FINAL POSTPROCESS:
+        # - Enforce CapCut default subtitle style (black background) across channels.
+        # - Restore template belt styling only for CH02 (some styling lives only in draft_info.json).
+        # Must run AFTER all sync/post-processing so it won't be wiped.
         try:
-            _restore_template_belt_design(draft_dir, template_dir=Path(args.draft_root) / template_name)
-            logger.info("✅ CH02 belt design restored from template")
+            _apply_common_subtitle_style(draft_dir, adapter=adapter, layout_config=layout_cfg)
+            logger.info("✅ Subtitle style normalized (CapCut default: black background)")
         except Exception as exc:
-            logger.error(f"❌ CH02 belt design restore failed: {exc}")
+            logger.error(f"❌ Subtitle style normalization failed: {exc}")
             sys.exit(1)
 
-    # CapCut may still show "missing media" if draft_meta_info.json retains stale
-    # references copied from the template. Sanitize it after all other sync steps.
-    try:
-        _sanitize_draft_meta_info(draft_dir, logger)
-    except Exception as exc:
-        logger.warning("draft_meta_info.json sanitize failed (ignored): %s", exc)
+        if channel_id == "CH02":
+            try:
+                _restore_template_belt_design(draft_dir, template_dir=Path(args.draft_root) / template_name)
+                logger.info("✅ CH02 belt design restored from template")
+            except Exception as exc:
+                logger.error(f"❌ CH02 belt design restore failed: {exc}")
+                sys.exit(1)
 
-    # CapCut may still show red "missing media" icons if draft_info.json keeps
-    # template placeholder paths in materials.* (even when draft_content.json is correct).
-    # Repair those paths from draft_content.json before post-flight validation.
-    try:
-        _repair_draft_info_material_paths_from_content(draft_dir, logger)
-    except Exception as exc:
-        logger.warning("draft_info.json material path repair failed (ignored): %s", exc)
+        # CapCut may still show "missing media" if draft_meta_info.json retains stale
+        # references copied from the template. Sanitize it after all other sync steps.
+        try:
+            _sanitize_draft_meta_info(draft_dir, logger)
+        except Exception as exc:
+            logger.warning("draft_meta_info.json sanitize failed (ignored): %s", exc)
 
-    # Post-flight validation: fail hard if template placeholders leaked into the draft.
-    try:
-        allow_generic_tracks = set(keep_generic_text_tracks)
-        if args.inject_into_main and insert_video_track_name:
-            # Allow writing into generic template tracks like `video_1` when explicitly requested.
-            allow_generic_tracks.add(insert_video_track_name)
-        if args.inject_into_main and template_background_video_track_name:
-            allow_generic_tracks.add(template_background_video_track_name)
-        _post_flight_validate_draft(
-            draft_dir,
-            expect_srt2images_track=not bool(getattr(args, "inject_into_main", False)),
-            expect_voice=bool(getattr(args, "voice_file", None)),
-            expect_subtitles=bool(getattr(args, "srt_file", None)),
-            allow_generic_tracks=allow_generic_tracks,
-            logger=logger,
-        )
-    except Exception as exc:
-        logger.error(f"❌ Post-flight validation failed: {exc}")
-        sys.exit(1)
+        # CapCut may still show red "missing media" icons if draft_info.json keeps
+        # template placeholder paths in materials.* (even when draft_content.json is correct).
+        # Repair those paths from draft_content.json before post-flight validation.
+        try:
+            _repair_draft_info_material_paths_from_content(draft_dir, logger)
+        except Exception as exc:
+            logger.warning("draft_info.json material path repair failed (ignored): %s", exc)
+
+        # Post-flight validation: fail hard if template placeholders leaked into the draft.
+        try:
+            allow_generic_tracks = set(keep_generic_text_tracks)
+            if args.inject_into_main and insert_video_track_name:
+                # Allow writing into generic template tracks like `video_1` when explicitly requested.
+                allow_generic_tracks.add(insert_video_track_name)
+            if args.inject_into_main and template_background_video_track_name:
+                allow_generic_tracks.add(template_background_video_track_name)
+            _post_flight_validate_draft(
+                draft_dir,
+                expect_srt2images_track=not bool(getattr(args, "inject_into_main", False)),
+                expect_voice=bool(getattr(args, "voice_file", None)),
+                expect_subtitles=bool(getattr(args, "srt_file", None)),
+                allow_generic_tracks=allow_generic_tracks,
+                logger=logger,
+            )
+        except Exception as exc:
+            logger.error(f"❌ Post-flight validation failed: {exc}")
+            sys.exit(1)
+    _mark_phase("postprocess")
 
     # Update root_meta_info.json so CapCut UI can list the draft.
     #
@@ -5445,6 +5478,7 @@ def main():
         (run_dir / 'capcut_draft_info.json').write_text(_json.dumps(info, ensure_ascii=False, indent=2), encoding='utf-8')
     except Exception as e:
         print(f"Note: Could not create output symlink/info: {e}")
+    _mark_phase("finalize")
 
 
 if __name__ == "__main__":
@@ -15,6 +15,10 @@ Workflow:
 1) submit: build JSONL requests from run_dir/image_cues.json -> upload -> create batch job -> write manifest JSON.
 2) fetch: poll job -> download results -> decode inline images -> write run_dir/images/####.png (with backups).
 
+Requests already fulfilled for any run (same batch model + prompt + target size) are served from the
+content-addressed image store at submit time and are not sent to the batch job
+(see video_pipeline/src/srt2images/image_store.py; disable with SRT2IMAGES_IMAGE_STORE=0).
+
 Notes:
 - Batch uses `generateContent` (e.g., model=gemini-2.5-flash-image). Imagen models use `generate_images`
   and are not currently batchable via this interface.
@@ -56,6 +60,7 @@ except Exception as exc:  # pragma: no cover
 from factory_common.artifacts.utils import utc_now_iso  # noqa: E402
 from factory_common.paths import repo_root, video_runs_root, workspace_root  # noqa: E402
 from video_pipeline.src.config.channel_resolver import ChannelPresetResolver  # noqa: E402
+from video_pipeline.src.srt2images import image_store  # noqa: E402
 from video_pipeline.src.srt2images.prompt_builder import build_prompt_for_image_model  # noqa: E402
 
 
@@ -220,16 +225,27 @@ def _build_summary_for_prompt(*, cue: Dict[str, Any], extra_suffix: str) -> str:
     return " \n".join([p for p in parts if p.strip()])
 
 
-def _size_str(payload: Dict[str, Any]) -> str:
+def _target_size(payload: Dict[str, Any]) -> Tuple[int, int]:
     size = payload.get("size") or {}
     try:
         w = int((size or {}).get("width") or 1920)
         h = int((size or {}).get("height") or 1080)
     except Exception:
         w, h = 1920, 1080
+    return w, h
+
+
+def _size_str(payload: Dict[str, Any]) -> str:
+    w, h = _target_size(payload)
     return f"{w}x{h}"
 
 
+def _store_fingerprint(*, model: str, prompt: str, payload: Dict[str, Any]) -> str:
+    # Batch requests are prompt-only (no reference images / seed); outputs are resized to the run target.
+    w, h = _target_size(payload)
+    return image_store.request_fingerprint(model=f"gemini-batch:{model}", prompt=prompt, width=w, height=h)
+
+
 def _prompt_from_cue(
     *,
     channel: str,
@@ -343,6 +359,7 @@ class ManifestItem:
     cue_index: int
     output_path: str
     prompt_sha256: str
+    fingerprint: str = ""
 
 
 def _load_manifest_items(manifest: Dict[str, Any]) -> List[ManifestItem]:
@@ -360,6 +377,7 @@ def _load_manifest_items(manifest: Dict[str, Any]) -> List[ManifestItem]:
                 cue_index=int(item.get("cue_index") or 0),
                 output_path=str(item.get("output_path") or ""),
                 prompt_sha256=str(item.get("prompt_sha256") or ""),
+                fingerprint=str(item.get("fingerprint") or ""),
             )
         )
     return [x for x in out if x.id and x.run_dir and x.output_path and x.cue_index > 0]
@@ -376,7 +394,7 @@ def submit_job(
     model: str,
     prompt_model_key: Optional[str],
     out_dir: Path,
-) -> Path:
+) -> Optional[Path]:
     api_key = _resolve_api_key()
     client = genai.Client(api_key=api_key)
 
@@ -396,6 +414,7 @@ def submit_job(
 
     items: List[ManifestItem] = []
     lines: List[str] = []
+    store_hits = 0
     for run_dir in resolved_runs:
         cues_path = run_dir / "image_cues.json"
         if not cues_path.exists():
@@ -452,6 +471,14 @@ def submit_job(
                 prompt_model_key=prompt_model_key,
             )
             prompt_hash = _sha256(prompt)
+            fingerprint = (
+                _store_fingerprint(model=model, prompt=prompt, payload=payload) if image_store.store_enabled() else ""
+            )
+            if fingerprint and image_store.lookup(fingerprint) is not None:
+                _backup_paths([out_path], backup_root=out_path.parent)
+                if image_store.materialize(fingerprint, out_path):
+                    store_hits += 1
+                    continue
 
             req_id = f"{run_dir.name}#{idx:04d}"
             line = {
@@ -475,10 +502,16 @@ def submit_job(
                     cue_index=int(idx),
                     output_path=str(out_path),
                     prompt_sha256=prompt_hash,
+                    fingerprint=fingerprint,
                 )
             )
 
+    if store_hits:
+        print(f"[STORE] served_from_image_store={store_hits} (not submitted)")
     if not items:
+        if store_hits:
+            print("✅ all selected images were served from the image store; no batch job submitted")
+            return None
         raise SystemExit("No batch items selected (check --videos/--run and filters)")
 
     input_jsonl.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -514,6 +547,7 @@ def submit_job(
                     "cue_index": it.cue_index,
                     "output_path": it.output_path,
                     "prompt_sha256": it.prompt_sha256,
+                    "fingerprint": it.fingerprint,
                 }
                 for it in items
             ],
@@ -606,6 +640,7 @@ def fetch_job(*, manifest_path: Path, write_images: bool, backup_existing: bool)
         out_path = Path(it.output_path)
         out_path.parent.mkdir(parents=True, exist_ok=True)
         _maybe_backup(out_path, run_dir_str=it.run_dir)
+        image_store.detach(out_path)
         target_w, target_h = _get_target_size(it.run_dir)
 
         # Write as a 16:9 (or run_dir-specified) PNG to keep downstream (CapCut) consistent.
@@ -643,9 +678,10 @@ def fetch_job(*, manifest_path: Path, write_images: bool, backup_existing: bool)
                     out = out.resize((target_w, target_h), Image.LANCZOS)
 
                 out.save(out_path, format="PNG")
-                return
         except Exception as exc:
             raise RuntimeError(f"resize_to_target_failed: {exc}") from exc
+        if it.fingerprint:
+            image_store.put(it.fingerprint, out_path, model=f"gemini-batch:{manifest.get('model') or ''}")
 
     errors: List[str] = []
     decoded_images = 0
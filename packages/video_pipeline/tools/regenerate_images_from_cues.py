@@ -9,6 +9,8 @@ Why this exists:
   (model selection is controlled by routing; call-time overrides are guarded under lockdown).
 
 No text LLM calls are made here. It only uses the image generation API.
+Identical requests already generated for any run are reused from the content-addressed image store
+(hardlinked into images/); pass --no-image-store to force fresh API generations.
 """
 
 from __future__ import annotations
@@ -572,6 +574,11 @@ def main() -> None:
         action="store_true",
         help="Regenerate images even if images/*.png already exists (non-destructive; keeps existing files until overwritten).",
     )
+    ap.add_argument(
+        "--no-image-store",
+        action="store_true",
+        help="Do not reuse/record images in the shared content-addressed image store (always call the API).",
+    )
     ap.add_argument("--max", type=int, default=0, help="Limit number of cues/images to generate (0 = all)")
     ap.add_argument(
         "--only-missing",
@@ -632,6 +639,8 @@ def main() -> None:
         help="Comma-separated props to treat as text/number-prone when --forbid-text is enabled.",
     )
     args = ap.parse_args()
+    if args.no_image_store:
+        os.environ["SRT2IMAGES_IMAGE_STORE"] = "0"
 
     run_dir = Path(args.run).resolve()
     cues_path = run_dir / "image_cues.json"
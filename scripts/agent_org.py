@@ -19,6 +19,7 @@ from _bootstrap import bootstrap
 
 PROJECT_ROOT = bootstrap(load_env=False)
 
+from factory_common import segmented_log
 from factory_common.agent_mode import get_queue_dir
 
 SCHEMA_VERSION = 1
@@ -321,15 +322,6 @@ def _locked_update_json(path: Path, update_fn) -> dict:
         return nxt
 
 
-def _append_jsonl(path: Path, payload: dict) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
-    except Exception:
-        return
-
-
 def _coord_dir(q: Path) -> Path:
     return q / "coordination"
 
@@ -339,7 +331,10 @@ def _events_path(q: Path) -> Path:
 
 
 def _append_event(q: Path, payload: dict) -> None:
-    _append_jsonl(_events_path(q), payload)
+    try:
+        segmented_log.append_jsonl(_events_path(q), payload)
+    except Exception:
+        return
 
 
 def _memos_dir(q: Path) -> Path:
@@ -12,8 +12,18 @@ try:
 except Exception:
     DEFAULT_LOG_PATH = "workspaces/logs/llm_usage.jsonl"
 
+try:
+    from factory_common import llm_usage_index, segmented_log
+except Exception:
+    llm_usage_index = None
+    segmented_log = None
+
 
 def load_logs(path: Path):
+    if segmented_log is not None and (path.exists() or segmented_log.segments(path)):
+        # Rotated segments first (oldest -> newest), then the active file.
+        yield from segmented_log.iter_records(path)
+        return
     if not path.exists():
         raise FileNotFoundError(f"Log file not found: {path}")
     for line in path.read_text(encoding="utf-8").splitlines():
@@ -26,22 +36,13 @@ def load_logs(path: Path):
             continue
 
 
-def main():
-    ap = argparse.ArgumentParser(description="Aggregate llm_usage.jsonl")
-    ap.add_argument("--log", default=DEFAULT_LOG_PATH, help="Path to llm_usage.jsonl")
-    ap.add_argument("--top", type=int, default=10, help="Top N models/tasks to show")
-    args = ap.parse_args()
-
-    path = Path(args.log)
+def scan_stats(path: Path):
     records = list(load_logs(path))
-    if not records:
-        print("No records found")
-        return 0
-
     model_cnt = Counter()
     task_cnt = Counter()
     fail_cnt = Counter()
     latency = defaultdict(list)
+    chain_cnt = Counter()
 
     for r in records:
         status = r.get("status")
@@ -54,13 +55,57 @@ def main():
                 latency[model].append(r["latency_ms"])
         else:
             fail_cnt[task] += 1
+        chain = r.get("chain")
+        if chain:
+            chain_cnt[tuple(chain)] += 1
 
     def avg(xs):
         return sum(xs) / len(xs) if xs else 0
 
+    return {
+        "records": len(records),
+        "models": [(m, c, avg(latency[m])) for m, c in model_cnt.items()],
+        "tasks": task_cnt,
+        "failures": fail_cnt,
+        "chains": chain_cnt,
+    }
+
+
+def indexed_stats(path: Path):
+    """Same counters from the incremental usage index (None -> scan the JSONL; LLM_USAGE_INDEX_DISABLE=1)."""
+    if llm_usage_index is None or not llm_usage_index.index_enabled():
+        return None
+    if not (path.exists() or segmented_log.segments(path)):
+        return None
+    try:
+        llm_usage_index.ingest(path)
+        return llm_usage_index.call_stats(path)
+    except Exception:
+        return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Aggregate llm_usage.jsonl")
+    ap.add_argument("--log", default=DEFAULT_LOG_PATH, help="Path to llm_usage.jsonl")
+    ap.add_argument("--top", type=int, default=10, help="Top N models/tasks to show")
+    args = ap.parse_args()
+
+    path = Path(args.log)
+    stats = indexed_stats(path)
+    if stats is None:
+        stats = scan_stats(path)
+    if not stats["records"]:
+        print("No records found")
+        return 0
+    model_cnt = Counter({m: c for m, c, _ in stats["models"]})
+    model_latency = {m: lat for m, _, lat in stats["models"]}
+    task_cnt = stats["tasks"]
+    fail_cnt = stats["failures"]
+    chain_cnt = stats["chains"]
+
     print("=== Top models by success count ===")
     for m, c in model_cnt.most_common(args.top):
-        print(f"{m:30s} {c:6d} avg_latency={avg(latency[m]):.1f}ms")
+        print(f"{m:30s} {c:6d} avg_latency={model_latency[m]:.1f}ms")
 
     print("\n=== Top tasks by success count ===")
     for t, c in task_cnt.most_common(args.top):
@@ -71,11 +116,6 @@ def main():
         print(f"{t:30s} {c:6d}")
 
     # Fallback chain stats
-    chain_cnt = Counter()
-    for r in records:
-        chain = r.get("chain")
-        if chain:
-            chain_cnt[tuple(chain)] += 1
     print("\n=== Top fallback chains ===")
     for ch, c in chain_cnt.most_common(args.top):
         print(f"{list(ch)} -> {c}")
@@ -4,6 +4,7 @@ batch_regenerate_tts — UI BatchTTS 用のバックグラウンド実行スク
 
 役割:
 - 指定チャンネルの video を列挙し、`python -m script_pipeline.cli audio` を順番に実行
+  （`--parallel N` で N 本同時実行。routing.json の VOICEVOX engine 群へ分散）
 - 進捗 JSON とログを更新（UI がポーリングして表示）
 - `--prepass` で「読み解決のみ（wav生成なし）」を高速に回せる（アノテーション除去/辞書適用の確認用）
 
@@ -19,7 +20,9 @@ import json
 import os
 import subprocess
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -49,6 +52,15 @@ def _append_log(log_path: Path, text: str) -> None:
             f.write("\n")
 
 
+def _voicevox_engine_urls() -> List[str]:
+    try:
+        from audio_tts.tts.routing import load_routing_config
+
+        return list(load_routing_config().voicevox_urls)
+    except Exception:
+        return []
+
+
 def _discover_channels(data_root: Path) -> List[str]:
     channels: List[str] = []
     if not data_root.exists():
@@ -152,6 +164,12 @@ def main() -> int:
     )
     ap.add_argument("--min-video", type=int, default=None, help="Only process videos >= N (numeric).")
     ap.add_argument("--max-video", type=int, default=None, help="Only process videos <= N (numeric).")
+    ap.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Run N episodes concurrently (default: 1). Jobs are spread across VOICEVOX engines from routing.json.",
+    )
     args = ap.parse_args()
 
     data_root = repo_paths.script_data_root()
@@ -195,54 +213,75 @@ def main() -> int:
 
     _append_log(
         log_path,
-        f"[batch_regenerate_tts] start {_now_iso()} channels={channels} excluded={sorted(excluded)} total={len(targets)} prepass={bool(args.prepass)} skip_tts_reading={bool(args.skip_tts_reading)} only_missing_final={bool(args.only_missing_final)}",
+        f"[batch_regenerate_tts] start {_now_iso()} channels={channels} excluded={sorted(excluded)} total={len(targets)} prepass={bool(args.prepass)} skip_tts_reading={bool(args.skip_tts_reading)} only_missing_final={bool(args.only_missing_final)} parallel={int(args.parallel or 1)}",
     )
 
     try:
-        with log_path.open("a", encoding="utf-8") as log_fh:
-            for ch, video in targets:
+        parallel = max(1, int(args.parallel or 1))
+        engine_urls = _voicevox_engine_urls()
+        progress_lock = threading.Lock()
+        job_log_dir = log_path.parent / f"{log_path.stem}_jobs"
+
+        def _run_one(idx: int, ch: str, video: str, log_fh: Any) -> None:
+            with progress_lock:
                 progress["current_channel"] = ch
                 progress["current_video"] = video
                 progress["current_step"] = "audio_prepass" if args.prepass else "audio"
                 progress["updated_at"] = _now_iso()
                 _write_json(progress_path, progress)
 
+            env = os.environ.copy()
+            if args.skip_tts_reading:
+                env["SKIP_TTS_READING"] = "1"
+            # For prepass runs, retries mostly waste time (mismatch/fail-fast is deterministic).
+            # Allow override by explicitly setting YTM_AUDIO_RETRY_COUNT in the parent environment.
+            if args.prepass and "YTM_AUDIO_RETRY_COUNT" not in env:
+                env["YTM_AUDIO_RETRY_COUNT"] = "0"
+            if len(engine_urls) > 1:
+                # Rotate the engine list so concurrent jobs prefer different VOICEVOX engines.
+                k = idx % len(engine_urls)
+                env["VOICEVOX_URLS"] = ",".join(engine_urls[k:] + engine_urls[:k])
+            cmd = [
+                sys.executable,
+                "-m",
+                "script_pipeline.cli",
+                "audio",
+                "--channel",
+                ch,
+                "--video",
+                video,
+                *(["--resume"] if args.resume else []),
+                *(["--prepass"] if args.prepass else []),
+                *(["--allow-unvalidated"] if args.allow_unvalidated else []),
+                *(["--force-overwrite-final"] if args.force_overwrite_final else []),
+            ]
+
+            if parallel <= 1:
                 log_fh.write(f"\n=== [{_now_iso()}] START {ch}-{video} ===\n")
                 log_fh.flush()
-
-                env = os.environ.copy()
-                if args.skip_tts_reading:
-                    env["SKIP_TTS_READING"] = "1"
-                # For prepass runs, retries mostly waste time (mismatch/fail-fast is deterministic).
-                # Allow override by explicitly setting YTM_AUDIO_RETRY_COUNT in the parent environment.
-                if args.prepass and "YTM_AUDIO_RETRY_COUNT" not in env:
-                    env["YTM_AUDIO_RETRY_COUNT"] = "0"
                 rc = subprocess.run(
-                    [
-                        sys.executable,
-                        "-m",
-                        "script_pipeline.cli",
-                        "audio",
-                        "--channel",
-                        ch,
-                        "--video",
-                        video,
-                        *(["--resume"] if args.resume else []),
-                        *(["--prepass"] if args.prepass else []),
-                        *(["--allow-unvalidated"] if args.allow_unvalidated else []),
-                        *(["--force-overwrite-final"] if args.force_overwrite_final else []),
-                    ],
-                    cwd=str(repo_paths.repo_root()),
-                    env=env,
-                    stdout=log_fh,
-                    stderr=log_fh,
-                    check=False,
+                    cmd, cwd=str(repo_paths.repo_root()), env=env, stdout=log_fh, stderr=log_fh, check=False
                 ).returncode
-
-                rc = int(rc)
-                log_fh.write(f"=== [{_now_iso()}] END {ch}-{video} exit={rc} ===\n")
+                log_fh.write(f"=== [{_now_iso()}] END {ch}-{video} exit={int(rc)} ===\n")
                 log_fh.flush()
-
+            else:
+                # Concurrent jobs log to their own file; the block is appended to the main log on completion.
+                job_log_dir.mkdir(parents=True, exist_ok=True)
+                job_log = job_log_dir / f"{ch}-{video}.log"
+                started = _now_iso()
+                with job_log.open("w", encoding="utf-8") as job_fh:
+                    rc = subprocess.run(
+                        cmd, cwd=str(repo_paths.repo_root()), env=env, stdout=job_fh, stderr=job_fh, check=False
+                    ).returncode
+                with progress_lock:
+                    log_fh.write(f"\n=== [{started}] START {ch}-{video} ===\n")
+                    log_fh.write(job_log.read_text(encoding="utf-8", errors="replace"))
+                    log_fh.write(f"=== [{_now_iso()}] END {ch}-{video} exit={int(rc)} ===\n")
+                    log_fh.flush()
+                job_log.unlink(missing_ok=True)
+
+            rc = int(rc)
+            with progress_lock:
                 progress["completed"] += 1
                 ch_state = progress.get("channels", {}).get(ch) or {}
                 ch_state["completed"] = int(ch_state.get("completed", 0)) + 1
@@ -263,6 +302,16 @@ def main() -> int:
                 progress["updated_at"] = _now_iso()
                 _write_json(progress_path, progress)
 
+        with log_path.open("a", encoding="utf-8") as log_fh:
+            if parallel <= 1:
+                for idx, (ch, video) in enumerate(targets):
+                    _run_one(idx, ch, video, log_fh)
+            else:
+                with ThreadPoolExecutor(max_workers=parallel) as pool:
+                    futures = [pool.submit(_run_one, idx, ch, video, log_fh) for idx, (ch, video) in enumerate(targets)]
+                    for fut in futures:
+                        fut.result()
+
         progress["status"] = "completed"
         progress["current_channel"] = None
         progress["current_video"] = None
@@ -12,8 +12,17 @@ try:
 except Exception:
     DEFAULT_LOG_PATH = "workspaces/logs/image_usage.log"
 
+try:
+    from factory_common import segmented_log
+except Exception:
+    segmented_log = None
+
 
 def load(path: Path):
+    if segmented_log is not None and (path.exists() or segmented_log.segments(path)):
+        # Rotated segments first (oldest -> newest), then the active file.
+        yield from segmented_log.iter_records(path)
+        return
     if not path.exists():
         raise SystemExit(f"log not found: {path}")
     for line in path.read_text(encoding="utf-8").splitlines():
@@ -21,8 +21,16 @@ except Exception:
         "workspaces/logs/tts_llm_usage.log",
     ]
 
+try:
+    from factory_common import segmented_log
+except Exception:
+    segmented_log = None
+
 
 def load(path: Path) -> List[Dict[str, Any]]:
+    if segmented_log is not None and (path.exists() or segmented_log.segments(path)):
+        # Rotated segments first (oldest -> newest), then the active file.
+        return list(segmented_log.iter_records(path))
     if not path.exists():
         return []
     out = []
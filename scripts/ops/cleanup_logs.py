@@ -109,6 +109,9 @@ def _should_keep(path: Path) -> bool:
         return True
     if path.suffix == ".pid":
         return True
+    # rotated segments + manifest of segmented logs (factory_common/segmented_log.py) are L1 history
+    if any(part.endswith(".segments") for part in path.parts):
+        return True
     parts = set(path.parts)
     if parts & SKIP_DIRS:
         return True
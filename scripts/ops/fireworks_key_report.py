@@ -29,7 +29,7 @@ from _bootstrap import bootstrap
 
 bootstrap(load_env=False)
 
-from factory_common import fireworks_keys  # noqa: E402
+from factory_common import fireworks_keys, segmented_log  # noqa: E402
 from factory_common.paths import logs_root, workspace_root  # noqa: E402
 
 
@@ -65,19 +65,12 @@ def _load_state_map(pool: str) -> Dict[str, Dict[str, Any]]:
 
 
 def _iter_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    if not path.exists():
+    if not (path.exists() or segmented_log.segments(path)):
         return
-    with path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                yield obj
+    # Rotated segments first (oldest -> newest), then the active file.
+    for obj in segmented_log.iter_records(path):
+        if isinstance(obj, dict):
+            yield obj
 
 
 def _parse_memo(path: Path) -> List[MemoKeyEntry]:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Content-addressed image store maintenance (workspaces/video/_state/image_store).
+
+Subcommands:
+- stats    : hit/miss/write/stale/evicted counters + object totals (per model)
+- compact  : drop altered/missing objects -> evict LRU objects to the byte budget -> remove stray tmp files -> VACUUM
+
+Examples:
+  python3 scripts/ops/image_store.py stats
+  python3 scripts/ops/image_store.py compact --max-gb 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+
+from _bootstrap import bootstrap
+
+
+bootstrap(load_env=True)
+
+from video_pipeline.src.srt2images import image_store  # noqa: E402
+
+
+def _mb(n: int) -> float:
+    return round(int(n or 0) / (1024 * 1024), 2)
+
+
+def _print(obj: Any, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(obj, ensure_ascii=False, indent=2))
+        return
+    for k, v in obj.items():
+        print(f"{k}: {v}")
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    stats = image_store.store_stats()
+    if args.json:
+        _print(stats, True)
+        return 0
+    models = stats.pop("models", [])
+    stats["mb"] = _mb(stats.pop("bytes", 0))
+    stats["budget_mb"] = _mb(stats.pop("max_bytes", 0))
+    _print(stats, False)
+    print("")
+    for row in models:
+        print(f"{row['model']:<48} objects={row['objects']:<6} mb={_mb(row['bytes']):<8} hits={row['hits']}")
+    return 0
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    max_bytes = int(float(args.max_gb) * 1024 * 1024 * 1024) if args.max_gb is not None else None
+    _print(image_store.compact(max_bytes), args.json)
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--json", action="store_true", help="Emit JSON")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("stats", help="Counters + object totals").set_defaults(func=cmd_stats)
+
+    sp = sub.add_parser("compact", help="Drop altered objects + evict to budget + VACUUM")
+    sp.add_argument("--max-gb", type=float, help="Byte budget in GB (default: SRT2IMAGES_IMAGE_STORE_MAX_GB or 20)")
+    sp.set_defaults(func=cmd_compact)
+
+    args = ap.parse_args()
+    return int(args.func(args) or 0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
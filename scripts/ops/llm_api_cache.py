@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+LLM API cache maintenance (workspaces/logs/llm_api_cache).
+
+Subcommands:
+- stats    : index totals + per-task breakdown (entries/bytes/hits)
+- inspect  : list indexed entries (most recent / most hit / largest / oldest)
+- reindex  : (re)build the SQLite index from cache files (entries written before the index existed)
+- compact  : reindex -> evict LRU entries to the byte budget -> remove stray tmp files -> VACUUM
+
+Examples:
+  python3 scripts/ops/llm_api_cache.py stats
+  python3 scripts/ops/llm_api_cache.py inspect --task script_chapter_draft --order hits --limit 10
+  python3 scripts/ops/llm_api_cache.py compact --max-mb 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any, Dict
+
+from _bootstrap import bootstrap
+
+
+bootstrap(load_env=True)
+
+from factory_common import llm_api_cache  # noqa: E402
+
+
+def _mb(n: int) -> float:
+    return round(int(n or 0) / (1024 * 1024), 2)
+
+
+def _print(obj: Any, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(obj, ensure_ascii=False, indent=2))
+        return
+    if isinstance(obj, list):
+        for row in obj:
+            print("  ".join(f"{k}={v}" for k, v in row.items()))
+        return
+    for k, v in obj.items():
+        print(f"{k}: {v}")
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    stats = llm_api_cache.cache_stats()
+    report: Dict[str, Any] = {
+        "cache_dir": str(llm_api_cache.cache_dir()),
+        "index": str(llm_api_cache.index_path()),
+        "indexed_entries": stats.get("indexed_entries"),
+        "indexed_mb": _mb(stats.get("indexed_bytes") or 0),
+        "budget_mb": _mb(stats.get("max_bytes") or 0),
+    }
+    if args.json:
+        report["tasks"] = llm_api_cache.task_summary()
+        _print(report, True)
+        return 0
+    _print(report, False)
+    print("")
+    for row in llm_api_cache.task_summary():
+        print(f"{row['task']:<40} entries={row['entries']:<6} mb={_mb(row['bytes']):<8} hits={row['hits']}")
+    return 0
+
+
+def cmd_inspect(args: argparse.Namespace) -> int:
+    _print(llm_api_cache.inspect_entries(task=args.task, order=args.order, limit=args.limit), args.json)
+    return 0
+
+
+def cmd_reindex(args: argparse.Namespace) -> int:
+    _print(llm_api_cache.reindex(), args.json)
+    return 0
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    max_bytes = int(args.max_mb) * 1024 * 1024 if args.max_mb is not None else None
+    _print(llm_api_cache.compact(max_bytes), args.json)
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--json", action="store_true", help="Emit JSON")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("stats", help="Index totals + per-task breakdown").set_defaults(func=cmd_stats)
+
+    sp = sub.add_parser("inspect", help="List indexed entries")
+    sp.add_argument("--task", help="Filter by task")
+    sp.add_argument("--order", choices=["last_access", "hits", "bytes", "oldest"], default="last_access")
+    sp.add_argument("--limit", type=int, default=20)
+    sp.set_defaults(func=cmd_inspect)
+
+    sub.add_parser("reindex", help="Rebuild the index from cache files").set_defaults(func=cmd_reindex)
+
+    sp = sub.add_parser("compact", help="Evict to budget + VACUUM")
+    sp.add_argument("--max-mb", type=int, help="Byte budget in MB (default: LLM_API_CACHE_MAX_MB or 2048)")
+    sp.set_defaults(func=cmd_compact)
+
+    args = ap.parse_args()
+    return int(args.func(args) or 0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+LLM usage index maintenance (workspaces/logs/llm_usage_index.sqlite3).
+
+Subcommands:
+- ingest   : tail llm_usage.jsonl into the index (--follow keeps tailing)
+- stats    : indexed records / calls / rollup rows per log
+- rebuild  : drop the index rows of a log and re-ingest it from byte 0
+
+Examples:
+  python3 scripts/ops/llm_usage_index.py ingest
+  python3 scripts/ops/llm_usage_index.py ingest --follow --interval 5
+  python3 scripts/ops/llm_usage_index.py rebuild --log workspaces/logs/llm_usage.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from _bootstrap import bootstrap
+
+
+bootstrap(load_env=True)
+
+from factory_common import llm_usage_index  # noqa: E402
+from factory_common.paths import logs_root  # noqa: E402
+
+
+def _default_log_path() -> Path:
+    env = str(os.getenv("LLM_ROUTER_LOG_PATH") or os.getenv("LLM_USAGE_LOG_PATH") or "").strip()
+    if env:
+        return Path(env)
+    return logs_root() / "llm_usage.jsonl"
+
+
+def _log_path(args: argparse.Namespace) -> Path:
+    return Path(args.log) if args.log else _default_log_path()
+
+
+def _print(obj: Any, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(obj, ensure_ascii=False, indent=2))
+        return
+    for k, v in obj.items():
+        print(f"{k}: {v}")
+
+
+def cmd_ingest(args: argparse.Namespace) -> int:
+    log_path = _log_path(args)
+    while True:
+        started = time.monotonic()
+        res = llm_usage_index.ingest(log_path)
+        res["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        if not args.follow or res["ingested"] or res["reset"]:
+            _print(res, args.json)
+        if not args.follow:
+            return 0
+        time.sleep(max(0.5, float(args.interval)))
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    log_path = _log_path(args)
+    llm_usage_index.ingest(log_path)
+    _print(llm_usage_index.index_stats(log_path), args.json)
+    return 0
+
+
+def cmd_rebuild(args: argparse.Namespace) -> int:
+    log_path = _log_path(args)
+    llm_usage_index.drop_log(log_path)
+    _print(llm_usage_index.ingest(log_path), args.json)
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--json", action="store_true", help="Emit JSON")
+    ap.add_argument("--log", default="", help="llm_usage.jsonl path (default: env LLM_ROUTER_LOG_PATH or workspaces/logs/llm_usage.jsonl)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sp = sub.add_parser("ingest", help="Tail new log lines into the index")
+    sp.add_argument("--follow", action="store_true", help="Keep tailing (Ctrl-C to stop)")
+    sp.add_argument("--interval", type=float, default=5.0, help="Seconds between polls with --follow")
+    sp.set_defaults(func=cmd_ingest)
+
+    sub.add_parser("stats", help="Indexed totals").set_defaults(func=cmd_stats)
+    sub.add_parser("rebuild", help="Re-ingest the log from scratch").set_defaults(func=cmd_rebuild)
+
+    args = ap.parse_args()
+    try:
+        return int(args.func(args) or 0)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from factory_common import llm_usage_index, segmented_log
 from factory_common.paths import logs_root
 
 
@@ -42,20 +43,17 @@ def _default_log_path() -> Path:
     return logs_root() / "llm_usage.jsonl"
 
 
+def _log_exists(path: Path) -> bool:
+    return path.exists() or bool(segmented_log.segments(path))
+
+
 def _iter_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    if not path.exists():
+    if not _log_exists(path):
         raise SystemExit(f"llm usage log not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                yield obj
+    # Rotated segments first (oldest -> newest), then the active file.
+    for obj in segmented_log.iter_records(path):
+        if isinstance(obj, dict):
+            yield obj
 
 
 @dataclass(frozen=True)
@@ -83,6 +81,62 @@ class UsageAgg:
             total_tokens=self.total_tokens + tt,
         )
 
+    def merge(self, other: "UsageAgg") -> "UsageAgg":
+        return UsageAgg(
+            calls=self.calls + other.calls,
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+            total_tokens=self.total_tokens + other.total_tokens,
+        )
+
+
+# (task, provider, model, is_cache_hit, usage)
+_UsageRow = Tuple[str, str, str, bool, UsageAgg]
+
+
+def _scan_usage_rows(log_path: Path, rk: str, task_prefix: str) -> Iterable[_UsageRow]:
+    for row in _iter_jsonl(log_path):
+        if str(row.get("status") or "").strip().lower() != "success":
+            continue
+        if str(row.get("routing_key") or "").strip() != rk:
+            continue
+        task = str(row.get("task") or "").strip() or "(unknown_task)"
+        if task_prefix and not task.startswith(task_prefix):
+            continue
+        usage = row.get("usage") if isinstance(row, dict) else None
+        model = str(row.get("model") or "").strip() or "(unknown_model)"
+        provider = str(row.get("provider") or "").strip() or "(unknown_provider)"
+
+        cache_obj = row.get("cache") if isinstance(row, dict) else None
+        is_cache_hit = isinstance(cache_obj, dict) and bool(cache_obj.get("hit"))
+        yield (task, provider, model, is_cache_hit, UsageAgg().add(usage))
+
+
+def _indexed_usage_rows(log_path: Path, rk: str, task_prefix: str) -> Optional[List[_UsageRow]]:
+    """Pre-grouped rows from the usage index (None -> scan the JSONL; LLM_USAGE_INDEX_DISABLE=1)."""
+    if not llm_usage_index.index_enabled() or not _log_exists(log_path):
+        return None
+    try:
+        llm_usage_index.ingest(log_path)
+        groups = llm_usage_index.routing_key_usage(log_path, rk, task_prefix=task_prefix)
+    except Exception:
+        return None
+    return [
+        (
+            g["task"],
+            g["provider"],
+            g["model"],
+            g["cache_hit"],
+            UsageAgg(
+                calls=g["calls"],
+                prompt_tokens=g["prompt_tokens"],
+                completion_tokens=g["completion_tokens"],
+                total_tokens=g["total_tokens"],
+            ),
+        )
+        for g in groups
+    ]
+
 
 def _pick_routing_key(args: argparse.Namespace) -> str:
     rk = str(args.routing_key or "").strip()
@@ -117,32 +171,19 @@ def main() -> int:
     matched_api = 0
     matched_cache = 0
 
-    for row in _iter_jsonl(log_path):
-        if str(row.get("status") or "").strip().lower() != "success":
-            continue
-        if str(row.get("routing_key") or "").strip() != rk:
-            continue
-        task = str(row.get("task") or "").strip() or "(unknown_task)"
-        if task_prefix and not task.startswith(task_prefix):
-            continue
-        usage = row.get("usage") if isinstance(row, dict) else None
-        model = str(row.get("model") or "").strip() or "(unknown_model)"
-        provider = str(row.get("provider") or "").strip() or "(unknown_provider)"
-
-        cache_obj = row.get("cache") if isinstance(row, dict) else None
-        is_cache_hit = isinstance(cache_obj, dict) and bool(cache_obj.get("hit"))
-
+    rows = _indexed_usage_rows(log_path, rk, task_prefix)
+    for task, provider, model, is_cache_hit, usage in rows if rows is not None else _scan_usage_rows(log_path, rk, task_prefix):
         if is_cache_hit:
-            total_cache = total_cache.add(usage)
-            by_task_cache[task] = by_task_cache.get(task, UsageAgg()).add(usage)
-            by_model_cache[(provider, model)] = by_model_cache.get((provider, model), UsageAgg()).add(usage)
-            matched_cache += 1
+            total_cache = total_cache.merge(usage)
+            by_task_cache[task] = by_task_cache.get(task, UsageAgg()).merge(usage)
+            by_model_cache[(provider, model)] = by_model_cache.get((provider, model), UsageAgg()).merge(usage)
+            matched_cache += usage.calls
             continue
 
-        total_api = total_api.add(usage)
-        by_task[task] = by_task.get(task, UsageAgg()).add(usage)
-        by_model[(provider, model)] = by_model.get((provider, model), UsageAgg()).add(usage)
-        matched_api += 1
+        total_api = total_api.merge(usage)
+        by_task[task] = by_task.get(task, UsageAgg()).merge(usage)
+        by_model[(provider, model)] = by_model.get((provider, model), UsageAgg()).merge(usage)
+        matched_api += usage.calls
 
     total_all = UsageAgg(
         calls=total_api.calls + total_cache.calls,
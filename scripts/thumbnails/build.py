@@ -51,9 +51,8 @@ from script_pipeline.thumbnails.tools.layer_specs_builder import (  # noqa: E402
     build_channel_thumbnails,
     iter_targets_from_layer_specs,
 )
-from script_pipeline.thumbnails.io_utils import PngOutputMode, save_png_atomic  # noqa: E402
-
-from PIL import Image, ImageDraw, ImageFont  # noqa: E402
+from script_pipeline.thumbnails.contactsheet import SheetTile, render_contactsheet  # noqa: E402
+from script_pipeline.thumbnails.io_utils import PngOutputMode  # noqa: E402
 
 
 SUPPORTED_PROJECT_STATUSES = {"draft", "in_progress", "review", "approved", "published", "archived"}
@@ -328,15 +327,6 @@ def _mark_projects_done(
         _write_projects(doc)
 
 
-def _pick_font() -> ImageFont.ImageFont:
-    for cand in ("/System/Library/Fonts/Helvetica.ttc", "/System/Library/Fonts/Supplemental/Arial Unicode.ttf"):
-        try:
-            return ImageFont.truetype(cand, 28)
-        except Exception:
-            continue
-    return ImageFont.load_default()
-
-
 def build_contactsheet(
     *,
     channel: str,
@@ -387,45 +377,14 @@ def build_contactsheet(
             rel_path = Path(image_rel.strip())
             selected_sources[vid] = rel_path if rel_path.is_absolute() else (assets_root / rel_path)
 
-    tile_w, tile_h = int(grid.tile_w), int(grid.tile_h)
-    cols = max(1, int(grid.cols))
-    rows = (len(vids) + cols - 1) // cols
-    pad = max(0, int(grid.pad))
-
-    W = cols * tile_w + (cols + 1) * pad
-    H = rows * tile_h + (rows + 1) * pad
-    canvas = Image.new("RGB", (W, H), (0, 0, 0))
-    draw = ImageDraw.Draw(canvas)
-    font = _pick_font()
-
+    tiles: List[SheetTile] = []
     missing_tiles: list[tuple[str, Optional[Path]]] = []
-
-    for i, vid in enumerate(vids):
-        r = i // cols
-        c = i % cols
-        x = pad + c * (tile_w + pad)
-        y = pad + r * (tile_h + pad)
+    for vid in vids:
         src = selected_sources.get(vid) if selected_sources is not None else (fpaths.thumbnail_assets_dir(ch, vid) / source_name)
         if not src or not src.exists():
-            if not allow_missing:
-                missing_tiles.append((vid, src))
-                continue
-            tile = Image.new("RGB", (tile_w, tile_h), (30, 30, 30))
-            canvas.paste(tile, (x, y))
-            draw.text((x + 10, y + 10), f"NEEDS_RESTORE {vid}", fill=(255, 80, 80), font=font)
-            continue
-        with Image.open(src) as im:
-            im = im.convert("RGB").resize((tile_w, tile_h), Image.LANCZOS)
-            canvas.paste(im, (x, y))
-
-        label = f"{vid}"
-        bbox = draw.textbbox((0, 0), label, font=font)
-        tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-        # Place the video label away from the typical "top-left title" area to avoid
-        # covering the thumbnail's own top text.
-        lx, ly = x + tile_w - 10 - tw, y + 10
-        draw.rectangle((lx - 6, ly - 4, lx + tw + 6, ly + th + 4), fill=(0, 0, 0))
-        draw.text((lx, ly), label, fill=(255, 255, 255), font=font)
+            missing_tiles.append((vid, src))
+            src = None
+        tiles.append(SheetTile(label=vid, path=src))
 
     if missing_tiles and not allow_missing:
         details = ", ".join([f"{ch}-{vid}" for vid, _ in missing_tiles[:30]])
@@ -434,8 +393,15 @@ def build_contactsheet(
             f"QC aborted: {len(missing_tiles)} thumbnails need restore before contactsheet can be generated: {details}{suffix}"
         )
 
-    save_png_atomic(canvas, out_path, mode=output_mode, verify=True)
-    return out_path
+    return render_contactsheet(
+        tiles,
+        out_path,
+        tile_w=int(grid.tile_w),
+        tile_h=int(grid.tile_h),
+        cols=int(grid.cols),
+        pad=int(grid.pad),
+        output_mode=output_mode,
+    )
 
 
 def _publish_qc_to_library(*, channel: str, qc_path: Path) -> Optional[Path]:
@@ -499,6 +465,8 @@ def _cmd_build(args: argparse.Namespace) -> int:
             export_flat=bool(args.export_flat),
             flat_name_suffix=str(args.flat_name_suffix),
             sleep_sec=float(args.sleep_sec),
+            workers=int(getattr(args, "workers", 1) or 1),
+            gen_workers=int(getattr(args, "gen_workers", 1) or 1),
             bg_brightness=float(args.bg_brightness),
             bg_contrast=float(args.bg_contrast),
             bg_color=float(args.bg_color),
@@ -731,6 +699,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     b.add_argument("--export-flat", action="store_true")
     b.add_argument("--flat-name-suffix", default="thumb")
     b.add_argument("--sleep-sec", type=float, default=0.25)
+    b.add_argument("--workers", type=int, default=1, help="Compose targets in N worker processes (default: 1 = serial)")
+    b.add_argument("--gen-workers", type=int, default=1, help="Concurrent background generations when --workers > 1")
     b.add_argument("--bg-brightness", type=float, default=1.0)
     b.add_argument("--bg-contrast", type=float, default=1.0)
     b.add_argument("--bg-color", type=float, default=1.0)
@@ -791,6 +761,8 @@ def main(argv: Optional[List[str]] = None) -> int:
     r.add_argument("--no-export-flat", action="store_false", dest="export_flat", default=True)
     r.add_argument("--flat-name-suffix", default="thumb")
     r.add_argument("--sleep-sec", type=float, default=0.25)
+    r.add_argument("--workers", type=int, default=1, help="Compose targets in N worker processes (default: 1 = serial)")
+    r.add_argument("--gen-workers", type=int, default=1, help="Concurrent background generations when --workers > 1")
     r.add_argument("--bg-brightness", type=float, default=1.0)
     r.add_argument("--bg-contrast", type=float, default=1.0)
     r.add_argument("--bg-color", type=float, default=1.0)
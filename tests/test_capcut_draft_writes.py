@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from video_pipeline.src.adapters.capcut import draft_writes as dw
+
+
+def _draft(tmp_path):
+    content = {
+        "duration": 5_000_000,
+        "tracks": [
+            {"id": "T1", "name": "srt2images_x", "type": "video", "segments": [{"id": "S1", "material_id": "M1"}]},
+            {"id": "T2", "name": "subtitles_text", "type": "text", "segments": [{"id": "S2", "material_id": "X1"}]},
+        ],
+        "materials": {"videos": [{"id": "M1", "path": "/a.png"}], "texts": [{"id": "X1", "content": "hi"}]},
+    }
+    (tmp_path / "draft_content.json").write_text(json.dumps(content, indent=2), encoding="utf-8")
+    (tmp_path / "draft_info.json").write_text(json.dumps({"tracks": []}, indent=2), encoding="utf-8")
+    return tmp_path
+
+
+def test_writes_deferred_until_block_exit(tmp_path, monkeypatch):
+    monkeypatch.delenv("CAPCUT_DRAFT_WRITE_COALESCE_DISABLE", raising=False)
+    draft_dir = _draft(tmp_path)
+    content_path = draft_dir / "draft_content.json"
+    before = content_path.read_text(encoding="utf-8")
+
+    with dw.coalesce_draft_writes(draft_dir) as buf:
+        for step in range(3):
+            data = dw.read_draft_json(content_path)
+            data["duration"] += 1
+            dw.write_draft_json(content_path, data)
+        assert content_path.read_text(encoding="utf-8") == before
+        assert buf.dirty == ["draft_content.json"]
+        assert buf.stats["disk_reads"] == 1
+
+    assert json.loads(content_path.read_text(encoding="utf-8"))["duration"] == 5_000_003
+    assert not list(draft_dir.glob(".*.tmp"))
+    assert dw.active_write_buffer(content_path) is None
+
+
+def test_reads_are_private_copies(tmp_path):
+    draft_dir = _draft(tmp_path)
+    content_path = draft_dir / "draft_content.json"
+    with dw.coalesce_draft_writes(draft_dir):
+        data = dw.read_draft_json(content_path)
+        data["tracks"].clear()  # mutated but never written (pass bailed out)
+        assert len(dw.read_draft_json(content_path)["tracks"]) == 2
+        assert len(dw.read_draft_json(content_path, shared=True)["tracks"]) == 2
+    assert len(json.loads(content_path.read_text(encoding="utf-8"))["tracks"]) == 2
+
+
+def test_flush_on_exception(tmp_path):
+    draft_dir = _draft(tmp_path)
+    info_path = draft_dir / "draft_info.json"
+    with pytest.raises(SystemExit):
+        with dw.coalesce_draft_writes(draft_dir):
+            dw.write_draft_json(info_path, {"tracks": [], "draft_name": "x"})
+            raise SystemExit(1)
+    assert json.loads(info_path.read_text(encoding="utf-8"))["draft_name"] == "x"
+
+
+def test_external_access_sees_pending_changes(tmp_path):
+    draft_dir = _draft(tmp_path)
+    content_path = draft_dir / "draft_content.json"
+    with dw.coalesce_draft_writes(draft_dir):
+        dw.write_draft_json(content_path, {"tracks": [], "duration": 1})
+        with dw.draft_files_on_disk(draft_dir):
+            assert json.loads(content_path.read_text(encoding="utf-8"))["duration"] == 1
+            content_path.write_text(json.dumps({"tracks": [], "duration": 2}), encoding="utf-8")
+        assert dw.read_draft_json(content_path)["duration"] == 2
+
+
+def test_disabled_or_outside_block_uses_legacy_files(tmp_path, monkeypatch):
+    draft_dir = _draft(tmp_path)
+    content_path = draft_dir / "draft_content.json"
+    other = draft_dir / "image_cues.json"
+
+    dw.write_draft_json(content_path, {"tracks": []})
+    assert content_path.read_text(encoding="utf-8") == json.dumps({"tracks": []}, indent=2)
+
+    with dw.coalesce_draft_writes(draft_dir):
+        dw.write_draft_json(other, {"a": 1})  # not a draft JSON file: written through
+        assert json.loads(other.read_text(encoding="utf-8")) == {"a": 1}
+
+    monkeypatch.setenv("CAPCUT_DRAFT_WRITE_COALESCE_DISABLE", "1")
+    with dw.coalesce_draft_writes(draft_dir) as buf:
+        assert buf is None
+        dw.write_draft_json(content_path, {"tracks": [1]})
+        assert json.loads(content_path.read_text(encoding="utf-8")) == {"tracks": [1]}
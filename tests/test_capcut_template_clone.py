@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from video_pipeline.src.adapters.capcut import template_clone as tc
+from video_pipeline.tools import capcut_batch_insert as batch
+
+
+def _template(tmp_path):
+    tpl = tmp_path / "CH02-テンプレ"
+    (tpl / "Resources" / "audio").mkdir(parents=True)
+    (tpl / "draft_content.json").write_text(json.dumps({"tracks": [{"id": "a"}]}), encoding="utf-8")
+    (tpl / "draft_info.json").write_text(json.dumps({"tracks": []}), encoding="utf-8")
+    (tpl / "Resources" / "audio" / "bgm.mp3").write_bytes(b"\x00" * 4096)
+    (tpl / "draft_cover.jpg").write_bytes(b"\xff\xd8" + b"\x01" * 100)
+    return tpl
+
+
+def _same_inode(a, b):
+    return os.stat(a).st_ino == os.stat(b).st_ino
+
+
+@pytest.mark.parametrize("mode", ["auto", "reflink", "copy"])
+def test_clone_reproduces_tree_and_keeps_template_intact(tmp_path, mode):
+    tpl = _template(tmp_path)
+    dest = tmp_path / "draft"
+    (dest / "stale").mkdir(parents=True)
+
+    stats = tc.clone_template_dir(tpl, dest, mode=mode)
+
+    assert stats.files == 4
+    assert stats.reflinked + stats.linked + stats.copied == 4
+    assert not (dest / "stale").exists()
+    assert sorted(p.relative_to(dest) for p in dest.rglob("*")) == sorted(p.relative_to(tpl) for p in tpl.rglob("*"))
+    assert (dest / "Resources" / "audio" / "bgm.mp3").read_bytes() == b"\x00" * 4096
+
+    # Draft JSON is rewritten in place by the pipeline: it must never share storage with the template.
+    assert not _same_inode(tpl / "draft_content.json", dest / "draft_content.json")
+    (dest / "draft_content.json").write_text("{}", encoding="utf-8")
+    assert json.loads((tpl / "draft_content.json").read_text(encoding="utf-8")) == {"tracks": [{"id": "a"}]}
+
+
+def test_media_is_hardlinked_when_cow_is_unavailable(tmp_path, monkeypatch):
+    tpl = _template(tmp_path)
+
+    def _no_reflink(src, dst):
+        raise OSError(tc.errno.EOPNOTSUPP, "no reflink")
+
+    monkeypatch.setattr(tc, "_reflink", _no_reflink)
+    stats = tc.clone_template_dir(tpl, tmp_path / "auto", mode="auto")
+    assert (stats.linked, stats.copied) == (1, 3)
+    assert _same_inode(tpl / "Resources" / "audio" / "bgm.mp3", tmp_path / "auto" / "Resources" / "audio" / "bgm.mp3")
+    # draft_cover.jpg belongs to the draft (CapCut rewrites it on save): never shared with the template.
+    assert not _same_inode(tpl / "draft_cover.jpg", tmp_path / "auto" / "draft_cover.jpg")
+
+    stats = tc.clone_template_dir(tpl, tmp_path / "nolink", mode="reflink")
+    assert (stats.linked, stats.copied) == (0, 4)
+
+
+def test_manifest_merges_common_args(tmp_path):
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "common": ["--draft-root", "/drafts", "--channel", "CH02"],
+                "episodes": [
+                    {"name": "CH02-034", "args": ["--run", "/runs/34", "--new", "d34"]},
+                    {"args": ["--run", "/runs/35", "--new=d35"]},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    jobs = batch.load_manifest(manifest)
+    assert [j.name for j in jobs] == ["CH02-034", "episode_002"]
+    assert jobs[0].argv == ["--draft-root", "/drafts", "--channel", "CH02", "--run", "/runs/34", "--new", "d34"]
+    assert batch._option(jobs[1].argv, "--new") == "d35"
+    assert batch._option(jobs[1].argv, "--draft-root") == "/drafts"
+
+    manifest.write_text(json.dumps({"episodes": [{"name": "x", "args": []}, {"name": "x", "args": []}]}), encoding="utf-8")
+    with pytest.raises(SystemExit):
+        batch.load_manifest(manifest)
+
+
+def test_episode_with_bad_args_fails_alone():
+    pytest.importorskip("pyJianYingDraft")
+    jobs = [
+        batch.EpisodeJob(name="ok", argv=["--run", "/runs/1", "--new", "d1"]),
+        batch.EpisodeJob(name="no-run", argv=["--new", "d2"]),
+    ]
+    errors = batch._validate_templates(jobs)
+    assert list(errors) == ["no-run"]
+    assert "--run" in errors["no-run"]
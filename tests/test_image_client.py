@@ -289,6 +289,7 @@ class TestImageClient(unittest.TestCase):
             # a1 may be called multiple times due to retry logic, just verify it was called
             self.assertGreaterEqual(a1.calls, 1)
             self.assertGreaterEqual(a2.calls, 1)
+            self.assertEqual(res.metadata["served_by"], "dummy:m2")
 
     def test_all_fail(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from factory_common import image_rate_limiter as rl
+from video_pipeline.src.srt2images import nanobanana_client as nb
+
+
+@pytest.fixture(autouse=True)
+def _state(tmp_path, monkeypatch):
+    monkeypatch.setenv("IMAGE_RATE_LIMIT_STATE_PATH", str(tmp_path / "limits.json"))
+    monkeypatch.delenv("IMAGE_RATE_LIMIT_ADAPTIVE_DISABLE", raising=False)
+    monkeypatch.delenv("IMAGE_RATE_LIMIT_MIN_PER_MINUTE", raising=False)
+
+
+def test_bucket_grants_burst_then_asks_to_wait():
+    key = rl.bucket_key("gemini", "g-1")
+    # ceiling 12/min -> burst capacity of 2 tokens.
+    assert rl.try_acquire(key, ceiling_per_min=12) == 0.0
+    assert rl.try_acquire(key, ceiling_per_min=12) == 0.0
+    wait = rl.try_acquire(key, ceiling_per_min=12)
+    assert 0 < wait <= 5.0
+
+
+def test_throttle_halves_provider_buckets_and_success_recovers():
+    a, b, other = rl.bucket_key("fireworks", "f-3"), rl.bucket_key("fireworks", "f-4"), rl.bucket_key("gemini", "g-1")
+    for key in (a, b, other):
+        rl.try_acquire(key, ceiling_per_min=10)
+
+    rl.record_throttle("fireworks")
+    state = rl.snapshot()
+    assert state[a]["rate_per_min"] == state[b]["rate_per_min"] == 5.0
+    assert state[a]["tokens"] == 0.0 and state[a]["throttles"] == 1
+    assert state[other]["rate_per_min"] == 10.0
+
+    for _ in range(4):
+        rl.record_success("fireworks", "f-3", latency_sec=2.0)
+    assert rl.snapshot()[a]["rate_per_min"] == 7.0
+
+    # Provider slowing down (latency far above best) -> hold the rate.
+    for _ in range(6):
+        rl.record_success("fireworks", "f-3", latency_sec=30.0)
+    held = rl.snapshot()[a]["rate_per_min"]
+    rl.record_success("fireworks", "f-3", latency_sec=30.0)
+    assert rl.snapshot()[a]["rate_per_min"] == held < 10.0
+
+    for _ in range(40):
+        rl.record_success("fireworks", "f-4", latency_sec=1.0)
+    assert rl.snapshot()[b]["rate_per_min"] == 10.0  # never above the ceiling
+
+
+def test_rate_floor(monkeypatch):
+    monkeypatch.setenv("IMAGE_RATE_LIMIT_MIN_PER_MINUTE", "2")
+    key = rl.bucket_key("gemini", "g-1")
+    rl.try_acquire(key, ceiling_per_min=10)
+    for _ in range(5):
+        rl.record_throttle("gemini")
+    assert rl.snapshot()[key]["rate_per_min"] == 2.0
+
+
+def test_pool_keeps_unthrottled_buckets_busy():
+    cues = [{"k": "slow", "i": i} for i in range(2)] + [{"k": "fast", "i": i} for i in range(5)]
+    rl.try_acquire("slow:m", ceiling_per_min=600)
+    rl.record_throttle("slow")  # drained: next token in ~0.2s
+    started = []
+    lock = threading.Lock()
+
+    def gen(cue):
+        with lock:
+            started.append(cue["k"])
+        time.sleep(0.01)
+
+    nb._run_bucketed_pool(
+        cues,
+        concurrency=2,
+        max_per_minute=600,
+        key_for=lambda cue: f"{cue['k']}:m",
+        gen=gen,
+    )
+    assert sorted(started) == sorted(c["k"] for c in cues)
+    assert started[:5] == ["fast"] * 5
+
+
+def test_pool_skips_tokens_for_existing_outputs():
+    key = "p:m"
+    rl.try_acquire(key, ceiling_per_min=6)  # bucket now empty
+    done = []
+    nb._run_bucketed_pool(
+        [{"n": 1}, {"n": 2}],
+        concurrency=2,
+        max_per_minute=6,
+        key_for=lambda cue: key,
+        gen=lambda cue: done.append(cue["n"]),
+        needs_token=lambda cue: False,
+    )
+    assert sorted(done) == [1, 2]
+
+
+def test_admission_charges_the_serving_bucket_and_refunds_the_dispatch_token():
+    a, b = rl.bucket_key("gemini", "g-1"), rl.bucket_key("fireworks", "f-1")
+    assert rl.try_acquire(a, ceiling_per_min=12) == 0.0  # dispatch token for the predicted model
+    with rl.admission(12, granted=a):
+        rl.admit("fireworks", "f-1")  # tier round-robin called another model
+    state = rl.snapshot()
+    assert state[a]["tokens"] == pytest.approx(2.0, abs=0.05)
+    assert state[b]["tokens"] == pytest.approx(1.0, abs=0.05)
+
+    rl.record_success("fireworks", "f-1", latency_sec=1.0)
+    assert rl.snapshot()[b]["successes"] == 1
+    assert rl.admit("gemini", "g-1") == 0.0  # outside an admission block: no token
+
+
+def test_store_hit_takes_no_token(tmp_path, monkeypatch):
+    monkeypatch.setenv("SRT2IMAGES_IMAGE_STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.delenv("SRT2IMAGES_IMAGE_STORE", raising=False)
+    key = rl.bucket_key("gemini", "g-1")
+
+    def fake_run_direct(prompt, output_path, *args, **kwargs):
+        rl.admit("gemini", "g-1")
+        with open(output_path, "wb") as fh:
+            fh.write(b"png")
+        return True
+
+    monkeypatch.setattr(nb, "_run_direct", fake_run_direct)
+    monkeypatch.setattr(nb, "_convert_to_16_9", lambda *args, **kwargs: None)
+    monkeypatch.setattr(nb, "_BucketKeyResolver", lambda: (lambda _cue: key))
+    for run in ("run1", "run2"):
+        cue = {"image_path": str(tmp_path / run / "images" / "0001.png"), "prompt": "p", "seed": 1}
+        nb._rate_limited_gen_one(cue, "direct", True, 1920, 1080, None, 30, None, False, 1, None, 12)
+        assert rl.snapshot()[key]["tokens"] == pytest.approx(1.0, abs=0.05)
+    assert (tmp_path / "run2" / "images" / "0001.png").read_bytes() == b"png"
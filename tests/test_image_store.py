@@ -0,0 +1,147 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from video_pipeline.src.srt2images import image_store
+from video_pipeline.src.srt2images import nanobanana_client as nb
+
+
+@pytest.fixture(autouse=True)
+def _store(tmp_path, monkeypatch):
+    monkeypatch.setenv("SRT2IMAGES_IMAGE_STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.delenv("SRT2IMAGES_IMAGE_STORE", raising=False)
+    monkeypatch.delenv("SRT2IMAGES_IMAGE_STORE_MAX_GB", raising=False)
+
+
+def _fp(**overrides):
+    kwargs = {"model": "gemini:g-1", "prompt": "a temple at dawn", "input_images": [], "width": 1920, "height": 1080, "seed": 7}
+    kwargs.update(overrides)
+    return image_store.request_fingerprint(**kwargs)
+
+
+def test_fingerprint_keys_reference_images_by_content(tmp_path):
+    a = tmp_path / "run_a" / "guide.png"
+    b = tmp_path / "run_b" / "guide.png"
+    for p in (a, b):
+        p.parent.mkdir(parents=True)
+        p.write_bytes(b"same guide")
+    assert _fp(input_images=[str(a)]) == _fp(input_images=[str(b)])
+
+    b.write_bytes(b"another guide")
+    assert _fp(input_images=[str(a)]) != _fp(input_images=[str(b)])
+    assert _fp() != _fp(seed=8)
+    assert _fp() != _fp(width=1280, height=720)
+    assert _fp() != _fp(model="fireworks:f-1")
+
+
+def _gen(cue, monkeypatch, calls):
+    def fake_run_direct(prompt, output_path, width, height, config_path, timeout_sec, **kwargs):
+        calls.append(output_path)
+        with open(output_path, "wb") as fh:  # in place, like the real generator
+            fh.write(f"png:{prompt}:{kwargs.get('seed')}".encode("utf-8"))
+        return True
+
+    monkeypatch.setattr(nb, "_run_direct", fake_run_direct)
+    monkeypatch.setattr(nb, "_convert_to_16_9", lambda *args, **kwargs: None)
+    monkeypatch.setattr(nb, "_BucketKeyResolver", lambda: (lambda _cue: "gemini:g-1"))
+    nb._gen_one(cue, "direct", True, 1920, 1080, None, 30, None, max_retries=1)
+
+
+def test_identical_request_in_another_run_is_materialised(tmp_path, monkeypatch):
+    calls = []
+    first = {"image_path": str(tmp_path / "run1" / "images" / "0001.png"), "prompt": "p", "seed": 3}
+    _gen(first, monkeypatch, calls)
+    assert len(calls) == 1
+
+    # Redo run (force) with the same request: no API call, hardlinked bytes.
+    second = {"image_path": str(tmp_path / "run2" / "images" / "0001.png"), "prompt": "p", "seed": 3}
+    _gen(second, monkeypatch, calls)
+    assert len(calls) == 1
+    assert Path(second["image_path"]).read_bytes() == b"png:p:3"
+    assert os.stat(first["image_path"]).st_ino == os.stat(second["image_path"]).st_ino
+
+    # A different seed is a different request.
+    third = {"image_path": str(tmp_path / "run3" / "images" / "0001.png"), "prompt": "p", "seed": 4}
+    _gen(third, monkeypatch, calls)
+    assert len(calls) == 2
+
+    # Regenerating over a materialised file must not alter the stored object.
+    _gen(dict(second, seed=5), monkeypatch, calls)
+    assert Path(second["image_path"]).read_bytes() == b"png:p:5"
+    assert Path(first["image_path"]).read_bytes() == b"png:p:3"
+    assert image_store.lookup(_fp(model="gemini:g-1", prompt="p", seed=3)) is not None
+
+    stats = image_store.store_stats()
+    assert (stats["hits"], stats["writes"], stats["objects"]) == (1, 3, 3)
+
+
+def test_image_is_stored_under_the_model_that_served_it(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run_direct(prompt, output_path, *args, served=None, **kwargs):
+        calls.append(output_path)
+        Path(output_path).write_bytes(b"from-f-1")
+        served["model"] = "fireworks:f-1"  # tier round-robin picked another model than the lookup key
+        return True
+
+    monkeypatch.setattr(nb, "_run_direct", fake_run_direct)
+    monkeypatch.setattr(nb, "_convert_to_16_9", lambda *args, **kwargs: None)
+    monkeypatch.setattr(nb, "_BucketKeyResolver", lambda: (lambda _cue: "gemini:g-1"))
+    for run in ("run1", "run2"):
+        cue = {"image_path": str(tmp_path / run / "images" / "0001.png"), "prompt": "p", "seed": 3}
+        nb._gen_one(cue, "direct", True, 1920, 1080, None, 30, None, max_retries=1)
+    # Never served as a g-1 hit; a request for f-1 itself reuses it.
+    assert len(calls) == 2
+    assert image_store.lookup(_fp(model="gemini:g-1", prompt="p", seed=3)) is None
+    assert image_store.lookup(_fp(model="fireworks:f-1", prompt="p", seed=3)) is not None
+
+
+def test_object_altered_through_a_link_is_not_served(tmp_path):
+    src = tmp_path / "images" / "0001.png"
+    src.parent.mkdir()
+    src.write_bytes(b"original")
+    fp = _fp()
+    image_store.put(fp, src, model="gemini:g-1")
+
+    with open(src, "r+b") as fh:  # in-place rewrite shares the inode with the store object
+        fh.write(b"ALTERED!!")
+    assert image_store.lookup(fp) is None
+    assert image_store.store_stats()["stale"] == 1
+    assert src.read_bytes() == b"ALTERED!!"
+
+
+def test_lru_eviction_keeps_recently_used_objects(tmp_path):
+    fps = []
+    for i in range(3):
+        src = tmp_path / f"{i}.png"
+        src.write_bytes(bytes([i]) * 100)
+        fps.append(_fp(seed=i))
+        image_store.put(fps[-1], src)
+    assert image_store.materialize(fps[0], tmp_path / "reuse.png")  # 0 becomes most recently used
+
+    out = image_store.evict(max_bytes=250, low_watermark=1.0)
+    assert out == {"evicted": 1, "bytes_evicted": 100}
+    assert image_store.lookup(fps[1]) is None
+    assert image_store.lookup(fps[0]) is not None and image_store.lookup(fps[2]) is not None
+    assert (tmp_path / "1.png").exists()  # run files keep their own link
+
+
+def test_batch_builds_one_bucket_resolver(tmp_path, monkeypatch):
+    built = []
+
+    def resolver():
+        built.append(1)
+        return lambda _cue: "gemini:g-1"
+
+    monkeypatch.setattr(nb, "_BucketKeyResolver", resolver)
+    monkeypatch.setattr(nb, "_run_direct", lambda prompt, output_path, *a, **k: Path(output_path).write_bytes(b"png") > 0)
+    monkeypatch.setattr(nb, "_convert_to_16_9", lambda *args, **kwargs: None)
+    monkeypatch.setenv("IMAGE_RATE_LIMIT_STATE_PATH", str(tmp_path / "limits.json"))
+    monkeypatch.setenv("SRT2IMAGES_IMAGE_MAX_PER_MINUTE", "6000")
+    (tmp_path / "run" / "images").mkdir(parents=True)
+    cues = [{"image_path": str(tmp_path / "run" / "images" / f"{i:04d}.png"), "prompt": f"p{i}"} for i in range(4)]
+    for concurrency in (1, 3):
+        built.clear()
+        nb.generate_image_batch(cues, "direct", concurrency, True, 1920, 1080, max_retries=1)
+        assert len(built) == 1
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from factory_common import llm_api_cache as cache
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_API_CACHE_DIR", str(tmp_path / "cache"))
+    for name in ("LLM_API_CACHE_DISABLE", "LLM_API_CACHE_READ_DISABLE", "LLM_API_CACHE_WRITE_DISABLE", "LLM_API_CACHE_TTL_SEC"):
+        monkeypatch.delenv(name, raising=False)
+    cache.clear_memory_tier()
+    monkeypatch.setattr(cache, "_COUNTERS", {k: 0 for k in cache._COUNTERS})
+    yield tmp_path / "cache"
+    cache.clear_memory_tier()
+
+
+def _msgs(i: int):
+    return [{"role": "user", "content": f"prompt {i}"}]
+
+
+def _payload(i: int, size: int = 200):
+    return {"content": f"answer {i} " + "x" * size, "usage": {"total_tokens": i}, "meta": {"provider": "dummy"}}
+
+
+def test_memory_tier_serves_copies_and_counts_hits(cache_env):
+    path = cache.write_cache("unit_task", _msgs(1), {}, _payload(1))
+    assert path is not None and path.exists()
+
+    first = cache.read_cache("unit_task", _msgs(1), {})
+    first["usage"]["total_tokens"] = 999  # callers must not corrupt the memory tier
+    second = cache.read_cache("unit_task", _msgs(1), {})
+    assert second["usage"]["total_tokens"] == 1
+    assert cache.read_cache("unit_task", _msgs(2), {}) is None
+
+    stats = cache.cache_stats()
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["indexed_entries"] == 1
+
+    # Cold process (empty memory tier) falls back to disk and re-warms.
+    cache.clear_memory_tier()
+    assert cache.read_cache("unit_task", _msgs(1), {})["content"].startswith("answer 1")
+    assert cache.cache_stats()["disk_hits"] == 1
+
+
+def test_lru_eviction_keeps_recently_used_entries(cache_env, monkeypatch):
+    monkeypatch.setenv("LLM_API_CACHE_MAX_MB", "0")
+    for i in range(6):
+        cache.write_cache("unit_task", _msgs(i), {}, _payload(i, size=1000))
+    rows = {r["task_id"]: r for r in cache.inspect_entries(limit=100)}
+    assert len(rows) == 6
+
+    # Touch entry 0 on disk so it becomes most recently used.
+    cache.clear_memory_tier()
+    assert cache.read_cache("unit_task", _msgs(0), {}) is not None
+    per_entry = max(r["bytes"] for r in rows.values())
+    result = cache.evict(max_bytes=per_entry * 3, low_watermark=1.0)
+    assert result["evicted"] == 3
+
+    cache.clear_memory_tier()
+    assert cache.read_cache("unit_task", _msgs(0), {}) is not None
+    assert cache.read_cache("unit_task", _msgs(1), {}) is None
+    assert len(list(cache_env.glob("*/*/*.json"))) == 3
+
+
+def test_reindex_picks_up_legacy_files_and_drops_missing(cache_env, monkeypatch):
+    monkeypatch.setenv("LLM_API_CACHE_INDEX_DISABLE", "1")
+    legacy = cache.write_cache("unit_task", _msgs(1), {}, _payload(1))
+    monkeypatch.delenv("LLM_API_CACHE_INDEX_DISABLE")
+    assert cache.cache_stats()["indexed_entries"] == 0
+
+    gone = cache.write_cache("unit_task", _msgs(2), {}, _payload(2))
+    gone.unlink()
+    report = cache.reindex()
+    assert report == {"indexed": 1, "dropped": 1}
+    assert [r["path"] for r in cache.inspect_entries()] == [str(legacy.relative_to(cache_env))]
@@ -129,3 +129,123 @@ def test_model_slot_overrides_tier_models_and_can_split_script_vs_non_script(mon
 
     assert router.get_models_for_task("unit_test_task") == ["m2"]
     assert router.get_models_for_task("script_unit_test_task") == ["m1"]
+
+
+def test_call_many_keeps_order_and_caps_provider_concurrency(monkeypatch):
+    import threading
+    import time
+
+    router, lr = _make_router(monkeypatch, models=["m1"])
+    monkeypatch.setenv("LLM_ROUTER_LOG_DISABLE", "1")
+    monkeypatch.setenv("LLM_ROUTER_PROVIDER_CONCURRENCY_DUMMY", "2")
+    monkeypatch.setattr(lr, "try_codex_exec", lambda **_kw: (None, {"attempted": False}))
+
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def _invoke(self, _provider, _client, _model_conf, messages, return_raw=False, **_kwargs):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        text = messages[-1]["content"]
+        if text == "boom":
+            raise RuntimeError("provider_fail")
+        return text.upper()
+
+    monkeypatch.setattr(lr.LLMRouter, "_invoke_provider", _invoke, raising=True)
+
+    texts = [f"req{i}" for i in range(8)] + ["boom"]
+    reqs = [{"task": "unit_test_task", "messages": [{"role": "user", "content": t}], "model_keys": ["m1"]} for t in texts]
+    out = router.call_many(reqs, max_workers=6, return_exceptions=True)
+
+    assert out[:8] == [t.upper() for t in texts[:8]]
+    assert isinstance(out[8], RuntimeError)
+    assert state["peak"] == 2
+    with pytest.raises(RuntimeError):
+        router.call_many(reqs, max_workers=6)
+
+
+def test_acall_matches_call(monkeypatch):
+    import asyncio
+
+    router, lr = _make_router(monkeypatch, models=["m1"])
+    monkeypatch.setenv("LLM_ROUTER_LOG_DISABLE", "1")
+    monkeypatch.setattr(lr, "try_codex_exec", lambda **_kw: (None, {"attempted": False}))
+    monkeypatch.setattr(
+        lr.LLMRouter,
+        "_invoke_provider",
+        lambda self, _p, _c, _mc, messages, return_raw=False, **_kw: messages[-1]["content"][::-1],
+        raising=True,
+    )
+
+    async def _run():
+        return await asyncio.gather(
+            *(router.acall("unit_test_task", [{"role": "user", "content": t}], model_keys=["m1"]) for t in ("ab", "cd"))
+        )
+
+    assert asyncio.run(_run()) == ["ba", "dc"]
+
+
+def test_fireworks_budget_reserves_inflight_calls(monkeypatch):
+    router, lr = _make_router(monkeypatch, models=["m1"])
+    monkeypatch.setenv("FIREWORKS_BUDGET_MAX_CALLS_TOTAL", "1")
+    monkeypatch.setattr(lr, "_FIREWORKS_BUDGET_STATE", {"total": {"calls": 0, "tokens": 0}, "per_routing_key": {}})
+
+    assert router._fireworks_budget_check("fireworks", reserve=True) is True
+    # A concurrent caller must not pass while the first call is still in flight.
+    with pytest.raises(lr.FireworksBudgetExceeded):
+        router._fireworks_budget_check("fireworks", reserve=True)
+    router._fireworks_budget_unreserve()
+    assert router._fireworks_budget_check("fireworks") is False
+
+
+def test_fireworks_rotation_keeps_leases_of_inflight_calls(monkeypatch):
+    import contextvars
+    from types import SimpleNamespace
+
+    router, lr = _make_router(monkeypatch, models=["m1"])
+    keys = ["fw_key_1", "fw_key_2", "fw_key_3"]
+    released = []
+
+    def _lease(key):
+        return SimpleNamespace(key_fp=lr._sha256_hex(key), lease_id=f"lease-{key}", key=key)
+
+    acquired = []
+
+    def _acquire(_pool, *, key, **_kw):
+        acquired.append(key)
+        return _lease(key)
+
+    monkeypatch.setattr(lr.fireworks_keys, "try_acquire_specific_key", _acquire)
+    monkeypatch.setattr(lr.fireworks_keys, "release_lease", lambda lease: released.append(lease.key))
+    monkeypatch.setattr(lr, "OpenAI", lambda **kw: SimpleNamespace(api_key=kw["api_key"]))
+    monkeypatch.setattr(lr, "_shared_http_client_kwargs", lambda *_a, **_kw: {})
+    router.config["providers"] = {"fireworks": {"base_url": "https://fireworks.invalid/v1"}}
+    router._fireworks_keys = keys
+    router._fireworks_key_index = 0
+    router._fireworks_dead_keys = set()
+    router._fireworks_lease = _lease(keys[0])
+    router.clients["fireworks"] = SimpleNamespace(api_key=keys[0])
+
+    a, b = contextvars.copy_context(), contextvars.copy_context()
+    with lr._FIREWORKS_LEASE_LOCK:
+        a.run(router._fireworks_hold_lease)
+        b.run(router._fireworks_hold_lease)
+
+    # Call A hits a key-scoped failure and rotates; B is still running on key 1.
+    a.run(router._fireworks_mark_current_key_dead)
+    assert a.run(router._fireworks_rotate_client).api_key == keys[1]
+    assert released == []
+
+    # B fails on key 1 too: it joins key 2 instead of rotating again, and key 1 is released exactly once.
+    b.run(router._fireworks_mark_current_key_dead)
+    assert b.run(router._fireworks_rotate_client).api_key == keys[1]
+    assert acquired == [keys[1]] and released == [keys[0]]
+
+    a.run(router._fireworks_release_lease)
+    assert released == [keys[0]]
+    b.run(router._fireworks_release_lease)
+    assert released == [keys[0], keys[1]] and router._fireworks_lease is None
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from factory_common import llm_usage_index, segmented_log
+from scripts import aggregate_llm_usage
+from scripts.ops import llm_usage_report
+
+
+@pytest.fixture(autouse=True)
+def _index_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_USAGE_INDEX_PATH", str(tmp_path / "usage_index.sqlite3"))
+    monkeypatch.delenv("LLM_USAGE_INDEX_DISABLE", raising=False)
+
+
+T0 = datetime(2026, 3, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _rec(minutes: float, **kw):
+    obj = {
+        "timestamp": (T0 + timedelta(minutes=minutes)).isoformat().replace("+00:00", "Z"),
+        "status": "success",
+        "task": "script_outline",
+        "provider": "azure",
+        "model": "gpt-5",
+        "routing_key": "CH01-001",
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        "latency_ms": 100,
+    }
+    obj.update(kw)
+    return obj
+
+
+def _records():
+    return [
+        _rec(-30),
+        _rec(5, usage={"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}, cache={"hit": True}),
+        _rec(50, model="or_deepseek", provider="", task="visual_prompt_refine", routing_key="CH02-010", chain=["or_deepseek", "gpt-5"]),
+        _rec(61, status="error", status_code=429, error="rate limited", provider="openrouter"),
+        _rec(125, routing_key="", usage=None, latency_ms=300),
+        _rec(190, task=" script_review ", usage={"prompt_tokens": 1, "completion_tokens": 1}, cache={"hit": 1}),
+        {"status": "success", "task": "undated", "model": "gpt-5", "usage": {"total_tokens": 7}},
+        _rec(24 * 60 + 5, usage={"prompt_tokens": 2000, "completion_tokens": 1}),
+    ]
+
+
+def _write(path: Path, records, mode="w"):
+    with path.open(mode, encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+def _metrics(**kw):
+    out = {m: 0 for m in llm_usage_index._METRICS}
+    out.update(kw)
+    return out
+
+
+def test_summarize_edge_hours_match_whole_hour_rollups(tmp_path):
+    log = tmp_path / "llm_usage.jsonl"
+    _write(log, _records())
+    llm_usage_index.ingest(log)
+
+    # 10:03 .. 12:10 -> partial first/last hours come from calls, 11:00 from rollups.
+    res = llm_usage_index.summarize(log, since=T0 + timedelta(minutes=3), until=T0 + timedelta(minutes=130), top_calls=3)
+    assert res["totals"] == _metrics(calls=4, prompt_tokens=110, completion_tokens=55, total_tokens=172, cache_hit_calls=1, cache_hit_total_tokens=150)
+    assert res["providers"]["openrouter"]["calls"] == 1
+    assert set(res["tasks"]) == {"script_outline", "visual_prompt_refine", "undated"}
+    assert res["routing_keys"]["CH02-010"]["total_tokens"] == 15
+    assert res["daily"]["2026-03-01"]["calls"] == 3
+    assert res["failures"]["total"] == 1 and res["failures"]["by_status_code"] == {"429": 1}
+    assert [c["total_tokens"] for c in res["top_calls"]] == [150, 15, 7]
+
+    res = llm_usage_index.summarize(log, since=T0 + timedelta(minutes=3), until=T0 + timedelta(minutes=4))
+    assert res["totals"]["calls"] == 1  # undated record only
+
+    res = llm_usage_index.summarize(log, since=None, until=None, provider="OpenRouter")
+    assert res["totals"]["calls"] == 1 and res["failures"]["total"] == 1
+    assert res["tasks"]["visual_prompt_refine"]["calls"] == 1
+
+
+def test_ingest_is_incremental_and_handles_partial_lines_and_truncation(tmp_path):
+    log = tmp_path / "llm_usage.jsonl"
+    records = _records()
+    _write(log, records[:3])
+    with log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(records[3])[:20])  # writer mid-line
+
+    assert llm_usage_index.ingest(log)["ingested"] == 3
+    assert llm_usage_index.ingest(log)["ingested"] == 0
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(records[3])[20:] + "\n")
+    _write(log, records[4:], mode="a")
+    assert llm_usage_index.ingest(log)["ingested"] == len(records) - 3
+    assert llm_usage_index.line_count(log) == len(records)
+
+    _write(log, records[:1])  # truncated / rotated in place
+    res = llm_usage_index.ingest(log)
+    assert res["reset"] and res["ingested"] == 1
+    assert llm_usage_index.summarize(log, since=None, until=None)["totals"]["calls"] == 1
+
+
+def test_aggregate_script_matches_scan(tmp_path):
+    log = tmp_path / "llm_usage.jsonl"
+    _write(log, _records())
+    indexed = aggregate_llm_usage.indexed_stats(log)
+    assert indexed is not None
+    scanned = aggregate_llm_usage.scan_stats(log)
+    # task keys are stripped in the index (" script_review " -> "script_review"); everything else matches
+    assert {k: v for k, v in indexed.items() if k != "tasks"} == {k: v for k, v in scanned.items() if k != "tasks"}
+    assert list(indexed["tasks"].values()) == list(scanned["tasks"].values())
+
+
+@pytest.mark.parametrize("task_prefix", ["", "script_"])
+def test_report_rows_match_scan(tmp_path, task_prefix):
+    log = tmp_path / "llm_usage.jsonl"
+    _write(log, _records())
+
+    def _totals(rows):
+        out = {}
+        for task, provider, model, hit, usage in rows:
+            key = (task, provider, model, hit)
+            out[key] = out.get(key, llm_usage_report.UsageAgg()).merge(usage)
+        return out
+
+    indexed = llm_usage_report._indexed_usage_rows(log, "CH01-001", task_prefix)
+    assert indexed is not None
+    assert _totals(indexed) == _totals(llm_usage_report._scan_usage_rows(log, "CH01-001", task_prefix))
+
+
+def test_ingest_follows_rotated_and_compressed_segments(tmp_path):
+    log = tmp_path / "llm_usage.jsonl"
+    records = _records()
+    _write(log, records[:4])
+    assert llm_usage_index.ingest(log)["ingested"] == 4
+
+    segmented_log.rotate(log, force=True)
+    _write(log, records[4:6], mode="a")
+    res = llm_usage_index.ingest(log)
+    assert (res["ingested"], res["reset"]) == (2, False)
+
+    segmented_log.finalize_segments(log, grace_sec=0)  # raw segment -> .gz
+    _write(log, records[6:], mode="a")
+    res = llm_usage_index.ingest(log)
+    assert (res["ingested"], res["reset"]) == (len(records) - 6, False)
+    assert llm_usage_index.line_count(log) == len(records)
+    assert llm_usage_index.summarize(log, since=None, until=None)["totals"]["calls"] == 7
+
+    llm_usage_index.drop_log(log)
+    assert llm_usage_index.ingest(log)["ingested"] == len(records)
@@ -25,3 +25,26 @@ def test_mecab_tokenizer_inserts_silence_tag(mecab_available):  # noqa: ARG001
     silence = [t for t in tokens if t.get("pos") == "silence_tag"]
     assert len(silence) == 1
     assert silence[0]["surface"] == "[1.2]"
+
+
+def test_mecab_tokenizer_reuses_tagger_and_returns_fresh_tokens(mecab_available):  # noqa: ARG001
+    """Memoized results must not leak caller mutations; the Tagger is reused per thread."""
+    from audio_tts.tts import mecab_tokenizer
+
+    first = mecab_tokenizer.tokenize_with_mecab("静かな夜です")
+    first[0]["surface"] = "MUTATED"
+    second = mecab_tokenizer.tokenize_with_mecab("静かな夜です")
+    assert second[0]["surface"] != "MUTATED"
+    assert mecab_tokenizer._get_tagger() is mecab_tokenizer._get_tagger()
+
+
+def test_mecab_parse_without_mecab_raises_runtime_error(monkeypatch):
+    """Callers catch RuntimeError when mecab-python3 is missing, not ImportError."""
+    import sys
+
+    from audio_tts.tts import mecab_tokenizer
+
+    monkeypatch.setitem(sys.modules, "MeCab", None)
+    monkeypatch.setattr(mecab_tokenizer._TAGGER_LOCAL, "tagger", None, raising=False)
+    with pytest.raises(RuntimeError):
+        list(mecab_tokenizer._mecab_parse("静かな夜です"))
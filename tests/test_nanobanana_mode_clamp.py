@@ -14,6 +14,7 @@ def test_nanobanana_mode_forces_direct(tmp_path, monkeypatch):
         return True
 
     # avoid actual image processing
+    monkeypatch.setenv("SRT2IMAGES_IMAGE_STORE_DIR", str(tmp_path / "image_store"))
     monkeypatch.setattr(nb, "_run_direct", fake_run_direct)
     monkeypatch.setattr(nb, "_convert_to_16_9", lambda *args, **kwargs: None)
 
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+
+from video_pipeline.src.srt2images import nanobanana_client as nb
+
+
+def _cues(tmp_path, persona_flags):
+    return [
+        {"image_path": str(tmp_path / "images" / f"{i + 1:04d}.png"), "use_persona": flag, "input_images": ["guide.png"]}
+        for i, flag in enumerate(persona_flags)
+    ]
+
+
+def _fake_gen(started, lock, delay=0.0):
+    def gen(cue):
+        with lock:
+            started.append((cue["image_path"], list(cue.get("input_images") or [])))
+        time.sleep(delay)
+        path = cue["image_path"]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(b"png")
+
+    return gen
+
+
+def test_chains_follow_persona_runs_and_explicit_references(tmp_path):
+    cues = _cues(tmp_path, [False, True, True, False, False, True])
+    assert nb._persona_chains(cues) == [[0, 1, 2], [3], [4, 5]]
+
+    # An explicit reference to another cue's output joins that cue's chain.
+    cues[3]["input_images"] = ["guide.png", cues[5]["image_path"]]
+    assert nb._persona_chains(cues) == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_pipelined_chains_run_concurrently_and_keep_previous_frame(tmp_path):
+    flags = [False, True, True, False, True, True, False, True, True]
+    cues = _cues(tmp_path, flags)
+    started, lock = [], threading.Lock()
+    active, peak = [0], [0]
+    inner = _fake_gen(started, lock, delay=0.05)
+
+    def gen(cue):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            inner(cue)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    nb._run_persona_chains_pipelined(cues, concurrency=3, gen=gen)
+
+    assert peak[0] == 3
+    order = [path for path, _ in started]
+    for i, cue in enumerate(cues):
+        if flags[i]:
+            prev = cues[i - 1]["image_path"]
+            assert order.index(prev) < order.index(cue["image_path"])
+            assert cue["input_images"] == ["guide.png", prev]
+        else:
+            assert cue["input_images"] == ["guide.png"]
+
+
+def test_serial_chain_matches_legacy_fallback_to_last_existing_frame(tmp_path):
+    cues = _cues(tmp_path, [False, True, True])
+    started, lock = [], threading.Lock()
+    ok = _fake_gen(started, lock)
+
+    def gen(cue):
+        if cue is cues[1]:
+            return  # generation failed: no output
+        ok(cue)
+
+    nb._run_persona_chain(cues, gen)
+    assert cues[1]["input_images"] == ["guide.png", cues[0]["image_path"]]
+    assert cues[2]["input_images"] == ["guide.png", cues[0]["image_path"]]
+
+
+def test_all_persona_cues_split_at_section_boundaries(tmp_path):
+    # CH01-style batch: every cue is a persona cue, sections change along the way.
+    cues = _cues(tmp_path, [True] * 6)
+    for cue, section in zip(cues, ["story", "story", "exposition", "exposition", "story", "story"]):
+        cue["section_type"] = section
+    chains = nb._persona_chains(cues)
+    assert chains == [[0, 1], [2, 3], [4, 5]]
+    assert len(chains) > 1
+
+    # An explicit persona segment wins over section_type.
+    for cue in cues:
+        cue["persona_segment"] = "hero"
+    assert nb._persona_chains(cues) == [[0, 1, 2, 3, 4, 5]]
+
+
+def test_serial_chain_drops_previous_frame_at_segment_start(tmp_path):
+    cues = _cues(tmp_path, [True, True, True])
+    cues[0]["section_type"] = cues[1]["section_type"] = "story"
+    cues[2]["section_type"] = "dialogue"
+    started, lock = [], threading.Lock()
+
+    nb._run_persona_chain(cues, _fake_gen(started, lock))
+    assert cues[0]["input_images"] == ["guide.png"]
+    assert cues[1]["input_images"] == ["guide.png", cues[0]["image_path"]]
+    assert cues[2]["input_images"] == ["guide.png"]
+
+
+def test_serial_batch_keeps_unsegmented_chain(tmp_path, monkeypatch):
+    cues = _cues(tmp_path, [True, True, True])
+    cues[0]["section_type"] = cues[1]["section_type"] = "story"
+    cues[2]["section_type"] = "dialogue"
+    started, lock = [], threading.Lock()
+    gen = _fake_gen(started, lock)
+    monkeypatch.delenv("SRT2IMAGES_PERSONA_CHAIN_SERIAL", raising=False)
+    monkeypatch.setattr(nb, "_rate_limited_gen_one", lambda cue, *args, **kwargs: gen(cue))
+
+    nb.generate_image_batch(cues, mode="none", concurrency=1, force=True, width=1920, height=1080)
+    assert cues[1]["input_images"] == ["guide.png", cues[0]["image_path"]]
+    assert cues[2]["input_images"] == ["guide.png", cues[1]["image_path"]]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from packages.script_pipeline import runner
+
+
+def test_chapter_draft_workers_priority(monkeypatch) -> None:
+    monkeypatch.setattr(runner, "_load_script_globals", lambda: {"chapter_draft_workers": 4})
+    monkeypatch.setattr(runner, "_load_sources", lambda _ch: {})
+    monkeypatch.delenv("SCRIPT_CHAPTER_DRAFT_WORKERS", raising=False)
+    assert runner._chapter_draft_workers("CH01", 5) == 4
+    assert runner._chapter_draft_workers("CH01", 2) == 2
+    assert runner._chapter_draft_workers("CH01", 1) == 1
+
+    monkeypatch.setenv("SCRIPT_CHAPTER_DRAFT_WORKERS", "1")
+    assert runner._chapter_draft_workers("CH01", 5) == 1
+
+    # Channel opt-in wins over the global default; env still wins over both.
+    monkeypatch.delenv("SCRIPT_CHAPTER_DRAFT_WORKERS")
+    monkeypatch.setattr(runner, "_load_script_globals", lambda: {"chapter_draft_workers": 1})
+    monkeypatch.setattr(runner, "_load_sources", lambda _ch: {"chapter_draft_workers": 3})
+    assert runner._chapter_draft_workers("CH01", 5) == 3
+    monkeypatch.setattr(runner, "_load_sources", lambda _ch: {})
+    assert runner._chapter_draft_workers("CH01", 5) == 1
+
+    monkeypatch.setenv("SCRIPT_CHAPTER_DRAFT_WORKERS", "3")
+    monkeypatch.setattr(runner, "_load_sources", lambda _ch: {"chapter_draft_mode": "serial"})
+    assert runner._chapter_draft_workers("CH01", 5) == 1
+
+
+def test_chapter_jobs_run_concurrently_and_raise_lowest_failure() -> None:
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0, "done": []}
+
+    def _job(num: int, fail: bool = False):
+        def _run() -> bool:
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.02)
+            with lock:
+                state["now"] -= 1
+                state["done"].append(num)
+            if fail:
+                raise SystemExit(f"[script_draft] chapter {num} pending")
+            return True
+
+        return _run
+
+    assert runner._run_chapter_jobs_concurrently([(n, _job(n)) for n in range(1, 6)], 3) is True
+    assert state["peak"] == 3
+
+    state["done"].clear()
+    with pytest.raises(SystemExit, match="chapter 2"):
+        runner._run_chapter_jobs_concurrently([(1, _job(1)), (2, _job(2, True)), (3, _job(3, True)), (4, _job(4))], 4)
+    # Every chapter still ran to completion (artifacts are written per chapter).
+    assert sorted(state["done"]) == [1, 2, 3, 4]
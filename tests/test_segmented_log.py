@@ -0,0 +1,108 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from factory_common import segmented_log
+
+
+@pytest.fixture(autouse=True)
+def _segment_env(monkeypatch):
+    for name in ("YTM_LOG_SEGMENT_DISABLE", "YTM_LOG_SEGMENT_MAX_MB", "YTM_LOG_SEGMENT_MAX_HOURS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("YTM_LOG_SEGMENT_COMPRESS", "gzip")
+
+
+def _append_many(path, start, count):
+    for i in range(start, start + count):
+        segmented_log.append_jsonl(path, {"timestamp": 1_700_000_000 + i * 60, "i": i})
+
+
+def test_size_rotation_keeps_every_record_in_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_LOG_SEGMENT_MAX_MB", str(2048 / (1024 * 1024)))
+    monkeypatch.setenv("YTM_LOG_SEGMENT_MAX_HOURS", "0")
+    log = tmp_path / "llm_usage.jsonl"
+    _append_many(log, 0, 200)
+
+    segs = segmented_log.segments(log)
+    assert len(segs) >= 3
+    assert all(not s.compressed for s in segs)  # still inside the compression grace period
+    assert [r["i"] for r in segmented_log.iter_records(log)] == list(range(200))
+    assert [r["i"] for r in segmented_log.tail_records(log, 120)] == list(range(80, 200))
+
+
+def test_finalized_segments_are_compressed_and_range_pruned(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_LOG_SEGMENT_MAX_HOURS", "0")
+    log = tmp_path / "image_usage.log"
+    _append_many(log, 0, 10)
+    segmented_log.rotate(log, force=True)
+    _append_many(log, 10, 10)
+    segmented_log.rotate(log, force=True)
+    segmented_log.append_line(log, json.dumps({"i": 20}))  # undated record in the active file
+
+    assert segmented_log.finalize_segments(log, grace_sec=0) == 2
+    first, second = segmented_log.segments(log)
+    assert first.path.name == "000001.log.gz" and first.compressed
+    assert (first.records, first.undated) == (10, 0)
+    assert first.last_ts < second.first_ts
+    assert first.ident != second.ident
+    with gzip.open(first.path, "rt", encoding="utf-8") as fh:
+        assert len(fh.read().splitlines()) == 10
+
+    window = [r["i"] for r in segmented_log.iter_records(log, since=second.first_ts, until=second.last_ts)]
+    assert window == list(range(10, 21))
+    assert [r["i"] for r in segmented_log.tail_records(log, 15)] == list(range(6, 21))
+
+
+def test_age_rotation_and_disable_toggle(tmp_path, monkeypatch):
+    log = tmp_path / "events.jsonl"
+    old = time.time() - 2 * 3600
+    segmented_log.append_jsonl(log, {"at": old})
+    monkeypatch.setenv("YTM_LOG_SEGMENT_MAX_HOURS", "1")
+
+    monkeypatch.setenv("YTM_LOG_SEGMENT_DISABLE", "1")
+    segmented_log.append_jsonl(log, {"at": time.time()})
+    assert segmented_log.segments(log) == []
+
+    monkeypatch.delenv("YTM_LOG_SEGMENT_DISABLE")
+    segmented_log.append_jsonl(log, {"at": time.time()})
+    assert len(segmented_log.segments(log)) == 1
+    assert not log.exists()
+    segmented_log.append_jsonl(log, {"at": time.time()})
+    assert len(list(segmented_log.iter_records(log))) == 4
+    assert len(segmented_log.segments(log)) == 1
+
+
+def test_closed_segments_are_finalized_after_the_grace_without_manual_call(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_LOG_SEGMENT_MAX_HOURS", "0")
+    monkeypatch.setattr(segmented_log, "_COMPRESS_GRACE_SEC", 0.2)
+    writer_log = tmp_path / "llm_usage.jsonl"
+    _append_many(writer_log, 0, 10)
+    segmented_log.rotate(writer_log, force=True)
+    assert segmented_log.segments(writer_log)[0].records is None  # just rotated: inside the grace
+
+    # Writer path: the first append after the grace compresses the closed segment.
+    time.sleep(0.3)
+    _append_many(writer_log, 10, 1)
+    (seg,) = segmented_log.segments(writer_log)
+    assert seg.compressed and seg.records == 10
+
+    # Reader path: a process that never appends again still gets pruned ranges.
+    reader_log = tmp_path / "image_usage.log"
+    _append_many(reader_log, 0, 10)
+    segmented_log.rotate(reader_log, force=True)
+    _append_many(reader_log, 10, 5)
+    segmented_log._FINALIZE_DUE.clear()
+    time.sleep(0.3)
+    since = 1_700_000_000 + 10 * 60
+    assert [r["i"] for r in segmented_log.iter_records(reader_log, since=since)] == list(range(10, 15))
+    (seg,) = segmented_log.segments(reader_log)
+    assert seg.compressed and not seg.overlaps(since, None)
+
+
+def test_tail_records_reads_last_lines(tmp_path):
+    log = tmp_path / "llm_usage.jsonl"
+    log.write_text("\n".join(json.dumps({"i": i}) for i in range(5000)) + "\n{broken\n", encoding="utf-8")
+    assert segmented_log.tail_records(log, 3) == [{"i": 4997}, {"i": 4998}, {"i": 4999}]
+    assert len(segmented_log.tail_records(log, 10000)) == 5000
@@ -0,0 +1,127 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from factory_common import paths
+from script_pipeline.thumbnails.tools import layer_specs_builder as lsb
+
+
+def _strip_times(obj):
+    if isinstance(obj, dict):
+        return {k: _strip_times(v) for k, v in obj.items() if not k.endswith("_at")}
+    if isinstance(obj, list):
+        return [_strip_times(v) for v in obj]
+    return obj
+
+
+def _variants():
+    return [
+        {"channel": "CH01", "video": "001", "title": "t1", "image_rel_path": "CH01/001/00_thumb.png", "label": "a"},
+        {"channel": "CH01", "video": "002", "title": None, "image_rel_path": "CH01/002/00_thumb.png", "label": "a"},
+        {"channel": "CH01", "video": "001", "title": "t1b", "image_rel_path": "CH01/001/00_thumb.v2.png", "label": "b"},
+        {"channel": "CH01", "video": "001", "title": None, "image_rel_path": "CH01/001/00_thumb.png", "label": "c", "status": ""},
+    ]
+
+
+def test_batch_upsert_matches_sequential_upserts(tmp_path, monkeypatch):
+    seed = {"version": 1, "projects": [{"channel": "CH01", "video": "002", "status": "draft", "variants": []}]}
+    single = tmp_path / "single.json"
+    batch = tmp_path / "batch.json"
+    single.write_text(json.dumps(seed), encoding="utf-8")
+    batch.write_text(json.dumps(seed), encoding="utf-8")
+
+    monkeypatch.setattr(lsb, "_load_thumbnail_projects_path", lambda: single)
+    for item in _variants():
+        lsb.upsert_fs_variant(**item)
+
+    writes = []
+    write = lsb._write_thumbnail_projects
+    monkeypatch.setattr(lsb, "_load_thumbnail_projects_path", lambda: batch)
+    monkeypatch.setattr(lsb, "_write_thumbnail_projects", lambda doc: (writes.append(1), write(doc)))
+    lsb.upsert_fs_variants(_variants())
+
+    assert len(writes) == 1
+    assert _strip_times(json.loads(batch.read_text(encoding="utf-8"))) == _strip_times(
+        json.loads(single.read_text(encoding="utf-8"))
+    )
+
+
+def test_batch_upsert_noop_without_variants(tmp_path, monkeypatch):
+    path = tmp_path / "projects.json"
+    monkeypatch.setattr(lsb, "_load_thumbnail_projects_path", lambda: path)
+    lsb.upsert_fs_variants([])
+    assert not path.exists()
+
+
+def _font_path():
+    env = os.getenv("YTM_THUMB_FONT_PATH")
+    if env and Path(env).is_file():
+        return env
+    for base in ("/usr/share/fonts", "/Library/Fonts", "/System/Library/Fonts", str(Path.home() / "Library" / "Fonts")):
+        for pattern in ("**/*.ttf", "**/*.otf"):
+            for p in sorted(Path(base).glob(pattern)):
+                return str(p)
+    return None
+
+
+@pytest.fixture
+def _thumb_workspace(tmp_path, monkeypatch):
+    font = _font_path()
+    if font is None:
+        pytest.skip("no TTF/OTF font available for text compositing")
+    src = paths.repo_root() / "workspaces" / "thumbnails"
+    dst = tmp_path / "workspaces" / "thumbnails"
+    shutil.copytree(src / "compiler", dst / "compiler")
+    shutil.copy(src / "templates.json", dst / "templates.json")
+    # Worker processes are spawned, so the roots must come from the environment.
+    monkeypatch.setenv("YTM_REPO_ROOT", str(tmp_path))
+    monkeypatch.setenv("YTM_WORKSPACE_ROOT", str(tmp_path / "workspaces"))
+    monkeypatch.setenv("YTM_THUMB_FONT_PATH", font)
+    paths.repo_root.cache_clear()
+    paths.workspace_root.cache_clear()
+    yield dst
+    paths.repo_root.cache_clear()
+    paths.workspace_root.cache_clear()
+
+
+def test_parallel_skip_generate_build_composes_all_targets(_thumb_workspace, monkeypatch):
+    from PIL import Image
+
+    targets = [lsb.BuildTarget("CH01", v) for v in ("001", "002", "003")]
+    for t in targets[:2]:
+        video_dir = _thumb_workspace / "assets" / "CH01" / t.video
+        video_dir.mkdir(parents=True)
+        Image.new("RGB", (1920, 1080), (40, 60, 80)).save(video_dir / "10_bg.png")
+
+    writes = []
+    write = lsb._write_thumbnail_projects
+    monkeypatch.setattr(lsb, "_write_thumbnail_projects", lambda doc: (writes.append(1), write(doc)))
+    counts = lsb.build_channel_thumbnails(
+        channel="CH01",
+        targets=targets,
+        width=640,
+        height=360,
+        force=False,
+        skip_generate=True,
+        continue_on_error=False,
+        max_gen_attempts=1,
+        export_flat=False,
+        flat_name_suffix="",
+        sleep_sec=0.0,
+        bg_brightness=1.0,
+        bg_contrast=1.0,
+        bg_color=1.0,
+        bg_gamma=1.0,
+        workers=2,
+    )
+
+    assert counts["rebuilt"] == 2 and counts["missing_bg"] == 1 and counts["failed"] == 0
+    for t in targets[:2]:
+        assert (_thumb_workspace / "assets" / "CH01" / t.video / "00_thumb.png").is_file()
+    assert len(writes) == 1  # projects.json merged once for the whole run
+    doc = json.loads((_thumb_workspace / "projects.json").read_text(encoding="utf-8"))
+    built = sorted(p["video"] for p in doc["projects"] if p.get("variants"))
+    assert built == ["001", "002"]
@@ -0,0 +1,76 @@
+import dataclasses
+import json
+
+from script_pipeline.thumbnails.tools import layer_specs_builder as lsb
+
+
+def _ctx(tmp_path, **overrides):
+    values = {f.name: None for f in dataclasses.fields(lsb._ChannelBuildContext)}
+    values.update(
+        channel="CH01",
+        stable_thumb_name="00_thumb.png",
+        force=False,
+        export_flat=False,
+        assets_root=tmp_path,
+    )
+    values.update(overrides)
+    return lsb._ChannelBuildContext(**values)
+
+
+def _target():
+    return lsb.BuildTarget(channel="CH01", video="001")
+
+
+def _setup(tmp_path, monkeypatch, fingerprint="fp-1"):
+    video_dir = tmp_path / "001"
+    (video_dir / "compiler").mkdir(parents=True)
+    thumb = video_dir / "00_thumb.png"
+    thumb.write_bytes(b"thumb")
+    bg = video_dir / "10_bg.png"
+    bg.write_bytes(b"bg")
+    monkeypatch.setattr(
+        lsb,
+        "_resolve_existing_background",
+        lambda ctx, target: lsb._TargetBackground(bg_src=bg, legacy_moved_from=None, generated=None),
+    )
+    monkeypatch.setattr(lsb, "_render_fingerprint", lambda ctx, target, bg_path: fingerprint)
+    return video_dir, thumb
+
+
+def _write_record(video_dir, thumb, fingerprint):
+    record = {"fingerprint": fingerprint, "thumb_sha256": lsb._file_digest(thumb)}
+    lsb._render_record_path(video_dir, "00_thumb.png").write_text(json.dumps(record), encoding="utf-8")
+
+
+def test_unchanged_inputs_skip_and_changed_inputs_rebuild(tmp_path, monkeypatch):
+    video_dir, thumb = _setup(tmp_path, monkeypatch, fingerprint="fp-1")
+    _write_record(video_dir, thumb, "fp-1")
+    assert lsb._skip_reason(_ctx(tmp_path), 1, 1, _target()) == "unchanged"
+    assert lsb._skip_reason(_ctx(tmp_path, force=True), 1, 1, _target()) is None
+
+    _write_record(video_dir, thumb, "fp-0")
+    assert lsb._skip_reason(_ctx(tmp_path), 1, 1, _target()) is None
+
+
+def test_unrecorded_or_hand_edited_thumbs_are_kept(tmp_path, monkeypatch):
+    video_dir, thumb = _setup(tmp_path, monkeypatch)
+    assert lsb._skip_reason(_ctx(tmp_path), 1, 1, _target()) == "kept"
+
+    _write_record(video_dir, thumb, "fp-0")
+    thumb.write_bytes(b"replaced in the UI")
+    assert lsb._skip_reason(_ctx(tmp_path), 1, 1, _target()) == "kept"
+
+
+def test_missing_thumb_is_built(tmp_path, monkeypatch):
+    _video_dir, thumb = _setup(tmp_path, monkeypatch)
+    thumb.unlink()
+    assert lsb._skip_reason(_ctx(tmp_path), 1, 1, _target()) is None
+
+
+def test_file_digest_tracks_content(tmp_path):
+    path = tmp_path / "a.bin"
+    assert lsb._file_digest(path) is None
+    path.write_bytes(b"one")
+    first = lsb._file_digest(path)
+    path.write_bytes(b"two!")
+    assert lsb._file_digest(path) != first
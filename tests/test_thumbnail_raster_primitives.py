@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import random
+from typing import Any, List, Sequence, Tuple
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+from script_pipeline.thumbnails.compiler import compose_text_layout as cl
+
+RGBA = Tuple[int, int, int, int]
+
+
+# --- Pre-NumPy reference implementations (per-pixel loops), kept verbatim for bit-compat checks.
+
+
+def _legacy_build_vertical_gradient(size: Tuple[int, int], stops: Sequence[Sequence[Any]]) -> Image.Image:
+    w, h = size
+    if w <= 0 or h <= 0:
+        raise ValueError(f"invalid gradient size: {size}")
+    parsed: List[Tuple[RGBA, float]] = []
+    for stop in stops:
+        if not isinstance(stop, (list, tuple)) or len(stop) != 2:
+            continue
+        color, pos = stop
+        if not isinstance(pos, (int, float)):
+            continue
+        parsed.append((cl._parse_color(str(color)), float(pos)))
+    if not parsed:
+        return Image.new("RGBA", size, (255, 255, 255, 255))
+    parsed.sort(key=lambda it: it[1])
+
+    img = Image.new("RGBA", size)
+    px = img.load()
+    if px is None:
+        return img
+
+    for y in range(h):
+        t = y / max(1, (h - 1))
+        lo = parsed[0]
+        hi = parsed[-1]
+        for i in range(len(parsed) - 1):
+            if parsed[i][1] <= t <= parsed[i + 1][1]:
+                lo = parsed[i]
+                hi = parsed[i + 1]
+                break
+        if hi[1] == lo[1]:
+            col = lo[0]
+        else:
+            local_t = (t - lo[1]) / (hi[1] - lo[1])
+            col = cl._lerp_rgba(lo[0], hi[0], local_t)
+        for x in range(w):
+            px[x, y] = col
+    return img
+
+
+def _legacy_apply_horizontal_overlay(
+    base: Image.Image,
+    *,
+    x0: float,
+    x1: float,
+    color: RGBA,
+    alpha_left: float,
+    alpha_right: float,
+) -> Image.Image:
+    """
+    Apply a horizontal alpha gradient overlay between x0..x1 (normalized 0..1).
+    """
+    img = base.convert("RGBA")
+    w, h = img.size
+    x0 = max(0.0, min(1.0, float(x0)))
+    x1 = max(0.0, min(1.0, float(x1)))
+    if x1 <= x0 + 1e-6:
+        return img
+    a0 = max(0.0, min(1.0, float(alpha_left)))
+    a1 = max(0.0, min(1.0, float(alpha_right)))
+
+    start_px = int(round(x0 * w))
+    end_px = int(round(x1 * w))
+    start_px = max(0, min(w, start_px))
+    end_px = max(0, min(w, end_px))
+    if end_px <= start_px:
+        return img
+
+    values: List[int] = [0] * w
+    span = max(1, end_px - start_px)
+    for x in range(start_px, end_px):
+        t = (x - start_px) / span
+        alpha = (a0 * (1.0 - t)) + (a1 * t)
+        values[x] = int(round(alpha * 255))
+
+    mask_row = Image.new("L", (w, 1), 0)
+    mask_row.putdata(values)
+    mask = mask_row.resize((w, h))
+
+    overlay = Image.new("RGBA", (w, h), (color[0], color[1], color[2], 255))
+    overlay.putalpha(mask)
+    return Image.alpha_composite(img, overlay)
+
+
+def _legacy_apply_vertical_overlay(
+    base: Image.Image,
+    *,
+    y0: float,
+    y1: float,
+    color: RGBA,
+    alpha_top: float,
+    alpha_bottom: float,
+) -> Image.Image:
+    """
+    Apply a vertical alpha gradient overlay between y0..y1 (normalized 0..1).
+    """
+    img = base.convert("RGBA")
+    w, h = img.size
+    y0 = max(0.0, min(1.0, float(y0)))
+    y1 = max(0.0, min(1.0, float(y1)))
+    if y1 <= y0 + 1e-6:
+        return img
+    a0 = max(0.0, min(1.0, float(alpha_top)))
+    a1 = max(0.0, min(1.0, float(alpha_bottom)))
+
+    start_px = int(round(y0 * h))
+    end_px = int(round(y1 * h))
+    start_px = max(0, min(h, start_px))
+    end_px = max(0, min(h, end_px))
+    if end_px <= start_px:
+        return img
+
+    values: List[int] = [0] * h
+    span = max(1, end_px - start_px)
+    for y in range(start_px, end_px):
+        t = (y - start_px) / span
+        alpha = (a0 * (1.0 - t)) + (a1 * t)
+        values[y] = int(round(alpha * 255))
+
+    mask_col = Image.new("L", (1, h), 0)
+    mask_col.putdata(values)
+    mask = mask_col.resize((w, h))
+
+    overlay = Image.new("RGBA", (w, h), (color[0], color[1], color[2], 255))
+    overlay.putalpha(mask)
+    return Image.alpha_composite(img, overlay)
+
+
+def _legacy_smooth_noise(values: List[float], *, window: int) -> List[float]:
+    if not values:
+        return []
+    w = max(1, int(window))
+    if w <= 1:
+        return list(values)
+    if w % 2 == 0:
+        w += 1
+    half = w // 2
+    n = len(values)
+    out: List[float] = [0.0] * n
+    for i in range(n):
+        s = 0.0
+        c = 0
+        lo = max(0, i - half)
+        hi = min(n - 1, i + half)
+        for j in range(lo, hi + 1):
+            s += float(values[j])
+            c += 1
+        out[i] = s / float(c or 1)
+    return out
+
+
+def _legacy_build_brush_band_mask(
+    size: Tuple[int, int],
+    *,
+    edge: str,
+    max_alpha: int,
+    seed: int,
+    roughness: float,
+    feather_px: int,
+    hole_count: int,
+    blur_px: int,
+) -> Image.Image:
+    """
+    Build a "brush stroke" alpha mask for a band region.
+
+    edge:
+      - "bottom": irregular bottom edge (top band)
+      - "top": irregular top edge (bottom band)
+    """
+    w, h = int(size[0]), int(size[1])
+    if w <= 0 or h <= 0:
+        return Image.new("L", (max(1, w), max(1, h)), 0)
+
+    edge_key = str(edge or "").strip().lower()
+    if edge_key not in {"bottom", "top"}:
+        edge_key = "bottom"
+
+    a = max(0, min(255, int(max_alpha)))
+    rough = max(0.0, min(0.55, float(roughness)))
+    feather = max(1, int(feather_px))
+    blur = max(0, int(blur_px))
+
+    rng = random.Random(int(seed) & 0xFFFFFFFF_FFFFFFFF)
+
+    # Low-frequency noise curve along X
+    step = max(18, int(round(w / 72.0)))
+    cps = [rng.uniform(-1.0, 1.0) for _ in range((w // step) + 3)]
+    raw_noise: List[float] = [0.0] * w
+    for i in range(len(cps) - 1):
+        x0 = i * step
+        x1 = min(w - 1, (i + 1) * step)
+        if x0 >= w:
+            break
+        v0, v1 = cps[i], cps[i + 1]
+        span = max(1, x1 - x0)
+        for x in range(x0, x1 + 1):
+            t = (x - x0) / float(span)
+            raw_noise[x] = (v0 * (1.0 - t)) + (v1 * t)
+    noise = _legacy_smooth_noise(raw_noise, window=max(5, step // 2))
+
+    # Edge curve (near the far side of the band so the text region stays solid).
+    if edge_key == "bottom":
+        base_edge = int(round(h * 0.97))
+        # Keep most of the band solid to preserve text legibility.
+        min_edge = int(round(h * 0.90))
+        max_edge = h - 1
+    else:
+        base_edge = int(round(h * 0.03))
+        min_edge = 0
+        max_edge = int(round(h * 0.20))
+
+    amp = max(1, int(round(h * rough)))
+    curve: List[int] = [0] * w
+    for x in range(w):
+        ey = base_edge + int(round(noise[x] * amp))
+        curve[x] = max(min_edge, min(max_edge, ey))
+
+    mask = Image.new("L", (w, h), 0)
+    pix = mask.load()
+
+    for x in range(w):
+        ey = int(curve[x])
+        if edge_key == "bottom":
+            for y in range(0, max(0, min(h, ey))):
+                pix[x, y] = a
+            for y in range(max(0, ey), max(0, min(h, ey + feather))):
+                t = (y - ey) / float(feather)
+                pix[x, y] = int(round(a * (1.0 - t)))
+        else:
+            for y in range(max(0, ey), h):
+                pix[x, y] = a
+            for y in range(max(0, ey - feather), max(0, min(h, ey))):
+                t = (ey - y) / float(feather)
+                pix[x, y] = int(round(a * (1.0 - t)))
+
+    # Punch a few "bristle holes" near the rough edge.
+    holes = max(0, int(hole_count))
+    if holes:
+        draw = ImageDraw.Draw(mask)
+        for _ in range(holes):
+            # Small "paint thinning" specks near the rough edge (avoid big blobs/slits).
+            rw = rng.randint(max(6, w // 320), max(18, w // 90))
+            rh = rng.randint(max(4, h // 80), max(14, h // 26))
+            rw = max(6, min(w - 1, rw))
+            rh = max(4, min(h - 1, rh))
+            x0 = rng.randint(0, max(0, w - rw))
+            if edge_key == "bottom":
+                y0 = rng.randint(max(0, h - max(8, int(round(feather * 2.2)))), max(0, h - rh))
+            else:
+                y0 = rng.randint(0, min(max(0, h - rh), max(0, int(round(feather * 1.6)))))
+            fill = int(round(a * rng.uniform(0.55, 0.90)))
+            draw.ellipse([x0, y0, x0 + rw, y0 + rh], fill=max(0, min(a, fill)))
+
+    # Add dry-brush texture near the rough edge (avoid "flat rectangle" look).
+    if a > 0 and rough > 0.0:
+        edge_band = int(round(max(18.0, float(feather) * 1.6, float(h) * 0.10)))
+        edge_band = max(8, min(h, edge_band))
+        # Higher-res noise to avoid large "bubble" artifacts.
+        nw = max(96, w // 24)
+        nh = max(24, edge_band // 3)
+        noise_small = Image.new("L", (nw, nh), 0)
+        noise_small.putdata([rng.randint(0, 255) for _ in range(nw * nh)])
+        noise = noise_small.resize((w, edge_band), resample=Image.BILINEAR)
+        noise_px = noise.load()
+
+        if edge_key == "bottom":
+            y_start = h - edge_band
+            for y in range(y_start, h):
+                wy = (y - y_start) / float(max(1, edge_band - 1))  # 0..1 (strong near bottom)
+                for x in range(w):
+                    cur = int(pix[x, y] or 0)
+                    if cur <= 0:
+                        continue
+                    n = float(noise_px[x, y - y_start]) / 255.0
+                    f = 0.60 + (0.40 * n)
+                    pix[x, y] = int(round(cur * ((1.0 - wy) + (wy * f))))
+        else:
+            y_end = edge_band
+            for y in range(0, y_end):
+                wy = (y_end - 1 - y) / float(max(1, y_end - 1))  # 0..1 (strong near top)
+                for x in range(w):
+                    cur = int(pix[x, y] or 0)
+                    if cur <= 0:
+                        continue
+                    n = float(noise_px[x, y]) / 255.0
+                    f = 0.60 + (0.40 * n)
+                    pix[x, y] = int(round(cur * ((1.0 - wy) + (wy * f))))
+
+    if blur:
+        mask = mask.filter(ImageFilter.GaussianBlur(radius=float(blur)))
+    return mask
+
+
+def _legacy_build_brush_stroke_mask(
+    size: Tuple[int, int],
+    *,
+    max_alpha: int,
+    seed: int,
+    roughness: float,
+    feather_px: int,
+    hole_count: int,
+    blur_px: int,
+) -> Image.Image:
+    """
+    Build an organic "brush stroke" alpha mask meant to sit behind text (not a full-width band).
+
+    This is intentionally stylized: irregular edges + slight splatter so it reads as "ink/brush".
+    """
+    w, h = int(size[0]), int(size[1])
+    if w <= 0 or h <= 0:
+        return Image.new("L", (max(1, w), max(1, h)), 0)
+
+    a = max(0, min(255, int(max_alpha)))
+    rough = max(0.0, min(0.85, float(roughness)))
+    feather = max(0, int(feather_px))
+    blur = max(0, int(blur_px))
+
+    rng = random.Random(int(seed) & 0xFFFFFFFF_FFFFFFFF)
+
+    # Build a brush-like "ink band" by combining top+bottom rough edges and tapering the ends.
+    holes = max(0, int(hole_count))
+    edge_holes = max(0, int(round(holes * 0.55)))
+    inner_holes = max(0, holes - edge_holes)
+    edge_blur = max(0, blur - 1)
+    edge_rough = max(0.0, min(0.55, (rough * 0.92) + 0.04))
+
+    top = _legacy_build_brush_band_mask(
+        (w, h),
+        edge="top",
+        max_alpha=a,
+        seed=int(seed) ^ 0xBADC0FFE,
+        roughness=edge_rough,
+        feather_px=feather,
+        hole_count=edge_holes,
+        blur_px=edge_blur,
+    )
+    bottom = _legacy_build_brush_band_mask(
+        (w, h),
+        edge="bottom",
+        max_alpha=a,
+        seed=(int(seed) + 1337) ^ 0xC0FFEE,
+        roughness=edge_rough,
+        feather_px=feather,
+        hole_count=edge_holes,
+        blur_px=edge_blur,
+    )
+    mask = ImageChops.darker(top, bottom)
+
+    # End taper: fade alpha near left/right ends so it reads as a brush stroke, not a rectangle.
+    end_span = max(10, int(round(w * (0.14 + (0.10 * rough)))))
+    taper_vals: List[int] = [0] * w
+    for x in range(w):
+        dist = min(x, (w - 1) - x)
+        t = min(1.0, float(dist) / float(end_span))
+        # Ease-in to keep center solid and ends thin.
+        t = t ** 0.70
+        factor = 0.10 + (0.90 * t)
+        taper_vals[x] = int(round(255 * factor))
+    taper_mask = Image.new("L", (w, 1), 0)
+    taper_mask.putdata(taper_vals)
+    taper_mask = taper_mask.resize((w, h), resample=Image.BILINEAR)
+    mask = ImageChops.multiply(mask, taper_mask)
+
+    draw = ImageDraw.Draw(mask)
+
+    # Interior thinning (subtle): a few low-alpha "dry" patches inside the band.
+    if inner_holes:
+        for _ in range(inner_holes):
+            rw = rng.randint(max(10, w // 120), max(38, w // 55))
+            rh = rng.randint(max(6, h // 22), max(26, h // 10))
+            rw = max(6, min(w - 1, rw))
+            rh = max(4, min(h - 1, rh))
+            x0 = rng.randint(0, max(0, w - rw))
+            y0 = rng.randint(0, max(0, h - rh))
+            fill = int(round(a * rng.uniform(0.10, 0.55)))
+            draw.ellipse([x0, y0, x0 + rw, y0 + rh], fill=max(0, min(a, fill)))
+
+    # Splatter near the top/bottom edges for a more "brush/ink" look.
+    splatter = max(0, int(round(holes * (0.70 + (rough * 0.85)))))
+    splatter = min(splatter, 70 + max(0, w // 28))
+    if splatter:
+        for _ in range(splatter):
+            r = rng.randint(2, max(3, int(round(min(w, h) * 0.028))))
+            x0 = rng.randint(0, max(0, w - 1))
+            if rng.random() < 0.5:
+                y0 = rng.randint(0, max(0, int(round(h * 0.36))))
+            else:
+                y0 = rng.randint(min(h - 1, int(round(h * 0.64))), h - 1)
+            fill = int(round(a * rng.uniform(0.12, 0.58)))
+            draw.ellipse([x0 - r, y0 - r, x0 + r, y0 + r], fill=max(0, min(a, fill)))
+
+    # Final softening for anti-aliasing (keep small so texture survives).
+    if blur > 0:
+        mask = mask.filter(ImageFilter.GaussianBlur(radius=float(blur)))
+    return mask
+
+
+# --- Tests
+
+
+def _same(a: Image.Image, b: Image.Image) -> bool:
+    return a.mode == b.mode and a.size == b.size and a.tobytes() == b.tobytes()
+
+
+def _base(size: Tuple[int, int], seed: int) -> Image.Image:
+    rng = random.Random(seed)
+    img = Image.new("RGBA", size)
+    img.putdata([(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 255) for _ in range(size[0] * size[1])])
+    return img
+
+
+@pytest.mark.parametrize(
+    "size,stops",
+    [
+        ((37, 61), [["#ff0000", 0.0], ["rgba(0,0,255,0.5)", 1.0]]),
+        ((64, 128), [["#101010", 0.0], ["#f0e0d0", 0.35], ["#f0e0d0", 0.35], ["rgba(10,200,30,0.2)", 1.0]]),
+        ((5, 1), [["#ffffff", 0.5]]),
+        ((9, 40), [["#000000", 0.2], ["#ffffff", 0.8]]),  # extrapolated (clamped) ends
+        ((12, 12), []),
+    ],
+)
+def test_vertical_gradient_matches_legacy(size, stops) -> None:
+    assert _same(cl._build_vertical_gradient(size, stops), _legacy_build_vertical_gradient(size, stops))
+
+
+def test_alpha_overlays_match_legacy() -> None:
+    base = _base((83, 47), seed=1)
+    for x0, x1, a0, a1 in [(0.0, 1.0, 0.0, 0.9), (0.1, 0.63, 0.7, 0.2), (0.5, 0.5, 1.0, 1.0), (0.99, 1.0, 1.0, 0.0)]:
+        kw = dict(color=(12, 34, 56, 255))
+        assert _same(
+            cl._apply_horizontal_overlay(base, x0=x0, x1=x1, alpha_left=a0, alpha_right=a1, **kw),
+            _legacy_apply_horizontal_overlay(base, x0=x0, x1=x1, alpha_left=a0, alpha_right=a1, **kw),
+        )
+        assert _same(
+            cl._apply_vertical_overlay(base, y0=x0, y1=x1, alpha_top=a0, alpha_bottom=a1, **kw),
+            _legacy_apply_vertical_overlay(base, y0=x0, y1=x1, alpha_top=a0, alpha_bottom=a1, **kw),
+        )
+
+
+def test_smooth_noise_matches_legacy() -> None:
+    rng = random.Random(7)
+    for n in [0, 1, 2, 5, 17, 200]:
+        values = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+        for window in [0, 1, 2, 5, 8, 31, 400]:
+            assert cl._smooth_noise(values, window=window) == _legacy_smooth_noise(values, window=window)
+
+
+@pytest.mark.parametrize("edge", ["bottom", "top", "bogus"])
+@pytest.mark.parametrize("size", [(1, 8), (19, 9), (240, 90), (641, 133)])
+def test_brush_band_mask_matches_legacy(edge, size) -> None:
+    for seed, rough, feather, holes, blur in [(1, 0.3, 12, 4, 0), (99, 0.0, 1, 0, 2), (cl._stable_seed_u64("CH01-001"), 0.55, 30, 9, 1)]:
+        kw = dict(edge=edge, max_alpha=230, seed=seed, roughness=rough, feather_px=feather, hole_count=holes, blur_px=blur)
+        assert _same(cl._build_brush_band_mask(size, **kw), _legacy_build_brush_band_mask(size, **kw)), (seed, rough)
+
+
+@pytest.mark.parametrize("size", [(3, 8), (120, 40), (700, 160)])
+def test_brush_stroke_mask_matches_legacy(size) -> None:
+    for seed, rough, feather, holes, blur in [(3, 0.4, 10, 12, 2), (cl._stable_seed_u64("x"), 0.85, 0, 0, 0)]:
+        kw = dict(max_alpha=200, seed=seed, roughness=rough, feather_px=feather, hole_count=holes, blur_px=blur)
+        assert _same(cl._build_brush_stroke_mask(size, **kw), _legacy_build_brush_stroke_mask(size, **kw))
+
+
+@pytest.mark.parametrize("size", [(1, 1), (19, 7), (5, 3)])
+def test_brush_masks_handle_bands_shorter_than_texture(size) -> None:
+    kw = dict(max_alpha=230, seed=1, roughness=0.3, feather_px=12, hole_count=0, blur_px=0)
+    for edge in ["bottom", "top"]:
+        assert cl._build_brush_band_mask(size, edge=edge, **kw).size == size
+    assert cl._build_brush_stroke_mask(size, **kw).size == size
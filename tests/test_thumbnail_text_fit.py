@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, List, Sequence, Tuple
+
+import pytest
+from PIL import ImageFont
+
+from script_pipeline.thumbnails.compiler import compile_buddha_3line as b3
+from script_pipeline.thumbnails.compiler import compose_text_layout as cl
+
+
+# --- Pre-bisection reference implementation (linear size walk, uncached measurements).
+
+
+def _legacy_wrap_tokens_to_lines(
+    tokens: Sequence[str],
+    font: Any,
+    max_width: int,
+    max_lines: int,
+    stroke_width: int,
+    tracking: int,
+) -> Tuple[List[str], bool]:
+    lines: List[str] = []
+    cur = ""
+    overflow = False
+
+    def push_line(s: str) -> None:
+        nonlocal lines
+        if s is None:
+            return
+        line = s.strip()
+        if line:
+            lines.append(line)
+
+    for tok in tokens:
+        if tok == "\n":
+            push_line(cur)
+            cur = ""
+            if len(lines) >= max_lines:
+                overflow = True
+                break
+            continue
+        if tok == " " and not cur:
+            continue
+        candidate = cur + tok
+        w, _ = cl._measure_line(font, candidate, stroke_width=stroke_width, tracking=tracking)
+        if w <= max_width:
+            cur = candidate
+            continue
+        if cur:
+            push_line(cur)
+            cur = tok.strip() if tok != " " else ""
+        else:
+            # single token too wide -> hard split by characters
+            hard = ""
+            for ch in tok:
+                cand = hard + ch
+                w2, _ = cl._measure_line(font, cand, stroke_width=stroke_width, tracking=tracking)
+                if w2 <= max_width or not hard:
+                    hard = cand
+                    continue
+                push_line(hard)
+                hard = ch
+                if len(lines) >= max_lines:
+                    overflow = True
+                    break
+            cur = hard
+        if len(lines) >= max_lines:
+            overflow = True
+            break
+
+    if not overflow:
+        push_line(cur)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        overflow = True
+    return lines, overflow
+
+
+def _legacy_fit_text_to_box(
+    text: str,
+    font_path: str,
+    base_size: int,
+    max_width: int,
+    max_height: int,
+    max_lines: int,
+    stroke_width: int,
+    tracking: int = 0,
+    min_size: int = 22,
+) -> cl.FitResult:
+    raw = (text or "").strip()
+    if not raw:
+        return cl.FitResult(lines=[], font_size=base_size, line_gap=0, stroke_width=stroke_width)
+
+    tokens = cl._tokenize_for_wrap(raw)
+    size = max(min_size, int(base_size))
+    tr = int(tracking or 0)
+    while size >= min_size:
+        font = cl._load_truetype(font_path, size)
+        lines, overflow = _legacy_wrap_tokens_to_lines(
+            tokens,
+            font,
+            max_width=max_width,
+            max_lines=max_lines,
+            stroke_width=stroke_width,
+            tracking=tr,
+        )
+        gap = max(2, int(round(size * 0.03)))
+        total_h = 0
+        max_w = 0
+        for idx, line in enumerate(lines):
+            w, h = cl._measure_line(font, line, stroke_width=stroke_width, tracking=tr)
+            max_w = max(max_w, w)
+            total_h += h
+            if idx > 0:
+                total_h += gap
+        if (not overflow) and max_w <= max_width and total_h <= max_height:
+            return cl.FitResult(lines=lines, font_size=size, line_gap=gap, stroke_width=stroke_width)
+        size -= 2
+
+    font = cl._load_truetype(font_path, min_size)
+    lines, _ = _legacy_wrap_tokens_to_lines(tokens, font, max_width=max_width, max_lines=max_lines, stroke_width=stroke_width, tracking=tr)
+    gap = max(2, int(round(min_size * 0.03)))
+    return cl.FitResult(lines=lines, font_size=min_size, line_gap=gap, stroke_width=stroke_width)
+
+
+# --- Tests
+
+
+@pytest.fixture(autouse=True)
+def _default_font(monkeypatch):
+    """Route font loading to Pillow's bundled FreeType font so the test needs no system fonts."""
+
+    @lru_cache(maxsize=None)
+    def _load(font_ref: str, size: int) -> ImageFont.FreeTypeFont:
+        return ImageFont.load_default(size=int(size))
+
+    monkeypatch.setattr(cl, "_load_truetype", _load)
+    cl._text_metrics.cache_clear()
+    cl._fit_text_to_box_cached.cache_clear()
+    yield
+    cl._text_metrics.cache_clear()
+    cl._fit_text_to_box_cached.cache_clear()
+
+
+def _random_text(rng: random.Random) -> str:
+    words = ["Buddha", "mind", "quiet", "THE", "way", "of", "letting", "go", "-", "2026", "zen:now", "A"]
+    parts: List[str] = []
+    for _ in range(rng.randint(1, 14)):
+        pick = rng.random()
+        if pick < 0.6:
+            parts.append(rng.choice(words))
+        elif pick < 0.8:
+            parts.append(" ")
+        elif pick < 0.9:
+            parts.append("\n")
+        else:
+            parts.append(rng.choice(["心", "の", "静", "け", "さ"]) * rng.randint(1, 4))
+    return "".join(parts)
+
+
+def test_fit_matches_linear_walk() -> None:
+    rng = random.Random(11)
+    for _ in range(120):
+        text = _random_text(rng)
+        kw = dict(
+            font_path="default",
+            base_size=rng.choice([22, 40, 71, 96, 140]),
+            max_width=rng.randint(40, 900),
+            max_height=rng.randint(20, 400),
+            max_lines=rng.randint(1, 4),
+            stroke_width=rng.choice([0, 3, 8]),
+            tracking=rng.choice([0, 0, -2, 4]),
+            min_size=rng.choice([10, 22]),
+        )
+        assert cl._fit_text_to_box(text, **kw) == _legacy_fit_text_to_box(text, **kw), (text, kw)
+
+
+def test_fit_with_unbreakable_tokens_stays_valid() -> None:
+    # Hard-split runs make fit-ness non-monotone in size; the bisected answer must still fit.
+    rng = random.Random(2)
+    for _ in range(150):
+        text = " ".join("x" * rng.randint(3, 30) for _ in range(rng.randint(1, 4)))
+        kw = dict(font_path="default", base_size=120, max_width=rng.randint(80, 700), max_height=rng.randint(40, 400), max_lines=3, stroke_width=2, min_size=10)
+        fit = cl._fit_text_to_box(text, **kw)
+        if fit.font_size == kw["min_size"]:
+            assert fit == _legacy_fit_text_to_box(text, **kw)
+            continue
+        font = cl._load_truetype("default", fit.font_size)
+        sizes = [cl._measure_line(font, line, stroke_width=2, tracking=0) for line in fit.lines]
+        assert 1 <= len(fit.lines) <= 3
+        assert max(w for w, _ in sizes) <= kw["max_width"]
+        assert sum(h for _, h in sizes) + fit.line_gap * (len(sizes) - 1) <= kw["max_height"]
+
+
+def test_fit_probes_logarithmically_and_reuses_results(monkeypatch) -> None:
+    probed: List[int] = []
+    real = cl._TextMetrics.wrap
+
+    def _wrap(self, tokens, max_width, max_lines):
+        probed.append(self.font.size)
+        return real(self, tokens, max_width, max_lines)
+
+    monkeypatch.setattr(cl._TextMetrics, "wrap", _wrap)
+    text = "letting go of the quiet mind " * 6
+    kw = dict(font_path="default", base_size=400, max_width=600, max_height=120, max_lines=3, stroke_width=4, min_size=10)
+    first = cl._fit_text_to_box(text, **kw)
+    assert first == _legacy_fit_text_to_box(text, **kw)
+    assert len(probed) <= 10  # 196-size ladder -> ~log2 probes instead of ~190
+
+    probed.clear()
+    again = cl._fit_text_to_box(text, **kw)
+    assert again == first and again.lines is not first.lines
+    assert probed == []
+
+
+def test_buddha_three_line_shrink_matches_linear_walk(monkeypatch) -> None:
+    monkeypatch.setattr(b3, "ImageFont", SimpleNamespace(truetype=lambda path, size: ImageFont.load_default(size=int(size))))
+
+    def _legacy(text, **kw):
+        sizes = b3._fit_three_lines(text, **{**kw, "max_height": 10**9})
+        cache: dict = {}
+
+        def total_height(sz):
+            hs = []
+            for t, s in zip((text.upper, text.title, text.lower), sz):
+                if not t:
+                    hs.append(0)
+                    continue
+                font = cache.setdefault(s, ImageFont.load_default(size=s))
+                sw = b3._scale_int(kw["stroke_base"], s / max(1, kw["size_base"]), min_value=1)
+                a, d = font.getmetrics()
+                hs.append(int(round((a + d + (sw * 2)) * kw["line_height"])))
+            return sum(hs) + max(0, sum(1 for t in (text.upper, text.title, text.lower) if t) - 1) * kw["gap"]
+
+        h = total_height(sizes)
+        if h <= kw["max_height"]:
+            return sizes
+        scale = kw["max_height"] / max(1, h)
+        sizes = tuple(max(kw["size_min"], int(s * scale)) for s in sizes)
+        for _ in range(200):
+            if total_height(sizes) <= kw["max_height"]:
+                return sizes
+            if all(s <= kw["size_min"] for s in sizes):
+                return sizes
+            sizes = tuple(max(kw["size_min"], s - 1) for s in sizes)
+        return sizes
+
+    rng = random.Random(5)
+    for _ in range(40):
+        text = b3.ThumbText(upper=_random_text(rng)[:12], title=_random_text(rng)[:20], lower=rng.choice(["", "Go"]))
+        kw = dict(
+            font_path="default",
+            max_width=rng.randint(200, 1200),
+            max_height=rng.randint(60, 500),
+            size_min=rng.choice([12, 24]),
+            size_base=100,
+            size_max=rng.choice([120, 220]),
+            stroke_base=6,
+            line_height=1.05,
+            gap=rng.randint(0, 20),
+        )
+        assert b3._fit_three_lines(text, **kw) == _legacy(text, **kw)
@@ -0,0 +1,100 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from backend.app import video_asset_watch
+
+
+@pytest.fixture(autouse=True)
+def _hubs(monkeypatch):
+    monkeypatch.delenv("YTM_FS_WATCH_DISABLE", raising=False)
+    video_asset_watch.reset_hubs()
+    yield
+    video_asset_watch.reset_hubs()
+
+
+def _make_run(root: Path) -> Path:
+    project_dir = root / "CH01-001_run"
+    (project_dir / "images").mkdir(parents=True)
+    (project_dir / "images" / "0001.png").write_bytes(b"png")
+    (project_dir / "images" / "notes.txt").write_text("skip", encoding="utf-8")
+    (project_dir / "image_variants" / "v1" / "images").mkdir(parents=True)
+    (project_dir / "image_variants" / "v1" / "images" / "0001.jpg").write_bytes(b"jpg")
+    return project_dir
+
+
+async def _next(sub, *, want: str, timeout: float = 5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        event = await sub.get(timeout=0.2)
+        if event is not None and event[0] == want:
+            return event[1]
+    raise AssertionError(f"no {want} event within {timeout}s")
+
+
+@pytest.mark.parametrize("fs_watch", [True, False])
+def test_hub_snapshot_matches_scan_and_pushes_changes(tmp_path, monkeypatch, fs_watch):
+    if not fs_watch:
+        monkeypatch.setenv("YTM_FS_WATCH_DISABLE", "1")
+    project_dir = _make_run(tmp_path)
+
+    async def scenario():
+        sub, snapshot = video_asset_watch.subscribe("CH01-001_run", project_dir, poll_interval=0.2)
+        try:
+            scanned = video_asset_watch.scan_assets("CH01-001_run", project_dir)
+            assert snapshot == [asset for _, asset in scanned.values()]
+            assert [a["kind"] for a in snapshot] == ["final", "variant"]
+            assert snapshot[1]["variant_id"] == "v1"
+            if fs_watch and video_asset_watch.InotifyWatcher.create() is not None:
+                assert sub.hub.watching
+
+            (project_dir / "images" / "0002.webp").write_bytes(b"webp")
+            upsert = await _next(sub, want="upsert")
+            assert upsert["asset"]["path"] == "CH01-001_run/images/0002.webp"
+
+            # New variant dir: the hub starts watching it and reports its images.
+            (project_dir / "image_variants" / "v2" / "images").mkdir(parents=True)
+            await asyncio.sleep(0.3)
+            (project_dir / "image_variants" / "v2" / "images" / "0001.png").write_bytes(b"png")
+            upsert = await _next(sub, want="upsert")
+            assert upsert["asset"]["path"] == "CH01-001_run/image_variants/v2/images/0001.png"
+
+            os.remove(project_dir / "images" / "0001.png")
+            remove = await _next(sub, want="remove")
+            assert remove["path"] == "CH01-001_run/images/0001.png"
+        finally:
+            sub.close()
+
+    asyncio.run(scenario())
+    assert video_asset_watch.active_hubs() == {}
+
+
+def test_subscribers_share_one_hub_and_resync_when_lagging(tmp_path, monkeypatch):
+    monkeypatch.setattr(video_asset_watch, "SUBSCRIBER_QUEUE_MAX", 1)
+    project_dir = _make_run(tmp_path)
+
+    async def scenario():
+        a, _ = video_asset_watch.subscribe("CH01-001_run", project_dir)
+        b, _ = video_asset_watch.subscribe("CH01-001_run", project_dir)
+        assert a.hub is b.hub and a.hub.subscriber_count == 2
+        assert list(video_asset_watch.active_hubs()) == [project_dir]
+
+        (project_dir / "images" / "0002.png").write_bytes(b"png")
+        (project_dir / "images" / "0003.png").write_bytes(b"png")
+        await asyncio.sleep(0.5)
+        (project_dir / "images" / "0004.png").write_bytes(b"png")
+        await asyncio.sleep(0.5)
+        # Queue of one overflowed: the next read is a full snapshot instead of the dropped upserts.
+        event = await a.get(timeout=1.0)
+        assert event is not None and event[0] == "snapshot"
+        assert len(event[1]["assets"]) == 5
+
+        a.close()
+        assert b.hub.subscriber_count == 1 and video_asset_watch.active_hubs()
+        b.close()
+        assert video_asset_watch.active_hubs() == {}
+
+    asyncio.run(scenario())
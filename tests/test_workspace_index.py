@@ -0,0 +1,182 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from factory_common import episode_progress, workspace_index
+from factory_common.fs_watch import InotifyWatcher
+
+
+@pytest.fixture(autouse=True)
+def _index_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORKSPACE_INDEX_PATH", str(tmp_path / "index.sqlite3"))
+    monkeypatch.delenv("WORKSPACE_INDEX_DISABLE", raising=False)
+    # Rescan-mode tests expect every query to see finished writes.
+    monkeypatch.setenv("WORKSPACE_INDEX_POLL_SEC", "0")
+    monkeypatch.delenv("YTM_FS_WATCH_DISABLE", raising=False)
+    workspace_index.reset_indexes()
+    yield
+    workspace_index.reset_indexes()
+
+
+def _write_json(path: Path, obj) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj), encoding="utf-8")
+
+
+def _make_runs(root: Path) -> None:
+    _write_json(root / "CH01-001_a" / "image_cues.json", {"cues": [{"prompt": "x"}, {"summary": ""}, {"refined_prompt": "y"}]})
+    (root / "CH01-001_a" / "images").mkdir()
+    (root / "CH01-001_a" / "images" / "0001.png").write_bytes(b"png")
+    (root / "CH01-001_a" / "images" / "notes.txt").write_text("skip", encoding="utf-8")
+    _write_json(root / "CH01-001_b" / "capcut_draft_info.json", {"draft": "x"})
+    _write_json(root / "custom_run" / "timeline_manifest.json", {"episode": {"id": "CH01-002"}})
+    _write_json(root / "_hidden" / "timeline_manifest.json", {"episode": {"channel": "CH01", "video": "003"}})
+    (root / "CH02-001").mkdir()
+
+
+def _candidates(monkeypatch, root: Path, **kwargs):
+    monkeypatch.setattr(episode_progress, "video_runs_root", lambda: root)
+    out = episode_progress.index_run_candidates("CH01", **kwargs)
+    return {vid: [c.as_dict() for c in items] for vid, items in out.items()}
+
+
+@pytest.mark.parametrize("include_hidden_runs", [False, True])
+def test_index_run_candidates_matches_legacy_scan(tmp_path, monkeypatch, include_hidden_runs):
+    root = tmp_path / "runs"
+    _make_runs(root)
+
+    indexed = _candidates(monkeypatch, root, include_hidden_runs=include_hidden_runs)
+    monkeypatch.setenv("WORKSPACE_INDEX_DISABLE", "1")
+    legacy = _candidates(monkeypatch, root, include_hidden_runs=include_hidden_runs)
+
+    assert indexed == legacy
+    assert set(indexed) == ({"001", "002", "003"} if include_hidden_runs else {"001", "002"})
+
+
+def test_video_run_entry_fields(tmp_path):
+    root = tmp_path / "runs"
+    _make_runs(root)
+
+    entry = workspace_index.video_runs_index(root).unit("CH01-001_a")
+    assert entry["cue_count"] == 3
+    assert entry["prompt_count"] == 2
+    assert entry["images_count"] == 1
+    assert entry["images_mtime"] == (root / "CH01-001_a" / "images" / "0001.png").stat().st_mtime
+    assert entry["recency"] >= entry["mtime"] > 0
+
+
+def test_watcher_applies_writes_without_rescan(tmp_path):
+    if InotifyWatcher.create() is None:
+        pytest.skip("inotify unavailable")
+    root = tmp_path / "runs"
+    _make_runs(root)
+    index = workspace_index.video_runs_index(root)
+    assert index.unit("CH01-001_a")["images_count"] == 1
+    assert index.watching
+    scans = index.stats["full_scans"]
+
+    (root / "CH01-001_a" / "images" / "0002.png").write_bytes(b"png")
+    _write_json(root / "CH01-001_a" / "image_cues.json", {"cues": [{"prompt": "only"}]})
+    (root / "CH01-003").mkdir()
+
+    assert index.unit("CH01-001_a")["images_count"] == 2
+    assert index.unit("CH01-001_a")["cue_count"] == 1
+    assert "CH01-003" in index.units()
+    assert index.stats["full_scans"] == scans
+
+
+def test_scripts_and_audio_index_track_changes_in_rescan_mode(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_FS_WATCH_DISABLE", "1")
+    scripts = tmp_path / "scripts"
+    audio = tmp_path / "audio_final"
+    _write_json(scripts / "CH01" / "001" / "status.json", {"status": "script_ready"})
+    (scripts / "CH01" / "002").mkdir(parents=True)
+    (scripts / "CH01" / "notes").mkdir()
+    (scripts / "misc").mkdir()
+    (audio / "CH01" / "001" / "chunks").mkdir(parents=True)
+
+    s_index = workspace_index.scripts_index(scripts)
+    a_index = workspace_index.audio_final_index(audio)
+    assert not s_index.watching
+    assert s_index.groups() == ["CH01"]
+    assert sorted(s_index.units("CH01")) == ["001", "002"]
+    assert s_index.unit("CH01/001")["status"] == {"status": "script_ready"}
+    assert s_index.unit("CH01/002")["status"] is None
+    assert a_index.unit("CH01/001")["chunk_wavs"] == 0
+
+    (scripts / "CH01" / "002" / "status.json").write_text("{broken", encoding="utf-8")
+    (scripts / "CH01" / "001" / "content").mkdir()
+    (scripts / "CH01" / "001" / "content" / "assembled.md").write_text("A", encoding="utf-8")
+    for i in range(3):
+        (audio / "CH01" / "001" / "chunks" / f"{i}.wav").write_bytes(b"w")
+    (audio / "CH01" / "001" / "CH01-001.wav").write_bytes(b"w")
+    os.utime(audio / "CH01" / "001" / "chunks", ns=(1, 1))
+
+    assert s_index.unit("CH01/002")["status_error"]
+    assert s_index.unit("CH01/001")["assembled"] is True
+    entry = a_index.unit("CH01/001")
+    assert entry["final_wav"] is True
+    assert entry["chunk_wavs"] == 3
+
+
+def test_index_persists_and_reparses_only_changed_units(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_FS_WATCH_DISABLE", "1")
+    root = tmp_path / "runs"
+    _make_runs(root)
+    first = workspace_index.video_runs_index(root)
+    assert first.unit("CH01-001_a")["cue_count"] == 3
+    workspace_index.reset_indexes()
+
+    second = workspace_index.video_runs_index(root)
+    assert second.unit("CH01-001_a")["cue_count"] == 3
+    assert second.stats["unit_refreshes"] == 0
+
+    (root / "CH01-001_b" / "capcut_draft_info.json").unlink()
+    (root / "custom_run").rename(root / "custom_run_2")
+    units = second.units()
+    assert "custom_run" not in units and "custom_run_2" in units
+    assert units["CH01-001_b"]["capcut_draft_info_mtime"] == 0.0
+    assert second.stats["unit_refreshes"] == 2
+
+
+@pytest.mark.parametrize("watch", [True, False])
+def test_versions_move_only_for_changed_groups(tmp_path, monkeypatch, watch):
+    if not watch:
+        monkeypatch.setenv("YTM_FS_WATCH_DISABLE", "1")
+    root = tmp_path / "audio_final"
+    index = workspace_index.audio_final_index(root)
+    assert index.groups() == []
+    missing = index.version("CH01")
+
+    (root / "CH01" / "001").mkdir(parents=True)
+    (root / "CH02" / "001").mkdir(parents=True)
+    assert index.groups() == ["CH01", "CH02"]
+    ch1, ch2 = index.version("CH01"), index.version("CH02")
+    assert ch1 != missing
+    unit = index.unit_version("CH01/001")
+    assert index.version("CH01") == ch1
+
+    (root / "CH01" / "001" / "CH01-001.srt").write_text("1", encoding="utf-8")
+    assert index.version("CH01") != ch1
+    assert index.unit_version("CH01/001") != unit
+    assert index.version("CH02") == ch2
+
+
+def test_rescan_mode_reuses_scans_by_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("YTM_FS_WATCH_DISABLE", "1")
+    monkeypatch.delenv("WORKSPACE_INDEX_POLL_SEC")
+    monkeypatch.setattr(workspace_index, "DEFAULT_POLL_SEC", 3600.0)
+    scripts = tmp_path / "scripts"
+    (scripts / "CH01" / "001").mkdir(parents=True)
+
+    index = workspace_index.scripts_index(scripts)
+    assert not index.watching
+    assert sorted(index.units("CH01")) == ["001"]
+    (scripts / "CH01" / "002").mkdir()
+    # Within the poll window the previous stat walk is reused.
+    assert sorted(index.units("CH01")) == ["001"]
+
+    monkeypatch.setenv("WORKSPACE_INDEX_POLL_SEC", "0")
+    assert sorted(index.units("CH01")) == ["001", "002"]